@@ -8,16 +8,24 @@ from backend.api.v1.endpoints import (
     bookings,
     categories,
     clients,
+    dashboard,
+    diagnostics,
     documents,
     equipment,
     health,
+    metrics,
     projects,
+    reports,
     scan_sessions,
 )
 
 api_router = APIRouter()
 
 api_router.include_router(health.health_router, prefix='/health', tags=['Health'])
+api_router.include_router(metrics.metrics_router, prefix='/metrics', tags=['Metrics'])
+api_router.include_router(
+    diagnostics.diagnostics_router, prefix='/diagnostics', tags=['Diagnostics']
+)
 api_router.include_router(auth.auth_router, prefix='/auth', tags=['Authentication'])
 api_router.include_router(
     equipment.equipment_router, prefix='/equipment', tags=['Equipment']
@@ -26,6 +34,9 @@ api_router.include_router(
     categories.categories_router, prefix='/categories', tags=['Categories']
 )
 api_router.include_router(clients.clients_router, prefix='/clients', tags=['Clients'])
+api_router.include_router(
+    dashboard.dashboard_router, prefix='/dashboard', tags=['Dashboard']
+)
 api_router.include_router(
     documents.documents_router, prefix='/documents', tags=['Documents']
 )
@@ -36,6 +47,7 @@ api_router.include_router(barcode.barcode_router, prefix='/barcodes', tags=['Bar
 api_router.include_router(
     projects.projects_router, prefix='/projects', tags=['Projects']
 )
+api_router.include_router(reports.reports_router, prefix='/reports', tags=['Reports'])
 api_router.include_router(
     scan_sessions.scan_sessions_router, prefix='/scan-sessions', tags=['Scan Sessions']
 )
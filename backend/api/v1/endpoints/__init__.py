@@ -11,10 +11,14 @@ from backend.api.v1.endpoints.barcode import barcode_router
 from backend.api.v1.endpoints.bookings import bookings_router
 from backend.api.v1.endpoints.categories import categories_router
 from backend.api.v1.endpoints.clients import clients_router
+from backend.api.v1.endpoints.dashboard import dashboard_router
+from backend.api.v1.endpoints.diagnostics import diagnostics_router
 from backend.api.v1.endpoints.documents import documents_router
 from backend.api.v1.endpoints.equipment import equipment_router
 from backend.api.v1.endpoints.health import health_router
+from backend.api.v1.endpoints.metrics import metrics_router
 from backend.api.v1.endpoints.projects import projects_router
+from backend.api.v1.endpoints.reports import reports_router
 from backend.api.v1.endpoints.scan_sessions import scan_sessions_router
 
 __all__ = [
@@ -23,9 +27,13 @@ __all__ = [
     'bookings_router',
     'categories_router',
     'clients_router',
+    'dashboard_router',
+    'diagnostics_router',
     'documents_router',
     'equipment_router',
     'health_router',
+    'metrics_router',
     'projects_router',
+    'reports_router',
     'scan_sessions_router',
 ]
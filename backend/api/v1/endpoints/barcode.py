@@ -3,12 +3,13 @@
 This module provides API endpoints for barcode generation and validation.
 """
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.v1.decorators import typed_get, typed_post
 from backend.core.database import get_db
+from backend.core.render_pool import RenderQueueFullError
 from backend.exceptions import ValidationError
 from backend.services import BarcodeService
 from backend.services.barcode import BarcodeType
@@ -191,6 +192,7 @@ async def get_barcode_image(
 
     Raises:
         ValidationError: If barcode is invalid or image generation fails
+        HTTPException: If the barcode renderer is overloaded
     """
     service = BarcodeService(db)
 
@@ -202,5 +204,14 @@ async def get_barcode_image(
         )
 
     # Generate barcode image
-    image_data, content_type = service.generate_barcode_image(barcode, barcode_type)
+    try:
+        image_data, content_type = await service.render_barcode_image(
+            barcode, barcode_type
+        )
+    except RenderQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Barcode renderer is busy, try again later',
+            headers={'Retry-After': '1'},
+        )
     return Response(content=image_data, media_type=content_type)
@@ -10,10 +10,12 @@ from datetime import datetime
 from typing import Annotated, Any, Optional
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from backend.api.v1.decorators import (
     typed_delete,
@@ -22,13 +24,17 @@ from backend.api.v1.decorators import (
     typed_post,
     typed_put,
 )
-from backend.core.database import get_db
+from backend.core.database import get_db, get_read_db
+from backend.core.export import ExportFormat, export_response
+from backend.core.unit_of_work import UnitOfWork
 from backend.exceptions import AvailabilityError, NotFoundError, StatusTransitionError
 from backend.exceptions.state_exceptions import StateError
 from backend.exceptions.validation_exceptions import ValidationError
 from backend.models import BookingStatus, PaymentStatus
 from backend.schemas import BookingCreate, BookingResponse, BookingUpdate
-from backend.services import BookingService, ClientService
+from backend.services import BookingService, ClientService, ExportService
+from backend.services.availability import invalidate_timelines
+from backend.services.export import BOOKING_COLUMNS
 
 bookings_router: APIRouter = APIRouter()
 
@@ -181,7 +187,8 @@ async def create_booking(
     Raises:
         HTTPException: If validation fails or equipment is not available
     """
-    logger.debug('Creating new booking: {}', booking.model_dump())
+    # Serialized only when debug records are written
+    logger.opt(lazy=True).debug('Creating new booking: {}', booking.model_dump)
     booking_service = BookingService(db)
     try:
         booking_obj = await booking_service.create_booking(
@@ -316,6 +323,62 @@ async def get_bookings(
         )
 
 
+@bookings_router.get(
+    '/export',
+    response_class=StreamingResponse,
+    summary='Export bookings',
+)
+async def export_bookings(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias='format', description='File format'
+    ),
+    query: Optional[str] = Query(
+        None, description='Search by client name, email, or phone'
+    ),
+    equipment_query: Optional[str] = Query(
+        None, description='Search by equipment name or serial number'
+    ),
+    equipment_id: Optional[int] = Query(None, description='Filter by equipment ID'),
+    booking_status: Optional[BookingStatus] = Query(
+        None, description='Filter by booking status'
+    ),
+    payment_status: Optional[PaymentStatus] = Query(
+        None, description='Filter by payment status'
+    ),
+    start_date: Optional[datetime] = Query(
+        None, description='Filter by start date (inclusive)'
+    ),
+    end_date: Optional[datetime] = Query(
+        None, description='Filter by end date (inclusive)'
+    ),
+    active_only: bool = Query(False, description='Return only active bookings'),
+) -> StreamingResponse:
+    """Export bookings matching the filters as a CSV or XLSX file.
+
+    Rows are streamed from a server-side cursor, so memory use does not
+    depend on the number of bookings.
+    """
+    bookings_query = await BookingService(db).get_filtered_bookings_query(
+        query=query,
+        equipment_query=equipment_query,
+        equipment_id=equipment_id,
+        booking_status=booking_status,
+        payment_status=payment_status,
+        start_date=start_date,
+        end_date=end_date,
+        active_only=active_only,
+    )
+    rows = ExportService(db).iter_rows(bookings_query, BOOKING_COLUMNS)
+    return export_response(
+        BOOKING_COLUMNS,
+        rows,
+        export_format,
+        'bookings',
+        background=BackgroundTask(db.close),
+    )
+
+
 @typed_get(
     bookings_router,
     '/{booking_id}',
@@ -759,90 +822,93 @@ async def create_bookings_batch(
 
     booking_service = BookingService(db)
     created_bookings = []
+    created_equipment_ids: list[int] = []
     failed_bookings = []
 
     try:
-        # Start transaction
+        # Bookings are committed together at the end of the unit of work
         logger.debug('Starting batch booking transaction')
+        async with UnitOfWork(db) as uow:
+            for i, booking_data in enumerate(bookings_data):
+                try:
+                    # Assign project_id if provided
+                    if project_id:
+                        booking_data.project_id = project_id
+
+                    logger.opt(lazy=True).debug(
+                        'Creating booking {}/{}: {}',
+                        lambda: i + 1,
+                        lambda: len(bookings_data),
+                        booking_data.model_dump,
+                    )
+
+                    # A failed booking only rolls back its own savepoint
+                    async with uow.savepoint():
+                        booking_obj = await booking_service.create_booking(
+                            client_id=booking_data.client_id,
+                            equipment_id=booking_data.equipment_id,
+                            start_date=booking_data.start_date,
+                            end_date=booking_data.end_date,
+                            total_amount=float(booking_data.total_amount),
+                            deposit_amount=float(booking_data.total_amount) * 0.2,
+                            quantity=booking_data.quantity,
+                            notes=None,
+                            project_id=booking_data.project_id,
+                        )
 
-        for i, booking_data in enumerate(bookings_data):
-            try:
-                # Assign project_id if provided
-                if project_id:
-                    booking_data.project_id = project_id
-
-                logger.debug(
-                    'Creating booking {}/{}: {}',
-                    i + 1,
-                    len(bookings_data),
-                    booking_data.model_dump(),
-                )
-
-                booking_obj = await booking_service.create_booking(
-                    client_id=booking_data.client_id,
-                    equipment_id=booking_data.equipment_id,
-                    start_date=booking_data.start_date,
-                    end_date=booking_data.end_date,
-                    total_amount=float(booking_data.total_amount),
-                    deposit_amount=float(booking_data.total_amount) * 0.2,
-                    quantity=booking_data.quantity,
-                    notes=None,
-                    project_id=booking_data.project_id,
-                )
-
-                booking_response = await _booking_to_response(booking_obj, db)
-                created_bookings.append(booking_response)
-                logger.debug(
-                    'Successfully created booking {}: {}',
-                    booking_obj.id,
-                    booking_obj.equipment_id,
-                )
-
-            except (ValidationError, AvailabilityError, StateError) as e:
-                error_detail = {
-                    'equipment_id': booking_data.equipment_id,
-                    'error': str(e),
-                    'error_type': type(e).__name__,
-                }
-                failed_bookings.append(error_detail)
+                    booking_response = await _booking_to_response(booking_obj, db)
+                    created_bookings.append(booking_response)
+                    created_equipment_ids.append(booking_obj.equipment_id)
+                    logger.debug(
+                        'Successfully created booking {}: {}',
+                        booking_obj.id,
+                        booking_obj.equipment_id,
+                    )
+
+                except (ValidationError, AvailabilityError, StateError) as e:
+                    error_detail = {
+                        'equipment_id': booking_data.equipment_id,
+                        'error': str(e),
+                        'error_type': type(e).__name__,
+                    }
+                    failed_bookings.append(error_detail)
+                    logger.warning(
+                        'Failed to create booking for equipment {}: {}',
+                        booking_data.equipment_id,
+                        str(e),
+                    )
+                    continue
+
+                except Exception as e:
+                    error_detail = {
+                        'equipment_id': booking_data.equipment_id,
+                        'error': f'Unexpected error: {str(e)}',
+                        'error_type': 'UnexpectedError',
+                    }
+                    failed_bookings.append(error_detail)
+                    logger.error(
+                        'Unexpected error creating booking for equipment {}: {}',
+                        booking_data.equipment_id,
+                        str(e),
+                    )
+                    continue
+
+            # Leaving the unit of work with an error rolls everything back
+            if not created_bookings:
                 logger.warning(
-                    'Failed to create booking for equipment {}: {}',
-                    booking_data.equipment_id,
-                    str(e),
+                    'Rolling back batch booking transaction: no bookings created'
                 )
-                continue
-
-            except Exception as e:
-                error_detail = {
-                    'equipment_id': booking_data.equipment_id,
-                    'error': f'Unexpected error: {str(e)}',
-                    'error_type': 'UnexpectedError',
-                }
-                failed_bookings.append(error_detail)
-                logger.error(
-                    'Unexpected error creating booking for equipment {}: {}',
-                    booking_data.equipment_id,
-                    str(e),
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail='No bookings could be created',
                 )
-                continue
-
-        # Commit transaction if we have any successful bookings
-        if created_bookings:
-            await db.commit()
-            logger.info(
-                'Committed batch booking transaction: {} created, {} failed',
-                len(created_bookings),
-                len(failed_bookings),
-            )
-        else:
-            await db.rollback()
-            logger.warning(
-                'Rolling back batch booking transaction: no bookings created'
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail='No bookings could be created',
-            )
+
+        logger.info(
+            'Committed batch booking transaction: {} created, {} failed',
+            len(created_bookings),
+            len(failed_bookings),
+        )
+        await invalidate_timelines(created_equipment_ids)
 
         return {
             'success': True,
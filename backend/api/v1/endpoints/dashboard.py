@@ -0,0 +1,36 @@
+"""Dashboard endpoints module.
+
+This module exposes aggregated counters for the home dashboard.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.v1.decorators import typed_get
+from backend.core.database import get_db
+from backend.schemas import DashboardSummary
+from backend.services import DashboardService
+
+dashboard_router: APIRouter = APIRouter()
+
+
+@typed_get(
+    dashboard_router,
+    '',
+    response_model=DashboardSummary,
+    summary='Get dashboard summary',
+)
+async def get_dashboard_summary(
+    refresh: bool = Query(False, description='Bypass cached counters'),
+    db: AsyncSession = Depends(get_db),
+) -> DashboardSummary:
+    """Get equipment and booking counters for the home dashboard.
+
+    Args:
+        refresh: Bypass cached counters
+        db: Database session
+
+    Returns:
+        DashboardSummary: Aggregated counters
+    """
+    return await DashboardService(db).get_summary(refresh=refresh)
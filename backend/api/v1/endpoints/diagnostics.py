@@ -0,0 +1,184 @@
+"""Diagnostics endpoints module.
+
+This module exposes the built-in profilers and the slow query log. All
+endpoints require the diagnostics token in the ``X-Diagnostics-Token``
+header and are hidden (404) when no token is configured.
+"""
+
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from backend.api.v1.decorators import typed_delete, typed_get
+from backend.core.config import settings
+from backend.core.profiler import (
+    DIAGNOSTICS_TOKEN_HEADER,
+    ProfilerBusyError,
+    format_collapsed,
+    has_diagnostics_access,
+    profile_event_loop,
+    request_profiles,
+)
+from backend.core.slow_query_log import slow_query_log
+from backend.schemas.diagnostics import QueryFingerprintSummary, RequestProfileSummary
+
+
+async def require_diagnostics_access(
+    token: Optional[str] = Header(None, alias=DIAGNOSTICS_TOKEN_HEADER),
+) -> None:
+    """Check the diagnostics token of a request.
+
+    Args:
+        token: Token from the ``X-Diagnostics-Token`` header
+
+    Raises:
+        HTTPException: 404 if diagnostics are disabled, 403 if the token
+            is missing or wrong
+    """
+    if not settings.DIAGNOSTICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Not Found')
+    if not has_diagnostics_access(token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Invalid diagnostics token',
+        )
+
+
+diagnostics_router: APIRouter = APIRouter(
+    dependencies=[Depends(require_diagnostics_access)]
+)
+
+
+@diagnostics_router.get(
+    '/profile',
+    response_class=PlainTextResponse,
+    summary='Sample the event loop',
+)
+async def sample_event_loop(
+    duration: float = Query(
+        5.0, gt=0, le=settings.PROFILE_MAX_SECONDS, description='Seconds to sample'
+    ),
+    interval_ms: int = Query(
+        10, ge=1, le=1000, description='Milliseconds between samples'
+    ),
+) -> PlainTextResponse:
+    """Sample the stacks of the worker event loop.
+
+    The loop keeps serving requests while it is sampled, so the result
+    shows where the worker spends its time under real traffic. The output
+    is in the collapsed stack format accepted by flamegraph tools.
+
+    Args:
+        duration: Sampling time in seconds
+        interval_ms: Time between samples in milliseconds
+
+    Returns:
+        PlainTextResponse: One ``stack count`` line per sampled stack
+
+    Raises:
+        HTTPException: 409 if another sampling run is in progress
+    """
+    try:
+        stacks = await profile_event_loop(duration, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    return PlainTextResponse(format_collapsed(stacks))
+
+
+@typed_get(
+    diagnostics_router,
+    '/profiles',
+    response_model=List[RequestProfileSummary],
+    summary='List request profiles',
+)
+async def list_request_profiles() -> List[RequestProfileSummary]:
+    """List stored per-request profiles.
+
+    Requests are profiled when sent with ``X-Profile: 1`` and the
+    diagnostics token.
+
+    Returns:
+        List[RequestProfileSummary]: Stored profiles, newest first
+    """
+    return [
+        RequestProfileSummary.model_validate(profile)
+        for profile in request_profiles.latest()
+    ]
+
+
+@diagnostics_router.get(
+    '/profiles/{profile_id}',
+    response_class=PlainTextResponse,
+    summary='Get request profile',
+)
+async def get_request_profile(profile_id: str) -> PlainTextResponse:
+    """Get the cProfile report of a profiled request.
+
+    Args:
+        profile_id: Value of the ``X-Profile-Id`` response header
+
+    Returns:
+        PlainTextResponse: Functions sorted by cumulative time
+
+    Raises:
+        HTTPException: If the profile is unknown or already dropped
+    """
+    profile = request_profiles.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail='Profile not found'
+        )
+    return PlainTextResponse(profile.stats)
+
+
+@typed_get(
+    diagnostics_router,
+    '/queries',
+    response_model=List[QueryFingerprintSummary],
+    summary='List the most expensive queries',
+)
+async def list_queries(
+    limit: int = Query(20, ge=1, le=500, description='Number of fingerprints'),
+    sort: Literal['total_time', 'max_time', 'mean_time', 'count'] = Query(
+        'total_time', description='Sort key'
+    ),
+) -> List[QueryFingerprintSummary]:
+    """List statement fingerprints of the worker, most expensive first.
+
+    Timings are collected since the worker started or the log was reset.
+    Slow statements include the function that issued them, slow
+    ``SELECT`` statements also their captured plan.
+
+    Args:
+        limit: Number of fingerprints
+        sort: Sort key
+
+    Returns:
+        List[QueryFingerprintSummary]: Fingerprint timings
+    """
+    return [
+        QueryFingerprintSummary(
+            fingerprint=stats.fingerprint,
+            count=stats.count,
+            slow_count=stats.slow_count,
+            total_ms=round(stats.total_time * 1000, 3),
+            mean_ms=round(stats.mean_time * 1000, 3),
+            max_ms=round(stats.max_time * 1000, 3),
+            statement=stats.statement,
+            source=stats.source,
+            plan=stats.plan,
+        )
+        for stats in slow_query_log.top(limit, sort)
+    ]
+
+
+@typed_delete(
+    diagnostics_router,
+    '/queries',
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary='Reset the query log',
+)
+async def reset_queries() -> None:
+    """Drop collected query timings of the worker."""
+    slow_query_log.reset()
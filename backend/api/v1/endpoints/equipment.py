@@ -10,9 +10,11 @@ from typing import List, Optional, cast
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from fastapi import status as http_status
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from backend.api.v1.decorators import (
     typed_delete,
@@ -22,21 +24,30 @@ from backend.api.v1.decorators import (
     typed_put,
 )
 from backend.api.v1.endpoints.bookings import _booking_to_response, _extract_safe_name
-from backend.core.database import get_db
+from backend.core.database import get_db, get_read_db
+from backend.core.export import ExportFormat, export_response
 from backend.exceptions import BusinessError, NotFoundError, StateError, ValidationError
 from backend.models.booking import BookingStatus
 from backend.models.equipment import EquipmentStatus
 from backend.schemas import (
     BookingConflictInfo,
     BookingResponse,
+    EquipmentAlternative,
     EquipmentAvailabilityResponse,
     EquipmentCreate,
     EquipmentResponse,
+    EquipmentTimeline,
     EquipmentUpdate,
     RegenerateBarcodeRequest,
     StatusTimelineResponse,
 )
-from backend.services import BookingService, EquipmentService
+from backend.services import (
+    AvailabilityService,
+    BookingService,
+    EquipmentService,
+    ExportService,
+)
+from backend.services.export import EQUIPMENT_COLUMNS
 
 equipment_router: APIRouter = APIRouter()
 
@@ -341,6 +352,86 @@ async def get_equipment_list_paginated_with_rental_status(
         ) from e
 
 
+@equipment_router.get(
+    '/export',
+    response_class=StreamingResponse,
+    summary='Export equipment list',
+)
+async def export_equipment(
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias='format', description='File format'
+    ),
+    status: Optional[EquipmentStatus] = Query(None, description='Filter by status'),
+    category_id: Optional[int] = Query(None, description='Filter by category ID'),
+    query: Optional[str] = Query(
+        None, description='Search by name, description, barcode, serial number'
+    ),
+    include_deleted: bool = Query(
+        False, description='Whether to include deleted equipment'
+    ),
+    db: AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    """Export equipment matching the filters as a CSV or XLSX file.
+
+    Rows are streamed from a server-side cursor, so memory use does not
+    depend on the catalog size.
+
+    Args:
+        export_format: Output format
+        status: Filter by equipment status
+        category_id: Filter by category, including subcategories
+        query: Search query
+        include_deleted: Whether to include deleted equipment
+        db: Database session
+
+    Returns:
+        StreamingResponse: File download
+    """
+    equipment_query = await EquipmentService(db).get_equipment_list_query(
+        status=status,
+        category_id=category_id,
+        query=query,
+        include_deleted=include_deleted,
+    )
+    rows = ExportService(db).iter_rows(equipment_query, EQUIPMENT_COLUMNS)
+    return export_response(
+        EQUIPMENT_COLUMNS,
+        rows,
+        export_format,
+        'equipment',
+        background=BackgroundTask(db.close),
+    )
+
+
+@typed_get(
+    equipment_router,
+    '/availability/timeline',
+    response_model=List[EquipmentTimeline],
+)
+async def get_availability_timelines(
+    equipment_ids: List[int] = Query(..., description='Equipment IDs'),
+    start_date: datetime = Query(..., description='Window start'),
+    end_date: datetime = Query(..., description='Window end'),
+    db: AsyncSession = Depends(get_db),
+) -> List[EquipmentTimeline]:
+    """Get busy and free intervals of several equipment items.
+
+    Lets a calendar load the availability of all shown items at once.
+
+    Args:
+        equipment_ids: Equipment IDs
+        start_date: Window start, naive values are Moscow time
+        end_date: Window end, naive values are Moscow time
+        db: Database session
+
+    Returns:
+        Timelines in the order of the requested IDs
+    """
+    return await AvailabilityService(db).get_timelines(
+        equipment_ids, start_date, end_date
+    )
+
+
 @typed_get(
     equipment_router,
     '/{equipment_id}',
@@ -1078,3 +1169,65 @@ async def check_equipment_availability(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'Error checking equipment availability: {str(e)}',
         ) from e
+
+
+@typed_get(
+    equipment_router,
+    '/{equipment_id}/availability/timeline',
+    response_model=EquipmentTimeline,
+)
+async def get_availability_timeline(
+    equipment_id: int,
+    start_date: datetime = Query(..., description='Window start'),
+    end_date: datetime = Query(..., description='Window end'),
+    db: AsyncSession = Depends(get_db),
+) -> EquipmentTimeline:
+    """Get busy and free intervals of an equipment item.
+
+    Args:
+        equipment_id: Equipment ID
+        start_date: Window start, naive values are Moscow time
+        end_date: Window end, naive values are Moscow time
+        db: Database session
+
+    Returns:
+        Equipment timeline within the window
+    """
+    timelines = await AvailabilityService(db).get_timelines(
+        [equipment_id], start_date, end_date
+    )
+    return timelines[0]
+
+
+@typed_get(
+    equipment_router,
+    '/{equipment_id}/alternatives',
+    response_model=List[EquipmentAlternative],
+)
+async def get_equipment_alternatives(
+    equipment_id: int,
+    start_date: datetime = Query(..., description='Period start'),
+    end_date: datetime = Query(..., description='Period end'),
+    same_name: bool = Query(False, description='Only items with the same name'),
+    limit: int = Query(10, ge=1, le=50, description='Maximum number of items'),
+    db: AsyncSession = Depends(get_db),
+) -> List[EquipmentAlternative]:
+    """Get available items that can replace an equipment item.
+
+    Items come from the same category or its subcategories and are free for
+    the whole period, best matches first.
+
+    Args:
+        equipment_id: ID of the equipment item to replace
+        start_date: Period start, naive values are Moscow time
+        end_date: Period end, naive values are Moscow time
+        same_name: Only suggest items with the same name
+        limit: Maximum number of suggestions
+        db: Database session
+
+    Returns:
+        Suggested equipment items
+    """
+    return await AvailabilityService(db).find_alternatives(
+        equipment_id, start_date, end_date, same_name=same_name, limit=limit
+    )
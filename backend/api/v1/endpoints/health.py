@@ -1,9 +1,13 @@
 """Health check endpoints module."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, status
 from fastapi.responses import JSONResponse
 
 from backend.api.v1.decorators import typed_get
+from backend.core import cache
+from backend.core.database import engine
+from backend.core.health import check_readiness
+from backend.schemas.health import ReadinessResponse
 
 health_router: APIRouter = APIRouter()
 
@@ -22,3 +26,51 @@ async def health_check() -> dict[str, str]:
         Status message indicating service is running
     """
     return {'status': 'Service is running'}
+
+
+@typed_get(
+    health_router,
+    '/live',
+    response_model=dict[str, str],
+    summary='Liveness probe',
+)
+async def liveness_check() -> dict[str, str]:
+    """Liveness probe.
+
+    Only confirms that the event loop is responsive; it never touches the
+    database or Redis, so a dependency outage does not restart workers.
+
+    Returns:
+        Status message indicating the process is alive
+    """
+    return {'status': 'alive'}
+
+
+@typed_get(
+    health_router,
+    '/ready',
+    response_model=ReadinessResponse,
+    summary='Readiness probe',
+)
+async def readiness_check(request: Request, response: Response) -> ReadinessResponse:
+    """Readiness probe.
+
+    Times a ``SELECT 1`` and a Redis ``PING``, reports connection pool
+    saturation and scheduler state. Returns 503 when the worker should not
+    receive traffic.
+
+    Args:
+        request: Incoming request
+        response: Outgoing response, used to set the status code
+
+    Returns:
+        ReadinessResponse: Readiness report
+    """
+    result = await check_readiness(
+        engine,
+        cache.redis,
+        scheduler=getattr(request.app.state, 'scheduler', None),
+    )
+    if result.status != 'ready':
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
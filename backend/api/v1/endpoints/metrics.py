@@ -0,0 +1,50 @@
+"""Metrics endpoints module.
+
+This module exposes application metrics in the Prometheus text format.
+"""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core import cache
+from backend.core.database import engine, get_db
+from backend.core.metrics import (
+    BOOKINGS,
+    EQUIPMENT_ITEMS,
+    collect_pool_metrics,
+    collect_redis_metrics,
+    registry,
+    set_status_counts,
+)
+from backend.repositories import BookingRepository, EquipmentRepository
+
+metrics_router: APIRouter = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@metrics_router.get(
+    '',
+    response_class=PlainTextResponse,
+    summary='Get application metrics',
+)
+async def get_metrics(db: AsyncSession = Depends(get_db)) -> PlainTextResponse:
+    """Get application metrics in the Prometheus text exposition format.
+
+    Pool and Redis gauges are sampled and booking/equipment counts are
+    queried at scrape time; request latency and job durations are
+    accumulated in-process.
+
+    Args:
+        db: Database session
+
+    Returns:
+        PlainTextResponse: Metrics in the text exposition format
+    """
+    collect_pool_metrics(engine)
+    collect_redis_metrics(cache.redis_pool)
+    set_status_counts(EQUIPMENT_ITEMS, await EquipmentRepository(db).count_by_status())
+    set_status_counts(BOOKINGS, await BookingRepository(db).count_by_status())
+
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -3,14 +3,16 @@
 This module contains API endpoints for managing projects.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from backend.api.v1.decorators import (
     typed_delete,
@@ -19,7 +21,8 @@ from backend.api.v1.decorators import (
     typed_post,
     typed_put,
 )
-from backend.core.database import get_db
+from backend.core.database import get_db, get_read_db
+from backend.core.export import ExportFormat, export_response
 from backend.exceptions import (
     BusinessError,
     CaptchaError,
@@ -36,11 +39,14 @@ from backend.schemas import (
     ProjectCreateWithBookings,
     ProjectPaymentStatusUpdate,
     ProjectPrint,
+    ProjectReschedule,
+    ProjectRescheduleResponse,
     ProjectResponse,
     ProjectUpdate,
     ProjectWithBookings,
 )
-from backend.services import CategoryService, ProjectService
+from backend.services import CategoryService, ExportService, ProjectService
+from backend.services.export import PROJECT_COLUMNS
 
 projects_router: APIRouter = APIRouter()
 
@@ -221,6 +227,56 @@ async def get_projects_paginated(
         )
 
 
+@projects_router.get(
+    '/export',
+    response_class=StreamingResponse,
+    summary='Export projects',
+)
+async def export_projects(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias='format', description='File format'
+    ),
+    client_id: Optional[int] = None,
+    project_status: Optional[ProjectStatus] = None,
+    payment_status: Optional[ProjectPaymentStatus] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    query: Optional[str] = None,
+) -> StreamingResponse:
+    """Export projects matching the filters as a CSV or XLSX file.
+
+    Args:
+        db: Database session
+        export_format: Output format
+        client_id: Filter by client ID
+        project_status: Filter by project status
+        payment_status: Filter by payment status
+        start_date: Filter by start date
+        end_date: Filter by end date
+        query: Search by project name (case-insensitive)
+
+    Returns:
+        StreamingResponse: File download
+    """
+    projects_query = await ProjectService(db).get_projects_list_query(
+        client_id=client_id,
+        status=project_status,
+        payment_status=payment_status,
+        start_date=start_date,
+        end_date=end_date,
+        query=query,
+    )
+    rows = ExportService(db).iter_rows(projects_query, PROJECT_COLUMNS)
+    return export_response(
+        PROJECT_COLUMNS,
+        rows,
+        export_format,
+        'projects',
+        background=BackgroundTask(db.close),
+    )
+
+
 @typed_get(
     projects_router,
     '/{project_id}',
@@ -294,7 +350,7 @@ async def create_project(
 
     service = ProjectService(db)
     try:
-        log.debug('Project data: {}', project.model_dump())
+        log.opt(lazy=True).debug('Project data: {}', project.model_dump)
 
         # Check if we have bookings data
         has_bookings = hasattr(project, 'bookings') and project.bookings
@@ -306,7 +362,10 @@ async def create_project(
                 project.name,
                 len(project.bookings),
             )
-            log.debug('Bookings data: {}', [b.model_dump() for b in project.bookings])
+            log.opt(lazy=True).debug(
+                'Bookings data: {}',
+                lambda: [b.model_dump() for b in project.bookings],
+            )
 
             # Create project with bookings
             created_project = await service.create_project_with_bookings(
@@ -474,6 +533,62 @@ async def add_booking_to_project(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@typed_post(
+    projects_router,
+    '/{project_id}/reschedule',
+    response_model=ProjectRescheduleResponse,
+    summary='Reschedule project bookings',
+)
+async def reschedule_project(
+    project_id: int,
+    reschedule: ProjectReschedule,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> ProjectRescheduleResponse:
+    """Move project bookings by an interval or to a new period.
+
+    With ``dry_run`` (the default) only the planned dates and conflicts are
+    returned. Otherwise all bookings are moved at once, or none if there is
+    a conflict, in which case the response has status 409.
+
+    Args:
+        project_id: Project ID
+        reschedule: Bookings to move and how
+        response: Response used to set the status code
+        db: Database session
+
+    Returns:
+        Planned periods, conflicts and whether the bookings were moved
+    """
+    shift = None
+    if reschedule.start_date is None and reschedule.end_date is None:
+        shift = timedelta(days=reschedule.shift_days, hours=reschedule.shift_hours)
+    elif reschedule.shift_days or reschedule.shift_hours:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Specify either a shift or new dates, not both',
+        )
+
+    service = ProjectService(db)
+    try:
+        result = await service.reschedule_project(
+            project_id,
+            shift=shift,
+            start_date=reschedule.start_date,
+            end_date=reschedule.end_date,
+            booking_ids=reschedule.booking_ids,
+            dry_run=reschedule.dry_run,
+        )
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not reschedule.dry_run and result.conflicts:
+        response.status_code = status.HTTP_409_CONFLICT
+    return result
+
+
 @typed_delete(
     projects_router,
     '/{project_id}/bookings/{booking_id}',
@@ -0,0 +1,139 @@
+"""Reports endpoints module.
+
+This module exposes paginated utilization, revenue and idle inventory
+reports computed from the ``booking_daily_stats`` summary table.
+"""
+
+from datetime import date
+from typing import Optional, cast
+
+from fastapi import APIRouter, Depends, Query
+from fastapi_pagination import Page, Params
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.v1.decorators import typed_get, typed_post
+from backend.core.database import get_db, get_read_db
+from backend.schemas import (
+    CategoryRevenueItem,
+    ClientRevenueItem,
+    IdleEquipmentItem,
+    MonthlyRevenueItem,
+    ReportRefreshResult,
+    UtilizationReportItem,
+)
+from backend.services import ReportService
+
+reports_router: APIRouter = APIRouter()
+
+START_DATE_QUERY = Query(None, description='First day of the period (inclusive)')
+END_DATE_QUERY = Query(None, description='Last day of the period (inclusive)')
+
+
+@typed_get(
+    reports_router,
+    '/utilization',
+    response_model=Page[UtilizationReportItem],
+    summary='Equipment utilization report',
+)
+async def get_utilization_report(
+    params: Params = Depends(),
+    start_date: Optional[date] = START_DATE_QUERY,
+    end_date: Optional[date] = END_DATE_QUERY,
+    category_id: Optional[int] = Query(
+        None, description='Filter by category, including subcategories'
+    ),
+    db: AsyncSession = Depends(get_read_db),
+) -> Page[UtilizationReportItem]:
+    """Get share of booked days per equipment item, most utilized first."""
+    stmt = ReportService(db).get_utilization_query(start_date, end_date, category_id)
+    return cast(Page[UtilizationReportItem], await paginate(db, stmt, params))
+
+
+@typed_get(
+    reports_router,
+    '/revenue/categories',
+    response_model=Page[CategoryRevenueItem],
+    summary='Revenue per category report',
+)
+async def get_category_revenue_report(
+    params: Params = Depends(),
+    start_date: Optional[date] = START_DATE_QUERY,
+    end_date: Optional[date] = END_DATE_QUERY,
+    db: AsyncSession = Depends(get_read_db),
+) -> Page[CategoryRevenueItem]:
+    """Get revenue per equipment category, highest first."""
+    stmt = ReportService(db).get_category_revenue_query(start_date, end_date)
+    return cast(Page[CategoryRevenueItem], await paginate(db, stmt, params))
+
+
+@typed_get(
+    reports_router,
+    '/revenue/clients',
+    response_model=Page[ClientRevenueItem],
+    summary='Revenue per client report',
+)
+async def get_client_revenue_report(
+    params: Params = Depends(),
+    start_date: Optional[date] = START_DATE_QUERY,
+    end_date: Optional[date] = END_DATE_QUERY,
+    db: AsyncSession = Depends(get_read_db),
+) -> Page[ClientRevenueItem]:
+    """Get revenue per client, highest first."""
+    stmt = ReportService(db).get_client_revenue_query(start_date, end_date)
+    return cast(Page[ClientRevenueItem], await paginate(db, stmt, params))
+
+
+@typed_get(
+    reports_router,
+    '/revenue/months',
+    response_model=Page[MonthlyRevenueItem],
+    summary='Revenue per month report',
+)
+async def get_monthly_revenue_report(
+    params: Params = Depends(),
+    start_date: Optional[date] = START_DATE_QUERY,
+    end_date: Optional[date] = END_DATE_QUERY,
+    db: AsyncSession = Depends(get_read_db),
+) -> Page[MonthlyRevenueItem]:
+    """Get revenue per calendar month with running total and change."""
+    stmt = ReportService(db).get_monthly_revenue_query(start_date, end_date)
+    return cast(Page[MonthlyRevenueItem], await paginate(db, stmt, params))
+
+
+@typed_get(
+    reports_router,
+    '/idle',
+    response_model=Page[IdleEquipmentItem],
+    summary='Idle inventory report',
+)
+async def get_idle_equipment_report(
+    params: Params = Depends(),
+    start_date: Optional[date] = START_DATE_QUERY,
+    end_date: Optional[date] = END_DATE_QUERY,
+    category_id: Optional[int] = Query(
+        None, description='Filter by category, including subcategories'
+    ),
+    db: AsyncSession = Depends(get_read_db),
+) -> Page[IdleEquipmentItem]:
+    """Get equipment without bookings in the period, longest idle first."""
+    stmt = ReportService(db).get_idle_equipment_query(start_date, end_date, category_id)
+    return cast(Page[IdleEquipmentItem], await paginate(db, stmt, params))
+
+
+@typed_post(
+    reports_router,
+    '/refresh',
+    response_model=ReportRefreshResult,
+    summary='Refresh report data',
+)
+async def refresh_reports(
+    full: bool = Query(False, description='Rebuild all report data'),
+    db: AsyncSession = Depends(get_db),
+) -> ReportRefreshResult:
+    """Recompute report data for bookings changed since the last refresh.
+
+    The scheduler does this periodically; the endpoint makes fresh changes
+    visible immediately.
+    """
+    return await ReportService(db).refresh(full=full)
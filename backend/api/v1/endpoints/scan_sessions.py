@@ -5,9 +5,10 @@ It provides routes for creating, retrieving, updating, and deleting scan session
 along with adding and removing equipment from sessions.
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.v1.decorators import typed_delete, typed_get, typed_post, typed_put
@@ -18,6 +19,8 @@ from backend.schemas.scan_session import (
     ScanSessionCreate,
     ScanSessionResponse,
     ScanSessionUpdate,
+    StockTakeResult,
+    StockTakeSummary,
 )
 from backend.services import ScanSessionService
 
@@ -142,6 +145,105 @@ async def get_scan_session(
     return ScanSessionResponse.model_validate(session, from_attributes=True)
 
 
+@typed_get(
+    scan_sessions_router,
+    '/{session_id}/stock-take',
+    response_model=StockTakeSummary,
+    summary='Get stock-take summary for scan session',
+)
+async def get_stock_take_summary(
+    session_id: int,
+    category_id: Optional[int] = Query(None, description='Limit audit to category'),
+    refresh: bool = Query(
+        False,
+        description='Ignore cached report, e.g. after booking or status changes',
+    ),
+    service: ScanSessionService = Depends(get_service),
+) -> StockTakeSummary:
+    """Reconcile a scan session and return the counters only.
+
+    Args:
+        session_id: Scan session ID
+        category_id: Optional category to limit the audit to its subtree
+        refresh: Recompute the report even if a cached copy exists
+        service: Scan session service
+
+    Returns:
+        StockTakeSummary: Number of present, missing, unexpected, booked and
+            rented items
+
+    Raises:
+        NotFoundError: If scan session not found
+    """
+    summary = await service.get_stock_take_summary(
+        session_id, category_id=category_id, refresh=refresh
+    )
+    if summary is None:
+        raise NotFoundError(f'Scan session with ID {session_id} not found')
+    return summary
+
+
+@scan_sessions_router.get(
+    '/{session_id}/stock-take/report',
+    response_class=StreamingResponse,
+    summary='Stream stock-take report for scan session',
+)
+async def stream_stock_take_report(
+    session_id: int,
+    category_id: Optional[int] = Query(None, description='Limit audit to category'),
+    result: Optional[List[StockTakeResult]] = Query(
+        None, description='Only include items with these results'
+    ),
+    refresh: bool = Query(
+        False,
+        description='Ignore cached report, e.g. after booking or status changes',
+    ),
+    service: ScanSessionService = Depends(get_service),
+) -> StreamingResponse:
+    """Stream a stock-take report as newline-delimited JSON.
+
+    The first line is the summary, every following line is one item. Items
+    are streamed from the database or the cache without loading the whole
+    report.
+
+    Args:
+        session_id: Scan session ID
+        category_id: Optional category to limit the audit to its subtree
+        result: Optional result filter
+        refresh: Recompute the report even if a cached copy exists
+        service: Scan session service
+
+    Returns:
+        StreamingResponse: NDJSON report
+
+    Raises:
+        NotFoundError: If scan session not found
+    """
+    stock_take = await service.stream_stock_take(
+        session_id, category_id=category_id, refresh=refresh
+    )
+    if stock_take is None:
+        raise NotFoundError(f'Scan session with ID {session_id} not found')
+    summary, items = stock_take
+    wanted = set(result) if result else None
+
+    async def generate() -> AsyncIterator[str]:
+        yield summary.model_dump_json() + '\n'
+        async for item in items:
+            if wanted is None or item.result in wanted:
+                yield item.model_dump_json() + '\n'
+
+    return StreamingResponse(
+        generate(),
+        media_type='application/x-ndjson',
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="stock_take_{session_id}.ndjson"'
+            )
+        },
+    )
+
+
 @typed_put(
     scan_sessions_router,
     '/{session_id}',
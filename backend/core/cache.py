@@ -1,11 +1,13 @@
 """Redis cache initialization module."""
 
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
+from loguru import logger
 from redis.asyncio import ConnectionPool, Redis
 from redis.exceptions import ConnectionError, RedisError
 
 from backend.core.config import settings
+from backend.core.metrics import record_cache_lookup
 
 # Create Redis connection pool and client
 # Using decode_responses=True, so we work with str values
@@ -72,3 +74,168 @@ async def close_redis() -> None:
         except RedisError:
             # Ignore errors during shutdown
             pass
+
+
+def make_cache_key(*parts: object) -> str:
+    """Build a namespaced cache key.
+
+    Args:
+        *parts: Key components, joined with ':'
+
+    Returns:
+        str: Cache key prefixed with the application namespace
+    """
+    return ':'.join([settings.CACHE_KEY_PREFIX, *(str(part) for part in parts)])
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """Get a cached value.
+
+    Cache failures are never fatal: if Redis is not initialized or the call
+    fails, the lookup is treated as a miss.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Optional[str]: Cached value or None on miss
+    """
+    if redis is None:
+        return None
+    try:
+        value = await redis.get(key)
+    except RedisError as e:
+        logger.warning('Cache get failed for {}: {}', key, str(e))
+        return None
+    record_cache_lookup(value is not None)
+    return value
+
+
+async def cache_set(key: str, value: str, ttl: int) -> None:
+    """Store a value in the cache.
+
+    Args:
+        key: Cache key
+        value: Value to store
+        ttl: Time to live in seconds
+    """
+    if redis is None:
+        return
+    try:
+        await redis.set(key, value, ex=ttl)
+    except RedisError as e:
+        logger.warning('Cache set failed for {}: {}', key, str(e))
+
+
+async def cache_delete(*keys: str) -> None:
+    """Remove values from the cache.
+
+    Args:
+        *keys: Cache keys to remove
+    """
+    if redis is None or not keys:
+        return
+    try:
+        await redis.delete(*keys)
+    except RedisError as e:
+        logger.warning('Cache delete failed for {}: {}', keys, str(e))
+
+
+async def cache_get_many(keys: Sequence[str]) -> Optional[List[Optional[str]]]:
+    """Get several plain values in a single round trip.
+
+    Unlike :func:`cache_get`, an unavailable cache is told apart from
+    missing keys, for callers that must not fall back to defaults then.
+
+    Args:
+        keys: Cache keys
+
+    Returns:
+        Optional[List[Optional[str]]]: Values in key order, None for missing
+            keys; None if the cache is unavailable
+    """
+    if redis is None:
+        return None
+    if not keys:
+        return []
+    try:
+        values: List[Optional[str]] = await redis.mget(keys)
+    except RedisError as e:
+        logger.warning('Cache mget failed for {} keys: {}', len(keys), str(e))
+        return None
+    return values
+
+
+async def cache_incr_many(keys: Sequence[str]) -> Optional[List[int]]:
+    """Increment several counters in a single round trip.
+
+    Counters are created at zero and never expire.
+
+    Args:
+        keys: Counter keys
+
+    Returns:
+        Optional[List[int]]: New values in key order; None if the cache is
+            unavailable
+    """
+    if redis is None:
+        return None
+    if not keys:
+        return []
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+            values: List[int] = await pipe.execute()
+    except RedisError as e:
+        logger.warning('Cache incr failed for {} keys: {}', len(keys), str(e))
+        return None
+    return values
+
+
+async def cache_hget_many(keys: Sequence[str], field: str) -> List[Optional[str]]:
+    """Get one field of several cached hashes in a single round trip.
+
+    Args:
+        keys: Hash keys
+        field: Hash field
+
+    Returns:
+        List[Optional[str]]: Cached values in key order, None on miss
+    """
+    if redis is None or not keys:
+        return [None] * len(keys)
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hget(key, field)
+            values: List[Optional[str]] = await pipe.execute()
+    except RedisError as e:
+        logger.warning('Cache hget failed for {} keys: {}', len(keys), str(e))
+        return [None] * len(keys)
+    for value in values:
+        record_cache_lookup(value is not None)
+    return values
+
+
+async def cache_hset_many(values: Dict[str, str], field: str, ttl: int) -> None:
+    """Store one field of several hashes.
+
+    The time to live applies to whole hashes, so removing a hash with
+    :func:`cache_delete` drops every field stored in it.
+
+    Args:
+        values: Field values by hash key
+        field: Hash field
+        ttl: Time to live of the hashes in seconds
+    """
+    if redis is None or not values:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.hset(key, field, value)
+                pipe.expire(key, ttl)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning('Cache hset failed for {} keys: {}', len(values), str(e))
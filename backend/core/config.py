@@ -43,6 +43,17 @@ class Settings(BaseSettings):
     ALLOWED_HOSTS: str = os.environ.get('ALLOWED_HOSTS', 'localhost,127.0.0.1')
     WORKERS_COUNT: int = int(os.environ.get('WORKERS_COUNT', '1'))
     LOG_LEVEL: str = os.environ.get('LOG_LEVEL', 'info')
+    # Write logs from a background thread instead of the request path
+    LOG_ENQUEUE: bool = os.environ.get('LOG_ENQUEUE', 'true').lower() in (
+        'true',
+        '1',
+        't',
+    )
+    # Emit console logs as JSON lines
+    LOG_JSON: bool = os.environ.get('LOG_JSON', 'false').lower() in ('true', '1', 't')
+    # Share of debug records kept per logger prefix, e.g.
+    # 'backend.api.v1.endpoints.bookings=0.01,backend.repositories=0.1'
+    LOG_SAMPLING: str = os.environ.get('LOG_SAMPLING', '')
 
     # API Documentation
     API_V1_STR: str = '/api/v1'
@@ -62,6 +73,25 @@ class Settings(BaseSettings):
         os.environ.get('POSTGRES_PASSWORD', DEFAULT_DB_PASS),
         description='Database password should never be empty',
     )
+    # Optional read replica for list, search and reporting queries
+    DATABASE_REPLICA_URL: str = os.environ.get('DATABASE_REPLICA_URL', '')
+    # 0 means WORKERS_COUNT * 2
+    DB_POOL_SIZE: int = int(os.environ.get('DB_POOL_SIZE', '0'))
+    DB_MAX_OVERFLOW: int = int(os.environ.get('DB_MAX_OVERFLOW', '10'))
+    DB_POOL_TIMEOUT: float = float(os.environ.get('DB_POOL_TIMEOUT', '30'))
+    DB_POOL_RECYCLE: int = int(os.environ.get('DB_POOL_RECYCLE', '3600'))
+    DB_POOL_PRE_PING: bool = os.environ.get('DB_POOL_PRE_PING', 'true').lower() in (
+        'true',
+        '1',
+        't',
+    )
+    DB_ECHO: bool = os.environ.get(
+        'DB_ECHO', os.environ.get('DEBUG', 'true')
+    ).lower() in ('true', '1', 't')
+    # Prepared statement cache per connection, set to 0 behind pgbouncer
+    DB_STATEMENT_CACHE_SIZE: int = int(os.environ.get('DB_STATEMENT_CACHE_SIZE', '100'))
+    # Server-side statement_timeout in milliseconds, 0 disables it
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', '0'))
 
     # Redis
     REDIS_HOST: str = os.environ.get('REDIS_HOST', 'localhost')
@@ -69,6 +99,83 @@ class Settings(BaseSettings):
     REDIS_DB: int = int(os.environ.get('REDIS_DB', '0'))
     REDIS_PASSWORD: str = os.environ.get('REDIS_PASSWORD', '')
 
+    # Cache
+    CACHE_KEY_PREFIX: str = os.environ.get('CACHE_KEY_PREFIX', 'act-rental')
+    # Keyed by scan session revision; booking and equipment status changes
+    # are only reflected once cached stock-takes expire
+    STOCK_TAKE_CACHE_TTL: int = int(os.environ.get('STOCK_TAKE_CACHE_TTL', '600'))
+    DASHBOARD_CACHE_TTL: int = int(os.environ.get('DASHBOARD_CACHE_TTL', '60'))
+    TIMELINE_CACHE_TTL: int = int(os.environ.get('TIMELINE_CACHE_TTL', '3600'))
+    # In-process category tree; bounds staleness after writes in other workers
+    CATEGORY_TREE_CACHE_TTL: int = int(os.environ.get('CATEGORY_TREE_CACHE_TTL', '300'))
+
+    # Reports
+    REPORTS_REFRESH_INTERVAL_MINUTES: int = int(
+        os.environ.get('REPORTS_REFRESH_INTERVAL_MINUTES', '15')
+    )
+    REPORTS_DEFAULT_PERIOD_DAYS: int = int(
+        os.environ.get('REPORTS_DEFAULT_PERIOD_DAYS', '30')
+    )
+
+    # Exports
+    EXPORT_BATCH_SIZE: int = int(os.environ.get('EXPORT_BATCH_SIZE', '1000'))
+
+    # Barcode rendering
+    BARCODE_RENDER_WORKERS: int = int(os.environ.get('BARCODE_RENDER_WORKERS', '2'))
+    BARCODE_RENDER_QUEUE_LIMIT: int = int(
+        os.environ.get('BARCODE_RENDER_QUEUE_LIMIT', '32')
+    )
+    BARCODE_NATIVE_CODE128: bool = os.environ.get(
+        'BARCODE_NATIVE_CODE128', 'true'
+    ).lower() in ('true', '1', 't')
+
+    # Diagnostics
+    METRICS_ENABLED: bool = os.environ.get('METRICS_ENABLED', 'true').lower() in (
+        'true',
+        '1',
+        't',
+    )
+    QUERY_COUNTER_ENABLED: bool = os.environ.get(
+        'QUERY_COUNTER_ENABLED', 'true'
+    ).lower() in ('true', '1', 't')
+    QUERY_COUNT_THRESHOLD: int = int(os.environ.get('QUERY_COUNT_THRESHOLD', '50'))
+    QUERY_DUPLICATE_THRESHOLD: int = int(
+        os.environ.get('QUERY_DUPLICATE_THRESHOLD', '10')
+    )
+    SLOW_QUERY_LOG_ENABLED: bool = os.environ.get(
+        'SLOW_QUERY_LOG_ENABLED', 'true'
+    ).lower() in ('true', '1', 't')
+    SLOW_QUERY_THRESHOLD_MS: float = float(
+        os.environ.get('SLOW_QUERY_THRESHOLD_MS', '200')
+    )
+    # Capture EXPLAIN (ANALYZE, BUFFERS) of slow SELECT statements, which
+    # runs them again; off by default in production
+    SLOW_QUERY_EXPLAIN: bool = os.environ.get(
+        'SLOW_QUERY_EXPLAIN',
+        str(os.environ.get('ENVIRONMENT', 'development') != 'production'),
+    ).lower() in ('true', '1', 't')
+    SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = int(
+        os.environ.get('SLOW_QUERY_EXPLAIN_TIMEOUT_MS', '5000')
+    )
+    SLOW_QUERY_EXPLAIN_LOCK_TIMEOUT_MS: int = int(
+        os.environ.get('SLOW_QUERY_EXPLAIN_LOCK_TIMEOUT_MS', '100')
+    )
+    SLOW_QUERY_MAX_FINGERPRINTS: int = int(
+        os.environ.get('SLOW_QUERY_MAX_FINGERPRINTS', '500')
+    )
+    READINESS_CACHE_TTL: float = float(os.environ.get('READINESS_CACHE_TTL', '2'))
+    READINESS_CHECK_TIMEOUT: float = float(
+        os.environ.get('READINESS_CHECK_TIMEOUT', '2')
+    )
+    READINESS_MAX_POOL_SATURATION: float = float(
+        os.environ.get('READINESS_MAX_POOL_SATURATION', '1.0')
+    )
+    # Token required by diagnostics endpoints, empty disables them
+    DIAGNOSTICS_TOKEN: str = os.environ.get('DIAGNOSTICS_TOKEN', '')
+    PROFILE_MAX_SECONDS: float = float(os.environ.get('PROFILE_MAX_SECONDS', '30'))
+    # Number of per-request profiles kept in memory
+    PROFILE_STORE_SIZE: int = int(os.environ.get('PROFILE_STORE_SIZE', '20'))
+
     # Security
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
         os.environ.get('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
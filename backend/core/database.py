@@ -5,11 +5,22 @@ including async session creation and dependency injection for FastAPI.
 """
 
 import os
-from typing import AsyncGenerator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterator, Optional, TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
 
 from backend.core.config import settings
+from backend.core.query_counter import install_query_counter
+from backend.core.slow_query_log import install_slow_query_log
 
 POSTGRES_USER = os.environ.get('POSTGRES_USER', settings.POSTGRES_USER)
 POSTGRES_PASSWORD = os.environ.get('POSTGRES_PASSWORD', settings.POSTGRES_PASSWORD)
@@ -35,20 +46,133 @@ SYNC_DATABASE_URL = (
 settings.__dict__['SYNC_DATABASE_URL'] = SYNC_DATABASE_URL
 settings.__dict__['DATABASE_URL'] = DATABASE_URL
 
-# Create async engine with optimized settings
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=settings.WORKERS_COUNT * 2,
-    max_overflow=10,
-    pool_recycle=3600,
+
+def create_engine_from_settings(url: str) -> AsyncEngine:
+    """Create an async engine configured from settings.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        AsyncEngine: Configured engine
+    """
+    connect_args: dict[str, Any] = {
+        # asyncpg statement cache and SQLAlchemy prepared statement cache
+        'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+        'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        connect_args['server_settings'] = {
+            'statement_timeout': str(settings.DB_STATEMENT_TIMEOUT_MS)
+        }
+
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_POOL_SIZE or settings.WORKERS_COUNT * 2,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=connect_args,
+    )
+
+
+# Primary engine, used for all writes
+engine = create_engine_from_settings(DATABASE_URL)
+
+# Optional read replica engine
+replica_engine: Optional[AsyncEngine] = (
+    create_engine_from_settings(settings.DATABASE_REPLICA_URL)
+    if settings.DATABASE_REPLICA_URL
+    else None
 )
 
+if settings.QUERY_COUNTER_ENABLED:
+    install_query_counter(engine)
+    if replica_engine is not None:
+        install_query_counter(replica_engine)
+
+if settings.SLOW_QUERY_LOG_ENABLED:
+    install_slow_query_log(engine)
+    if replica_engine is not None:
+        install_slow_query_log(replica_engine)
+
+_use_replica: ContextVar[bool] = ContextVar('use_replica', default=False)
+
+F = TypeVar('F', bound=Callable[..., Awaitable[Any]])
+
+
+class RoutingSession(Session):
+    """Session routing read-only statements to the replica.
+
+    Statements run inside :func:`use_replica` (or a method decorated with
+    :func:`read_only`) go to the replica engine when one is configured.
+    Once the current transaction has used the primary, reads stay on the
+    primary until it ends, so they see the transaction's own writes.
+    Flushes and everything else use the session's own bind.
+    """
+
+    def get_bind(self, mapper: Any = None, **kw: Any) -> Any:
+        """Select the engine for a statement."""
+        bind = super().get_bind(mapper, **kw)
+        if (
+            replica_engine is not None
+            and _use_replica.get()
+            and not self._flushing
+            and not self._uses_connection(bind)
+        ):
+            return replica_engine.sync_engine
+        return bind
+
+    def _uses_connection(self, bind: Any) -> bool:
+        """Check whether the current transaction holds a connection of a bind."""
+        transaction = self.get_transaction()
+        # Connections are shared by the root transaction and its savepoints
+        return transaction is not None and bind in transaction._connections
+
+
+@contextmanager
+def use_replica() -> Iterator[None]:
+    """Route reads executed within the block to the read replica."""
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def read_only(func: F) -> F:
+    """Mark an async repository method as safe to serve from the replica.
+
+    Args:
+        func: Async function that only reads data
+
+    Returns:
+        Wrapped function executed within :func:`use_replica`
+    """
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with use_replica():
+            return await func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+# Session factory bound to the replica, falls back to the primary
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=replica_engine or engine,
+    class_=AsyncSession,
     expire_on_commit=False,
     autoflush=False,
 )
@@ -76,3 +200,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only database session.
+
+    Uses the read replica when ``DATABASE_REPLICA_URL`` is set, otherwise
+    the primary database. Intended for list, export and reporting
+    endpoints that never write.
+
+    Yields:
+        AsyncSession: Database session
+    """
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -0,0 +1,330 @@
+"""Streaming export module.
+
+This module turns an async iterator of rows into CSV or XLSX bytes that are
+sent while rows are still being read from the database, so memory use does
+not depend on the number of exported rows.
+
+XLSX files are written with the standard library: a minimal workbook with
+one sheet is zipped into an unseekable buffer that is drained after every
+batch of rows.
+"""
+
+import csv
+import enum
+import io
+import re
+import zipfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+from backend.core.timezone_utils import MOSCOW_TZ
+
+# Number of rows written between two flushes to the client
+EXPORT_FLUSH_ROWS = 500
+
+# Characters that are not allowed in XML 1.0 documents
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class ExportFormat(str, enum.Enum):
+    """Export file format."""
+
+    CSV = 'csv'
+    XLSX = 'xlsx'
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: 'text/csv; charset=utf-8',
+    ExportFormat.XLSX: (
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """Exported column.
+
+    Attributes:
+        header: Column title in the first row
+        value: Function extracting the cell value from an exported object
+    """
+
+    header: str
+    value: Callable[[Any], Any]
+
+
+def format_cell(value: Any) -> Any:
+    """Convert a value to a plain cell value.
+
+    Numbers are kept as numbers, dates are rendered in the business
+    timezone, enums by their value and None as an empty string.
+
+    Args:
+        value: Raw value
+
+    Returns:
+        str, int, float or Decimal cell value
+    """
+    if value is None:
+        return ''
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(MOSCOW_TZ)
+        return value.strftime('%d.%m.%Y %H:%M')
+    if isinstance(value, date):
+        return value.strftime('%d.%m.%Y')
+    if isinstance(value, bool):
+        return 'да' if value else 'нет'
+    if isinstance(value, (int, float, Decimal)):
+        return value
+    return str(value)
+
+
+async def iter_csv(
+    headers: Sequence[str], rows: AsyncIterator[Sequence[Any]]
+) -> AsyncIterator[bytes]:
+    """Encode rows as UTF-8 CSV.
+
+    The output starts with a byte order mark so spreadsheet applications
+    detect the encoding.
+
+    Args:
+        headers: Column titles
+        rows: Rows of cell values
+
+    Yields:
+        bytes: CSV chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    yield ('\ufeff' + buffer.getvalue()).encode('utf-8')
+    buffer.seek(0)
+    buffer.truncate()
+
+    pending = 0
+    async for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= EXPORT_FLUSH_ROWS:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+class _ChunkWriter(io.RawIOBase):
+    """Unseekable binary sink collecting written bytes until drained."""
+
+    def __init__(self) -> None:
+        """Initialize writer."""
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        """Report that the stream is writable."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Collect written bytes.
+
+        Args:
+            data: Bytes-like object
+
+        Returns:
+            int: Number of bytes written
+        """
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and forget collected bytes.
+
+        Returns:
+            bytes: Bytes written since the previous call
+        """
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships '
+    'xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook '
+    'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships '
+    'xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+_XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData>'
+)
+
+_XLSX_SHEET_END = '</sheetData></worksheet>'
+
+
+def _column_letter(index: int) -> str:
+    """Get spreadsheet column letter for a zero-based column index.
+
+    Args:
+        index: Zero-based column index
+
+    Returns:
+        str: Column letters, e.g. 'A', 'Z', 'AA'
+    """
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _xlsx_row(number: int, values: Iterable[Any]) -> str:
+    """Render one worksheet row.
+
+    Args:
+        number: One-based row number
+        values: Cell values
+
+    Returns:
+        str: ``<row>`` element
+    """
+    cells = []
+    for index, value in enumerate(values):
+        ref = f'{_column_letter(index)}{number}'
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+        elif value == '' or value is None:
+            continue
+        else:
+            text = escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+            cells.append(
+                f'<c r="{ref}" t="inlineStr"><is>'
+                f'<t xml:space="preserve">{text}</t></is></c>'
+            )
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+async def iter_xlsx(
+    headers: Sequence[str],
+    rows: AsyncIterator[Sequence[Any]],
+    sheet_name: str = 'Export',
+) -> AsyncIterator[bytes]:
+    """Encode rows as an XLSX workbook with a single sheet.
+
+    Args:
+        headers: Column titles
+        rows: Rows of cell values
+        sheet_name: Worksheet name
+
+    Yields:
+        bytes: Chunks of the zipped workbook
+    """
+    sink = _ChunkWriter()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+        archive.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+        archive.writestr(
+            'xl/workbook.xml',
+            _XLSX_WORKBOOK.format(name=escape(sheet_name[:31], {'"': '&quot;'})),
+        )
+        archive.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(_XLSX_SHEET_START.encode('utf-8'))
+            sheet.write(_xlsx_row(1, headers).encode('utf-8'))
+            number = 1
+            async for row in rows:
+                number += 1
+                sheet.write(_xlsx_row(number, row).encode('utf-8'))
+                if number % EXPORT_FLUSH_ROWS == 0:
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+            sheet.write(_XLSX_SHEET_END.encode('utf-8'))
+
+    yield sink.drain()
+
+
+def export_response(
+    columns: Sequence[ExportColumn],
+    rows: AsyncIterator[Sequence[Any]],
+    export_format: ExportFormat,
+    filename: str,
+    background: Optional[BackgroundTask] = None,
+) -> StreamingResponse:
+    """Build a streaming download response.
+
+    Args:
+        columns: Exported columns, used for the header row
+        rows: Rows of cell values
+        export_format: Output format
+        filename: File name without extension
+        background: Task run after the response is sent, e.g. closing the
+            database session the rows are read from
+
+    Returns:
+        StreamingResponse: Response streaming the file
+    """
+    headers = [column.header for column in columns]
+    if export_format == ExportFormat.XLSX:
+        content = iter_xlsx(headers, rows, sheet_name=filename)
+    else:
+        content = iter_csv(headers, rows)
+
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        },
+        background=background,
+    )
@@ -0,0 +1,183 @@
+"""Readiness probe module.
+
+This module checks the dependencies a worker needs to serve traffic: the
+database (``SELECT 1``), Redis (``PING``) and free capacity in the database
+connection pool. Results are cached for a short window so that frequent
+orchestrator probes do not add load themselves.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from redis.asyncio import Redis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.core.config import settings
+from backend.schemas.health import HealthCheckResult, PoolStatus, ReadinessResponse
+
+_cached: Optional[Tuple[float, ReadinessResponse]] = None
+_lock = asyncio.Lock()
+
+
+async def _timed_check(check: Callable[[], Awaitable[Any]]) -> HealthCheckResult:
+    """Run a check with timeout and measure its latency.
+
+    Args:
+        check: Coroutine function performing the check
+
+    Returns:
+        HealthCheckResult: Check outcome
+    """
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(check(), timeout=settings.READINESS_CHECK_TIMEOUT)
+    except asyncio.TimeoutError:
+        return HealthCheckResult(
+            healthy=False,
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
+            detail=f'Timed out after {settings.READINESS_CHECK_TIMEOUT}s',
+        )
+    except Exception as e:
+        return HealthCheckResult(
+            healthy=False,
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
+            detail=str(e),
+        )
+    return HealthCheckResult(
+        healthy=True, latency_ms=round((time.perf_counter() - started) * 1000, 2)
+    )
+
+
+def get_pool_status(engine: AsyncEngine) -> Optional[PoolStatus]:
+    """Get connection pool usage.
+
+    Args:
+        engine: Async engine to inspect
+
+    Returns:
+        Optional[PoolStatus]: Pool usage, None for pools without a size limit
+    """
+    pool: Any = engine.sync_engine.pool
+    if not hasattr(pool, 'checkedout') or not hasattr(pool, '_max_overflow'):
+        return None
+
+    size = pool.size()
+    checked_out = pool.checkedout()
+    max_overflow = max(pool._max_overflow, 0)
+    max_connections = size + max_overflow
+    return PoolStatus(
+        size=size,
+        checked_out=checked_out,
+        overflow=max(pool.overflow(), 0),
+        max_connections=max_connections,
+        saturation=round(checked_out / max_connections, 3) if max_connections else 0,
+    )
+
+
+def get_scheduler_state(scheduler: Any) -> str:
+    """Describe scheduler state.
+
+    Args:
+        scheduler: APScheduler instance or None when not configured
+
+    Returns:
+        str: 'running', 'stopped' or 'disabled'
+    """
+    if scheduler is None:
+        return 'disabled'
+    return 'running' if scheduler.running else 'stopped'
+
+
+def _get_cached() -> Optional[ReadinessResponse]:
+    """Get the last readiness result if it is still fresh."""
+    if _cached is None:
+        return None
+    checked_at, response = _cached
+    if time.monotonic() - checked_at >= settings.READINESS_CACHE_TTL:
+        return None
+    return response.model_copy(update={'cached': True})
+
+
+async def check_readiness(
+    engine: AsyncEngine,
+    redis: Optional[Redis],
+    scheduler: Any = None,
+    use_cache: bool = True,
+) -> ReadinessResponse:
+    """Check whether the worker can serve traffic.
+
+    Concurrent probes share a single in-flight check, and the result is
+    reused for ``READINESS_CACHE_TTL`` seconds.
+
+    Args:
+        engine: Async engine to check
+        redis: Redis client, None if Redis is not initialized
+        scheduler: Optional APScheduler instance
+        use_cache: Reuse a recent result if available
+
+    Returns:
+        ReadinessResponse: Readiness report
+    """
+    global _cached
+    cached = _get_cached() if use_cache else None
+    if cached is not None:
+        return cached
+
+    async with _lock:
+        # Another probe may have refreshed the result while we were waiting
+        cached = _get_cached() if use_cache else None
+        if cached is not None:
+            return cached
+
+        response = await _run_checks(engine, redis, scheduler)
+        _cached = (time.monotonic(), response)
+        return response
+
+
+async def _run_checks(
+    engine: AsyncEngine, redis: Optional[Redis], scheduler: Any
+) -> ReadinessResponse:
+    """Run all readiness checks.
+
+    Args:
+        engine: Async engine to check
+        redis: Redis client, None if Redis is not initialized
+        scheduler: Optional APScheduler instance
+
+    Returns:
+        ReadinessResponse: Readiness report
+    """
+
+    async def check_database() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+
+    async def check_redis() -> None:
+        if redis is None:
+            raise RuntimeError('Redis is not initialized')
+        await redis.ping()
+
+    database, cache = await asyncio.gather(
+        _timed_check(check_database), _timed_check(check_redis)
+    )
+    checks = {'database': database, 'redis': cache}
+
+    pool = get_pool_status(engine)
+    if pool is not None:
+        pool_healthy = pool.saturation < settings.READINESS_MAX_POOL_SATURATION
+        checks['pool'] = HealthCheckResult(
+            healthy=pool_healthy,
+            detail=None if pool_healthy else 'Connection pool is exhausted',
+        )
+
+    ready = all(check.healthy for check in checks.values())
+    return ReadinessResponse(
+        status='ready' if ready else 'unavailable',
+        checked_at=datetime.now(timezone.utc),
+        checks=checks,
+        pool=pool,
+        scheduler=get_scheduler_state(scheduler),
+    )
@@ -5,17 +5,38 @@ Loguru. It includes a custom logging configuration, an interceptor for standard
 Python logging, and utilities for setting up the logging system.
 """
 
+import itertools
 import logging
 import sys
 import types
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Iterator, Union
 
 from loguru import logger
 from pydantic import BaseModel
 
 from backend.core.config import settings
 
+# Attributes every LogRecord has; anything else was passed as ``extra``
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {
+    'message',
+    'asctime',
+}
+
+# Request lines of static files and frequent endpoints skipped in testing
+_TESTING_SKIPPED_REQUESTS = (
+    'GET /css/',
+    'GET /js/',
+    'GET /static/',
+    'GET /api/v1/health',
+    'GET /api/v1/equipment',
+    'GET /api/v1/categories',
+)
+
+# Lowest level accepted by the configured sinks; records of standard
+# logging below it are dropped before they are formatted
+_min_level_no = logging.NOTSET
+
 
 class LogConfig(BaseModel):
     """Logging configuration for the application.
@@ -176,38 +197,18 @@ class InterceptHandler(logging.Handler):
         """
         try:
             extra = {}
-            if hasattr(record, '__dict__'):
-                for key, value in record.__dict__.items():
-                    if not key.startswith('_') and key not in {
-                        'args',
-                        'asctime',
-                        'created',
-                        'exc_info',
-                        'exc_text',
-                        'filename',
-                        'levelname',
-                        'levelno',
-                        'msecs',
-                        'msg',
-                        'name',
-                        'pathname',
-                        'process',
-                        'processName',
-                        'relativeCreated',
-                        'thread',
-                        'threadName',
-                        'funcName',
-                        'lineno',
-                        'module',
-                    }:
-                        try:
-                            # Attempt to serialize the value
-                            if isinstance(value, (str, int, float, bool, type(None))):
-                                extra[key] = value
-                            else:
-                                extra[key] = str(value)
-                        except Exception:
-                            extra[key] = '<non-serializable>'
+            for key in record.__dict__.keys() - _RECORD_ATTRIBUTES:
+                if key.startswith('_'):
+                    continue
+                value = record.__dict__[key]
+                try:
+                    # Attempt to serialize the value
+                    if isinstance(value, (str, int, float, bool, type(None))):
+                        extra[key] = value
+                    else:
+                        extra[key] = str(value)
+                except Exception:
+                    extra[key] = '<non-serializable>'
             return extra
         except Exception:
             return {}
@@ -218,44 +219,35 @@ class InterceptHandler(logging.Handler):
         Args:
             record: The logging record to process
         """
-        # Skip uvicorn access logs timestamp
         try:
-            # Skip more verbose logs in testing environment
-            if settings.ENVIRONMENT == 'testing':
-                # Skip all uvicorn access logs in testing
-                if record.name == 'uvicorn.access':
-                    return
-
-                # Skip HTTP request logs for static files and common API endpoints
-                if hasattr(record, 'getMessage'):
-                    msg = record.getMessage()
-                    if any(
-                        pattern in msg
-                        for pattern in [
-                            'GET /css/',
-                            'GET /js/',
-                            'GET /static/',
-                            'GET /api/v1/health',
-                            'GET /api/v1/equipment',
-                            'GET /api/v1/categories',
-                        ]
-                    ):
-                        return
-
-            # Original filtering logic
-            if record.name == 'uvicorn.access' and record.getMessage().startswith('20'):
+            # Drop records no sink accepts before doing any work on them
+            if record.levelno < _min_level_no:
                 return
 
-            # Get level and find caller
-            level = self._get_level(record)
-            frame, depth = self._get_frame_depth()
+            # Skip all uvicorn access logs in testing
+            if settings.ENVIRONMENT == 'testing' and record.name == 'uvicorn.access':
+                return
 
-            # Get message safely
+            # Get message safely, formatting it only once
             try:
                 message = record.getMessage()
             except Exception:
                 message = str(record.msg)
 
+            # Skip HTTP request logs for static files and common API endpoints
+            if settings.ENVIRONMENT == 'testing' and any(
+                pattern in message for pattern in _TESTING_SKIPPED_REQUESTS
+            ):
+                return
+
+            # Skip uvicorn access logs timestamp
+            if record.name == 'uvicorn.access' and message.startswith('20'):
+                return
+
+            # Get level and find caller
+            level = self._get_level(record)
+            frame, depth = self._get_frame_depth()
+
             # Extract base attributes with safe defaults
             name = self._safe_get_attribute(record, 'name', 'unknown')
             function = self._safe_get_attribute(record, 'funcName', 'unknown')
@@ -356,6 +348,104 @@ def should_log(record: Any) -> bool:
         return True  # If filtering fails, allow the log
 
 
+def parse_sampling_rates(value: str) -> Dict[str, float]:
+    """Parse per-logger sampling rates.
+
+    Args:
+        value: Comma separated ``logger_prefix=rate`` pairs
+
+    Returns:
+        Dict[str, float]: Share of kept debug records by logger prefix
+
+    Raises:
+        ValueError: If a rate is not a number between 0 and 1
+    """
+    rates = {}
+    for item in value.split(','):
+        if not item.strip():
+            continue
+        prefix, _, rate = item.partition('=')
+        try:
+            share = float(rate)
+        except ValueError:
+            share = -1.0
+        if not prefix.strip() or not 0 <= share <= 1:
+            raise ValueError(f'Invalid log sampling rate: {item.strip()}')
+        rates[prefix.strip()] = share
+    return rates
+
+
+class LogSampler:
+    """Keep a share of debug records of hot loggers.
+
+    Every n-th debug record of a logger is kept, n following from the rate
+    of the longest matching logger prefix. Records above DEBUG and loggers
+    without a rate are never sampled.
+    """
+
+    def __init__(self, rates: Dict[str, float]) -> None:
+        """Initialize sampler.
+
+        Args:
+            rates: Share of kept debug records by logger prefix
+        """
+        self.rates = rates
+        self._intervals: Dict[str, int] = {}
+        self._counters: Dict[str, Iterator[int]] = {}
+
+    def _interval(self, name: str) -> int:
+        """Get the sampling interval of a logger, 0 dropping all records."""
+        matches = [
+            prefix
+            for prefix in self.rates
+            if name == prefix or name.startswith(f'{prefix}.')
+        ]
+        if not matches:
+            return 1
+        rate = self.rates[max(matches, key=len)]
+        return round(1 / rate) if rate else 0
+
+    def keep(self, record: Any) -> bool:
+        """Check whether a record passes sampling.
+
+        Args:
+            record: Loguru record
+
+        Returns:
+            bool: True if the record should be written
+        """
+        if record['level'].no > logging.DEBUG:
+            return True
+        name = record['name'] or ''
+        interval = self._intervals.get(name)
+        if interval is None:
+            interval = self._intervals[name] = self._interval(name)
+            self._counters[name] = itertools.count()
+        if interval <= 1:
+            return interval == 1
+        return next(self._counters[name]) % interval == 0
+
+
+def build_log_filter(sampling: str) -> Callable[[Any], bool]:
+    """Build the record filter of the log sinks.
+
+    Args:
+        sampling: Per-logger sampling rates, see :func:`parse_sampling_rates`
+
+    Returns:
+        Callable[[Any], bool]: Filter accepting records to write
+    """
+    rates = parse_sampling_rates(sampling)
+    if not rates:
+        return should_log
+    sampler = LogSampler(rates)
+
+    def log_filter(record: Any) -> bool:
+        return sampler.keep(record) and should_log(record)
+
+    return log_filter
+
+
 def setup_logging_intercept() -> None:
     """Intercept all standard logging and redirect to loguru."""
     # Remove all existing handlers
@@ -367,7 +457,7 @@ def setup_logging_intercept() -> None:
     # Redirect standard logging to loguru
     logging.basicConfig(
         handlers=[InterceptHandler()],
-        level=0,
+        level=_min_level_no,
         force=True,
         format='%(message)s',  # Remove timestamp from format
     )
@@ -407,10 +497,16 @@ def configure_logging(
     2. Configuring Loguru with the application's logging settings
     3. Setting up log handlers and formatters
 
+    Console records are written from a background thread (``LOG_ENQUEUE``),
+    optionally as JSON lines (``LOG_JSON``), and debug records of hot
+    loggers can be sampled (``LOG_SAMPLING``).
+
     Args:
         sink: Optional log file path
         **kwargs: Additional logging configuration options
     """
+    global _min_level_no
+
     # Create log config instance
     log_config = LogConfig()
 
@@ -421,17 +517,22 @@ def configure_logging(
     log_level = log_config.LOG_LEVEL
     if settings.ENVIRONMENT == 'testing':
         log_level = 'WARNING'
+    _min_level_no = logger.level(log_level).no
+    log_filter = build_log_filter(settings.LOG_SAMPLING)
 
-    # Configure console logging with colors
+    # Configure console logging, with colors unless JSON is requested.
+    # Tests keep writing synchronously to get deterministic output.
     logger.add(
         sys.stderr,
         format=log_config.CONSOLE_FORMAT,
         level=log_level,
-        colorize=True,
+        colorize=not settings.LOG_JSON,
+        serialize=settings.LOG_JSON,
+        enqueue=settings.LOG_ENQUEUE and settings.ENVIRONMENT != 'testing',
         backtrace=True,
         diagnose=True,
         catch=True,
-        filter=should_log,
+        filter=log_filter,
         **kwargs,
     )
 
@@ -452,7 +553,7 @@ def configure_logging(
             diagnose=True,  # Include diagnostic info
             serialize=True,  # Enable JSON serialization
             catch=True,  # Handle exceptions gracefully
-            filter=should_log,
+            filter=log_filter,
             **kwargs,
         )
 
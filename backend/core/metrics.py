@@ -0,0 +1,446 @@
+"""In-process metrics module.
+
+This module implements a small Prometheus-compatible metrics registry
+(counters, gauges and histograms rendered in the text exposition format),
+the HTTP latency middleware and collectors for the database pool and Redis.
+No external service or client library is required.
+"""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from redis.asyncio import ConnectionPool
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text exposition format."""
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label pairs as ``{name="value",...}``."""
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f'{{{pairs}}}'
+
+
+class Metric(ABC):
+    """Base class for metrics."""
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialize metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of labels
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        """Get label values in declaration order.
+
+        Raises:
+            ValueError: If labels do not match declared label names
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f'Metric {self.name} expects labels {self.labelnames}, '
+                f'got {tuple(labels)}'
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float, Sequence[str]]]:
+        """Get samples as (suffix, label values, value, extra label names)."""
+
+    def render(self) -> List[str]:
+        """Render metric in the text exposition format."""
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.type_name}',
+        ]
+        for suffix, values, value, extra_names in self.samples():
+            labels = _format_labels(self.labelnames + tuple(extra_names), values)
+            lines.append(f'{self.name}{suffix}{labels} {_format_value(value)}')
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialize counter."""
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment counter.
+
+        Args:
+            amount: Increment
+            **labels: Label values
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Get current value."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float, Sequence[str]]]:
+        """Get counter samples."""
+        with self._lock:
+            items = list(self._values.items())
+        return [('_total', key, value, ()) for key, value in items]
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialize gauge."""
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set gauge value.
+
+        Args:
+            value: New value
+            **labels: Label values
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment gauge."""
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrement gauge."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        """Get current value."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def clear(self) -> None:
+        """Remove all label combinations."""
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float, Sequence[str]]]:
+        """Get gauge samples."""
+        with self._lock:
+            items = list(self._values.items())
+        return [('', key, value, ()) for key, value in items]
+
+
+class Histogram(Metric):
+    """Cumulative histogram with fixed buckets."""
+
+    type_name = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of labels
+            buckets: Upper bounds of buckets, +Inf is added automatically
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value
+            **labels: Label values
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * len(self.buckets)
+                self._sums[key] = 0.0
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._sums[key] += value
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float, Sequence[str]]]:
+        """Get histogram samples."""
+        with self._lock:
+            items = [(key, list(counts)) for key, counts in self._counts.items()]
+            sums = dict(self._sums)
+        result = []
+        for key, counts in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                result.append(
+                    ('_bucket', key + (_format_value(bound),), cumulative, ('le',))
+                )
+            result.append(('_sum', key, sums[key], ()))
+            result.append(('_count', key, cumulative, ()))
+        return result
+
+
+MetricType = TypeVar('MetricType', bound=Metric)
+
+
+class MetricsRegistry:
+    """Registry of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize registry."""
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: MetricType) -> MetricType:
+        """Register a metric.
+
+        Args:
+            metric: Metric to register
+
+        Returns:
+            Metric: Registered metric
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f'Metric {metric.name} is already registered')
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.register(
+    Counter(
+        'http_requests',
+        'Number of HTTP requests',
+        ('method', 'route', 'status'),
+    )
+)
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        'http_request_duration_seconds',
+        'HTTP request latency',
+        ('method', 'route'),
+    )
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.register(
+    Gauge('http_requests_in_progress', 'HTTP requests being processed')
+)
+DB_POOL_SIZE = registry.register(Gauge('db_pool_size', 'Database pool size'))
+DB_POOL_CHECKED_OUT = registry.register(
+    Gauge('db_pool_checked_out', 'Database connections in use')
+)
+DB_POOL_CHECKED_IN = registry.register(
+    Gauge('db_pool_checked_in', 'Idle database connections in the pool')
+)
+DB_POOL_OVERFLOW = registry.register(
+    Gauge('db_pool_overflow', 'Database connections above pool size')
+)
+REDIS_POOL_CONNECTIONS = registry.register(
+    Gauge('redis_pool_connections', 'Redis pool connections', ('state',))
+)
+CACHE_REQUESTS = registry.register(
+    Counter('cache_requests', 'Cache lookups', ('result',))
+)
+CACHE_HIT_RATIO = registry.register(
+    Gauge('cache_hit_ratio', 'Share of cache lookups served from the cache')
+)
+SCHEDULER_JOB_DURATION = registry.register(
+    Histogram(
+        'scheduler_job_duration_seconds',
+        'Duration of scheduled jobs',
+        ('job', 'status'),
+        buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+    )
+)
+EQUIPMENT_ITEMS = registry.register(
+    Gauge('equipment_items', 'Equipment items by status', ('status',))
+)
+BOOKINGS = registry.register(Gauge('bookings', 'Bookings by status', ('status',)))
+RENDER_QUEUE_DEPTH = registry.register(
+    Gauge('render_queue_depth', 'Render tasks waiting for a worker', ('pool',))
+)
+RENDERS_IN_PROGRESS = registry.register(
+    Gauge('renders_in_progress', 'Render tasks being processed', ('pool',))
+)
+RENDER_DURATION = registry.register(
+    Histogram('render_duration_seconds', 'Duration of render tasks', ('pool',))
+)
+RENDER_REJECTED = registry.register(
+    Counter('render_rejected', 'Render tasks rejected by a full queue', ('pool',))
+)
+
+
+def record_cache_lookup(hit: bool) -> None:
+    """Record a cache lookup result.
+
+    Args:
+        hit: Whether the value was found in the cache
+    """
+    CACHE_REQUESTS.inc(result='hit' if hit else 'miss')
+
+
+def collect_pool_metrics(engine: AsyncEngine) -> None:
+    """Update database pool gauges.
+
+    Args:
+        engine: Async engine to inspect
+    """
+    pool = engine.sync_engine.pool
+    for gauge, attribute in (
+        (DB_POOL_SIZE, 'size'),
+        (DB_POOL_CHECKED_OUT, 'checkedout'),
+        (DB_POOL_CHECKED_IN, 'checkedin'),
+        (DB_POOL_OVERFLOW, 'overflow'),
+    ):
+        getter = getattr(pool, attribute, None)
+        if getter is not None:
+            gauge.set(getter())
+
+
+def collect_redis_metrics(pool: Optional[ConnectionPool]) -> None:
+    """Update Redis pool and cache hit ratio gauges.
+
+    Args:
+        pool: Redis connection pool, None if Redis is not initialized
+    """
+    if pool is not None:
+        available = len(getattr(pool, '_available_connections', []))
+        in_use = len(getattr(pool, '_in_use_connections', []))
+        REDIS_POOL_CONNECTIONS.set(available, state='idle')
+        REDIS_POOL_CONNECTIONS.set(in_use, state='in_use')
+        REDIS_POOL_CONNECTIONS.set(pool.max_connections, state='max')
+
+    hits = CACHE_REQUESTS.get(result='hit')
+    total = hits + CACHE_REQUESTS.get(result='miss')
+    CACHE_HIT_RATIO.set(hits / total if total else 0.0)
+
+
+def set_status_counts(gauge: Gauge, counts: Dict[str, int]) -> None:
+    """Replace per-status gauge values.
+
+    Args:
+        gauge: Gauge labelled by status
+        counts: Count per status
+    """
+    gauge.clear()
+    for status, count in counts.items():
+        gauge.set(count, status=status)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts and latency per route.
+
+    Requests are labelled with the route template (e.g.
+    ``/api/v1/equipment/{equipment_id}``) rather than the raw path to keep
+    label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status_code: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            route = scope.get('route')
+            route_path = getattr(route, 'path', None) or 'unmatched'
+            method = scope.get('method', '')
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started, method=method, route=route_path
+            )
+            HTTP_REQUESTS.inc(
+                method=method, route=route_path, status=str(status_code or 500)
+            )
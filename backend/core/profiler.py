@@ -0,0 +1,296 @@
+"""Profiling module.
+
+This module provides two opt-in profiling tools for diagnosing slow
+workers in production, both built on the standard library:
+
+* a statistical profiler sampling the event loop thread from a helper
+  thread for a limited time and producing collapsed stacks, the input
+  format of flamegraph tools;
+* per-request ``cProfile`` runs triggered by the ``X-Profile`` header and
+  kept in a small in-memory store.
+
+Both are only available with the diagnostics token, see
+:func:`has_diagnostics_access`.
+"""
+
+import asyncio
+import cProfile
+import io
+import pstats
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Deque, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import settings
+
+DIAGNOSTICS_TOKEN_HEADER = 'X-Diagnostics-Token'
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+# Number of functions listed in request profiles
+PROFILE_TOP_FUNCTIONS = 60
+
+# Only one sampling run and one cProfile run may be active at a time
+_sampling_lock = threading.Lock()
+_request_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one is running."""
+
+
+def has_diagnostics_access(token: Optional[str]) -> bool:
+    """Check a diagnostics token.
+
+    Args:
+        token: Token sent by the client
+
+    Returns:
+        bool: True if diagnostics are enabled and the token matches
+    """
+    if not settings.DIAGNOSTICS_TOKEN or not token:
+        return False
+    return secrets.compare_digest(token, settings.DIAGNOSTICS_TOKEN)
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Get the ``module:function`` label of a frame."""
+    module = frame.f_globals.get('__name__', '?')
+    return f'{module}:{frame.f_code.co_name}'
+
+
+def collapse_stack(frame: Optional[FrameType]) -> str:
+    """Collapse a stack into one line, outermost frame first.
+
+    Args:
+        frame: Innermost frame of the stack
+
+    Returns:
+        str: Frame labels separated by semicolons
+    """
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+def sample_thread(thread_id: int, duration: float, interval: float) -> Counter[str]:
+    """Sample the stack of a thread at a fixed interval.
+
+    Args:
+        thread_id: Identifier of the sampled thread
+        duration: Sampling time in seconds
+        interval: Time between samples in seconds
+
+    Returns:
+        Counter[str]: Number of samples per collapsed stack
+    """
+    stacks: Counter[str] = Counter()
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            stacks[collapse_stack(frame)] += 1
+        del frame
+        time.sleep(interval)
+    return stacks
+
+
+def format_collapsed(stacks: Counter[str]) -> str:
+    """Format sampled stacks in the collapsed (folded) stack format.
+
+    Args:
+        stacks: Number of samples per collapsed stack
+
+    Returns:
+        str: One ``stack count`` line per stack, most frequent first
+    """
+    return ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+
+async def profile_event_loop(duration: float, interval: float) -> Counter[str]:
+    """Sample the running event loop without blocking it.
+
+    Args:
+        duration: Sampling time in seconds
+        interval: Time between samples in seconds
+
+    Returns:
+        Counter[str]: Number of samples per collapsed stack
+
+    Raises:
+        ProfilerBusyError: If another sampling run is in progress
+    """
+    if not _sampling_lock.acquire(blocking=False):
+        raise ProfilerBusyError('Another profile is being captured')
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, sample_thread, threading.get_ident(), duration, interval
+        )
+    finally:
+        _sampling_lock.release()
+
+
+@dataclass
+class RequestProfile:
+    """cProfile result of one request.
+
+    Attributes:
+        id: Profile identifier, returned in the ``X-Profile-Id`` header
+        method: HTTP method
+        path: Request path
+        status_code: Response status code
+        duration_ms: Request duration in milliseconds
+        created_at: Time the request finished
+        stats: Functions sorted by cumulative time, as printed by pstats
+    """
+
+    id: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    created_at: datetime
+    stats: str
+
+
+class ProfileStore:
+    """In-memory store of the latest request profiles."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize store.
+
+        Args:
+            size: Number of profiles kept, older ones are dropped
+        """
+        self._profiles: Deque[RequestProfile] = deque(maxlen=max(1, size))
+
+    def add(self, profile: RequestProfile) -> None:
+        """Store a profile.
+
+        Args:
+            profile: Request profile
+        """
+        self._profiles.append(profile)
+
+    def latest(self) -> List[RequestProfile]:
+        """Get stored profiles.
+
+        Returns:
+            List[RequestProfile]: Profiles, newest first
+        """
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        """Get a profile by ID.
+
+        Args:
+            profile_id: Profile identifier
+
+        Returns:
+            Optional[RequestProfile]: Profile if still stored
+        """
+        return next(
+            (profile for profile in self._profiles if profile.id == profile_id), None
+        )
+
+
+request_profiles = ProfileStore(settings.PROFILE_STORE_SIZE)
+
+
+def format_profile_stats(profiler: cProfile.Profile) -> str:
+    """Print the most expensive functions of a profile.
+
+    Args:
+        profiler: Finished profiler
+
+    Returns:
+        str: pstats report sorted by cumulative time
+    """
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+    return stream.getvalue()
+
+
+class RequestProfilerMiddleware:
+    """ASGI middleware running requests under cProfile on demand.
+
+    Requests carrying ``X-Profile: 1`` and a valid diagnostics token are
+    profiled and stored in :data:`request_profiles`; the response gets an
+    ``X-Profile-Id`` header. cProfile records the whole event loop thread,
+    so concurrent requests show up in the profile too.
+    """
+
+    def __init__(self, app: ASGIApp, store: Optional[ProfileStore] = None) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            store: Store of finished profiles
+        """
+        self.app = app
+        self.store = store if store is not None else request_profiles
+
+    @staticmethod
+    def _requested(scope: Scope) -> bool:
+        """Check whether a request asks to be profiled."""
+        if scope['type'] != 'http' or not settings.DIAGNOSTICS_TOKEN:
+            return False
+        headers = Headers(scope=scope)
+        return headers.get(PROFILE_HEADER) == '1' and has_diagnostics_access(
+            headers.get(DIAGNOSTICS_TOKEN_HEADER)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        if not self._requested(scope) or not _request_profile_lock.acquire(
+            blocking=False
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex[:12]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile_id)
+            await send(message)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                profiler.disable()
+        finally:
+            _request_profile_lock.release()
+
+        self.store.add(
+            RequestProfile(
+                id=profile_id,
+                method=scope.get('method', ''),
+                path=scope.get('path', ''),
+                status_code=status_code,
+                duration_ms=round((time.perf_counter() - started) * 1000, 2),
+                created_at=datetime.now(timezone.utc),
+                stats=format_profile_stats(profiler),
+            )
+        )
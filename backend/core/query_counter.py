@@ -0,0 +1,250 @@
+"""SQL query counting module.
+
+This module hooks SQLAlchemy cursor events to count statements and database
+time per request. Repeated identical statements are reported as likely N+1
+patterns, totals are exposed through the ``Server-Timing`` response header.
+"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import settings
+
+
+@dataclass
+class QueryStats:
+    """Statement counters collected for one tracked scope.
+
+    Attributes:
+        count: Number of executed statements
+        duration: Total database time in seconds
+        statements: Number of executions per statement text
+    """
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record one executed statement.
+
+        Args:
+            statement: SQL statement text
+            duration: Execution time in seconds
+        """
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def merge(self, other: 'QueryStats') -> None:
+        """Add counters of a nested scope.
+
+        Args:
+            other: Stats to merge into this instance
+        """
+        self.count += other.count
+        self.duration += other.duration
+        self.statements.update(other.statements)
+
+    def duplicates(self, threshold: int = 2) -> List[Tuple[str, int]]:
+        """Get statements executed at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum number of executions
+
+        Returns:
+            List of (statement, count) tuples, most frequent first
+        """
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    'query_stats', default=None
+)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Get stats of the currently tracked scope.
+
+    Returns:
+        Optional[QueryStats]: Current stats or None when not tracking
+    """
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Track statements executed within the block.
+
+    Scopes nest: when the block exits, its counters are added to the
+    enclosing scope, so a test can wrap a request that is tracked by the
+    middleware as well.
+
+    Yields:
+        QueryStats: Stats collected for the block
+    """
+    parent = _current_stats.get()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if parent is not None:
+            parent.merge(stats)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Remember statement start time when queries are tracked."""
+    if _current_stats.get() is not None:
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Record statement duration in the current stats."""
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    start_times = conn.info.get('query_start_time')
+    if not start_times:
+        return
+    stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+def install_query_counter(engine: AsyncEngine | Engine) -> None:
+    """Register query counting listeners on an engine.
+
+    Calling this more than once for the same engine is a no-op.
+
+    Args:
+        engine: Async or sync SQLAlchemy engine
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, 'before_cursor_execute', _before_cursor_execute):
+        return
+    event.listen(sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+class QueryCounterMiddleware:
+    """ASGI middleware counting SQL statements per HTTP request.
+
+    Adds a ``Server-Timing`` header with database and total time and logs
+    requests exceeding the configured query count or repeating the same
+    statement too often.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_queries: Optional[int] = None,
+        max_duplicates: Optional[int] = None,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_queries: Query count above which a request is logged
+            max_duplicates: Repetitions of one statement above which a request
+                is logged as a likely N+1
+        """
+        self.app = app
+        self.max_queries = (
+            max_queries if max_queries is not None else settings.QUERY_COUNT_THRESHOLD
+        )
+        self.max_duplicates = (
+            max_duplicates
+            if max_duplicates is not None
+            else settings.QUERY_DUPLICATE_THRESHOLD
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    headers = MutableHeaders(scope=message)
+                    headers.append('Server-Timing', self._server_timing(stats, started))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._report(scope, stats)
+
+    @staticmethod
+    def _server_timing(stats: QueryStats, started: float) -> str:
+        """Build ``Server-Timing`` header value.
+
+        Args:
+            stats: Stats collected so far
+            started: Request start time from ``time.perf_counter``
+
+        Returns:
+            str: Header value
+        """
+        total_ms = (time.perf_counter() - started) * 1000
+        return (
+            f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+            f'app;dur={total_ms:.1f}'
+        )
+
+    def _report(self, scope: Scope, stats: QueryStats) -> None:
+        """Log requests with too many or repeated statements.
+
+        Args:
+            scope: ASGI scope of the request
+            stats: Stats collected for the request
+        """
+        duplicates = stats.duplicates(self.max_duplicates + 1)
+        if stats.count <= self.max_queries and not duplicates:
+            return
+
+        logger.warning(
+            'Request {} {} executed {} queries in {:.1f} ms',
+            scope.get('method'),
+            scope.get('path'),
+            stats.count,
+            stats.duration * 1000,
+        )
+        for statement, count in duplicates[:5]:
+            logger.warning(
+                'Possible N+1: statement repeated {} times: {}',
+                count,
+                ' '.join(statement.split())[:300],
+            )
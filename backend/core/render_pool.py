@@ -0,0 +1,127 @@
+"""Render pool module.
+
+This module runs blocking CPU-bound rendering (barcode images) in a bounded
+thread pool so the event loop keeps serving other requests. The number of
+waiting tasks is limited and exported as metrics together with the number
+of running tasks and render latency.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from backend.core.metrics import (
+    RENDER_DURATION,
+    RENDER_QUEUE_DEPTH,
+    RENDER_REJECTED,
+    RENDERS_IN_PROGRESS,
+)
+
+T = TypeVar('T')
+
+
+class RenderQueueFullError(Exception):
+    """Raised when a render pool has no room for another task."""
+
+
+class RenderPool:
+    """Bounded executor for blocking render functions.
+
+    At most ``workers`` tasks run at once; up to ``max_queue`` more wait for
+    a free worker and further tasks are rejected immediately.
+    """
+
+    def __init__(self, name: str, workers: int, max_queue: int) -> None:
+        """Initialize pool.
+
+        Args:
+            name: Pool name used as the metrics label
+            workers: Number of worker threads
+            max_queue: Number of tasks allowed to wait for a worker
+        """
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix=f'{self.name}-render'
+                )
+            return self._executor
+
+    def _publish(self) -> None:
+        """Update gauges from the counters. Must be called with the lock."""
+        RENDER_QUEUE_DEPTH.set(self._pending - self._running, pool=self.name)
+        RENDERS_IN_PROGRESS.set(self._running, pool=self.name)
+
+    def _call(self, func: Callable[..., T], args: tuple) -> T:
+        """Run a task in a worker thread, keeping the counters."""
+        with self._lock:
+            self._running += 1
+            self._publish()
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            RENDER_DURATION.observe(time.perf_counter() - started, pool=self.name)
+            with self._lock:
+                self._running -= 1
+                self._publish()
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking function in the pool.
+
+        Args:
+            func: Function to run
+            *args: Positional arguments of the function
+
+        Returns:
+            Function result
+
+        Raises:
+            RenderQueueFullError: If all workers are busy and the queue is full
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                RENDER_REJECTED.inc(pool=self.name)
+                raise RenderQueueFullError(f'Render pool {self.name} is full')
+            self._pending += 1
+            self._publish()
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), self._call, func, args
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._publish()
+
+    def stats(self) -> Dict[str, int]:
+        """Get current pool load.
+
+        Returns:
+            Dict[str, int]: Running and queued task counts
+        """
+        with self._lock:
+            return {
+                'running': self._running,
+                'queued': self._pending - self._running,
+            }
+
+    def shutdown(self) -> None:
+        """Stop worker threads without waiting for queued tasks."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
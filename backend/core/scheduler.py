@@ -4,18 +4,56 @@ This module provides scheduler for background tasks.
 """
 
 import logging
-from typing import Callable
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from backend.core.config import settings
+from backend.core.database import AsyncSessionLocal
+from backend.core.metrics import SCHEDULER_JOB_DURATION
 from backend.repositories import ScanSessionRepository
-from backend.services import ScanSessionService
+from backend.services import ReportService, ScanSessionService
 
 logger = logging.getLogger(__name__)
 
+JobFunc = TypeVar('JobFunc', bound=Callable[..., Awaitable[Any]])
 
+
+def timed_job(job_id: str) -> Callable[[JobFunc], JobFunc]:
+    """Record duration and outcome of a scheduled job.
+
+    Args:
+        job_id: Job identifier used as metric label
+
+    Returns:
+        Decorator for async job functions
+    """
+
+    def decorator(func: JobFunc) -> JobFunc:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            status = 'error'
+            try:
+                result = await func(*args, **kwargs)
+                status = 'success'
+                return result
+            finally:
+                SCHEDULER_JOB_DURATION.observe(
+                    time.perf_counter() - started, job=job_id, status=status
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@timed_job('clean_expired_scan_sessions')
 async def clean_expired_scan_sessions(
     repository: ScanSessionRepository,
 ) -> None:
@@ -29,6 +67,24 @@ async def clean_expired_scan_sessions(
     logger.info(f'Cleaned {count} expired scan sessions')
 
 
+@timed_job('refresh_report_stats')
+async def refresh_report_stats(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Refresh report summary rows for recently changed bookings.
+
+    Every worker schedules the job; runs overlapping a refresh in another
+    worker are skipped.
+
+    Args:
+        session_factory: Factory for a fresh session per run
+    """
+    async with session_factory() as session:
+        result = await ReportService(session).try_refresh()
+    if result is not None:
+        logger.info(f'Refreshed report stats for {result.bookings} bookings')
+
+
 def setup_scheduler(
     app: FastAPI,
     get_scan_session_repository: Callable[[], ScanSessionRepository],
@@ -54,6 +110,16 @@ def setup_scheduler(
         replace_existing=True,
     )
 
+    # Keep report summary rows up to date
+    scheduler.add_job(
+        refresh_report_stats,
+        trigger=IntervalTrigger(minutes=settings.REPORTS_REFRESH_INTERVAL_MINUTES),
+        args=[AsyncSessionLocal],
+        id='refresh_report_stats',
+        name='Refresh report stats',
+        replace_existing=True,
+    )
+
     # Start scheduler
     scheduler.start()
     app.state.scheduler = scheduler
@@ -0,0 +1,354 @@
+"""Slow query log module.
+
+This module hooks SQLAlchemy cursor events to aggregate execution time per
+statement fingerprint, the statement text with literals and parameters
+normalized. Statements slower than the configured threshold are logged
+with the repository or service function that issued them, and the plan of
+slow ``SELECT`` statements is captured once per fingerprint with
+``EXPLAIN (ANALYZE, BUFFERS)`` on a separate connection, without delaying
+the request.
+"""
+
+import asyncio
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from types import FrameType
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import greenlet
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.core.config import settings
+
+# Maximum number of plans captured concurrently
+MAX_PENDING_PLANS = 2
+
+_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PARAMETER_RE = re.compile(r'\$\d+|%\(\w+\)s|%s|(?<!:):[A-Za-z_]\w*')
+_NUMBER_RE = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?\b')
+_IN_LIST_RE = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_VALUES_RE = re.compile(r'\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+# Statements whose re-execution takes locks other sessions may wait on
+_LOCKING_RE = re.compile(
+    r'\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b'
+    r'|\bpg_(?:try_)?advisory_',
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so that executions of one query group together.
+
+    Comments are dropped, literals and bind parameters become ``?``, ``IN``
+    lists and multi-row ``VALUES`` collapse to a single element and
+    whitespace is squeezed.
+
+    Args:
+        statement: SQL statement text
+
+    Returns:
+        str: Statement fingerprint
+    """
+    text = _COMMENT_RE.sub(' ', statement)
+    text = _STRING_RE.sub('?', text)
+    text = _PARAMETER_RE.sub('?', text)
+    text = _NUMBER_RE.sub('?', text)
+    text = _IN_LIST_RE.sub('IN (...)', text)
+    text = _VALUES_RE.sub(r'VALUES \1', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+@dataclass
+class FingerprintStats:
+    """Execution statistics of one statement fingerprint.
+
+    Attributes:
+        fingerprint: Normalized statement
+        count: Number of executions
+        total_time: Total execution time in seconds
+        max_time: Longest execution time in seconds
+        slow_count: Number of executions above the threshold
+        statement: Text of the slowest execution
+        source: Function that issued the slowest execution
+        plan: ``EXPLAIN (ANALYZE, BUFFERS)`` output of a slow execution
+    """
+
+    fingerprint: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    slow_count: int = 0
+    statement: Optional[str] = None
+    source: Optional[str] = None
+    plan: Optional[str] = None
+
+    @property
+    def mean_time(self) -> float:
+        """Get average execution time in seconds."""
+        return self.total_time / self.count if self.count else 0.0
+
+
+class SlowQueryLog:
+    """Aggregated statement timings, keyed by fingerprint."""
+
+    SORT_KEYS = ('total_time', 'max_time', 'mean_time', 'count')
+
+    def __init__(self, threshold_ms: float, max_fingerprints: int) -> None:
+        """Initialize log.
+
+        Args:
+            threshold_ms: Execution time above which a statement is slow
+            max_fingerprints: Number of fingerprints kept; when full, the
+                fingerprint with the least total time is dropped
+        """
+        self.threshold = threshold_ms / 1000
+        self.max_fingerprints = max(1, max_fingerprints)
+        self._stats: Dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration: float) -> FingerprintStats:
+        """Record one execution.
+
+        Args:
+            statement: SQL statement text
+            duration: Execution time in seconds
+
+        Returns:
+            FingerprintStats: Updated statistics of the statement
+        """
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    cheapest = min(self._stats.values(), key=lambda s: s.total_time)
+                    del self._stats[cheapest.fingerprint]
+                stats = self._stats[key] = FingerprintStats(key)
+            stats.count += 1
+            stats.total_time += duration
+            if duration > self.threshold:
+                stats.slow_count += 1
+            if duration >= stats.max_time:
+                stats.max_time = duration
+                stats.statement = statement
+        return stats
+
+    def top(self, limit: int = 20, sort: str = 'total_time') -> List[FingerprintStats]:
+        """Get the most expensive fingerprints.
+
+        Args:
+            limit: Maximum number of fingerprints
+            sort: One of :attr:`SORT_KEYS`
+
+        Returns:
+            List[FingerprintStats]: Fingerprints, most expensive first
+
+        Raises:
+            ValueError: If the sort key is unknown
+        """
+        if sort not in self.SORT_KEYS:
+            raise ValueError(f'Unknown sort key: {sort}')
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda s: getattr(s, sort), reverse=True)[:limit]
+
+    def reset(self) -> None:
+        """Drop all collected statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+slow_query_log = SlowQueryLog(
+    settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_MAX_FINGERPRINTS
+)
+
+# Async engines by their sync engine, used to capture plans
+_async_engines: Dict[Engine, AsyncEngine] = {}
+_pending_plans: Set[str] = set()
+_plan_tasks: Set['asyncio.Task[None]'] = set()
+
+
+def _iter_frames() -> Iterator[FrameType]:
+    """Iterate over the calling stack, innermost frame first.
+
+    With the async engine, cursor events run in a greenlet whose stack
+    ends at SQLAlchemy's adapter; the awaiting coroutines are found on the
+    stack of the parent greenlet.
+    """
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+    parent = greenlet.getcurrent().parent
+    frame = parent.gr_frame if parent is not None else None
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def find_source() -> Optional[str]:
+    """Find the application function that executed the current statement.
+
+    Returns:
+        Optional[str]: ``module:function`` of the innermost application
+            frame outside ``backend.core``, None if there is none
+    """
+    for frame in _iter_frames():
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith('backend.') and not module.startswith('backend.core'):
+            return f'{module}:{frame.f_code.co_name}'
+    return None
+
+
+async def capture_plan(
+    engine: AsyncEngine, stats: FingerprintStats, statement: str, parameters: Any
+) -> None:
+    """Capture the plan of a slow statement.
+
+    The statement runs again under ``EXPLAIN (ANALYZE, BUFFERS)`` in a
+    transaction that is rolled back, with statement and lock timeouts so a
+    plan capture never runs or waits for long.
+
+    Args:
+        engine: Engine the statement was executed on
+        stats: Statistics receiving the plan
+        statement: SQL statement text
+        parameters: Parameters of the slow execution
+    """
+    try:
+        async with engine.connect() as conn:
+            # SET does not accept bind parameters
+            await conn.exec_driver_sql(
+                'SET LOCAL statement_timeout = '
+                f'{int(settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS)}'
+            )
+            await conn.exec_driver_sql(
+                'SET LOCAL lock_timeout = '
+                f'{int(settings.SLOW_QUERY_EXPLAIN_LOCK_TIMEOUT_MS)}'
+            )
+            result = await conn.exec_driver_sql(
+                f'EXPLAIN (ANALYZE, BUFFERS) {statement}', parameters
+            )
+            stats.plan = '\n'.join(row[0] for row in result)
+            await conn.rollback()
+    except Exception as e:
+        logger.warning('Failed to capture plan of slow query: {}', e)
+    finally:
+        _pending_plans.discard(stats.fingerprint)
+
+
+def can_explain(statement: str) -> bool:
+    """Check whether a statement is safe to run again to capture its plan.
+
+    Only plain ``SELECT`` statements qualify: row locking clauses and
+    advisory lock functions would block other sessions while the plan is
+    captured.
+
+    Args:
+        statement: SQL statement text
+
+    Returns:
+        bool: True if the statement may run under ``EXPLAIN ANALYZE``
+    """
+    text = fingerprint(statement)
+    return text[:6].upper() == 'SELECT' and not _LOCKING_RE.search(text)
+
+
+def _schedule_plan(
+    conn: Any, stats: FingerprintStats, statement: str, parameters: Any
+) -> None:
+    """Start capturing a plan in the background if it is safe and needed."""
+    if (
+        not settings.SLOW_QUERY_EXPLAIN
+        or stats.plan is not None
+        or stats.fingerprint in _pending_plans
+        or len(_pending_plans) >= MAX_PENDING_PLANS
+        or not can_explain(statement)
+    ):
+        return
+    engine = _async_engines.get(conn.engine)
+    if engine is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _pending_plans.add(stats.fingerprint)
+    task = loop.create_task(capture_plan(engine, stats, statement, parameters))
+    _plan_tasks.add(task)
+    task.add_done_callback(_plan_tasks.discard)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Remember statement start time."""
+    conn.info.setdefault('slow_query_start_time', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Record statement duration and handle slow statements."""
+    start_times = conn.info.get('slow_query_start_time')
+    if not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+    if statement.startswith('EXPLAIN'):
+        return
+
+    stats = slow_query_log.record(statement, duration)
+    if duration <= slow_query_log.threshold:
+        return
+
+    source = find_source()
+    if stats.statement == statement:
+        stats.source = source
+    logger.warning(
+        'Slow query ({:.1f} ms) from {}: {}',
+        duration * 1000,
+        source or 'unknown',
+        stats.fingerprint[:300],
+    )
+    if not executemany:
+        _schedule_plan(conn, stats, statement, parameters)
+
+
+def install_slow_query_log(engine: AsyncEngine | Engine) -> None:
+    """Register slow query log listeners on an engine.
+
+    Plans are only captured for async engines. Calling this more than once
+    for the same engine is a no-op.
+
+    Args:
+        engine: Async or sync SQLAlchemy engine
+    """
+    if isinstance(engine, AsyncEngine):
+        sync_engine = engine.sync_engine
+        _async_engines[sync_engine] = engine
+    else:
+        sync_engine = engine
+    if event.contains(sync_engine, 'before_cursor_execute', _before_cursor_execute):
+        return
+    event.listen(sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', _after_cursor_execute)
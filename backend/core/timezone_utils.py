@@ -12,6 +12,8 @@ from datetime import datetime, timedelta, timezone
 
 # Moscow timezone (UTC+3)
 MOSCOW_TZ = timezone(timedelta(hours=3))
+# Same zone by name, for conversions done in PostgreSQL
+MOSCOW_TZ_NAME = 'Europe/Moscow'
 
 
 def ensure_timezone_aware(dt: datetime) -> datetime:
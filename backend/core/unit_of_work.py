@@ -0,0 +1,111 @@
+"""Unit of work module.
+
+This module scopes several repository writes to one database transaction.
+Inside a unit of work repositories only flush their changes; the unit
+commits once when it completes and rolls everything back on error.
+Savepoints isolate failures of single items, so one bad row of a batch
+does not discard the rest.
+"""
+
+from types import TracebackType
+from typing import Optional, Type
+
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+
+# Session info key holding the nesting depth of active units of work
+_DEPTH_KEY = 'unit_of_work_depth'
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """Check whether a unit of work owns the session transaction.
+
+    Args:
+        session: Database session
+
+    Returns:
+        bool: True if commits are deferred to a unit of work
+    """
+    return session.info.get(_DEPTH_KEY, 0) > 0
+
+
+async def commit_or_flush(session: AsyncSession) -> None:
+    """Commit the session, or only flush it inside a unit of work.
+
+    Args:
+        session: Database session
+    """
+    if in_unit_of_work(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+async def rollback_if_unowned(session: AsyncSession) -> None:
+    """Roll back the session unless a unit of work owns the transaction.
+
+    Inside a unit of work the error propagates to the enclosing savepoint
+    or unit, which rolls back only its own changes.
+
+    Args:
+        session: Database session
+    """
+    if not in_unit_of_work(session):
+        await session.rollback()
+
+
+class UnitOfWork:
+    """Transaction spanning several repository operations.
+
+    Units of work may be nested; only the outermost one commits or rolls
+    back. Example:
+        ```python
+        async with UnitOfWork(session) as uow:
+            project = await project_repository.create(project)
+            for booking in bookings:
+                try:
+                    async with uow.savepoint():
+                        await booking_repository.create(booking)
+                except ValidationError:
+                    continue
+        ```
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize unit of work.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def __aenter__(self) -> 'UnitOfWork':
+        """Start deferring commits of the session."""
+        self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Commit on success or roll back on error if outermost."""
+        depth = self.session.info[_DEPTH_KEY] - 1
+        self.session.info[_DEPTH_KEY] = depth
+        if depth > 0:
+            return
+        if exc_type is None:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        """Start a savepoint within the unit of work.
+
+        Used as an async context manager, the savepoint is released when
+        the block completes and rolled back if it raises.
+
+        Returns:
+            AsyncSessionTransaction: Nested transaction
+        """
+        return self.session.begin_nested()
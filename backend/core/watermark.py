@@ -0,0 +1,47 @@
+"""Change watermark module.
+
+``updated_at`` columns are set by the database to the start time of the
+writing transaction, so a row becomes visible only when that transaction
+commits, possibly long after the timestamp it carries. Incremental jobs that
+select rows by ``updated_at`` must therefore resume from a point no later
+than the start of the oldest transaction still running when they read.
+"""
+
+from sqlalchemy import DateTime, String, func, select, table
+from sqlalchemy.sql import Select, column
+
+_pg_stat_activity = table(
+    'pg_stat_activity',
+    column('datname', String),
+    column('backend_type', String),
+    column('xact_start', DateTime(timezone=True)),
+)
+
+
+def change_watermark_query() -> Select:
+    """Build a query for the watermark of the next incremental run.
+
+    The watermark is the current transaction time or the start of the oldest
+    open transaction of the database, whichever is earlier. Rows committed
+    later carry an ``updated_at`` at or after it, so a run that reads after
+    this query and resumes from its result misses none of them; rows visible
+    to both runs are processed twice.
+
+    Only transactions of sessions visible to the current role are considered,
+    so writers must connect as the same role or the role must be granted
+    ``pg_read_all_stats``.
+
+    Returns:
+        Select statement returning a single timestamp
+    """
+    oldest_transaction = (
+        select(func.min(_pg_stat_activity.c.xact_start))
+        .where(
+            _pg_stat_activity.c.datname == func.current_database(),
+            _pg_stat_activity.c.backend_type == 'client backend',
+        )
+        .scalar_subquery()
+    )
+    return select(
+        func.least(func.now(), oldest_transaction, type_=DateTime(timezone=True))
+    )
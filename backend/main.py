@@ -21,10 +21,14 @@ from backend.core.cache import close_redis, init_redis
 from backend.core.config import settings
 from backend.core.database import AsyncSessionLocal
 from backend.core.logging import configure_logging
+from backend.core.metrics import MetricsMiddleware
+from backend.core.profiler import RequestProfilerMiddleware
+from backend.core.query_counter import QueryCounterMiddleware
 from backend.core.scheduler import setup_scheduler
 from backend.core.templates import static_files
 from backend.exceptions import BusinessError
 from backend.repositories import ScanSessionRepository
+from backend.services.barcode import barcode_render_pool
 from backend.web.router import web_router
 
 
@@ -63,7 +67,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
     # Cleanup resources
     await close_redis()
+    barcode_render_pool.shutdown()
     logger.info('Application shutdown')
+    # Wait until enqueued log records are written
+    await logger.complete()
 
 
 def create_app() -> FastAPI:
@@ -93,6 +100,17 @@ def create_app() -> FastAPI:
         allow_headers=['*'],
     )
 
+    # Record request latency per route
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    # Count SQL statements per request
+    if settings.QUERY_COUNTER_ENABLED:
+        app.add_middleware(QueryCounterMiddleware)
+
+    # Profile requests on demand, only with the diagnostics token
+    app.add_middleware(RequestProfilerMiddleware)
+
     # Configure exception handlers
     app.add_exception_handler(BusinessError, business_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -7,7 +7,7 @@ timestamp tracking and soft delete support.
 
 # Then import models without dependencies or with minimal dependencies
 from backend.models.booking import Booking, BookingStatus, PaymentStatus
-from backend.models.category import Category
+from backend.models.category import Category, CategoryEquipmentCount
 from backend.models.client import Client, ClientStatus
 
 # First import from core and mixins packages
@@ -19,6 +19,7 @@ from backend.models.equipment import Equipment, EquipmentStatus
 from backend.models.global_barcode import GlobalBarcodeSequence
 from backend.models.mixins import SoftDeleteMixin, TimestampMixin
 from backend.models.project import Project, ProjectPaymentStatus, ProjectStatus
+from backend.models.report import BookingDailyStat
 from backend.models.scan_session import ScanSession
 from backend.models.user import User
 
@@ -29,6 +30,7 @@ __all__ = [
     'SoftDeleteMixin',
     # Entity models
     'Category',
+    'CategoryEquipmentCount',
     'Equipment',
     'Client',
     'Booking',
@@ -37,6 +39,7 @@ __all__ = [
     'GlobalBarcodeSequence',
     'Project',
     'ScanSession',
+    'BookingDailyStat',
     # Status and type enums
     'BookingStatus',
     'PaymentStatus',
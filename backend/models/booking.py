@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, text
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -86,6 +86,19 @@ class Booking(TimestampMixin, SoftDeleteMixin, Base):
     """
 
     __tablename__ = 'bookings'
+    __table_args__ = (
+        # Availability, conflict and timeline lookups of live bookings
+        Index(
+            'ix_bookings_equipment_status_period',
+            'equipment_id',
+            'booking_status',
+            'start_date',
+            'end_date',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        # Client booking history, newest first; also backs the client FK
+        Index('ix_bookings_client_id_created_at', 'client_id', 'created_at'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     client_id: Mapped[int] = mapped_column(
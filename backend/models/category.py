@@ -3,16 +3,32 @@
 This module defines the Category model for equipment categorization.
 Categories can be hierarchical (have parent categories) and are used
 to organize equipment items into logical groups.
+
+It also defines the ``category_equipment_counts`` rollup: the number of
+live equipment items per category and status, both directly in the
+category and in its whole subtree. The rollup is maintained by database
+triggers on ``equipment`` and ``categories``, so every write path, including
+set-based updates and ``COPY``, keeps it current in the same transaction.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    event,
+)
 from sqlalchemy import text as sql_text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.core import Base
+from backend.models.equipment import EquipmentStatus, equipment_status_enum
 from backend.models.mixins import TimestampMixin
 
 
@@ -28,6 +44,9 @@ class Category(TimestampMixin, Base):
         children: Child categories relationship.
         equipment: Equipment items in this category.
         equipment_count: Virtual attribute for equipment count.
+        direct_equipment_count: Virtual attribute for equipment count
+            without subcategories.
+        equipment_by_status: Virtual attribute for equipment count by status.
         deleted_at: Deletion timestamp
         show_in_print_overview: Whether to show this category as a header in print forms
     """
@@ -71,8 +90,10 @@ class Category(TimestampMixin, Base):
         cascade='all, delete-orphan',
     )
 
-    # Virtual attribute for equipment count
+    # Virtual attributes for equipment counts
     equipment_count: int = 0
+    direct_equipment_count: int = 0
+    equipment_by_status: Dict[str, int] = {}
 
     def __repr__(self) -> str:
         """Get string representation.
@@ -81,3 +102,192 @@ class Category(TimestampMixin, Base):
             String representation
         """
         return f'Category(id={self.id}, name={self.name})'
+
+
+class CategoryEquipmentCount(Base):
+    """Live equipment count of one category and status.
+
+    Attributes:
+        id: Primary key
+        category_id: Reference to category
+        status: Equipment status
+        direct_count: Equipment items directly in the category
+        subtree_count: Equipment items in the category and its subcategories
+    """
+
+    __tablename__ = 'category_equipment_counts'
+    __table_args__ = (
+        UniqueConstraint(
+            'category_id', 'status', name='uq_category_equipment_counts_status'
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey('categories.id', ondelete='CASCADE'), nullable=False
+    )
+    status: Mapped[EquipmentStatus] = mapped_column(
+        equipment_status_enum, nullable=False
+    )
+    direct_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=sql_text('0')
+    )
+    subtree_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=sql_text('0')
+    )
+
+
+# Adds per category deltas to the rollup rows of the categories and all of
+# their ancestors. Deltas cancelling out are dropped, so updates that do not
+# move equipment between categories or statuses write nothing.
+ADD_EQUIPMENT_COUNTS_FUNCTION = '''
+CREATE OR REPLACE FUNCTION category_equipment_counts_add(
+    category_ids integer[], statuses equipmentstatus[], deltas integer[]
+) RETURNS void LANGUAGE sql AS $$
+    WITH RECURSIVE delta AS (
+        SELECT category_id, status, sum(n) AS n
+        FROM unnest(category_ids, statuses, deltas) AS d (category_id, status, n)
+        GROUP BY category_id, status
+        HAVING sum(n) <> 0
+    ),
+    ancestors (category_id, ancestor_id) AS (
+        SELECT DISTINCT category_id, category_id FROM delta
+        UNION
+        SELECT ancestors.category_id, categories.parent_id
+        FROM ancestors
+        JOIN categories ON categories.id = ancestors.ancestor_id
+        WHERE categories.parent_id IS NOT NULL
+    )
+    INSERT INTO category_equipment_counts AS counts
+        (category_id, status, direct_count, subtree_count)
+    SELECT
+        ancestors.ancestor_id,
+        delta.status,
+        coalesce(sum(delta.n) FILTER (
+            WHERE ancestors.ancestor_id = delta.category_id
+        ), 0),
+        sum(delta.n)
+    FROM delta
+    JOIN ancestors ON ancestors.category_id = delta.category_id
+    GROUP BY ancestors.ancestor_id, delta.status
+    ORDER BY ancestors.ancestor_id, delta.status
+    ON CONFLICT (category_id, status) DO UPDATE SET
+        direct_count = counts.direct_count + excluded.direct_count,
+        subtree_count = counts.subtree_count + excluded.subtree_count
+$$
+'''
+
+# Statement level trigger function for equipment writes; only live (not soft
+# deleted) rows are counted
+EQUIPMENT_COUNTS_TRIGGER_FUNCTION = '''
+CREATE OR REPLACE FUNCTION category_equipment_counts_on_equipment()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM category_equipment_counts;
+    ELSIF TG_OP = 'INSERT' THEN
+        PERFORM category_equipment_counts_add(
+            array_agg(category_id), array_agg(status), array_agg(1)
+        )
+        FROM new_rows
+        WHERE deleted_at IS NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM category_equipment_counts_add(
+            array_agg(category_id), array_agg(status), array_agg(-1)
+        )
+        FROM old_rows
+        WHERE deleted_at IS NULL;
+    ELSE
+        PERFORM category_equipment_counts_add(
+            array_agg(category_id), array_agg(status), array_agg(n)
+        )
+        FROM (
+            SELECT category_id, status, 1 AS n
+            FROM new_rows
+            WHERE deleted_at IS NULL
+            UNION ALL
+            SELECT category_id, status, -1 AS n
+            FROM old_rows
+            WHERE deleted_at IS NULL
+        ) AS changes;
+    END IF;
+    RETURN NULL;
+END
+$$
+'''
+
+# Row level trigger function for category moves: subtree counts of the moved
+# category are taken from its old ancestors and added to the new ones
+CATEGORY_MOVE_TRIGGER_FUNCTION = '''
+CREATE OR REPLACE FUNCTION category_equipment_counts_on_category_move()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    WITH RECURSIVE chain (id, sign) AS (
+        SELECT OLD.parent_id, -1 WHERE OLD.parent_id IS NOT NULL
+        UNION ALL
+        SELECT NEW.parent_id, 1 WHERE NEW.parent_id IS NOT NULL
+        UNION
+        SELECT categories.parent_id, chain.sign
+        FROM chain
+        JOIN categories ON categories.id = chain.id
+        WHERE categories.parent_id IS NOT NULL
+    )
+    INSERT INTO category_equipment_counts AS counts
+        (category_id, status, direct_count, subtree_count)
+    SELECT chain.id, moved.status, 0, sum(chain.sign * moved.subtree_count)
+    FROM chain
+    CROSS JOIN category_equipment_counts AS moved
+    WHERE moved.category_id = NEW.id AND moved.subtree_count <> 0
+    GROUP BY chain.id, moved.status
+    HAVING sum(chain.sign * moved.subtree_count) <> 0
+    ORDER BY chain.id, moved.status
+    ON CONFLICT (category_id, status) DO UPDATE SET
+        subtree_count = counts.subtree_count + excluded.subtree_count;
+    RETURN NULL;
+END
+$$
+'''
+
+EQUIPMENT_COUNTS_TRIGGERS = (
+    'CREATE TRIGGER equipment_counts_insert AFTER INSERT ON equipment '
+    'REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER equipment_counts_update AFTER UPDATE ON equipment '
+    'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER equipment_counts_delete AFTER DELETE ON equipment '
+    'REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER equipment_counts_truncate AFTER TRUNCATE ON equipment '
+    'FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER categories_equipment_counts_move '
+    'AFTER UPDATE OF parent_id ON categories FOR EACH ROW '
+    'WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id) '
+    'EXECUTE FUNCTION category_equipment_counts_on_category_move()',
+)
+
+EQUIPMENT_COUNTS_FUNCTIONS = (
+    'category_equipment_counts_on_category_move()',
+    'category_equipment_counts_on_equipment()',
+    'category_equipment_counts_add(integer[], equipmentstatus[], integer[])',
+)
+
+# Install the triggers with the schema, as migration 7c3d5e1f9a2b does
+for statement in (
+    ADD_EQUIPMENT_COUNTS_FUNCTION,
+    EQUIPMENT_COUNTS_TRIGGER_FUNCTION,
+    CATEGORY_MOVE_TRIGGER_FUNCTION,
+    *EQUIPMENT_COUNTS_TRIGGERS,
+):
+    event.listen(
+        Base.metadata, 'after_create', DDL(statement).execute_if(dialect='postgresql')
+    )
+for function in EQUIPMENT_COUNTS_FUNCTIONS:
+    event.listen(
+        Base.metadata,
+        'before_drop',
+        DDL(f'DROP FUNCTION IF EXISTS {function} CASCADE').execute_if(
+            dialect='postgresql'
+        ),
+    )
@@ -21,6 +21,11 @@ class HasId:
 
 
 class Base(DeclarativeBase, HasId):
-    """Base model class."""
+    """Base model class.
 
-    pass
+    Server-generated values (timestamps and other server defaults) are
+    fetched with RETURNING by the INSERT or UPDATE itself, so written
+    instances are complete without a separate SELECT.
+    """
+
+    __mapper_args__ = {'eager_defaults': True}
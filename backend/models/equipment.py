@@ -6,7 +6,7 @@ This module defines the Equipment model for rental equipment items.
 import enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -58,6 +58,15 @@ class Equipment(TimestampMixin, SoftDeleteMixin, Base):
     """
 
     __tablename__ = 'equipment'
+    __table_args__ = (
+        # Equipment lists filtered by category and sorted by name
+        Index(
+            'ix_equipment_category_id_name',
+            'category_id',
+            'name',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
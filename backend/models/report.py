@@ -0,0 +1,59 @@
+"""Report model module.
+
+This module defines the summary table used by reports. Each row is one day
+of one booking with its share of the booking amount, so utilization and
+revenue reports aggregate a narrow table instead of expanding bookings.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.core import Base
+
+
+class BookingDailyStat(Base):
+    """Booking day summary row.
+
+    Attributes:
+        id: Primary key
+        booking_id: Reference to booking
+        day: Rental day in the business timezone
+        equipment_id: Reference to booked equipment
+        client_id: Reference to client
+        quantity: Number of booked items
+        revenue: Share of the booking amount attributed to this day
+        refreshed_at: Change watermark of the refresh that computed the row
+    """
+
+    __tablename__ = 'booking_daily_stats'
+    __table_args__ = (
+        UniqueConstraint('booking_id', 'day', name='uq_booking_daily_stats_day'),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    booking_id: Mapped[int] = mapped_column(
+        ForeignKey('bookings.id', ondelete='CASCADE'), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    equipment_id: Mapped[int] = mapped_column(
+        ForeignKey('equipment.id', ondelete='CASCADE'), index=True
+    )
+    client_id: Mapped[int] = mapped_column(
+        ForeignKey('clients.id', ondelete='CASCADE'), index=True
+    )
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -3,10 +3,10 @@
 This module provides model for storing temporary scan sessions.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.models.base import Base, TimestampMixin
@@ -24,6 +24,14 @@ class ScanSession(TimestampMixin, Base):
     """
 
     __tablename__ = 'scan_sessions'
+    __table_args__ = (
+        # Expired session cleanup
+        Index(
+            'ix_scan_sessions_expires_at',
+            'expires_at',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[Optional[int]] = mapped_column(
@@ -50,5 +58,5 @@ class ScanSession(TimestampMixin, Base):
             name=name,
             user_id=user_id,
             items=items or [],
-            expires_at=datetime.now() + timedelta(days=days),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=days),
         )
@@ -11,6 +11,7 @@ from backend.repositories.document import DocumentRepository
 from backend.repositories.equipment import EquipmentRepository
 from backend.repositories.global_barcode import GlobalBarcodeSequenceRepository
 from backend.repositories.project import ProjectRepository
+from backend.repositories.report import ReportRepository
 from backend.repositories.scan_session import ScanSessionRepository
 
 __all__ = [
@@ -22,5 +23,6 @@ __all__ = [
     'DocumentRepository',
     'GlobalBarcodeSequenceRepository',
     'ProjectRepository',
+    'ReportRepository',
     'ScanSessionRepository',
 ]
@@ -4,9 +4,10 @@ from datetime import datetime, timezone
 from typing import Generic, List, Optional, Type, TypeVar, Union
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.unit_of_work import commit_or_flush, rollback_if_unowned
 from backend.models.core import Base
 
 ModelType = TypeVar('ModelType', bound=Base)
@@ -15,7 +16,10 @@ ModelType = TypeVar('ModelType', bound=Base)
 class BaseRepository(Generic[ModelType]):
     """Base repository class.
 
-    This class provides basic CRUD operations for models.
+    This class provides basic CRUD operations for models. Writes commit
+    immediately unless they run inside a
+    :class:`~backend.core.unit_of_work.UnitOfWork`, which defers the
+    commit to the end of the whole operation.
     """
 
     model: Type[ModelType]
@@ -30,6 +34,21 @@ class BaseRepository(Generic[ModelType]):
         self.session = session
         self.model = model
 
+    async def _flush(self, instance: ModelType) -> None:
+        """Flush pending changes and complete the instance.
+
+        Server-generated values come back with the INSERT or UPDATE via
+        RETURNING, so a SELECT is only issued for attributes that are still
+        expired, e.g. after a rollback.
+
+        Args:
+            instance: Model instance being written
+        """
+        await self.session.flush()
+        expired = inspect(instance).expired_attributes
+        if expired:
+            await self.session.refresh(instance, attribute_names=list(expired))
+
     async def get(
         self,
         id: Union[int, UUID],
@@ -78,12 +97,11 @@ class BaseRepository(Generic[ModelType]):
         """
         try:
             self.session.add(instance)
-            await self.session.flush()
-            await self.session.refresh(instance)
-            await self.session.commit()
+            await self._flush(instance)
+            await commit_or_flush(self.session)
             return instance
         except Exception as e:
-            await self.session.rollback()
+            await rollback_if_unowned(self.session)
             raise e
 
     async def update(self, instance: ModelType) -> ModelType:
@@ -100,12 +118,11 @@ class BaseRepository(Generic[ModelType]):
         """
         try:
             self.session.add(instance)
-            await self.session.flush()
-            await self.session.refresh(instance)
-            await self.session.commit()
+            await self._flush(instance)
+            await commit_or_flush(self.session)
             return instance
         except Exception as e:
-            await self.session.rollback()
+            await rollback_if_unowned(self.session)
             raise e
 
     async def delete(self, id: Union[int, UUID]) -> bool:
@@ -119,7 +136,7 @@ class BaseRepository(Generic[ModelType]):
         """
         query = delete(self.model).where(self.model.id == id)
         result = await self.session.execute(query)
-        await self.session.commit()
+        await commit_or_flush(self.session)
         # Use getattr for compatibility with different SQLAlchemy type stubs
         rowcount = getattr(result, 'rowcount', 0)
         return bool(rowcount and rowcount > 0)
@@ -153,12 +170,11 @@ class BaseRepository(Generic[ModelType]):
             instance = await self.get(id)
             if instance:
                 instance.deleted_at = datetime.now(timezone.utc)
-                await self.session.flush()
-                await self.session.refresh(instance)
-                await self.session.commit()
+                await self._flush(instance)
+                await commit_or_flush(self.session)
             return instance
         except Exception as e:
-            await self.session.rollback()
+            await rollback_if_unowned(self.session)
             raise e
 
     async def search(
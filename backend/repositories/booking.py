@@ -5,15 +5,31 @@ including creating, retrieving, updating, and canceling rental records.
 """
 
 import traceback
-from datetime import datetime
-from typing import List, Optional, Sequence
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from loguru import logger
-from sqlalchemy import and_, or_, select
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    Row,
+    and_,
+    case,
+    column,
+    func,
+    or_,
+    select,
+    union_all,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import Select
 
+from backend.core.database import read_only
+from backend.core.unit_of_work import commit_or_flush, rollback_if_unowned
+
 # Keep Project import as it's used in joinedload
 from backend.models import Project  # noqa: F401
 from backend.models import Booking, BookingStatus, Client, Equipment, PaymentStatus
@@ -21,6 +37,28 @@ from backend.repositories import BaseRepository
 from backend.schemas import BookingWithDetails, EquipmentResponse
 from backend.schemas.project import ProjectBase
 
+# Statuses of bookings that keep equipment busy
+BUSY_STATUSES = (
+    BookingStatus.CONFIRMED,
+    BookingStatus.ACTIVE,
+    BookingStatus.OVERDUE,
+)
+
+# Statuses of bookings that can still be rescheduled
+OPEN_STATUSES = (
+    BookingStatus.PENDING,
+    BookingStatus.CONFIRMED,
+    BookingStatus.ACTIVE,
+    BookingStatus.OVERDUE,
+)
+
+# Statuses that block another booking of the same item, as checked by
+# EquipmentRepository.check_availability
+BLOCKING_STATUSES = (BookingStatus.CONFIRMED, BookingStatus.ACTIVE)
+
+# Planned booking period: booking ID, equipment ID, start and end date
+BookingMove = Tuple[int, int, datetime, datetime]
+
 
 class BookingRepository(BaseRepository[Booking]):
     """Repository for managing bookings."""
@@ -52,13 +90,9 @@ class BookingRepository(BaseRepository[Booking]):
             True if equipment is available, False otherwise
         """
         # Check for conflicting bookings in relevant statuses
-        conflicting_statuses = [
-            BookingStatus.CONFIRMED,
-            BookingStatus.ACTIVE,
-            BookingStatus.OVERDUE,
-        ]
+        conflicting_statuses = list(BUSY_STATUSES)
         # Query explanation:
-        # Find any booking for the given equipment_id
+        # Find any live booking for the given equipment_id
         # that is in a conflicting status
         # AND overlaps with the requested [start_date, end_date] period.
         # Overlap condition: (ExistingStart <= ReqEnd) AND (ExistingEnd >= ReqStart)
@@ -67,6 +101,7 @@ class BookingRepository(BaseRepository[Booking]):
             Booking.booking_status.in_(conflicting_statuses),
             Booking.start_date <= end_date,
             Booking.end_date >= start_date,
+            Booking.deleted_at.is_(None),
         )
 
         if exclude_booking_id:
@@ -354,6 +389,356 @@ class BookingRepository(BaseRepository[Booking]):
         result = await self.session.execute(stmt)
         return list(result.unique().scalars().all())
 
+    @read_only
+    async def count_by_status(self) -> Dict[str, int]:
+        """Count non-deleted bookings grouped by status.
+
+        Returns:
+            Number of bookings per status value
+        """
+        result = await self.session.execute(
+            select(Booking.booking_status, func.count(Booking.id))
+            .where(Booking.deleted_at.is_(None))
+            .group_by(Booking.booking_status)
+        )
+        return {status.value: count for status, count in result.all()}
+
+    @read_only
+    async def get_day_counts(
+        self, day_start: datetime, day_end: datetime, now: datetime
+    ) -> Dict[str, int]:
+        """Count pickups, returns and overdue bookings in one statement.
+
+        Args:
+            day_start: Start of the day (inclusive)
+            day_end: End of the day (exclusive)
+            now: Current datetime used for the overdue check
+
+        Returns:
+            Dictionary with 'pickups', 'returns' and 'overdue' counts
+        """
+        pickup_statuses = [BookingStatus.PENDING, BookingStatus.CONFIRMED]
+        return_statuses = [
+            BookingStatus.CONFIRMED,
+            BookingStatus.ACTIVE,
+            BookingStatus.OVERDUE,
+        ]
+        stmt = select(
+            func.count(Booking.id)
+            .filter(
+                Booking.booking_status.in_(pickup_statuses),
+                Booking.start_date >= day_start,
+                Booking.start_date < day_end,
+            )
+            .label('pickups'),
+            func.count(Booking.id)
+            .filter(
+                Booking.booking_status.in_(return_statuses),
+                Booking.end_date >= day_start,
+                Booking.end_date < day_end,
+            )
+            .label('returns'),
+            func.count(Booking.id)
+            .filter(
+                or_(
+                    Booking.booking_status == BookingStatus.OVERDUE,
+                    and_(
+                        Booking.booking_status.in_(
+                            [BookingStatus.ACTIVE, BookingStatus.CONFIRMED]
+                        ),
+                        Booking.end_date < now,
+                    ),
+                )
+            )
+            .label('overdue'),
+        ).where(Booking.deleted_at.is_(None))
+        row = (await self.session.execute(stmt)).one()
+        return {
+            'pickups': row.pickups,
+            'returns': row.returns,
+            'overdue': row.overdue,
+        }
+
+    async def get_busy_intervals(
+        self, equipment_ids: Sequence[int], start_date: datetime, end_date: datetime
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get merged busy intervals of equipment within a window.
+
+        Bookings in busy statuses are clipped to the window and overlapping
+        or touching ones are merged in SQL: a booking starts a new interval
+        when it begins after the latest end of the bookings before it.
+
+        Args:
+            equipment_ids: Equipment IDs
+            start_date: Window start (inclusive)
+            end_date: Window end (exclusive)
+
+        Returns:
+            Busy intervals per equipment ID in chronological order, each a
+            dictionary with 'start', 'end' and 'booking_ids'
+        """
+        clipped = (
+            select(
+                Booking.id,
+                Booking.equipment_id,
+                func.greatest(Booking.start_date, start_date).label('start'),
+                func.least(Booking.end_date, end_date).label('end'),
+            )
+            .where(
+                Booking.equipment_id.in_(equipment_ids),
+                Booking.booking_status.in_(BUSY_STATUSES),
+                Booking.deleted_at.is_(None),
+                Booking.start_date < end_date,
+                Booking.end_date > start_date,
+            )
+            .subquery()
+        )
+        previous_end = (
+            func.max(clipped.c.end)
+            .over(
+                partition_by=clipped.c.equipment_id,
+                order_by=(clipped.c.start, clipped.c.end),
+                rows=(None, -1),
+            )
+            .label('previous_end')
+        )
+        ordered = select(clipped, previous_end).subquery()
+        island = (
+            func.sum(
+                case(
+                    (
+                        or_(
+                            ordered.c.previous_end.is_(None),
+                            ordered.c.start > ordered.c.previous_end,
+                        ),
+                        1,
+                    ),
+                    else_=0,
+                )
+            )
+            .over(
+                partition_by=ordered.c.equipment_id,
+                order_by=(ordered.c.start, ordered.c.end),
+            )
+            .label('island')
+        )
+        islands = select(ordered, island).subquery()
+        stmt = (
+            select(
+                islands.c.equipment_id,
+                func.min(islands.c.start).label('start'),
+                func.max(islands.c.end).label('end'),
+                func.array_agg(islands.c.id).label('booking_ids'),
+            )
+            .group_by(islands.c.equipment_id, islands.c.island)
+            .order_by(islands.c.equipment_id, func.min(islands.c.start))
+        )
+
+        intervals: Dict[int, List[Dict[str, Any]]] = {}
+        for row in (await self.session.execute(stmt)).all():
+            intervals.setdefault(row.equipment_id, []).append(
+                {
+                    'start': row.start,
+                    'end': row.end,
+                    'booking_ids': sorted(row.booking_ids),
+                }
+            )
+        return intervals
+
+    async def close_project_bookings(
+        self, project_id: int, deleted_at: datetime
+    ) -> List[Row]:
+        """Complete and soft delete all bookings of a project in one statement.
+
+        Bookings that are not already completed or cancelled become
+        completed. The change is flushed but not committed.
+
+        Args:
+            project_id: Project ID
+            deleted_at: Soft deletion timestamp
+
+        Returns:
+            Rows with 'id' and 'equipment_id' of the closed bookings
+        """
+        stmt = (
+            update(Booking)
+            .where(Booking.project_id == project_id, Booking.deleted_at.is_(None))
+            .values(
+                booking_status=case(
+                    (
+                        Booking.booking_status.in_(
+                            [BookingStatus.COMPLETED, BookingStatus.CANCELLED]
+                        ),
+                        Booking.booking_status,
+                    ),
+                    else_=BookingStatus.COMPLETED,
+                ),
+                deleted_at=deleted_at,
+            )
+            .returning(Booking.id, Booking.equipment_id)
+            .execution_options(synchronize_session='fetch')
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_project_open_bookings(
+        self,
+        project_id: int,
+        booking_ids: Optional[Sequence[int]] = None,
+        for_update: bool = False,
+    ) -> List[Row]:
+        """Get open bookings of a project with their equipment names.
+
+        Args:
+            project_id: Project ID
+            booking_ids: Only return these bookings
+            for_update: Lock the booking rows until the end of the transaction
+
+        Returns:
+            Rows with 'id', 'equipment_id', 'equipment_name', 'start_date'
+            and 'end_date', ordered by ID
+        """
+        stmt = (
+            select(
+                Booking.id,
+                Booking.equipment_id,
+                Equipment.name.label('equipment_name'),
+                Booking.start_date,
+                Booking.end_date,
+            )
+            .join(Equipment, Equipment.id == Booking.equipment_id)
+            .where(
+                Booking.project_id == project_id,
+                Booking.booking_status.in_(OPEN_STATUSES),
+                Booking.deleted_at.is_(None),
+            )
+            .order_by(Booking.id)
+        )
+        if booking_ids is not None:
+            stmt = stmt.where(Booking.id.in_(booking_ids))
+        if for_update:
+            stmt = stmt.with_for_update(of=Booking)
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def find_move_conflicts(self, moves: Sequence[BookingMove]) -> List[Row]:
+        """Find bookings that would overlap bookings moved to new periods.
+
+        All planned periods are checked in one statement, both against
+        bookings that stay in place and against each other. As in
+        ``EquipmentRepository.check_availability``, only confirmed or
+        active bookings block and items without a serial number are never
+        in conflict.
+
+        Args:
+            moves: Planned periods of the moved bookings
+
+        Returns:
+            Rows with 'booking_id', 'equipment_id', 'conflicting_booking_id',
+            'conflicting_project_id', 'start_date', 'end_date' and
+            'booking_status' of the conflicting booking
+        """
+        if not moves:
+            return []
+        moved = values(
+            column('booking_id', Integer),
+            column('equipment_id', Integer),
+            column('start_date', DateTime(timezone=True)),
+            column('end_date', DateTime(timezone=True)),
+            name='moved',
+        ).data(list(moves))
+        moved_ids = [move[0] for move in moves]
+        equipment_ids = {move[1] for move in moves}
+
+        staying = select(
+            Booking.id,
+            Booking.equipment_id,
+            Booking.project_id,
+            Booking.start_date,
+            Booking.end_date,
+            Booking.booking_status,
+        ).where(
+            Booking.equipment_id.in_(equipment_ids),
+            Booking.id.not_in(moved_ids),
+            Booking.booking_status.in_(BLOCKING_STATUSES),
+            Booking.deleted_at.is_(None),
+        )
+        moving = (
+            select(
+                Booking.id,
+                Booking.equipment_id,
+                Booking.project_id,
+                moved.c.start_date,
+                moved.c.end_date,
+                Booking.booking_status,
+            )
+            .join(moved, moved.c.booking_id == Booking.id)
+            .where(Booking.booking_status.in_(BLOCKING_STATUSES))
+        )
+        blockers = union_all(staying, moving).subquery('blockers')
+
+        stmt = (
+            select(
+                moved.c.booking_id,
+                moved.c.equipment_id,
+                blockers.c.id.label('conflicting_booking_id'),
+                blockers.c.project_id.label('conflicting_project_id'),
+                blockers.c.start_date,
+                blockers.c.end_date,
+                blockers.c.booking_status,
+            )
+            .join(
+                blockers,
+                and_(
+                    blockers.c.equipment_id == moved.c.equipment_id,
+                    blockers.c.id != moved.c.booking_id,
+                    blockers.c.start_date < moved.c.end_date,
+                    blockers.c.end_date > moved.c.start_date,
+                ),
+            )
+            .join(Equipment, Equipment.id == moved.c.equipment_id)
+            .where(func.coalesce(func.trim(Equipment.serial_number), '') != '')
+            .order_by(moved.c.booking_id, blockers.c.start_date)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def move_bookings(
+        self,
+        booking_ids: Sequence[int],
+        shift: Optional[timedelta] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """Move bookings in one statement.
+
+        Either shifts every booking by the same interval or sets the same
+        period on all of them. The change is flushed but not committed.
+
+        Args:
+            booking_ids: IDs of the bookings to move
+            shift: Interval added to both dates
+            start_date: New start date, used when no shift is given
+            end_date: New end date, used when no shift is given
+
+        Returns:
+            Number of moved bookings
+        """
+        if shift is not None:
+            new_values = {
+                'start_date': Booking.start_date + shift,
+                'end_date': Booking.end_date + shift,
+            }
+        else:
+            new_values = {'start_date': start_date, 'end_date': end_date}
+        result = await self.session.execute(
+            update(Booking)
+            .where(Booking.id.in_(booking_ids))
+            .values(**new_values)
+            .execution_options(synchronize_session='fetch')
+        )
+        return result.rowcount
+
     async def get_by_payment_status(self, status: PaymentStatus) -> List[Booking]:
         """Get bookings by payment status.
 
@@ -506,6 +891,7 @@ class BookingRepository(BaseRepository[Booking]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @read_only
     async def get_filtered(
         self,
         query: Optional[str] = None,
@@ -831,9 +1217,9 @@ class BookingRepository(BaseRepository[Booking]):
         """
         try:
             self.session.add(instance)
-            await self.session.commit()
-            await self.session.refresh(instance)
+            await self._flush(instance)
+            await commit_or_flush(self.session)
             return instance
         except Exception as e:
-            await self.session.rollback()
+            await rollback_if_unowned(self.session)
             raise e
@@ -6,13 +6,13 @@ including creating, retrieving, updating, and organizing hierarchical relationsh
 
 from typing import Dict, List, Optional
 
-from sqlalchemy import bindparam, literal_column, select
+from sqlalchemy import RowMapping, and_, delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased
 from sqlalchemy.sql import func
 from sqlalchemy.sql.expression import CTE, or_
 
-from backend.models import Category, Equipment
+from backend.core.database import read_only
+from backend.models import Category, CategoryEquipmentCount, Equipment
 from backend.repositories import BaseRepository
 
 
@@ -103,6 +103,7 @@ class CategoryRepository(BaseRepository[Category]):
         """
         return await self.get_children(category_id)
 
+    @read_only
     async def search(
         self,
         query: str,
@@ -134,118 +135,114 @@ class CategoryRepository(BaseRepository[Category]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    @read_only
     async def get_all_with_equipment_count(self) -> List[Category]:
         """Get all categories with equipment count.
 
+        Counts are read from the ``category_equipment_counts`` rollup, which
+        triggers keep current, so the cost does not grow with the catalog.
+
         Returns:
             List of categories with equipment count, including equipment
             from subcategories.
         """
-        # Create recursive CTE to get all subcategories
-        hierarchy: CTE = select(
-            Category.id.label('category_id'),
-            Category.id.label('subcategory_id'),
-        ).cte(recursive=True)
-
-        hierarchy = hierarchy.union_all(
-            select(
-                hierarchy.c.category_id,
-                Category.id.label('subcategory_id'),
-            ).join(
-                Category,
-                Category.parent_id == hierarchy.c.subcategory_id,
-            )
-        )
-
-        # Count equipment in each category and its subcategories
-        equipment_count = (
-            select(
-                hierarchy.c.category_id,
-                func.count(Equipment.id).label('equipment_count'),
-            )
-            .join(
-                Equipment,
-                Equipment.category_id == hierarchy.c.subcategory_id,
-            )
-            .group_by(hierarchy.c.category_id)
-            .subquery()
-        )
-
-        # Get categories with equipment count
         stmt = (
             select(
                 Category,
-                func.coalesce(equipment_count.c.equipment_count, 0).label(
-                    'equipment_count'
-                ),
+                CategoryEquipmentCount.status,
+                CategoryEquipmentCount.direct_count,
+                CategoryEquipmentCount.subtree_count,
             )
             .outerjoin(
-                equipment_count,
-                Category.id == equipment_count.c.category_id,
+                CategoryEquipmentCount,
+                and_(
+                    CategoryEquipmentCount.category_id == Category.id,
+                    CategoryEquipmentCount.subtree_count > 0,
+                ),
             )
             .where(Category.deleted_at.is_(None))
+            .order_by(Category.id)
         )
 
         result = await self.session.execute(stmt)
-        categories = []
-        for row in result:
-            category = row[0]
-            category.equipment_count = row[1]
-            categories.append(category)
-        return categories
+        categories: Dict[int, Category] = {}
+        for category, status, direct_count, subtree_count in result:
+            if category.id not in categories:
+                category.equipment_count = 0
+                category.direct_equipment_count = 0
+                category.equipment_by_status = {}
+                categories[category.id] = category
+            if status is not None:
+                category.equipment_count += subtree_count
+                category.direct_equipment_count += direct_count
+                category.equipment_by_status[status.value] = subtree_count
+        return list(categories.values())
+
+    async def rebuild_equipment_counts(self) -> int:
+        """Recompute the ``category_equipment_counts`` rollup from scratch.
+
+        Triggers keep the rollup current; a rebuild is only needed after
+        writes made with triggers disabled, e.g. with
+        ``session_replication_role = replica``. The change is not committed.
 
-    async def get_category_path_from_root(self, category_id: int) -> List[Dict]:
-        """Retrieves the full ancestry path for a given category_id.
-
-        Path is ordered from root, using SQLAlchemy ORM for the recursive CTE.
+        Returns:
+            Number of rollup rows written
         """
-        # Alias for the Category model for the recursive part of the CTE
-        category_alias = aliased(Category, name='c_alias')
-
-        # Base case of the CTE: select the starting category
-        cte_base = (
+        ancestors: CTE = select(
+            Category.id.label('category_id'),
+            Category.id.label('ancestor_id'),
+        ).cte('category_ancestors', recursive=True)
+        ancestors = ancestors.union(
+            select(ancestors.c.category_id, Category.parent_id)
+            .join(Category, Category.id == ancestors.c.ancestor_id)
+            .where(Category.parent_id.is_not(None))
+        )
+        direct = (
             select(
-                Category.id,
-                Category.name,
-                Category.parent_id,
-                Category.show_in_print_overview,
-                literal_column('0').label('distance'),
+                Equipment.category_id,
+                Equipment.status,
+                func.count(Equipment.id).label('n'),
             )
-            .where(Category.id == bindparam('current_category_id'))
-            .where(Category.deleted_at.is_(None))
-            .cte(name='category_path_cte', recursive=True)
+            .where(Equipment.deleted_at.is_(None))
+            .group_by(Equipment.category_id, Equipment.status)
+            .cte('direct_counts')
         )
-
-        # Recursive part of the CTE: join with the CTE itself
-        cte_recursive_part = (
+        rows = (
             select(
-                category_alias.id,
-                category_alias.name,
-                category_alias.parent_id,
-                category_alias.show_in_print_overview,
-                (cte_base.c.distance + 1).label('distance'),
+                ancestors.c.ancestor_id,
+                direct.c.status,
+                func.coalesce(
+                    func.sum(direct.c.n).filter(
+                        ancestors.c.ancestor_id == direct.c.category_id
+                    ),
+                    0,
+                ),
+                func.sum(direct.c.n),
             )
-            .join(cte_base, category_alias.id == cte_base.c.parent_id)
-            .where(category_alias.deleted_at.is_(None))
+            .join(ancestors, ancestors.c.category_id == direct.c.category_id)
+            .group_by(ancestors.c.ancestor_id, direct.c.status)
         )
 
-        # Combine base and recursive parts
-        category_path_cte = cte_base.union_all(cte_recursive_part)
-
-        # Final query to select from the CTE and order the results
-        final_query = (
-            select(
-                category_path_cte.c.id,
-                category_path_cte.c.name,
-                category_path_cte.c.show_in_print_overview,
-                category_path_cte.c.parent_id,
+        await self.session.execute(delete(CategoryEquipmentCount))
+        result = await self.session.execute(
+            insert(CategoryEquipmentCount).from_select(
+                ['category_id', 'status', 'direct_count', 'subtree_count'], rows
             )
-            .select_from(category_path_cte)
-            .order_by(category_path_cte.c.distance.desc())
         )
+        return getattr(result, 'rowcount', 0)
+
+    async def get_tree_nodes(self) -> List[RowMapping]:
+        """Get the hierarchy fields of all non-deleted categories.
 
+        Returns:
+            Rows with id, name, parent_id and show_in_print_overview
+        """
         result = await self.session.execute(
-            final_query, {'current_category_id': category_id}
+            select(
+                Category.id,
+                Category.name,
+                Category.parent_id,
+                Category.show_in_print_overview,
+            ).where(Category.deleted_at.is_(None))
         )
-        rows = result.mappings().all()
-        return [dict(row) for row in rows]
+        return list(result.mappings().all())
@@ -5,22 +5,48 @@ including inventory tracking, availability status, and maintenance records.
 """
 
 from datetime import datetime
-from typing import Any, List, Optional, Protocol, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
-from sqlalchemy import Column, ScalarSelect, and_, or_, select
+from sqlalchemy import (
+    Column,
+    RowMapping,
+    ScalarSelect,
+    and_,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import Select
 
+from backend.core.database import read_only
 from backend.exceptions import BusinessError
 from backend.models.booking import Booking, BookingStatus
+from backend.models.category import Category
 from backend.models.equipment import Equipment, EquipmentStatus
 from backend.models.project import Project
 from backend.repositories import BaseRepository
 
 T = TypeVar('T')
 
+# Category name shown for equipment without a category
+UNCATEGORIZED_NAME = 'Без категории'
+
 
 class HasBookingStatus(Protocol):
     """Protocol for models with booking_status attribute."""
@@ -203,6 +229,7 @@ class EquipmentRepository(BaseRepository[Equipment]):
             .scalar_subquery()
         )
 
+    @read_only
     async def search(
         self,
         query_str: str,
@@ -310,6 +337,143 @@ class EquipmentRepository(BaseRepository[Equipment]):
         )
         return overlapping_booking is None or bool(has_valid_booking)
 
+    async def find_alternatives(
+        self,
+        equipment: Equipment,
+        start_date: datetime,
+        end_date: datetime,
+        same_name: bool = False,
+        limit: int = 10,
+    ) -> List[RowMapping]:
+        """Find equipment that can be booked instead of the given item.
+
+        Candidates come from the item's category and its descendants and
+        follow the same rules as :meth:`check_availability`: they must be
+        available or rented, and items with a serial number must have no
+        confirmed or active booking overlapping the period. Results are
+        ranked by exact name match, then by a shared first word of the name
+        (usually the brand), category distance and name.
+
+        Args:
+            equipment: Equipment item to replace
+            start_date: Period start
+            end_date: Period end
+            same_name: Only return items with the same name
+            limit: Maximum number of results
+
+        Returns:
+            Rows with equipment columns, 'category_name', 'same_name' and
+            'category_depth'
+        """
+        subtree = (
+            select(Category.id, literal(0).label('depth'))
+            .where(Category.id == equipment.category_id)
+            .cte('alternative_categories', recursive=True)
+        )
+        subtree = subtree.union_all(
+            select(Category.id, (subtree.c.depth + 1).label('depth')).where(
+                Category.parent_id == subtree.c.id,
+                Category.deleted_at.is_(None),
+            )
+        )
+        name_match = func.lower(Equipment.name) == equipment.name.lower()
+        words = equipment.name.lower().split()
+        prefix_match = (
+            func.lower(Equipment.name).startswith(words[0], autoescape=True)
+            if words
+            else literal(False)
+        )
+        busy = (
+            select(Booking.id)
+            .where(
+                Booking.equipment_id == Equipment.id,
+                Booking.booking_status.in_(
+                    [BookingStatus.CONFIRMED, BookingStatus.ACTIVE]
+                ),
+                Booking.deleted_at.is_(None),
+                Booking.start_date < end_date,
+                Booking.end_date > start_date,
+            )
+            .exists()
+        )
+        stmt = (
+            select(
+                Equipment.id,
+                Equipment.name,
+                Equipment.barcode,
+                Equipment.serial_number,
+                Equipment.category_id,
+                Category.name.label('category_name'),
+                Equipment.status,
+                Equipment.replacement_cost,
+                name_match.label('same_name'),
+                subtree.c.depth.label('category_depth'),
+            )
+            .join(subtree, subtree.c.id == Equipment.category_id)
+            .join(Category, Category.id == Equipment.category_id)
+            .where(
+                Equipment.id != equipment.id,
+                Equipment.deleted_at.is_(None),
+                Equipment.status.in_(
+                    [EquipmentStatus.AVAILABLE, EquipmentStatus.RENTED]
+                ),
+                or_(
+                    func.coalesce(func.trim(Equipment.serial_number), '') == '',
+                    ~busy,
+                ),
+            )
+            .order_by(
+                name_match.desc(),
+                prefix_match.desc(),
+                subtree.c.depth,
+                Equipment.name,
+                Equipment.id,
+            )
+            .limit(limit)
+        )
+        if same_name:
+            stmt = stmt.where(name_match)
+
+        result = await self.session.execute(stmt)
+        return list(result.mappings().all())
+
+    async def release_rented(self, equipment_ids: Iterable[int]) -> List[int]:
+        """Make rented equipment available when no active booking is left.
+
+        The change is flushed but not committed.
+
+        Args:
+            equipment_ids: IDs of equipment whose bookings ended
+
+        Returns:
+            IDs of equipment that became available
+        """
+        ids = list(equipment_ids)
+        if not ids:
+            return []
+        active_booking = (
+            select(Booking.id)
+            .where(
+                Booking.equipment_id == Equipment.id,
+                Booking.booking_status == BookingStatus.ACTIVE,
+                Booking.deleted_at.is_(None),
+            )
+            .exists()
+        )
+        stmt = (
+            update(Equipment)
+            .where(
+                Equipment.id.in_(ids),
+                Equipment.status == EquipmentStatus.RENTED,
+                ~active_booking,
+            )
+            .values(status=EquipmentStatus.AVAILABLE)
+            .returning(Equipment.id)
+            .execution_options(synchronize_session='fetch')
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_status(self, status: EquipmentStatus) -> List[Equipment]:
         """Get equipment by status.
 
@@ -324,6 +488,56 @@ class EquipmentRepository(BaseRepository[Equipment]):
         )
         return list(result.scalars().all())
 
+    async def get_existing_ids(self, equipment_ids: Sequence[int]) -> Set[int]:
+        """Get IDs of non-deleted equipment among the given ones.
+
+        Args:
+            equipment_ids: Equipment IDs to look up
+
+        Returns:
+            IDs that exist and are not deleted
+        """
+        result = await self.session.execute(
+            select(Equipment.id).where(
+                Equipment.id.in_(equipment_ids), Equipment.deleted_at.is_(None)
+            )
+        )
+        return set(result.scalars().all())
+
+    @read_only
+    async def count_by_status(self) -> Dict[str, int]:
+        """Count non-deleted equipment grouped by status.
+
+        Returns:
+            Number of equipment items per status value
+        """
+        result = await self.session.execute(
+            select(Equipment.status, func.count(Equipment.id))
+            .where(Equipment.deleted_at.is_(None))
+            .group_by(Equipment.status)
+        )
+        return {status.value: count for status, count in result.all()}
+
+    @read_only
+    async def count_by_category(self) -> List[RowMapping]:
+        """Count non-deleted equipment grouped by category.
+
+        Returns:
+            Rows with category_id, category_name and count, largest first
+        """
+        result = await self.session.execute(
+            select(
+                Equipment.category_id,
+                func.coalesce(Category.name, UNCATEGORIZED_NAME).label('category_name'),
+                func.count(Equipment.id).label('count'),
+            )
+            .outerjoin(Category, Equipment.category_id == Category.id)
+            .where(Equipment.deleted_at.is_(None))
+            .group_by(Equipment.category_id, Category.name)
+            .order_by(func.count(Equipment.id).desc(), Category.name)
+        )
+        return list(result.mappings().all())
+
     async def get(
         self, id: Union[int, UUID], include_deleted: bool = False
     ) -> Optional[Equipment]:
@@ -366,6 +580,82 @@ class EquipmentRepository(BaseRepository[Equipment]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    def _apply_list_filters(
+        self,
+        stmt: Select,
+        status: Optional[EquipmentStatus] = None,
+        category_id: Optional[int] = None,
+        category_ids: Optional[List[int]] = None,
+        query: Optional[str] = None,
+        available_from: Optional[datetime] = None,
+        available_to: Optional[datetime] = None,
+        include_deleted: bool = False,
+    ) -> Select:
+        """Apply equipment list filters to a statement.
+
+        Args:
+            stmt: Statement selecting from the equipment table
+            status: Filter by equipment status
+            category_id: Filter by category ID
+            category_ids: Filter by category IDs, takes precedence over category_id
+            query: Search in name, description, barcode and serial number
+            available_from: Start of the period equipment must be free in
+            available_to: End of the period equipment must be free in
+            include_deleted: Whether to include soft-deleted equipment
+
+        Returns:
+            Filtered statement
+        """
+        # Фильтрация удалённых элементов, если include_deleted=False
+        if not include_deleted:
+            stmt = stmt.where(Equipment.deleted_at.is_(None))
+
+        if status:
+            stmt = stmt.where(Equipment.status == status)
+
+        # Use category_ids if provided, otherwise fall back to category_id
+        if category_ids:
+            stmt = stmt.where(Equipment.category_id.in_(category_ids))
+        elif category_id:
+            stmt = stmt.where(Equipment.category_id == category_id)
+
+        if query:
+            search_pattern = f'%{query}%'
+            stmt = stmt.where(
+                or_(
+                    Equipment.name.ilike(search_pattern),
+                    Equipment.description.ilike(search_pattern),
+                    Equipment.barcode.ilike(search_pattern),
+                    Equipment.serial_number.ilike(search_pattern),
+                )
+            )
+
+        # Add date filtering if both dates are provided
+        if available_from and available_to:
+            # Get equipment IDs that are not booked during the specified period
+            booked_equipment = (
+                select(Booking.equipment_id)
+                .where(
+                    and_(
+                        Booking.start_date < available_to,
+                        Booking.end_date > available_from,
+                        Booking.booking_status.in_(
+                            [
+                                BookingStatus.PENDING,
+                                BookingStatus.CONFIRMED,
+                                BookingStatus.ACTIVE,
+                            ]
+                        ),
+                        Booking.deleted_at.is_(None),
+                    )
+                )
+                .distinct()
+            )
+            stmt = stmt.where(~Equipment.id.in_(booked_equipment))
+
+        return stmt
+
+    @read_only
     async def get_list(
         self,
         skip: int = 0,
@@ -380,58 +670,84 @@ class EquipmentRepository(BaseRepository[Equipment]):
     ) -> List[Equipment]:
         """Get list of equipment with optional filtering and search."""
         try:
-            stmt = select(Equipment)
+            stmt = self._apply_list_filters(
+                select(Equipment),
+                status=status,
+                category_id=category_id,
+                category_ids=category_ids,
+                query=query,
+                available_from=available_from,
+                available_to=available_to,
+                include_deleted=include_deleted,
+            )
+            stmt = stmt.offset(skip).limit(limit)
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
 
-            # Фильтрация удалённых элементов, если include_deleted=False
-            if not include_deleted:
-                stmt = stmt.where(Equipment.deleted_at.is_(None))
+        except Exception as e:
+            raise BusinessError(
+                'Failed to get equipment list',
+                details={'error': str(e)},
+            ) from e
 
-            if status:
-                stmt = stmt.where(Equipment.status == status)
+    @read_only
+    async def get_list_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[EquipmentStatus] = None,
+        category_id: Optional[int] = None,
+        category_ids: Optional[List[int]] = None,
+        query: Optional[str] = None,
+        available_from: Optional[datetime] = None,
+        available_to: Optional[datetime] = None,
+        include_deleted: bool = False,
+    ) -> List[RowMapping]:
+        """Get equipment list rows with the category name in a single query.
 
-            # Use category_ids if provided, otherwise fall back to category_id
-            if category_ids:
-                stmt = stmt.where(Equipment.category_id.in_(category_ids))
-            elif category_id:
-                stmt = stmt.where(Equipment.category_id == category_id)
+        Selects plain columns joined with the category name instead of ORM
+        entities, so no identity map bookkeeping or relationship loading
+        happens per row. Takes the same filters as :meth:`get_list`.
 
-            if query:
-                search_pattern = f'%{query}%'
-                stmt = stmt.where(
-                    or_(
-                        Equipment.name.ilike(search_pattern),
-                        Equipment.description.ilike(search_pattern),
-                        Equipment.barcode.ilike(search_pattern),
-                        Equipment.serial_number.ilike(search_pattern),
-                    )
-                )
+        Returns:
+            Row mappings with equipment columns and ``category_name``
 
-            # Add date filtering if both dates are provided
-            if available_from and available_to:
-                # Get equipment IDs that are not booked during the specified period
-                booked_equipment = (
-                    select(Booking.equipment_id)
-                    .where(
-                        and_(
-                            Booking.start_date < available_to,
-                            Booking.end_date > available_from,
-                            Booking.booking_status.in_(
-                                [
-                                    BookingStatus.PENDING,
-                                    BookingStatus.CONFIRMED,
-                                    BookingStatus.ACTIVE,
-                                ]
-                            ),
-                            Booking.deleted_at.is_(None),
-                        )
-                    )
-                    .distinct()
+        Raises:
+            BusinessError: If the query fails
+        """
+        try:
+            stmt = (
+                select(
+                    Equipment.id,
+                    Equipment.name,
+                    Equipment.description,
+                    Equipment.category_id,
+                    Equipment.barcode,
+                    Equipment.serial_number,
+                    Equipment.replacement_cost,
+                    Equipment.status,
+                    Equipment.created_at,
+                    Equipment.updated_at,
+                    func.coalesce(Category.name, UNCATEGORIZED_NAME).label(
+                        'category_name'
+                    ),
                 )
-                stmt = stmt.where(~Equipment.id.in_(booked_equipment))
-
-            stmt = stmt.offset(skip).limit(limit)
+                .select_from(Equipment)
+                .outerjoin(Category, Category.id == Equipment.category_id)
+            )
+            stmt = self._apply_list_filters(
+                stmt,
+                status=status,
+                category_id=category_id,
+                category_ids=category_ids,
+                query=query,
+                available_from=available_from,
+                available_to=available_to,
+                include_deleted=include_deleted,
+            )
+            stmt = stmt.order_by(Equipment.id).offset(skip).limit(limit)
             result = await self.session.execute(stmt)
-            return list(result.scalars().all())
+            return list(result.mappings().all())
 
         except Exception as e:
             raise BusinessError(
@@ -595,6 +911,7 @@ class EquipmentRepository(BaseRepository[Equipment]):
 
         return stmt
 
+    @read_only
     async def get_active_projects_for_equipment(
         self, equipment_ids: List[int]
     ) -> List[dict]:
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import Select
 
+from backend.core.database import read_only
 from backend.models import (
     Booking,
     Client,
@@ -49,8 +50,7 @@ class ProjectRepository(BaseRepository[Project]):
             Created project
         """
         self.session.add(project)
-        await self.session.flush()
-        await self.session.refresh(project)
+        await self._flush(project)
         return project
 
     async def get_by_id(self, project_id: Union[int, UUID]) -> Optional[Project]:
@@ -91,6 +91,7 @@ class ProjectRepository(BaseRepository[Project]):
         result = await self.session.execute(query)
         return result.scalars().first()
 
+    @read_only
     async def get_projects_with_filters(
         self,
         limit: int = 100,
@@ -195,8 +196,7 @@ class ProjectRepository(BaseRepository[Project]):
             if hasattr(project, key):
                 setattr(project, key, value)
 
-        await self.session.flush()
-        await self.session.refresh(project)
+        await self._flush(project)
         return project
 
     def get_paginatable_query(
@@ -0,0 +1,439 @@
+"""Report repository module.
+
+This module maintains the ``booking_daily_stats`` summary table and builds
+the aggregate queries behind utilization and revenue reports.
+"""
+
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Numeric,
+    case,
+    cast,
+    delete,
+    distinct,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from backend.core.timezone_utils import MOSCOW_TZ_NAME
+from backend.core.watermark import change_watermark_query
+from backend.models import (
+    Booking,
+    BookingDailyStat,
+    BookingStatus,
+    Category,
+    Client,
+    Equipment,
+    EquipmentStatus,
+)
+from backend.repositories.base import BaseRepository
+from backend.repositories.equipment import UNCATEGORIZED_NAME
+
+# Bookings in these states count towards utilization and revenue
+REPORTED_BOOKING_STATUSES = (
+    BookingStatus.CONFIRMED,
+    BookingStatus.ACTIVE,
+    BookingStatus.OVERDUE,
+    BookingStatus.COMPLETED,
+)
+
+# Advisory lock key serializing summary table refreshes across workers
+REFRESH_LOCK_KEY = 0x5245504F  # 'REPO'
+
+
+def _category_subtree_filter(category_id: int) -> Any:
+    """Build a filter limiting equipment to a category and its descendants.
+
+    Args:
+        category_id: Root category ID
+
+    Returns:
+        SQL expression usable in a WHERE clause
+    """
+    subtree = (
+        select(Category.id)
+        .where(Category.id == category_id)
+        .cte('report_categories', recursive=True)
+    )
+    subtree = subtree.union_all(
+        select(Category.id).where(
+            Category.parent_id == subtree.c.id,
+            Category.deleted_at.is_(None),
+        )
+    )
+    return Equipment.category_id.in_(select(subtree.c.id))
+
+
+class ReportRepository(BaseRepository[BookingDailyStat]):
+    """Repository for report summary data."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        super().__init__(session, BookingDailyStat)
+
+    async def lock_refresh(self, wait: bool = True) -> bool:
+        """Take the refresh lock for the current transaction.
+
+        The lock is released when the transaction commits or rolls back.
+
+        Args:
+            wait: Wait for a concurrent refresh to finish instead of
+                giving up immediately
+
+        Returns:
+            bool: True if the lock was taken
+        """
+        if wait:
+            await self.session.execute(
+                select(func.pg_advisory_xact_lock(REFRESH_LOCK_KEY))
+            )
+            return True
+        result = await self.session.execute(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))
+        )
+        return bool(result.scalar_one())
+
+    async def get_change_watermark(self) -> datetime:
+        """Get the point the next incremental refresh must resume from.
+
+        Returns:
+            datetime: Database-side change watermark
+        """
+        result = await self.session.execute(change_watermark_query())
+        return result.scalar_one()
+
+    async def get_watermark(self) -> Optional[datetime]:
+        """Get the time of the last refresh that produced rows.
+
+        Returns:
+            Optional[datetime]: Latest ``refreshed_at`` or None if empty
+        """
+        result = await self.session.execute(
+            select(func.max(BookingDailyStat.refreshed_at))
+        )
+        return result.scalar_one_or_none()
+
+    async def refresh_daily_stats(
+        self, refreshed_at: datetime, since: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """Rebuild summary rows for bookings changed since a point in time.
+
+        Rows of the affected bookings are deleted and recomputed in one
+        ``INSERT ... SELECT``: ``generate_series`` expands every booking into
+        its rental days and window functions split the booking amount over
+        them, giving the rounding remainder to the last day. Bookings that
+        start matching ``since`` between the two statements already have
+        rows, which are overwritten.
+
+        Callers hold the refresh lock, see ``lock_refresh``.
+
+        Args:
+            refreshed_at: Watermark stored on the new rows
+            since: Only process bookings updated at or after this time;
+                None rebuilds the whole table
+
+        Returns:
+            Tuple of (processed bookings, inserted rows)
+        """
+        changed = select(Booking.id)
+        if since is not None:
+            changed = changed.where(Booking.updated_at >= since)
+
+        bookings = (
+            await self.session.execute(
+                select(func.count()).select_from(changed.subquery())
+            )
+        ).scalar_one()
+
+        clear = delete(BookingDailyStat)
+        if since is not None:
+            clear = clear.where(BookingDailyStat.booking_id.in_(changed))
+        await self.session.execute(clear)
+
+        first_day = func.date(func.timezone(MOSCOW_TZ_NAME, Booking.start_date))
+        last_day = func.date(func.timezone(MOSCOW_TZ_NAME, Booking.end_date))
+        expanded = (
+            select(
+                Booking.id.label('booking_id'),
+                cast(
+                    func.generate_series(
+                        first_day, last_day, literal_column("interval '1 day'")
+                    ),
+                    Date,
+                ).label('day'),
+                Booking.equipment_id,
+                Booking.client_id,
+                Booking.quantity,
+                Booking.total_amount,
+            )
+            .where(
+                Booking.deleted_at.is_(None),
+                Booking.booking_status.in_(REPORTED_BOOKING_STATUSES),
+                Booking.id.in_(changed),
+            )
+            .subquery('expanded')
+        )
+
+        days_in_booking = func.count().over(partition_by=expanded.c.booking_id)
+        day_number = func.row_number().over(
+            partition_by=expanded.c.booking_id, order_by=expanded.c.day
+        )
+        daily_share = func.round(expanded.c.total_amount / days_in_booking, 2)
+        revenue = case(
+            (
+                day_number == days_in_booking,
+                expanded.c.total_amount - daily_share * (days_in_booking - 1),
+            ),
+            else_=daily_share,
+        )
+
+        stmt = pg_insert(BookingDailyStat).from_select(
+            [
+                'booking_id',
+                'day',
+                'equipment_id',
+                'client_id',
+                'quantity',
+                'revenue',
+                'refreshed_at',
+            ],
+            select(
+                expanded.c.booking_id,
+                expanded.c.day,
+                expanded.c.equipment_id,
+                expanded.c.client_id,
+                expanded.c.quantity,
+                revenue,
+                literal(refreshed_at, DateTime(timezone=True)),
+            ),
+        )
+        result = await self.session.execute(
+            stmt.on_conflict_do_update(
+                constraint='uq_booking_daily_stats_day',
+                set_={
+                    name: stmt.excluded[name]
+                    for name in (
+                        'equipment_id',
+                        'client_id',
+                        'quantity',
+                        'revenue',
+                        'refreshed_at',
+                    )
+                },
+            )
+        )
+        await self.session.commit()
+        return bookings, result.rowcount
+
+    def get_utilization_query(
+        self, start_date: date, end_date: date, category_id: Optional[int] = None
+    ) -> Select:
+        """Build equipment utilization query.
+
+        Utilization is the share of days in the period with at least one
+        reported booking. ``category_rank`` ranks items within their category.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+            category_id: Optional category; includes its subcategories
+
+        Returns:
+            Select statement, most utilized equipment first
+        """
+        period_days = (end_date - start_date).days + 1
+        booked = (
+            select(
+                BookingDailyStat.equipment_id,
+                func.count(distinct(BookingDailyStat.day)).label('booked_days'),
+                func.sum(BookingDailyStat.revenue).label('revenue'),
+            )
+            .where(BookingDailyStat.day.between(start_date, end_date))
+            .group_by(BookingDailyStat.equipment_id)
+            .subquery('booked')
+        )
+        booked_days = func.coalesce(booked.c.booked_days, 0)
+        utilization = func.round(cast(booked_days * 100, Numeric) / period_days, 2)
+
+        stmt = (
+            select(
+                Equipment.id.label('equipment_id'),
+                Equipment.name.label('equipment_name'),
+                Equipment.category_id,
+                func.coalesce(Category.name, UNCATEGORIZED_NAME).label('category_name'),
+                booked_days.label('booked_days'),
+                utilization.label('utilization'),
+                func.coalesce(booked.c.revenue, 0).label('revenue'),
+                func.rank()
+                .over(partition_by=Equipment.category_id, order_by=booked_days.desc())
+                .label('category_rank'),
+            )
+            .outerjoin(booked, booked.c.equipment_id == Equipment.id)
+            .outerjoin(Category, Equipment.category_id == Category.id)
+            .where(
+                Equipment.deleted_at.is_(None),
+                Equipment.status != EquipmentStatus.RETIRED,
+            )
+            .order_by(utilization.desc(), Equipment.id)
+        )
+        if category_id is not None:
+            stmt = stmt.where(_category_subtree_filter(category_id))
+        return stmt
+
+    def get_category_revenue_query(self, start_date: date, end_date: date) -> Select:
+        """Build revenue per category query.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+
+        Returns:
+            Select statement, highest revenue first
+        """
+        revenue = func.sum(BookingDailyStat.revenue)
+        return (
+            select(
+                Equipment.category_id,
+                func.coalesce(Category.name, UNCATEGORIZED_NAME).label('category_name'),
+                func.count(distinct(BookingDailyStat.booking_id)).label('bookings'),
+                revenue.label('revenue'),
+                self._share(revenue).label('share'),
+                func.rank().over(order_by=revenue.desc()).label('rank'),
+            )
+            .select_from(BookingDailyStat)
+            .join(Equipment, Equipment.id == BookingDailyStat.equipment_id)
+            .outerjoin(Category, Equipment.category_id == Category.id)
+            .where(BookingDailyStat.day.between(start_date, end_date))
+            .group_by(Equipment.category_id, Category.name)
+            .order_by(revenue.desc(), Equipment.category_id)
+        )
+
+    def get_client_revenue_query(self, start_date: date, end_date: date) -> Select:
+        """Build revenue per client query.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+
+        Returns:
+            Select statement, highest revenue first
+        """
+        revenue = func.sum(BookingDailyStat.revenue)
+        return (
+            select(
+                Client.id.label('client_id'),
+                Client.name.label('client_name'),
+                func.count(distinct(BookingDailyStat.booking_id)).label('bookings'),
+                revenue.label('revenue'),
+                self._share(revenue).label('share'),
+                func.rank().over(order_by=revenue.desc()).label('rank'),
+            )
+            .select_from(BookingDailyStat)
+            .join(Client, Client.id == BookingDailyStat.client_id)
+            .where(BookingDailyStat.day.between(start_date, end_date))
+            .group_by(Client.id, Client.name)
+            .order_by(revenue.desc(), Client.id)
+        )
+
+    def get_monthly_revenue_query(self, start_date: date, end_date: date) -> Select:
+        """Build revenue per month query with running total.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+
+        Returns:
+            Select statement ordered by month
+        """
+        month = func.date_trunc('month', BookingDailyStat.day)
+        revenue = func.sum(BookingDailyStat.revenue)
+        return (
+            select(
+                cast(month, Date).label('month'),
+                func.count(distinct(BookingDailyStat.booking_id)).label('bookings'),
+                revenue.label('revenue'),
+                func.sum(revenue).over(order_by=month).label('running_total'),
+                (revenue - func.lag(revenue).over(order_by=month)).label('change'),
+            )
+            .where(BookingDailyStat.day.between(start_date, end_date))
+            .group_by(month)
+            .order_by(month)
+        )
+
+    def get_idle_equipment_query(
+        self, start_date: date, end_date: date, category_id: Optional[int] = None
+    ) -> Select:
+        """Build query for equipment without bookings in a period.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+            category_id: Optional category; includes its subcategories
+
+        Returns:
+            Select statement, longest idle equipment first
+        """
+        booked_in_period = exists(
+            select(BookingDailyStat.booking_id).where(
+                BookingDailyStat.equipment_id == Equipment.id,
+                BookingDailyStat.day.between(start_date, end_date),
+            )
+        )
+        last_booked_day = (
+            select(func.max(BookingDailyStat.day))
+            .where(
+                BookingDailyStat.equipment_id == Equipment.id,
+                BookingDailyStat.day <= end_date,
+            )
+            .correlate(Equipment)
+            .scalar_subquery()
+        )
+
+        stmt = (
+            select(
+                Equipment.id.label('equipment_id'),
+                Equipment.name.label('equipment_name'),
+                Equipment.category_id,
+                func.coalesce(Category.name, UNCATEGORIZED_NAME).label('category_name'),
+                Equipment.status,
+                last_booked_day.label('last_booked_day'),
+                (literal(end_date, Date) - last_booked_day).label('idle_days'),
+            )
+            .outerjoin(Category, Equipment.category_id == Category.id)
+            .where(
+                Equipment.deleted_at.is_(None),
+                Equipment.status != EquipmentStatus.RETIRED,
+                ~booked_in_period,
+            )
+            .order_by(last_booked_day.asc().nulls_first(), Equipment.id)
+        )
+        if category_id is not None:
+            stmt = stmt.where(_category_subtree_filter(category_id))
+        return stmt
+
+    @staticmethod
+    def _share(revenue: Any) -> Any:
+        """Build percentage of total revenue expression.
+
+        Args:
+            revenue: Aggregated revenue expression of a group
+
+        Returns:
+            Window expression with the group's share of all groups
+        """
+        total = func.nullif(func.sum(revenue).over(), 0)
+        return func.coalesce(func.round(revenue * 100 / total, 2), 0)
@@ -4,14 +4,48 @@ This module provides repository for scan sessions.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 
-from sqlalchemy import or_, select
+from sqlalchemy import (
+    Integer,
+    and_,
+    case,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    union,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 
-from backend.models import ScanSession
+from backend.models import (
+    Booking,
+    BookingStatus,
+    Category,
+    Equipment,
+    EquipmentStatus,
+    ScanSession,
+)
 from backend.repositories.base import BaseRepository
 
+# Equipment in these states is expected to be physically in the warehouse
+ON_SITE_STATUSES = (
+    EquipmentStatus.AVAILABLE,
+    EquipmentStatus.MAINTENANCE,
+    EquipmentStatus.BROKEN,
+)
+
+# Bookings in these states mean the item should currently be with a client
+OUTSTANDING_BOOKING_STATUSES = (
+    BookingStatus.CONFIRMED,
+    BookingStatus.ACTIVE,
+    BookingStatus.OVERDUE,
+)
+
 
 class ScanSessionRepository(BaseRepository[ScanSession]):
     """Repository for scan sessions."""
@@ -79,3 +113,163 @@ class ScanSessionRepository(BaseRepository[ScanSession]):
             await self.soft_delete(session.id)
 
         return len(expired_sessions)
+
+    async def stream_stock_take_rows(
+        self,
+        scanned_ids: Sequence[int],
+        now: datetime,
+        category_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Row[Any]]:
+        """Stream reconciled rows through a server-side cursor.
+
+        Args:
+            scanned_ids: Distinct equipment IDs present in the scan session
+            now: Reference time used to detect outstanding bookings
+            category_id: Optional category; limits the audit to its subtree
+            batch_size: Rows fetched from the cursor at once
+
+        Yields:
+            Row[Any]: Rows as described in ``_stock_take_query``
+        """
+        result = await self.session.stream(
+            self._stock_take_query(scanned_ids, now, category_id).execution_options(
+                yield_per=batch_size
+            )
+        )
+        async for row in result:
+            yield row
+
+    async def count_stock_take_results(
+        self,
+        scanned_ids: Sequence[int],
+        now: datetime,
+        category_id: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Count reconciled rows per result without loading them.
+
+        Args:
+            scanned_ids: Distinct equipment IDs present in the scan session
+            now: Reference time used to detect outstanding bookings
+            category_id: Optional category; limits the audit to its subtree
+
+        Returns:
+            Dict[str, int]: Number of rows by StockTakeResult value
+        """
+        rows = (
+            self._stock_take_query(scanned_ids, now, category_id)
+            .order_by(None)
+            .subquery('stock_take')
+        )
+        result = await self.session.execute(
+            select(rows.c.result, func.count()).group_by(rows.c.result)
+        )
+        return {stock_take_result: count for stock_take_result, count in result.all()}
+
+    def _stock_take_query(
+        self,
+        scanned_ids: Sequence[int],
+        now: datetime,
+        category_id: Optional[int] = None,
+    ) -> Select:
+        """Build the stock-take reconciliation query.
+
+        Everything is computed in a single statement: the scanned IDs are
+        passed as one array parameter, unioned with the set of equipment
+        expected on site and classified with a CASE expression.
+
+        Args:
+            scanned_ids: Distinct equipment IDs present in the scan session
+            now: Reference time used to detect outstanding bookings
+            category_id: Optional category; limits the audit to its subtree
+
+        Returns:
+            Select of rows with equipment columns, category name, outstanding
+            booking ID and a ``result`` column holding a StockTakeResult value
+        """
+        scanned = select(
+            func.unnest(literal(list(scanned_ids), ARRAY(Integer))).label(
+                'equipment_id'
+            )
+        ).cte('scanned')
+
+        outstanding_booking = (
+            select(func.min(Booking.id))
+            .where(
+                Booking.equipment_id == Equipment.id,
+                Booking.deleted_at.is_(None),
+                Booking.booking_status.in_(OUTSTANDING_BOOKING_STATUSES),
+                Booking.start_date <= now,
+                Booking.end_date >= now,
+            )
+            .correlate(Equipment)
+            .scalar_subquery()
+        )
+        has_outstanding_booking = exists(
+            select(Booking.id).where(
+                Booking.equipment_id == Equipment.id,
+                Booking.deleted_at.is_(None),
+                Booking.booking_status.in_(OUTSTANDING_BOOKING_STATUSES),
+                Booking.start_date <= now,
+                Booking.end_date >= now,
+            )
+        )
+
+        in_scope: Any = literal(True)
+        if category_id is not None:
+            subtree = (
+                select(Category.id)
+                .where(Category.id == category_id)
+                .cte('audit_categories', recursive=True)
+            )
+            subtree = subtree.union_all(
+                select(Category.id).where(
+                    Category.parent_id == subtree.c.id,
+                    Category.deleted_at.is_(None),
+                )
+            )
+            in_scope = Equipment.category_id.in_(select(subtree.c.id))
+
+        expected = select(Equipment.id.label('equipment_id')).where(
+            Equipment.deleted_at.is_(None),
+            Equipment.status.in_(ON_SITE_STATUSES),
+            in_scope,
+            ~has_outstanding_booking,
+        )
+        candidates = union(select(scanned.c.equipment_id), expected).subquery(
+            'candidates'
+        )
+
+        is_scanned = scanned.c.equipment_id.is_not(None)
+        is_known = and_(
+            Equipment.id.is_not(None),
+            Equipment.deleted_at.is_(None),
+            Equipment.status != EquipmentStatus.RETIRED,
+            in_scope,
+        )
+        result_column = case(
+            (and_(is_scanned, ~is_known), 'UNEXPECTED'),
+            (and_(is_scanned, Equipment.status == EquipmentStatus.RENTED), 'RENTED'),
+            (and_(is_scanned, outstanding_booking.is_not(None)), 'BOOKED'),
+            (is_scanned, 'PRESENT'),
+            else_='MISSING',
+        ).label('result')
+
+        return (
+            select(
+                candidates.c.equipment_id,
+                Equipment.barcode,
+                Equipment.name,
+                Equipment.serial_number,
+                Equipment.status,
+                Equipment.category_id,
+                Category.name.label('category_name'),
+                outstanding_booking.label('booking_id'),
+                result_column,
+            )
+            .select_from(candidates)
+            .outerjoin(Equipment, Equipment.id == candidates.c.equipment_id)
+            .outerjoin(Category, Category.id == Equipment.category_id)
+            .outerjoin(scanned, scanned.c.equipment_id == candidates.c.equipment_id)
+            .order_by(Category.name, Equipment.name, candidates.c.equipment_id)
+        )
@@ -8,6 +8,11 @@ from backend.models.client import ClientStatus
 from backend.models.document import DocumentStatus, DocumentType
 from backend.models.equipment import EquipmentStatus
 from backend.models.project import ProjectStatus
+from backend.schemas.availability import (
+    EquipmentAlternative,
+    EquipmentTimeline,
+    TimelineInterval,
+)
 from backend.schemas.booking import (
     BookingBase,
     BookingCreate,
@@ -27,6 +32,8 @@ from backend.schemas.client import (
     ClientResponse,
     ClientUpdate,
 )
+from backend.schemas.dashboard import CategoryCount, DashboardSummary
+from backend.schemas.diagnostics import QueryFingerprintSummary, RequestProfileSummary
 from backend.schemas.document import (
     DocumentBase,
     DocumentCreate,
@@ -44,6 +51,11 @@ from backend.schemas.equipment import (
     RegenerateBarcodeRequest,
     StatusTimelineResponse,
 )
+from backend.schemas.health import (
+    HealthCheckResult,
+    PoolStatus,
+    ReadinessResponse,
+)
 from backend.schemas.project import (
     BookingCreateForProject,
     BookingInProject,
@@ -56,15 +68,31 @@ from backend.schemas.project import (
     ProjectCreateWithBookings,
     ProjectPaymentStatusUpdate,
     ProjectPrint,
+    ProjectReschedule,
+    ProjectRescheduleResponse,
     ProjectResponse,
     ProjectUpdate,
     ProjectWithBookings,
+    RescheduleConflict,
+    RescheduledBooking,
+)
+from backend.schemas.report import (
+    CategoryRevenueItem,
+    ClientRevenueItem,
+    IdleEquipmentItem,
+    MonthlyRevenueItem,
+    ReportRefreshResult,
+    UtilizationReportItem,
 )
 from backend.schemas.scan_session import (
     EquipmentItem,
     ScanSessionCreate,
     ScanSessionResponse,
     ScanSessionUpdate,
+    StockTakeItem,
+    StockTakeReport,
+    StockTakeResult,
+    StockTakeSummary,
 )
 
 __all__ = [
@@ -76,6 +104,10 @@ __all__ = [
     'DocumentType',
     'EquipmentStatus',
     'ProjectStatus',
+    # Availability schemas
+    'EquipmentAlternative',
+    'EquipmentTimeline',
+    'TimelineInterval',
     # Booking schemas
     'BookingBase',
     'BookingCreate',
@@ -108,6 +140,16 @@ __all__ = [
     'CategoryUpdate',
     'CategoryWithEquipmentCount',
     'CategoryTree',
+    # Dashboard schemas
+    'CategoryCount',
+    'DashboardSummary',
+    # Health schemas
+    'HealthCheckResult',
+    'PoolStatus',
+    'ReadinessResponse',
+    # Diagnostics schemas
+    'QueryFingerprintSummary',
+    'RequestProfileSummary',
     # Project schemas
     'ProjectBase',
     'ProjectCreate',
@@ -123,9 +165,24 @@ __all__ = [
     'ProjectPrint',
     'DateFilterType',
     'ProjectBookingResponse',
+    'ProjectReschedule',
+    'ProjectRescheduleResponse',
+    'RescheduleConflict',
+    'RescheduledBooking',
+    # Report schemas
+    'CategoryRevenueItem',
+    'ClientRevenueItem',
+    'IdleEquipmentItem',
+    'MonthlyRevenueItem',
+    'ReportRefreshResult',
+    'UtilizationReportItem',
     # Scan Session
     'EquipmentItem',
     'ScanSessionCreate',
     'ScanSessionUpdate',
     'ScanSessionResponse',
+    'StockTakeItem',
+    'StockTakeReport',
+    'StockTakeResult',
+    'StockTakeSummary',
 ]
@@ -0,0 +1,49 @@
+"""Availability schema module.
+
+This module defines Pydantic models for equipment availability timelines
+and suggested alternatives.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from backend.models.equipment import EquipmentStatus
+
+
+class TimelineInterval(BaseModel):
+    """Busy or free interval of an equipment timeline."""
+
+    start: datetime
+    end: datetime
+    booking_ids: List[int] = Field(
+        default_factory=list, description='Bookings making the interval busy'
+    )
+
+
+class EquipmentTimeline(BaseModel):
+    """Busy and free intervals of one equipment item within a window."""
+
+    equipment_id: int
+    start_date: datetime
+    end_date: datetime
+    busy: List[TimelineInterval] = Field(default_factory=list)
+    free: List[TimelineInterval] = Field(default_factory=list)
+
+
+class EquipmentAlternative(BaseModel):
+    """Equipment item available instead of a booked one."""
+
+    id: int
+    name: str
+    barcode: str
+    serial_number: Optional[str] = None
+    category_id: int
+    category_name: str
+    status: EquipmentStatus
+    replacement_cost: Optional[int] = None
+    same_name: bool = Field(description='Whether the name matches the original')
+    category_depth: int = Field(
+        description='Distance from the original category, 0 for the same category'
+    )
@@ -5,7 +5,7 @@ including request/response schemas for managing equipment categories.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -50,5 +50,11 @@ class CategoryWithEquipmentCount(CategoryResponse):
     equipment_count: int = Field(
         ..., description='Number of equipment items in this category'
     )
+    direct_equipment_count: int = Field(
+        0, description='Number of equipment items without subcategories'
+    )
+    equipment_by_status: Dict[str, int] = Field(
+        default_factory=dict, description='Number of equipment items by status'
+    )
 
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,30 @@
+"""Dashboard schema module.
+
+This module defines Pydantic models for the aggregated home dashboard.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CategoryCount(BaseModel):
+    """Number of equipment items in a category."""
+
+    category_id: Optional[int] = None
+    category_name: str
+    count: int
+
+
+class DashboardSummary(BaseModel):
+    """Aggregated counters shown on the home dashboard."""
+
+    equipment_total: int = 0
+    equipment_by_status: Dict[str, int] = Field(default_factory=dict)
+    equipment_by_category: List[CategoryCount] = Field(default_factory=list)
+    bookings_by_status: Dict[str, int] = Field(default_factory=dict)
+    pickups_today: int = 0
+    returns_today: int = 0
+    overdue: int = 0
+    generated_at: datetime
@@ -0,0 +1,36 @@
+"""Diagnostics schema module.
+
+This module defines Pydantic models for profiling and query log endpoints.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RequestProfileSummary(BaseModel):
+    """Stored per-request profile without its statistics."""
+
+    id: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class QueryFingerprintSummary(BaseModel):
+    """Aggregated timings of one statement fingerprint."""
+
+    fingerprint: str
+    count: int
+    slow_count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    statement: Optional[str] = None
+    source: Optional[str] = None
+    plan: Optional[str] = None
@@ -0,0 +1,38 @@
+"""Health schema module.
+
+This module defines Pydantic models for liveness and readiness probes.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class HealthCheckResult(BaseModel):
+    """Result of a single readiness check."""
+
+    healthy: bool
+    latency_ms: Optional[float] = None
+    detail: Optional[str] = None
+
+
+class PoolStatus(BaseModel):
+    """Database connection pool usage."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    max_connections: int
+    saturation: float
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response."""
+
+    status: str
+    checked_at: datetime
+    cached: bool = False
+    checks: Dict[str, HealthCheckResult] = Field(default_factory=dict)
+    pool: Optional[PoolStatus] = None
+    scheduler: str = 'disabled'
@@ -305,3 +305,61 @@ class ProjectPaymentStatusUpdate(BaseModel):
         ser_json_bytes='utf8',
         validate_default=True,
     )
+
+
+class ProjectReschedule(BaseModel):
+    """Project reschedule request schema.
+
+    Bookings are either shifted by ``shift_days`` and ``shift_hours`` or
+    moved to ``start_date`` and ``end_date``.
+    """
+
+    booking_ids: Optional[List[int]] = Field(
+        None,
+        title='Booking IDs',
+        description='Bookings to move, all open bookings of the project if omitted',
+    )
+    shift_days: int = Field(0, title='Shift Days')
+    shift_hours: int = Field(0, title='Shift Hours')
+    start_date: Optional[datetime] = Field(None, title='New Start Date')
+    end_date: Optional[datetime] = Field(None, title='New End Date')
+    dry_run: bool = Field(
+        True,
+        title='Dry Run',
+        description='Only preview the new dates and conflicts',
+    )
+
+
+class RescheduledBooking(BaseModel):
+    """Current and planned period of a moved booking."""
+
+    booking_id: int
+    equipment_id: int
+    equipment_name: str
+    start_date: datetime
+    end_date: datetime
+    new_start_date: datetime
+    new_end_date: datetime
+
+
+class RescheduleConflict(BaseModel):
+    """Booking overlapping the planned period of a moved booking."""
+
+    booking_id: int = Field(..., title='Moved Booking ID')
+    equipment_id: int
+    conflicting_booking_id: int
+    conflicting_project_id: Optional[int] = None
+    start_date: datetime
+    end_date: datetime
+    booking_status: str
+
+
+class ProjectRescheduleResponse(BaseModel):
+    """Project reschedule preview or result."""
+
+    project_id: int
+    applied: bool = Field(..., description='Whether the bookings were moved')
+    project_start_date: datetime
+    project_end_date: datetime
+    bookings: List[RescheduledBooking]
+    conflicts: List[RescheduleConflict]
@@ -0,0 +1,82 @@
+"""Report schema module.
+
+This module defines Pydantic models for utilization and revenue reports.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ReportRow(BaseModel):
+    """Base model for report rows read from SQL result rows."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UtilizationReportItem(ReportRow):
+    """Equipment utilization over a period."""
+
+    equipment_id: int
+    equipment_name: str
+    category_id: Optional[int] = None
+    category_name: str
+    booked_days: int
+    utilization: Decimal
+    revenue: Decimal
+    category_rank: int
+
+
+class CategoryRevenueItem(ReportRow):
+    """Revenue of one category over a period."""
+
+    category_id: Optional[int] = None
+    category_name: str
+    bookings: int
+    revenue: Decimal
+    share: Decimal
+    rank: int
+
+
+class ClientRevenueItem(ReportRow):
+    """Revenue from one client over a period."""
+
+    client_id: int
+    client_name: str
+    bookings: int
+    revenue: Decimal
+    share: Decimal
+    rank: int
+
+
+class MonthlyRevenueItem(ReportRow):
+    """Revenue of one calendar month."""
+
+    month: date
+    bookings: int
+    revenue: Decimal
+    running_total: Decimal
+    change: Optional[Decimal] = None
+
+
+class IdleEquipmentItem(ReportRow):
+    """Equipment without bookings in a period."""
+
+    equipment_id: int
+    equipment_name: str
+    category_id: Optional[int] = None
+    category_name: str
+    status: str
+    last_booked_day: Optional[date] = None
+    idle_days: Optional[int] = None
+
+
+class ReportRefreshResult(BaseModel):
+    """Outcome of a summary table refresh."""
+
+    full: bool
+    bookings: int
+    rows: int
+    refreshed_at: datetime
@@ -3,11 +3,14 @@
 This module provides Pydantic schemas for scan sessions.
 """
 
+import enum
 from datetime import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from backend.models.equipment import EquipmentStatus
+
 
 class EquipmentItem(BaseModel):
     """Schema for scanned equipment item."""
@@ -63,3 +66,49 @@ class ScanSessionResponse(ScanSessionBase):
     model_config = {
         'from_attributes': True,
     }
+
+
+class StockTakeResult(str, enum.Enum):
+    """Reconciliation result for a single item of a stock-take."""
+
+    PRESENT = 'PRESENT'
+    MISSING = 'MISSING'
+    UNEXPECTED = 'UNEXPECTED'
+    BOOKED = 'BOOKED'
+    RENTED = 'RENTED'
+
+
+class StockTakeItem(BaseModel):
+    """Schema for a single reconciled stock-take line."""
+
+    equipment_id: int
+    result: StockTakeResult
+    barcode: Optional[str] = None
+    name: Optional[str] = None
+    serial_number: Optional[str] = None
+    status: Optional[EquipmentStatus] = None
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+    booking_id: Optional[int] = None
+    scan_count: int = 0
+
+
+class StockTakeSummary(BaseModel):
+    """Schema for stock-take counters."""
+
+    session_id: int
+    category_id: Optional[int] = None
+    generated_at: datetime
+    scanned: int = 0
+    present: int = 0
+    missing: int = 0
+    unexpected: int = 0
+    booked: int = 0
+    rented: int = 0
+
+
+class StockTakeReport(BaseModel):
+    """Schema for a full stock-take report."""
+
+    summary: StockTakeSummary
+    items: List[StockTakeItem] = Field(default_factory=list)
@@ -0,0 +1,600 @@
+"""Bulk seed loader.
+
+Seed rows are written with PostgreSQL ``COPY`` through asyncpg's
+``copy_records_to_table`` instead of one ORM insert per record. Tables are
+loaded in foreign key order with their original IDs, after which ID sequences
+and the global barcode sequence are moved past the loaded rows.
+
+Rows are consumed from iterators in batches, so datasets are never held in
+memory as a whole. Sources are:
+
+- ``extended_data.json`` or a directory of NDJSON files written by
+  ``extract_extended_data.py``
+- the synthetic generator, which scales to millions of bookings
+"""
+
+import enum
+import gzip
+import itertools
+import json
+import random
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from loguru import logger
+from sqlalchemy import Boolean, Date, DateTime, Enum, Integer, Numeric, Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from backend.core.timezone_utils import MOSCOW_TZ
+from backend.models.booking import Booking, BookingStatus, PaymentStatus
+from backend.models.category import Category
+from backend.models.client import Client, ClientStatus
+from backend.models.core import Base
+from backend.models.equipment import Equipment, EquipmentStatus
+from backend.models.global_barcode import GlobalBarcodeSequence
+from backend.models.project import Project, ProjectPaymentStatus, ProjectStatus
+from backend.services.barcode import BarcodeService
+
+# Rows sent to the server in one COPY statement
+BULK_BATCH_SIZE = 10_000
+
+# Tables filled by the loader, keyed by the names used in seed files
+SEEDED_TABLES: Mapping[str, Table] = {
+    'categories': Category.__table__,
+    'clients': Client.__table__,
+    'equipment': Equipment.__table__,
+    'projects': Project.__table__,
+    'bookings': Booking.__table__,
+}
+
+Row = Dict[str, Any]
+
+
+def load_order(names: Iterable[str]) -> List[str]:
+    """Sort seeded tables so referenced tables are loaded first.
+
+    Args:
+        names: Seed file table names
+
+    Returns:
+        List[str]: Names in foreign key dependency order
+    """
+    by_table = {SEEDED_TABLES[name].name: name for name in names}
+    return [
+        by_table[table.name]
+        for table in Base.metadata.sorted_tables
+        if table.name in by_table
+    ]
+
+
+def _converter(column: Any) -> Callable[[Any], Any]:
+    """Get function converting a seed value to the column's Python type.
+
+    Seed files contain JSON values; asyncpg's binary COPY needs datetimes,
+    decimals and enum labels.
+
+    Args:
+        column: Table column
+
+    Returns:
+        Function converting one non-null value
+    """
+    column_type = column.type
+    if isinstance(column_type, Enum):
+        return lambda value: value.value if isinstance(value, enum.Enum) else value
+    if isinstance(column_type, DateTime):
+        return lambda value: (
+            datetime.fromisoformat(value) if isinstance(value, str) else value
+        )
+    if isinstance(column_type, Date):
+        return lambda value: (
+            date.fromisoformat(value) if isinstance(value, str) else value
+        )
+    if isinstance(column_type, Numeric):
+        return lambda value: Decimal(str(value))
+    if isinstance(column_type, Integer):
+        return int
+    if isinstance(column_type, Boolean):
+        return bool
+    return lambda value: value
+
+
+def _scalar_default(column: Any) -> Any:
+    """Get the Python-side scalar default of a column.
+
+    Args:
+        column: Table column
+
+    Returns:
+        Default value or None if the column has no scalar default
+    """
+    default = column.default
+    if default is None or not default.is_scalar:
+        return None
+    return default.arg
+
+
+def to_records(
+    table: Table, rows: Iterator[Row]
+) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+    """Convert seed rows to COPY records.
+
+    Copied columns are the table columns present in the first row plus
+    columns with a Python-side default, which COPY would not apply. Columns
+    with server defaults are left to the server when missing.
+
+    Args:
+        table: Target table
+        rows: Seed rows; all rows of a table should have the same keys
+
+    Returns:
+        Tuple of (copied column names, iterator of records)
+    """
+    first = next(rows, None)
+    if first is None:
+        return [], iter(())
+
+    columns = [
+        column
+        for column in table.columns
+        if column.name in first or _scalar_default(column) is not None
+    ]
+    plan = [
+        (column.name, _converter(column), _scalar_default(column)) for column in columns
+    ]
+
+    def records() -> Iterator[Tuple[Any, ...]]:
+        for row in itertools.chain((first,), rows):
+            record = []
+            for name, convert, default in plan:
+                value = row.get(name, default)
+                record.append(None if value is None else convert(value))
+            yield tuple(record)
+
+    return [column.name for column in columns], records()
+
+
+async def copy_rows(
+    connection: AsyncConnection,
+    table: Table,
+    rows: Iterator[Row],
+    batch_size: int = BULK_BATCH_SIZE,
+) -> int:
+    """Copy seed rows into a table in batches.
+
+    Args:
+        connection: Connection in an open transaction
+        table: Target table
+        rows: Seed rows
+        batch_size: Rows per COPY statement
+
+    Returns:
+        int: Number of copied rows
+    """
+    columns, records = to_records(table, rows)
+    if not columns:
+        return 0
+
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    count = 0
+    while batch := list(itertools.islice(records, batch_size)):
+        await driver_connection.copy_records_to_table(
+            table.name, records=batch, columns=columns
+        )
+        count += len(batch)
+    return count
+
+
+async def reset_sequences(connection: AsyncConnection, tables: Iterable[Table]) -> None:
+    """Move ID sequences past the largest loaded IDs.
+
+    Args:
+        connection: Database connection
+        tables: Loaded tables
+    """
+    for table in tables:
+        await connection.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f'COALESCE(MAX(id), 0) + 1, false) FROM {table.name}'
+            )
+        )
+
+
+async def sync_barcode_sequence(connection: AsyncConnection) -> None:
+    """Move the global barcode sequence past loaded equipment barcodes.
+
+    Only barcodes in the generated ``NNNNNNNNNCC`` format are considered.
+
+    Args:
+        connection: Database connection
+    """
+    sequence_table = GlobalBarcodeSequence.__tablename__
+    await connection.execute(
+        text(
+            f'INSERT INTO {sequence_table} (id, last_number) '
+            'SELECT 1, COALESCE(MAX(LEFT(barcode, :length)::bigint), 0) '
+            f'FROM {Equipment.__tablename__} '
+            "WHERE barcode ~ '^[0-9]+$' AND LENGTH(barcode) = :barcode_length "
+            'ON CONFLICT (id) DO UPDATE SET last_number = GREATEST('
+            f'{sequence_table}.last_number, EXCLUDED.last_number)'
+        ),
+        {
+            'length': BarcodeService.SEQUENCE_LENGTH,
+            'barcode_length': BarcodeService.BARCODE_LENGTH,
+        },
+    )
+
+
+async def bulk_load(
+    connection: AsyncConnection,
+    data: Mapping[str, Iterable[Row]],
+    truncate: bool = False,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> Dict[str, int]:
+    """Load seed rows into empty tables with COPY.
+
+    Rows keep their IDs, so the data must be referentially consistent.
+    The caller owns the transaction; nothing is committed here.
+
+    Args:
+        connection: Connection in an open transaction
+        data: Rows by seed file table name
+        truncate: Empty the seeded tables, and tables referencing them, first
+        batch_size: Rows per COPY statement
+
+    Returns:
+        Dict[str, int]: Number of loaded rows by table name
+
+    Raises:
+        ValueError: If a table name is unknown or a target table is not empty
+    """
+    unknown = set(data) - set(SEEDED_TABLES)
+    if unknown:
+        raise ValueError(f'Unknown seed tables: {", ".join(sorted(unknown))}')
+
+    names = load_order(data)
+    tables = [SEEDED_TABLES[name] for name in names]
+    if truncate:
+        await connection.execute(
+            text(
+                f'TRUNCATE {", ".join(table.name for table in tables)} '
+                'RESTART IDENTITY CASCADE'
+            )
+        )
+    else:
+        for table in tables:
+            result = await connection.execute(
+                text(f'SELECT EXISTS (SELECT 1 FROM {table.name})')
+            )
+            if result.scalar_one():
+                raise ValueError(
+                    f'Table {table.name} is not empty; use truncate to replace it'
+                )
+
+    counts = {}
+    for name, table in zip(names, tables):
+        counts[name] = await copy_rows(connection, table, iter(data[name]), batch_size)
+        logger.info('Copied {} rows into {}', counts[name], table.name)
+
+    await reset_sequences(connection, tables)
+    if 'equipment' in counts:
+        await sync_barcode_sequence(connection)
+    return counts
+
+
+def _open_text(path: Path) -> IO[str]:
+    """Open a seed file for reading, decompressing ``.gz`` files.
+
+    Args:
+        path: File path
+
+    Returns:
+        Text stream
+    """
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _iter_ndjson(path: Path) -> Iterator[Row]:
+    """Read rows of an NDJSON file lazily.
+
+    Args:
+        path: File path
+
+    Yields:
+        Row: One decoded row per line
+    """
+    with _open_text(path) as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_extended_data(path: Path) -> Dict[str, Iterable[Row]]:
+    """Read seed rows written by ``extract_extended_data.py``.
+
+    NDJSON directories are read lazily, one line at a time; a single JSON
+    file is decoded as a whole.
+
+    Args:
+        path: ``extended_data.json`` file or directory with ``manifest.json``
+
+    Returns:
+        Dict[str, Iterable[Row]]: Rows by table name
+    """
+    if path.is_dir():
+        with open(path / 'manifest.json', 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+        return {
+            name: _iter_ndjson(path / file_name)
+            for name, file_name in manifest['files'].items()
+            if name in SEEDED_TABLES
+        }
+
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    return {name: data[name] for name in SEEDED_TABLES if name in data}
+
+
+# Synthetic category tree: root name -> subcategory names
+SYNTHETIC_CATEGORIES: Mapping[str, Sequence[str]] = {
+    'Cameras': ('Cinema Cameras', 'DSLR Cameras', 'Action Cameras'),
+    'Lenses': ('Prime Lenses', 'Zoom Lenses', 'Anamorphic Lenses'),
+    'Lighting': ('LED Panels', 'HMI', 'Tungsten'),
+    'Audio': ('Microphones', 'Recorders', 'Wireless Systems'),
+    'Grip': ('Tripods', 'Sliders', 'Gimbals'),
+}
+
+# Business hours of pickups and returns
+_PICKUP_TIME = time(10, 0)
+_RETURN_TIME = time(18, 0)
+
+
+def _at(day: date, at: time) -> datetime:
+    """Combine a day and a time of day in the business timezone."""
+    return datetime.combine(day, at, tzinfo=MOSCOW_TZ)
+
+
+def _equipment_timeline(
+    seed: int, equipment_id: int, bookings: int, today: date
+) -> List[Tuple[date, date]]:
+    """Build non-overlapping rental periods of one equipment item.
+
+    About four fifths of the periods lie in the past.
+
+    Args:
+        seed: Generator seed
+        equipment_id: Equipment ID
+        bookings: Number of periods
+        today: Current day
+
+    Returns:
+        List of (first day, last day) pairs in chronological order
+    """
+    rng = random.Random(f'{seed}:timeline:{equipment_id}')
+    day = today - timedelta(days=int(bookings * 7 * 0.8) + rng.randrange(7))
+    periods = []
+    for _ in range(bookings):
+        day += timedelta(days=rng.randrange(7))
+        last_day = day + timedelta(days=rng.randrange(7))
+        periods.append((day, last_day))
+        day = last_day + timedelta(days=1)
+    return periods
+
+
+def _synthetic_categories(depth: int) -> Tuple[List[Row], List[int]]:
+    """Build the synthetic category tree.
+
+    Every subcategory of ``SYNTHETIC_CATEGORIES`` is extended by a chain of
+    nested categories down to ``depth`` levels.
+
+    Args:
+        depth: Number of levels, at least 1
+
+    Returns:
+        Tuple of (category rows with parents first, IDs of leaf categories)
+    """
+    rows: List[Row] = [
+        {'id': root_id, 'name': name, 'parent_id': None}
+        for root_id, name in enumerate(SYNTHETIC_CATEGORIES, 1)
+    ]
+    if depth <= 1:
+        return rows, [row['id'] for row in rows]
+
+    leaves = []
+    for root_id, children in enumerate(SYNTHETIC_CATEGORIES.values(), 1):
+        for name in children:
+            parent_id = root_id
+            for level in range(2, depth + 1):
+                rows.append(
+                    {
+                        'id': len(rows) + 1,
+                        'name': name if level == 2 else f'{name} L{level}',
+                        'parent_id': parent_id,
+                    }
+                )
+                parent_id = rows[-1]['id']
+            leaves.append(parent_id)
+    return rows, leaves
+
+
+def _bookings_of(equipment_id: int, equipment: int, bookings: int) -> int:
+    """Get number of bookings of an equipment item when spread evenly."""
+    return bookings // equipment + (1 if equipment_id <= bookings % equipment else 0)
+
+
+def generate_synthetic_data(
+    bookings: int,
+    equipment: Optional[int] = None,
+    clients: Optional[int] = None,
+    projects: Optional[int] = None,
+    category_depth: int = 2,
+    seed: int = 0,
+    today: Optional[date] = None,
+) -> Dict[str, Iterator[Row]]:
+    """Generate a consistent synthetic dataset.
+
+    Rows are produced lazily. Bookings of an equipment item never overlap,
+    their statuses follow their dates, and equipment with a booking covering
+    today is rented. The same arguments always give the same data.
+
+    Args:
+        bookings: Number of bookings
+        equipment: Number of equipment items; one per 50 bookings by default
+        clients: Number of clients; one per 200 bookings by default
+        projects: Number of projects; one per 20 bookings by default
+        category_depth: Levels of the category tree; equipment is put into
+            its leaves
+        seed: Generator seed
+        today: Current day; today in the business timezone by default
+
+    Returns:
+        Dict[str, Iterator[Row]]: Rows by table name
+    """
+    equipment = equipment or max(10, bookings // 50)
+    clients = clients or max(5, bookings // 200)
+    projects = projects or max(1, bookings // 20)
+    today = today or datetime.now(MOSCOW_TZ).date()
+
+    categories, leaf_categories = _synthetic_categories(category_depth)
+
+    def client_rows() -> Iterator[Row]:
+        for client_id in range(1, clients + 1):
+            yield {
+                'id': client_id,
+                'name': f'Клиент {client_id}',
+                'email': f'client{client_id}@example.com',
+                'phone': f'+7 (900) {client_id % 10_000_000:07d}',
+                'company': f'Студия {client_id}',
+                'status': ClientStatus.ACTIVE,
+            }
+
+    def project_rows() -> Iterator[Row]:
+        rng = random.Random(f'{seed}:projects')
+        for project_id in range(1, projects + 1):
+            first_day = today + timedelta(days=rng.randrange(-365, 60))
+            last_day = first_day + timedelta(days=rng.randrange(1, 30))
+            if last_day < today:
+                status = ProjectStatus.COMPLETED
+            elif first_day <= today:
+                status = ProjectStatus.ACTIVE
+            else:
+                status = ProjectStatus.DRAFT
+            yield {
+                'id': project_id,
+                'name': f'Проект {project_id}',
+                'client_id': (project_id - 1) % clients + 1,
+                'start_date': _at(first_day, _PICKUP_TIME),
+                'end_date': _at(last_day, _RETURN_TIME),
+                'status': status,
+                'payment_status': (
+                    ProjectPaymentStatus.PAID
+                    if status == ProjectStatus.COMPLETED
+                    else ProjectPaymentStatus.UNPAID
+                ),
+            }
+
+    def replacement_cost(equipment_id: int) -> int:
+        return random.Random(f'{seed}:cost:{equipment_id}').randrange(10_000, 2_000_000)
+
+    def equipment_rows() -> Iterator[Row]:
+        for equipment_id in range(1, equipment + 1):
+            timeline = _equipment_timeline(
+                seed,
+                equipment_id,
+                _bookings_of(equipment_id, equipment, bookings),
+                today,
+            )
+            rented = any(first <= today <= last for first, last in timeline)
+            yield {
+                'id': equipment_id,
+                'name': f'Оборудование {equipment_id}',
+                'serial_number': f'SYN-{equipment_id:09d}',
+                'barcode': BarcodeService.format_barcode(equipment_id),
+                'category_id': leaf_categories[equipment_id % len(leaf_categories)],
+                'status': (
+                    EquipmentStatus.RENTED if rented else EquipmentStatus.AVAILABLE
+                ),
+                'replacement_cost': replacement_cost(equipment_id),
+            }
+
+    def booking_rows() -> Iterator[Row]:
+        rng = random.Random(f'{seed}:bookings')
+        booking_id = 0
+        for equipment_id in range(1, equipment + 1):
+            daily_rate = Decimal(replacement_cost(equipment_id) // 100)
+            timeline = _equipment_timeline(
+                seed,
+                equipment_id,
+                _bookings_of(equipment_id, equipment, bookings),
+                today,
+            )
+            for first_day, last_day in timeline:
+                booking_id += 1
+                if rng.random() < 0.6:
+                    project_id: Optional[int] = rng.randrange(1, projects + 1)
+                    client_id = (project_id - 1) % clients + 1
+                else:
+                    project_id = None
+                    client_id = rng.randrange(1, clients + 1)
+
+                if last_day < today:
+                    status = (
+                        BookingStatus.CANCELLED
+                        if rng.random() < 0.05
+                        else BookingStatus.COMPLETED
+                    )
+                elif first_day <= today:
+                    status = BookingStatus.ACTIVE
+                elif rng.random() < 0.3:
+                    status = BookingStatus.PENDING
+                else:
+                    status = BookingStatus.CONFIRMED
+
+                total = daily_rate * ((last_day - first_day).days + 1)
+                if status == BookingStatus.COMPLETED:
+                    payment, paid = PaymentStatus.PAID, total
+                elif status == BookingStatus.ACTIVE:
+                    payment, paid = PaymentStatus.PARTIAL, total / 2
+                else:
+                    payment, paid = PaymentStatus.PENDING, Decimal(0)
+
+                yield {
+                    'id': booking_id,
+                    'client_id': client_id,
+                    'equipment_id': equipment_id,
+                    'project_id': project_id,
+                    'quantity': 1,
+                    'start_date': _at(first_day, _PICKUP_TIME),
+                    'end_date': _at(last_day, _RETURN_TIME),
+                    'booking_status': status,
+                    'payment_status': payment,
+                    'total_amount': total,
+                    'deposit_amount': Decimal(0),
+                    'paid_amount': paid,
+                }
+
+    return {
+        'categories': iter(categories),
+        'clients': client_rows(),
+        'equipment': equipment_rows(),
+        'projects': project_rows(),
+        'bookings': booking_rows(),
+    }
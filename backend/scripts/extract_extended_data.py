@@ -1,203 +1,462 @@
-"""Script to extract extended data from database to JSON format."""
+"""Script to extract extended data from database to JSON format.
+
+Tables are read through server-side cursors in batches and written row by
+row, so memory use does not depend on the size of the database. Tables are
+extracted concurrently, one connection per table; all connections share one
+exported snapshot so the files are consistent with each other.
+
+Output formats:
+
+- ``json``: single ``extended_data.json`` file read by ``seed_data.py``
+- ``ndjson`` / ``ndjson.gz``: one newline-delimited JSON file per table and a
+  ``manifest.json`` with row counts and the watermark for the next
+  incremental extraction (``--since``)
+
+Incremental extractions only contain rows updated since the watermark, so
+hard-deleted rows (e.g. deleted bookings or removed scan session rows) are
+not in them. They therefore also list the IDs of all rows of every table
+(``<table>.ids.ndjson`` files, ``<table>_ids`` keys in ``json`` output);
+consumers drop rows whose ID is not listed.
+"""
 
 import argparse
+import enum
+import gzip
 import json
 import os
-from datetime import datetime
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, Any, Dict, Iterable, Optional, Sequence, Tuple
 
 from loguru import logger
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 
 from backend.core.config import settings
 from backend.core.logging import configure_logging
+from backend.core.watermark import change_watermark_query
 from backend.models.booking import Booking
 from backend.models.category import Category
 from backend.models.client import Client
 from backend.models.equipment import Equipment
 from backend.models.project import Project
 
+SCRIPTS_DIR = Path(__file__).parent
+DEFAULT_JSON_FILE = SCRIPTS_DIR / 'extended_data.json'
+DEFAULT_OUTPUT_DIR = SCRIPTS_DIR / 'extended_data'
+MANIFEST_NAME = 'manifest.json'
+
+# Snapshot IDs returned by pg_export_snapshot(), e.g. '00000003-0000001B-1'
+_SNAPSHOT_ID = re.compile(r'^[0-9A-F]+-[0-9A-F]+(-[0-9]+)?$')
+
+
+class OutputFormat(str, enum.Enum):
+    """Extraction output format."""
+
+    JSON = 'json'
+    NDJSON = 'ndjson'
+    NDJSON_GZ = 'ndjson.gz'
+
+
+@dataclass(frozen=True)
+class TableExtract:
+    """Extracted table.
+
+    Attributes:
+        name: Key in the output and base name of the table file
+        model: ORM model of the table
+        columns: Extracted attribute names, in output order
+    """
+
+    name: str
+    model: Any
+    columns: Tuple[str, ...]
+
+
+EXTRACTED_TABLES: Sequence[TableExtract] = (
+    TableExtract(
+        'categories',
+        Category,
+        (
+            'id',
+            'name',
+            'description',
+            'parent_id',
+            'show_in_print_overview',
+            'created_at',
+            'updated_at',
+        ),
+    ),
+    TableExtract(
+        'equipment',
+        Equipment,
+        (
+            'id',
+            'name',
+            'description',
+            'serial_number',
+            'barcode',
+            'category_id',
+            'status',
+            'replacement_cost',
+            'notes',
+            'created_at',
+            'updated_at',
+        ),
+    ),
+    TableExtract(
+        'clients',
+        Client,
+        (
+            'id',
+            'name',
+            'email',
+            'phone',
+            'company',
+            'status',
+            'notes',
+            'created_at',
+            'updated_at',
+        ),
+    ),
+    TableExtract(
+        'projects',
+        Project,
+        (
+            'id',
+            'name',
+            'client_id',
+            'start_date',
+            'end_date',
+            'status',
+            'description',
+            'notes',
+            'created_at',
+            'updated_at',
+        ),
+    ),
+    TableExtract(
+        'bookings',
+        Booking,
+        (
+            'id',
+            'client_id',
+            'equipment_id',
+            'project_id',
+            'booking_status',
+            'payment_status',
+            'start_date',
+            'end_date',
+            'total_amount',
+            'deposit_amount',
+            'notes',
+            'created_at',
+            'updated_at',
+        ),
+    ),
+)
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for datetime objects."""
 
     def default(self, obj: Any) -> Any:
-        """Convert datetime and Decimal objects to serializable format."""
-        if isinstance(obj, datetime):
+        """Convert datetime, Decimal and enum objects to serializable format."""
+        if isinstance(obj, (datetime, date)):
             return obj.isoformat()
         elif isinstance(obj, Decimal):
             return float(obj)
+        elif isinstance(obj, enum.Enum):
+            return obj.value
         return super().default(obj)
 
 
-def extract_categories(session: Session) -> List[Dict[str, Any]]:
-    """Extract all categories from database.
+_encoder = DateTimeEncoder(ensure_ascii=False)
+
+
+def encode_row(row: Dict[str, Any]) -> str:
+    """Encode one row as a single-line JSON document.
 
     Args:
-        session: Database session
+        row: Column values by name
 
     Returns:
-        List of category dictionaries
+        str: JSON text without trailing newline
     """
-    categories = session.query(Category).all()
-
-    result = []
-    for category in categories:
-        result.append(
-            {
-                'id': category.id,
-                'name': category.name,
-                'description': category.description,
-                'parent_id': category.parent_id,
-                'show_in_print_overview': category.show_in_print_overview,
-                'created_at': category.created_at,
-                'updated_at': category.updated_at,
-            }
-        )
+    return _encoder.encode(dict(row))
+
+
+def table_file_name(table: str, output_format: OutputFormat) -> str:
+    """Get file name of an extracted table.
+
+    Args:
+        table: Table name
+        output_format: Output format; ``json`` uses plain NDJSON parts
 
-    logger.info('Extracted {} categories', len(result))
-    return result
+    Returns:
+        str: File name
+    """
+    if output_format == OutputFormat.NDJSON_GZ:
+        return f'{table}.ndjson.gz'
+    return f'{table}.ndjson'
 
 
-def extract_equipment(session: Session) -> List[Dict[str, Any]]:
-    """Extract all equipment from database.
+def id_file_name(table: str, output_format: OutputFormat) -> str:
+    """Get file name of the ID list of an extracted table.
 
     Args:
-        session: Database session
+        table: Table name
+        output_format: Output format; ``json`` uses plain NDJSON parts
 
     Returns:
-        List of equipment dictionaries
+        str: File name
     """
-    equipment_list = session.query(Equipment).all()
-
-    result = []
-    for equipment in equipment_list:
-        result.append(
-            {
-                'id': equipment.id,
-                'name': equipment.name,
-                'description': equipment.description,
-                'serial_number': equipment.serial_number,
-                'barcode': equipment.barcode,
-                'category_id': equipment.category_id,
-                'status': equipment.status.value,  # Convert enum to string
-                'replacement_cost': equipment.replacement_cost,
-                'notes': equipment.notes,
-                'created_at': equipment.created_at,
-                'updated_at': equipment.updated_at,
-            }
-        )
+    return table_file_name(f'{table}.ids', output_format)
 
-    logger.info('Extracted {} equipment items', len(result))
-    return result
 
+def open_table_file(path: Path) -> IO[str]:
+    """Open a table file for writing, compressing ``.gz`` files.
 
-def extract_clients(session: Session) -> List[Dict[str, Any]]:
-    """Extract all clients from database.
+    Args:
+        path: File path
+
+    Returns:
+        Text stream
+    """
+    if path.suffix == '.gz':
+        return gzip.open(path, 'wt', encoding='utf-8')
+    return open(path, 'w', encoding='utf-8')
+
+
+def write_ndjson(rows: Iterable[Dict[str, Any]], path: Path) -> int:
+    """Write rows as newline-delimited JSON.
 
     Args:
-        session: Database session
+        rows: Rows of column values
+        path: Output file; gzip compressed if it ends with ``.gz``
 
     Returns:
-        List of client dictionaries
+        int: Number of written rows
     """
-    clients = session.query(Client).all()
-
-    result = []
-    for client in clients:
-        result.append(
-            {
-                'id': client.id,
-                'name': client.name,
-                'email': client.email,
-                'phone': client.phone,
-                'company': client.company,
-                'status': client.status.value,  # Convert enum to string
-                'notes': client.notes,
-                'created_at': client.created_at,
-                'updated_at': client.updated_at,
-            }
-        )
+    count = 0
+    with open_table_file(path) as file:
+        for row in rows:
+            file.write(encode_row(row))
+            file.write('\n')
+            count += 1
+    return count
+
 
-    logger.info('Extracted {} clients', len(result))
-    return result
+def assemble_json(
+    parts: Sequence[Tuple[str, Path]], output_file: Path, metadata: Dict[str, Any]
+) -> None:
+    """Combine NDJSON table files into one JSON document.
 
+    Lines are copied one at a time, so memory use does not depend on the
+    size of the tables.
 
-def extract_projects(session: Session) -> List[Dict[str, Any]]:
-    """Extract all projects from database.
+    Args:
+        parts: Pairs of (output key, NDJSON file)
+        output_file: Resulting JSON file
+        metadata: Additional top-level keys written after the tables
+    """
+    with open(output_file, 'w', encoding='utf-8') as out:
+        out.write('{')
+        for index, (key, path) in enumerate(parts):
+            if index:
+                out.write(',')
+            out.write(f'\n  {json.dumps(key)}: [')
+            with open(path, 'r', encoding='utf-8') as part:
+                for number, line in enumerate(part):
+                    out.write(',\n    ' if number else '\n    ')
+                    out.write(line.rstrip('\n'))
+            out.write('\n  ]')
+        for key, value in metadata.items():
+            out.write(f',\n  {json.dumps(key)}: ')
+            out.write(json.dumps(value, cls=DateTimeEncoder, ensure_ascii=False))
+        out.write('\n}\n')
+
+
+def _set_snapshot(connection: Any, snapshot_id: Optional[str]) -> None:
+    """Make a connection's transaction see an exported snapshot.
 
     Args:
-        session: Database session
+        connection: Connection in a REPEATABLE READ transaction
+        snapshot_id: Snapshot ID or None to use a fresh snapshot
+    """
+    if snapshot_id is None:
+        return
+    if not _SNAPSHOT_ID.match(snapshot_id):
+        raise ValueError(f'Invalid snapshot ID: {snapshot_id}')
+    # SET TRANSACTION does not accept bind parameters
+    connection.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'"))
+
+
+def extract_table(
+    engine: Engine,
+    table: TableExtract,
+    path: Path,
+    since: Optional[datetime] = None,
+    snapshot_id: Optional[str] = None,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+    id_path: Optional[Path] = None,
+) -> int:
+    """Stream one table into an NDJSON file.
+
+    Args:
+        engine: Database engine
+        table: Extracted table
+        path: Output file
+        since: Only extract rows updated at or after this time
+        snapshot_id: Exported snapshot shared by all extracted tables
+        batch_size: Rows fetched from the server-side cursor at once
+        id_path: Optional file receiving the IDs of all rows of the table,
+            read from the same snapshot
 
     Returns:
-        List of project dictionaries
+        int: Number of extracted rows
     """
-    projects = session.query(Project).all()
-
-    result = []
-    for project in projects:
-        result.append(
-            {
-                'id': project.id,
-                'name': project.name,
-                'client_id': project.client_id,
-                'start_date': project.start_date,
-                'end_date': project.end_date,
-                'status': project.status.value,
-                'description': project.description,
-                'notes': project.notes,
-                'created_at': project.created_at,
-                'updated_at': project.updated_at,
-            }
-        )
+    model = table.model
+    stmt = select(*(getattr(model, column) for column in table.columns))
+    if since is not None:
+        stmt = stmt.where(model.updated_at >= since)
+    stmt = stmt.order_by(model.id).execution_options(yield_per=batch_size)
+
+    with engine.connect().execution_options(
+        isolation_level='REPEATABLE READ'
+    ) as connection:
+        with connection.begin():
+            _set_snapshot(connection, snapshot_id)
+            count = write_ndjson(connection.execute(stmt).mappings(), path)
+            if id_path is not None:
+                ids = (
+                    select(model.id)
+                    .order_by(model.id)
+                    .execution_options(yield_per=batch_size)
+                )
+                write_ndjson(connection.execute(ids).mappings(), id_path)
+
+    logger.info('Extracted {} {}', count, table.name)
+    return count
 
-    logger.info('Extracted {} projects', len(result))
-    return result
 
+def _export_snapshot(connection: Any) -> Tuple[Optional[str], datetime]:
+    """Begin a transaction on a connection and export its snapshot.
 
-def extract_bookings(session: Session) -> List[Dict[str, Any]]:
-    """Extract all bookings from database.
+    The transaction is left open; the snapshot can be imported by other
+    transactions until it ends. The watermark is read together with the
+    snapshot, so rows of transactions still running then are extracted by
+    the next incremental run.
 
     Args:
-        session: Database session
+        connection: Connection with REPEATABLE READ isolation level
 
     Returns:
-        List of booking dictionaries
+        Tuple of (snapshot ID or None if unsupported, change watermark)
     """
-    bookings = session.query(Booking).all()
-
-    result = []
-    for booking in bookings:
-        result.append(
-            {
-                'id': booking.id,
-                'client_id': booking.client_id,
-                'equipment_id': booking.equipment_id,
-                'project_id': booking.project_id,
-                'booking_status': booking.booking_status.value,
-                'payment_status': booking.payment_status.value,
-                'start_date': booking.start_date,
-                'end_date': booking.end_date,
-                'total_amount': booking.total_amount,
-                'deposit_amount': booking.deposit_amount,
-                'notes': booking.notes,
-                'created_at': booking.created_at,
-                'updated_at': booking.updated_at,
+    connection.begin()
+    try:
+        snapshot_id, watermark = connection.execute(
+            select(
+                func.pg_export_snapshot(),
+                change_watermark_query().scalar_subquery(),
+            )
+        ).one()
+    except DBAPIError as e:
+        # Not available on hot standby servers
+        logger.warning('Tables are extracted without a shared snapshot: {}', str(e))
+        connection.rollback()
+        connection.begin()
+        snapshot_id = None
+        watermark = connection.execute(change_watermark_query()).scalar_one()
+    return snapshot_id, watermark
+
+
+def extract_tables(
+    engine: Engine,
+    output_dir: Path,
+    output_format: OutputFormat,
+    since: Optional[datetime] = None,
+    workers: Optional[int] = None,
+) -> Tuple[Dict[str, int], datetime]:
+    """Extract all tables concurrently into NDJSON files.
+
+    Incremental extractions also write the ID list of every table, see
+    ``id_file_name``.
+
+    Args:
+        engine: Database engine with a pool of at least ``workers + 1``
+        output_dir: Directory for table files
+        output_format: Output format
+        since: Only extract rows updated at or after this time
+        workers: Number of tables extracted at once; all by default
+
+    Returns:
+        Tuple of (row counts by table, watermark for the next extraction)
+    """
+    with engine.connect().execution_options(
+        isolation_level='REPEATABLE READ'
+    ) as coordinator:
+        # The snapshot stays valid until the coordinator connection is closed
+        snapshot_id, watermark = _export_snapshot(coordinator)
+        with ThreadPoolExecutor(
+            max_workers=workers or len(EXTRACTED_TABLES)
+        ) as executor:
+            futures = {
+                table.name: executor.submit(
+                    extract_table,
+                    engine,
+                    table,
+                    output_dir / table_file_name(table.name, output_format),
+                    since,
+                    snapshot_id,
+                    id_path=(
+                        output_dir / id_file_name(table.name, output_format)
+                        if since is not None
+                        else None
+                    ),
+                )
+                for table in EXTRACTED_TABLES
             }
-        )
+            counts = {name: future.result() for name, future in futures.items()}
+    return counts, watermark
+
+
+def _summary(counts: Dict[str, int]) -> Dict[str, int]:
+    """Build summary of row counts.
 
-    logger.info('Extracted {} bookings', len(result))
-    return result
+    Args:
+        counts: Row counts by table
+
+    Returns:
+        Dict[str, int]: Counts keyed ``<table>_count``
+    """
+    return {f'{name}_count': count for name, count in counts.items()}
 
 
-def extract_extended_data(custom_database_url: str | None = None) -> None:
-    """Extract all extended data and save to JSON file.
+def extract_extended_data(
+    custom_database_url: str | None = None,
+    output_format: OutputFormat = OutputFormat.JSON,
+    output_path: Optional[Path] = None,
+    since: Optional[datetime] = None,
+    workers: Optional[int] = None,
+) -> None:
+    """Extract all extended data and save it to files.
 
     Args:
         custom_database_url: Optional custom database URL to use instead of settings
+        output_format: Output format
+        output_path: JSON file or directory for NDJSON files; defaults to
+            ``extended_data.json`` or ``extended_data/`` next to this script
+        since: Only extract rows updated at or after this time
+        workers: Number of tables extracted at once; all by default
     """
     # Configure logging
     configure_logging()
@@ -212,64 +471,85 @@ def extract_extended_data(custom_database_url: str | None = None) -> None:
     )
     logger.info('Using database URL: {}', masked_url)
 
-    # Create database engine and session
-    engine = create_engine(
-        database_url,
-        echo=False,
-    )
-    SessionLocal = sessionmaker(
-        bind=engine,
-        expire_on_commit=False,
-    )
+    # One connection per table plus the one holding the snapshot
+    pool_size = (workers or len(EXTRACTED_TABLES)) + 1
+    engine = create_engine(database_url, echo=False, pool_size=pool_size)
 
     try:
-        with SessionLocal() as session:
-            logger.info('Starting extended data extraction...')
-
-            # Extract all data
-            categories = extract_categories(session)
-            equipment = extract_equipment(session)
-            clients = extract_clients(session)
-            projects = extract_projects(session)
-            bookings = extract_bookings(session)
-
-            # Combine all data
-            extended_data = {
-                'categories': categories,
-                'equipment': equipment,
-                'clients': clients,
-                'projects': projects,
-                'bookings': bookings,
-                'extracted_at': datetime.now().isoformat(),
-                'summary': {
-                    'categories_count': len(categories),
-                    'equipment_count': len(equipment),
-                    'clients_count': len(clients),
-                    'projects_count': len(projects),
-                    'bookings_count': len(bookings),
-                },
-            }
-
-            # Save to JSON file
-            output_file = Path(__file__).parent / 'extended_data.json'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    extended_data,
-                    f,
-                    cls=DateTimeEncoder,
-                    ensure_ascii=False,
-                    indent=2,
+        logger.info('Starting extended data extraction...')
+        if since is not None:
+            logger.info('Extracting rows updated since {}', since.isoformat())
+
+        if output_format == OutputFormat.JSON:
+            output_file = output_path or DEFAULT_JSON_FILE
+            with tempfile.TemporaryDirectory(dir=output_file.parent) as parts_dir:
+                counts, watermark = extract_tables(
+                    engine, Path(parts_dir), output_format, since, workers
                 )
-
+                parts = [
+                    (
+                        table.name,
+                        Path(parts_dir) / table_file_name(table.name, output_format),
+                    )
+                    for table in EXTRACTED_TABLES
+                ]
+                metadata: Dict[str, Any] = {
+                    'extracted_at': datetime.now().isoformat(),
+                    'since': since,
+                    'watermark': watermark,
+                    'summary': _summary(counts),
+                }
+                if since is not None:
+                    parts += [
+                        (
+                            f'{table.name}_ids',
+                            Path(parts_dir) / id_file_name(table.name, output_format),
+                        )
+                        for table in EXTRACTED_TABLES
+                    ]
+                    # Rows absent from the ID lists were deleted since the watermark
+                    metadata['deletions'] = 'reconcile with <table>_ids'
+                assemble_json(parts, output_file, metadata)
             logger.info('Extended data extracted successfully to {}', output_file)
-            logger.info(
-                'Summary: {} categories, {} equipment, {} clients, {} projects, {} bookings',  # noqa: E501
-                len(categories),
-                len(equipment),
-                len(clients),
-                len(projects),
-                len(bookings),
+        else:
+            output_dir = output_path or DEFAULT_OUTPUT_DIR
+            if output_dir.exists():
+                shutil.rmtree(output_dir)
+            output_dir.mkdir(parents=True)
+            counts, watermark = extract_tables(
+                engine, output_dir, output_format, since, workers
             )
+            manifest: Dict[str, Any] = {
+                'extracted_at': datetime.now().isoformat(),
+                'format': output_format.value,
+                'since': since,
+                'watermark': watermark,
+                'files': {
+                    table.name: table_file_name(table.name, output_format)
+                    for table in EXTRACTED_TABLES
+                },
+                'summary': _summary(counts),
+            }
+            if since is not None:
+                # Rows absent from the ID lists were deleted since the watermark
+                manifest['deletions'] = 'reconcile with id_files'
+                manifest['id_files'] = {
+                    table.name: id_file_name(table.name, output_format)
+                    for table in EXTRACTED_TABLES
+                }
+            with open(output_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, cls=DateTimeEncoder, indent=2)
+            logger.info('Extended data extracted successfully to {}', output_dir)
+
+        logger.info(
+            'Summary: {} categories, {} equipment, {} clients, {} projects, {} bookings',  # noqa: E501
+            counts['categories'],
+            counts['equipment'],
+            counts['clients'],
+            counts['projects'],
+            counts['bookings'],
+        )
+        logger.info('Next incremental extraction: --since {}', watermark.isoformat())
 
     except Exception as e:
         logger.error('Error extracting extended data: {}', str(e))
@@ -278,6 +558,24 @@ def extract_extended_data(custom_database_url: str | None = None) -> None:
         engine.dispose()
 
 
+def parse_since(value: str) -> datetime:
+    """Parse the ``--since`` watermark.
+
+    Args:
+        value: ISO 8601 timestamp; naive values are treated as UTC
+
+    Returns:
+        datetime: Timezone-aware timestamp
+    """
+    try:
+        since = datetime.fromisoformat(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f'Invalid timestamp: {value}') from e
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return since
+
+
 def main() -> None:
     """Main function with CLI argument parsing."""
     parser = argparse.ArgumentParser(
@@ -287,13 +585,40 @@ def main() -> None:
         '--database-url',
         help='Custom database URL (can also use TEMP_DATABASE_URL env var)',
     )
+    parser.add_argument(
+        '--format',
+        choices=[output_format.value for output_format in OutputFormat],
+        default=OutputFormat.JSON.value,
+        help='json: single file for seed_data.py; ndjson/ndjson.gz: file per table',
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        help='Output JSON file or NDJSON directory',
+    )
+    parser.add_argument(
+        '--since',
+        type=parse_since,
+        help='Only extract rows updated at or after this ISO 8601 timestamp',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of tables extracted concurrently (default: all)',
+    )
 
     args = parser.parse_args()
 
     # Check for custom database URL from args or environment
     custom_url = args.database_url or os.getenv('TEMP_DATABASE_URL')
 
-    extract_extended_data(custom_database_url=custom_url)
+    extract_extended_data(
+        custom_database_url=custom_url,
+        output_format=OutputFormat(args.format),
+        output_path=args.output,
+        since=args.since,
+        workers=args.workers,
+    )
 
 
 if __name__ == '__main__':
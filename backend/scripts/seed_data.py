@@ -4,10 +4,11 @@ import argparse
 import asyncio
 import json
 import shutil
+import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -26,6 +27,11 @@ from backend.repositories.client import ClientRepository
 from backend.repositories.equipment import EquipmentRepository
 from backend.repositories.project import ProjectRepository
 from backend.schemas import PaymentStatus
+from backend.scripts.bulk_seed import (
+    bulk_load,
+    generate_synthetic_data,
+    read_extended_data,
+)
 from backend.services.barcode import BarcodeService
 
 
@@ -847,6 +853,56 @@ async def seed_data(use_extended_data: bool = False) -> None:
         await engine.dispose()
 
 
+async def bulk_seed_data(
+    extended_data_path: Optional[Path] = None,
+    synthetic_bookings: Optional[int] = None,
+    seed: int = 0,
+    truncate: bool = False,
+) -> None:
+    """Seed database with COPY instead of ORM inserts.
+
+    Loads either extended data or a synthetic dataset in one transaction.
+    Target tables must be empty unless ``truncate`` is set.
+
+    Args:
+        extended_data_path: ``extended_data.json`` or directory of NDJSON files
+        synthetic_bookings: Number of synthetic bookings to generate instead
+        seed: Synthetic data generator seed
+        truncate: Empty seeded tables before loading
+    """
+    configure_logging()
+
+    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        if synthetic_bookings is not None:
+            logger.info('Generating {} synthetic bookings...', synthetic_bookings)
+            data = generate_synthetic_data(synthetic_bookings, seed=seed)
+        else:
+            path = extended_data_path or Path(__file__).parent / 'extended_data.json'
+            if not path.exists():
+                logger.warning('Extended data not found: {}', path)
+                return
+            logger.info('Bulk loading production data from {}', path)
+            data = read_extended_data(path)
+
+        started = time.perf_counter()
+        async with engine.begin() as conn:
+            counts = await bulk_load(conn, data, truncate=truncate)
+        logger.info(
+            'Bulk load completed in {:.1f}s: {}',
+            time.perf_counter() - started,
+            ', '.join(f'{count} {name}' for name, count in counts.items()),
+        )
+    except Exception as e:
+        logger.error('Error bulk seeding database: {}', str(e))
+        raise
+    finally:
+        await engine.dispose()
+
+
 def main() -> None:
     """Main function with CLI argument parsing."""
     parser = argparse.ArgumentParser(
@@ -857,9 +913,46 @@ def main() -> None:
         action='store_true',
         help='Load extended data instead of basic test data',
     )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Load extended data with COPY into empty tables, keeping IDs',
+    )
+    parser.add_argument(
+        '--extended-path',
+        type=Path,
+        help='extended_data.json file or NDJSON directory for --bulk',
+    )
+    parser.add_argument(
+        '--synthetic-bookings',
+        type=int,
+        help='Bulk load a generated dataset with this many bookings',
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Seed of the synthetic data generator',
+    )
+    parser.add_argument(
+        '--truncate',
+        action='store_true',
+        help='Empty seeded tables before a bulk load',
+    )
 
     args = parser.parse_args()
 
+    if args.bulk or args.synthetic_bookings is not None:
+        asyncio.run(
+            bulk_seed_data(
+                extended_data_path=args.extended_path,
+                synthetic_bookings=args.synthetic_bookings,
+                seed=args.seed,
+                truncate=args.truncate,
+            )
+        )
+        return
+
     asyncio.run(seed_data(use_extended_data=args.extended_data))
 
 
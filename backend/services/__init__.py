@@ -3,23 +3,31 @@
 This package implements business logic for all application features.
 """
 
+from backend.services.availability import AvailabilityService
 from backend.services.barcode import BarcodeService
 from backend.services.booking import BookingService
 from backend.services.category import CategoryService
 from backend.services.client import ClientService
+from backend.services.dashboard import DashboardService
 from backend.services.document import DocumentService
 from backend.services.equipment import EquipmentService
+from backend.services.export import ExportService
 from backend.services.project import ProjectService
+from backend.services.report import ReportService
 from backend.services.scan_session import ScanSessionService
 
 __all__ = [
     # Business services
+    'AvailabilityService',
     'BarcodeService',
     'BookingService',
     'CategoryService',
     'ClientService',
+    'DashboardService',
     'DocumentService',
     'EquipmentService',
+    'ExportService',
     'ProjectService',
+    'ReportService',
     'ScanSessionService',
 ]
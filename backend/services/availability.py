@@ -0,0 +1,269 @@
+"""Availability service module.
+
+This module builds equipment availability timelines: merged busy intervals
+and the free gaps between them within a requested window. Timelines are
+cached per equipment item under a version that is bumped whenever a booking
+of the item changes. It also suggests available substitutes for a booked item.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.cache import (
+    cache_delete,
+    cache_get_many,
+    cache_hget_many,
+    cache_hset_many,
+    cache_incr_many,
+    make_cache_key,
+)
+from backend.core.config import settings
+from backend.core.timezone_utils import ensure_timezone_aware
+from backend.exceptions import DateError, NotFoundError, ValidationError
+from backend.repositories import BookingRepository, EquipmentRepository
+from backend.schemas import EquipmentAlternative, EquipmentTimeline, TimelineInterval
+
+# Limits of one timeline request
+MAX_TIMELINE_EQUIPMENT = 500
+MAX_TIMELINE_DAYS = 366
+MAX_ALTERNATIVES = 50
+
+
+def timeline_version_key(equipment_id: int) -> str:
+    """Get the key of the timeline cache version of an equipment item.
+
+    Versions have no time to live, so the ``volatile-*`` eviction policies
+    never reset them to a version that may still have cached timelines.
+
+    Args:
+        equipment_id: Equipment ID
+
+    Returns:
+        str: Counter key
+    """
+    return make_cache_key('timeline', equipment_id, 'version')
+
+
+def timeline_cache_key(equipment_id: int, version: Union[int, str, None]) -> str:
+    """Get the cache key holding timelines of an equipment item.
+
+    Args:
+        equipment_id: Equipment ID
+        version: Timeline cache version of the item, None before the first
+            invalidation
+
+    Returns:
+        str: Key of a hash with one field per requested window
+    """
+    return make_cache_key('timeline', equipment_id, version or 0)
+
+
+async def invalidate_timelines(equipment_ids: Iterable[int]) -> None:
+    """Drop cached timelines after bookings of equipment changed.
+
+    The version of every item is bumped, so timelines computed from data
+    read before the change are stored under a version no longer read.
+
+    Args:
+        equipment_ids: IDs of equipment whose bookings changed
+    """
+    ids = list(dict.fromkeys(equipment_ids))
+    versions = await cache_incr_many([timeline_version_key(item) for item in ids])
+    if versions:
+        await cache_delete(
+            *(
+                timeline_cache_key(equipment_id, version - 1)
+                for equipment_id, version in zip(ids, versions)
+            )
+        )
+
+
+def free_intervals(
+    busy: Sequence[Dict[str, Any]], start_date: datetime, end_date: datetime
+) -> List[Dict[str, Any]]:
+    """Get the gaps between busy intervals within a window.
+
+    Args:
+        busy: Merged busy intervals in chronological order
+        start_date: Window start
+        end_date: Window end
+
+    Returns:
+        Free intervals with 'start' and 'end'
+    """
+    free = []
+    cursor = start_date
+    for interval in busy:
+        if interval['start'] > cursor:
+            free.append({'start': cursor, 'end': interval['start']})
+        cursor = max(cursor, interval['end'])
+    if cursor < end_date:
+        free.append({'start': cursor, 'end': end_date})
+    return free
+
+
+class AvailabilityService:
+    """Service for equipment availability timelines."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+        self.booking_repository = BookingRepository(session)
+        self.equipment_repository = EquipmentRepository(session)
+
+    async def get_timelines(
+        self, equipment_ids: Sequence[int], start_date: datetime, end_date: datetime
+    ) -> List[EquipmentTimeline]:
+        """Get availability timelines of equipment within a window.
+
+        Args:
+            equipment_ids: Equipment IDs
+            start_date: Window start (inclusive)
+            end_date: Window end (exclusive)
+
+        Returns:
+            List[EquipmentTimeline]: Timelines in the order of the given IDs
+
+        Raises:
+            ValidationError: If no or too many equipment IDs are given
+            DateError: If the window is empty or too long
+            NotFoundError: If equipment does not exist
+        """
+        ids = list(dict.fromkeys(equipment_ids))
+        if not ids:
+            raise ValidationError('At least one equipment ID is required')
+        if len(ids) > MAX_TIMELINE_EQUIPMENT:
+            raise ValidationError(
+                f'At most {MAX_TIMELINE_EQUIPMENT} equipment items per request',
+                details={'equipment_count': len(ids)},
+            )
+
+        start_date = ensure_timezone_aware(start_date)
+        end_date = ensure_timezone_aware(end_date)
+        if start_date >= end_date:
+            raise DateError(
+                'Start date must be before end date',
+                start_date=start_date,
+                end_date=end_date,
+            )
+        if end_date - start_date > timedelta(days=MAX_TIMELINE_DAYS):
+            raise DateError(
+                f'Timeline window cannot exceed {MAX_TIMELINE_DAYS} days',
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+        window = f'{start_date.isoformat()}/{end_date.isoformat()}'
+        # Versions are read before the bookings, see invalidate_timelines
+        versions = await cache_get_many([timeline_version_key(item) for item in ids])
+        keys = (
+            {
+                equipment_id: timeline_cache_key(equipment_id, version)
+                for equipment_id, version in zip(ids, versions)
+            }
+            if versions is not None
+            else {}
+        )
+        timelines: Dict[int, EquipmentTimeline] = {}
+        cached_values = await cache_hget_many(list(keys.values()), window)
+        for equipment_id, cached in zip(keys, cached_values):
+            if cached is not None:
+                timelines[equipment_id] = EquipmentTimeline.model_validate_json(cached)
+
+        missing = [
+            equipment_id for equipment_id in ids if equipment_id not in timelines
+        ]
+        if missing:
+            existing = await self.equipment_repository.get_existing_ids(missing)
+            unknown = [
+                equipment_id for equipment_id in missing if equipment_id not in existing
+            ]
+            if unknown:
+                raise NotFoundError(
+                    f'Equipment with ID {unknown[0]} not found',
+                    details={'equipment_ids': unknown},
+                )
+
+            busy = await self.booking_repository.get_busy_intervals(
+                missing, start_date, end_date
+            )
+            for equipment_id in missing:
+                intervals = busy.get(equipment_id, [])
+                timelines[equipment_id] = EquipmentTimeline(
+                    equipment_id=equipment_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    busy=[TimelineInterval(**interval) for interval in intervals],
+                    free=[
+                        TimelineInterval(**interval)
+                        for interval in free_intervals(intervals, start_date, end_date)
+                    ],
+                )
+            await cache_hset_many(
+                {
+                    keys[equipment_id]: timelines[equipment_id].model_dump_json()
+                    for equipment_id in missing
+                    if equipment_id in keys
+                },
+                window,
+                settings.TIMELINE_CACHE_TTL,
+            )
+
+        return [timelines[equipment_id] for equipment_id in ids]
+
+    async def find_alternatives(
+        self,
+        equipment_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        same_name: bool = False,
+        limit: int = 10,
+    ) -> List[EquipmentAlternative]:
+        """Find available substitutes for an equipment item.
+
+        Args:
+            equipment_id: ID of the equipment item to replace
+            start_date: Period start
+            end_date: Period end
+            same_name: Only suggest items with the same name
+            limit: Maximum number of suggestions
+
+        Returns:
+            List[EquipmentAlternative]: Best matches first
+
+        Raises:
+            NotFoundError: If equipment does not exist
+            DateError: If the period is empty
+            ValidationError: If the limit is out of range
+        """
+        if not 1 <= limit <= MAX_ALTERNATIVES:
+            raise ValidationError(
+                f'Limit must be between 1 and {MAX_ALTERNATIVES}',
+                details={'limit': limit},
+            )
+        start_date = ensure_timezone_aware(start_date)
+        end_date = ensure_timezone_aware(end_date)
+        if start_date >= end_date:
+            raise DateError(
+                'Start date must be before end date',
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+        equipment = await self.equipment_repository.get(equipment_id)
+        if equipment is None or equipment.deleted_at is not None:
+            raise NotFoundError(
+                f'Equipment with ID {equipment_id} not found',
+                details={'equipment_id': equipment_id},
+            )
+
+        rows = await self.equipment_repository.find_alternatives(
+            equipment, start_date, end_date, same_name=same_name, limit=limit
+        )
+        return [EquipmentAlternative.model_validate(dict(row)) for row in rows]
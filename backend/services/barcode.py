@@ -12,6 +12,9 @@ import treepoem
 from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core import code128
+from backend.core.config import settings
+from backend.core.render_pool import RenderPool
 from backend.exceptions import ValidationError
 from backend.models import GlobalBarcodeSequence
 from backend.repositories import GlobalBarcodeSequenceRepository
@@ -24,6 +27,14 @@ class BarcodeType(str, Enum):
     DATAMATRIX = 'datamatrix'
 
 
+# Image rendering runs outside the event loop
+barcode_render_pool = RenderPool(
+    'barcode',
+    workers=settings.BARCODE_RENDER_WORKERS,
+    max_queue=settings.BARCODE_RENDER_QUEUE_LIMIT,
+)
+
+
 class BarcodeService:
     """Service for generating and validating barcodes.
 
@@ -61,13 +72,21 @@ class BarcodeService:
         """
         # Increment sequence number
         sequence_number = await self.global_sequence_repository.increment_sequence()
+        return self.format_barcode(sequence_number)
+
+    @classmethod
+    def format_barcode(cls, sequence_number: int) -> str:
+        """Build the barcode for a sequence number.
 
-        # Generate barcode without checksum
-        sequence_part = f'{sequence_number:0{self.SEQUENCE_LENGTH}d}'
-        checksum = self._calculate_checksum(sequence_part)
-        barcode = f'{sequence_part}{checksum:02d}'
+        Args:
+            sequence_number: Global sequence number
 
-        return barcode
+        Returns:
+            Barcode with zero-padded sequence number and checksum
+        """
+        sequence_part = f'{sequence_number:0{cls.SEQUENCE_LENGTH}d}'
+        checksum = cls._calculate_checksum(sequence_part)
+        return f'{sequence_part}{checksum:02d}'
 
     async def parse_barcode(self, barcode: str) -> int:
         """Parse a barcode and return its sequence number.
@@ -123,7 +142,8 @@ class BarcodeService:
         except ValueError:
             return False
 
-    def _calculate_checksum(self, sequence_part: str) -> int:
+    @staticmethod
+    def _calculate_checksum(sequence_part: str) -> int:
         """Calculate checksum for a barcode.
 
         The checksum is calculated using a weighted sum algorithm:
@@ -167,11 +187,36 @@ class BarcodeService:
             return sequence.last_number + 1
         return 1
 
+    async def render_barcode_image(
+        self, barcode_value: str, barcode_type: BarcodeType = BarcodeType.CODE128
+    ) -> Tuple[bytes, str]:
+        """Generate a barcode image without blocking the event loop.
+
+        Rendering runs in the bounded barcode render pool.
+
+        Args:
+            barcode_value: The barcode value to encode
+            barcode_type: The type of barcode to generate (code128 or datamatrix)
+
+        Returns:
+            Tuple containing the image data as bytes and the MIME type
+
+        Raises:
+            ValidationError: If barcode generation fails
+            RenderQueueFullError: If too many images are being rendered
+        """
+        return await barcode_render_pool.run(
+            self.generate_barcode_image, barcode_value, barcode_type
+        )
+
     def generate_barcode_image(
         self, barcode_value: str, barcode_type: BarcodeType = BarcodeType.CODE128
     ) -> Tuple[bytes, str]:
         """Generate a barcode image.
 
+        This call blocks while the image is rendered; use
+        ``render_barcode_image`` from request handlers.
+
         Args:
             barcode_value: The barcode value to encode
             barcode_type: The type of barcode to generate (code128 or datamatrix)
@@ -210,7 +255,10 @@ class BarcodeService:
             )
 
     def _generate_code128_image(self, barcode_value: str) -> Tuple[bytes, str]:
-        """Generate a Code128 barcode image using treepoem.
+        """Generate a Code128 barcode image.
+
+        Printable ASCII values are drawn by the built-in rasterizer unless
+        it is disabled in settings; other values are rendered with treepoem.
 
         Args:
             barcode_value: The barcode value to encode
@@ -218,6 +266,9 @@ class BarcodeService:
         Returns:
             Tuple containing the image data as bytes and the MIME type
         """
+        if settings.BARCODE_NATIVE_CODE128 and code128.is_encodable(barcode_value):
+            return code128.render_png(barcode_value), 'image/png'
+
         try:
             # Generate Code128 using treepoem
             image = treepoem.generate_barcode(
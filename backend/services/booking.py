@@ -23,6 +23,7 @@ from backend.exceptions import (
 from backend.models import Booking, BookingStatus, EquipmentStatus, PaymentStatus
 from backend.repositories import BookingRepository, EquipmentRepository
 from backend.schemas import BookingWithDetails
+from backend.services.availability import invalidate_timelines
 from backend.services.equipment import EquipmentService
 
 # Constants for booking validation
@@ -196,6 +197,7 @@ class BookingService:
                 project_id=project_id,
             )
             created_booking = await self.repository.create(booking)
+            await invalidate_timelines([equipment_id])
 
             # Load related objects
             return await self.get_booking_with_relations(created_booking.id)
@@ -325,6 +327,7 @@ class BookingService:
             booking.equipment_id = booking.equipment_id
 
             updated_booking = await self.repository.update(booking)
+            await invalidate_timelines([updated_booking.equipment_id])
             return await self.get_booking_with_relations(updated_booking.id)
         except (ValidationError, DateError, StateError) as e:
             # Do not convert domain-specific errors to ValueError
@@ -497,6 +500,7 @@ class BookingService:
 
         # Delete the booking directly instead of changing status
         await self.repository.delete(booking_id)
+        await invalidate_timelines([booking.equipment_id])
 
         # If the equipment was rented (ACTIVE booking status), set it back to available
         if booking.booking_status == BookingStatus.ACTIVE:
@@ -562,6 +566,7 @@ class BookingService:
             )
 
         updated_booking = await self.repository.update(booking)
+        await invalidate_timelines([updated_booking.equipment_id])
         return await self.get_booking_with_relations(updated_booking.id)
 
     async def change_payment_status(
@@ -2,13 +2,21 @@
 
 This module implements business logic for managing equipment categories,
 including hierarchy management and validation of category relationships.
+
+Ancestry lookups for print forms use an in-process snapshot of the category
+tree. It is dropped on category writes of this worker and reloaded after
+``CATEGORY_TREE_CACHE_TTL`` seconds, which bounds how long writes made by
+other workers stay invisible.
 """
 
-from typing import List, Optional, Tuple
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.config import settings
 from backend.exceptions import (
     BusinessError,
     ConflictError,
@@ -21,6 +29,80 @@ from backend.schemas import CategoryResponse, CategoryWithEquipmentCount
 from backend.schemas.project import PrintableCategoryInfo
 
 
+@dataclass(frozen=True)
+class CategoryNode:
+    """Hierarchy fields of a category.
+
+    Attributes:
+        id: Category ID
+        name: Category name
+        parent_id: Parent category ID
+        show_in_print_overview: Whether to show the category in print forms
+    """
+
+    id: int
+    name: str
+    parent_id: Optional[int]
+    show_in_print_overview: bool
+
+
+class CategoryTree:
+    """Snapshot of non-deleted categories for ancestry lookups.
+
+    Attributes:
+        nodes: Categories by ID
+        missing: IDs looked up and not found when the snapshot was loaded
+    """
+
+    def __init__(self, nodes: Iterable[CategoryNode]) -> None:
+        """Initialize tree.
+
+        Args:
+            nodes: Non-deleted categories
+        """
+        self.nodes: Dict[int, CategoryNode] = {node.id: node for node in nodes}
+        self.missing: Set[int] = set()
+
+    def __contains__(self, category_id: object) -> bool:
+        """Check whether a category is part of the snapshot."""
+        return category_id in self.nodes
+
+    def path_from_root(self, category_id: int) -> List[CategoryNode]:
+        """Get the ancestry path of a category.
+
+        The walk stops at a deleted ancestor, as the path then starts at
+        the highest non-deleted one.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            List[CategoryNode]: Categories from root to the given one, empty
+                if the category is unknown or deleted
+        """
+        path: List[CategoryNode] = []
+        seen = set()
+        node = self.nodes.get(category_id)
+        while node is not None and node.id not in seen:
+            seen.add(node.id)
+            path.append(node)
+            node = self.nodes.get(node.parent_id) if node.parent_id else None
+        path.reverse()
+        return path
+
+
+_category_tree: Optional[Tuple[float, CategoryTree]] = None
+# Incremented by every invalidation, so loads overlapping one are not cached
+_category_tree_generation = 0
+
+
+def invalidate_category_tree() -> None:
+    """Drop the category tree snapshot of this worker after category writes."""
+    global _category_tree, _category_tree_generation
+    _category_tree = None
+    _category_tree_generation += 1
+
+
 class CategoryService:
     """Service for managing equipment categories."""
 
@@ -83,6 +165,7 @@ class CategoryService:
             show_in_print_overview=show_in_print_overview,
         )
         await self.repository.create(category)
+        invalidate_category_tree()
         return category
 
     async def update_category(
@@ -147,6 +230,7 @@ class CategoryService:
             category.show_in_print_overview = show_in_print_overview
 
         await self.repository.update(category)
+        invalidate_category_tree()
         return category
 
     async def get_categories(self) -> List[Category]:
@@ -201,6 +285,7 @@ class CategoryService:
 
         # Use soft delete instead of physical delete
         deleted_category = await self.repository.soft_delete(category_id)
+        invalidate_category_tree()
         return deleted_category is not None
 
     async def search_categories(self, query: str) -> List[Category]:
@@ -222,17 +307,62 @@ class CategoryService:
         """
         return await self.repository.get_all_with_equipment_count()
 
+    async def get_category_tree(
+        self, category_id: Optional[int] = None
+    ) -> CategoryTree:
+        """Get the category tree snapshot of this worker.
+
+        The snapshot is reloaded when it is older than
+        ``CATEGORY_TREE_CACHE_TTL`` or does not contain the requested
+        category, which may have been created by another worker. A category
+        still absent after the reload is deleted or unknown; it is
+        remembered as missing, so later lookups of it do not reload again
+        until the snapshot is invalidated or expires. A snapshot whose load
+        overlapped an invalidation may predate the write and is returned
+        without being cached.
+
+        Args:
+            category_id: Category that must be part of the snapshot (optional)
+
+        Returns:
+            CategoryTree: Non-deleted categories
+        """
+        global _category_tree
+        if _category_tree is not None:
+            loaded_at, tree = _category_tree
+            fresh = time.monotonic() - loaded_at < settings.CATEGORY_TREE_CACHE_TTL
+            if fresh and (
+                category_id is None
+                or category_id in tree
+                or category_id in tree.missing
+            ):
+                return tree
+
+        generation = _category_tree_generation
+        rows = await self.repository.get_tree_nodes()
+        tree = CategoryTree(CategoryNode(**row) for row in rows)
+        if generation != _category_tree_generation:
+            return tree
+        if category_id is not None and category_id not in tree:
+            tree.missing.add(category_id)
+        _category_tree = (time.monotonic(), tree)
+        return tree
+
     async def get_print_hierarchy_and_sort_path(
         self, category_id: Optional[int]
     ) -> Tuple[List[int], List[PrintableCategoryInfo]]:
         """Retrieves ancestry path and printable categories for a category_id.
 
         For a given category_id, retrieves its full ancestry path for sorting
-        and a list of categories marked for printing.
+        and a list of categories marked for printing. The path is walked in
+        the cached category tree, so repeated calls run no queries.
+
+        Deleted categories have no hierarchy, so equipment still assigned
+        to one is printed without categories.
 
         Args:
             category_id: The ID of the direct category of the equipment.
-                         If None, returns empty lists.
+                         If None or deleted, returns empty lists.
 
         Returns:
             A tuple containing:
@@ -245,50 +375,23 @@ class CategoryService:
         if category_id is None:
             return [], []
 
-        # Call the repository method to get the full path
-        full_path_rows = await self.repository.get_category_path_from_root(category_id)
-
-        if not full_path_rows:
-            direct_category = await self.repository.get(category_id)
-            if direct_category and direct_category.show_in_print_overview:
-                return (
-                    [direct_category.id],
-                    [
-                        PrintableCategoryInfo(
-                            id=direct_category.id,
-                            name=direct_category.name,
-                            level=1,
-                        )
-                    ],
-                )
+        tree = await self.get_category_tree(category_id)
+        path = tree.path_from_root(category_id)
+        if not path:
             return [], []
 
-        sort_path: List[int] = [row['id'] for row in full_path_rows]
-
-        printable_categories: List[PrintableCategoryInfo] = []
-        current_printable_level = 1
-        has_any_printable = False
-
-        for row in full_path_rows:
-            if row['show_in_print_overview']:
-                has_any_printable = True
-                printable_categories.append(
-                    PrintableCategoryInfo(
-                        id=row['id'],
-                        name=row['name'],
-                        level=current_printable_level,
-                    )
-                )
-                current_printable_level += 1
+        sort_path: List[int] = [node.id for node in path]
+        printable_categories = [
+            PrintableCategoryInfo(id=node.id, name=node.name, level=level)
+            for level, node in enumerate(
+                (node for node in path if node.show_in_print_overview), start=1
+            )
+        ]
 
-        if not has_any_printable and full_path_rows:
-            root_category_in_path = full_path_rows[0]
+        # Without printable categories, the root category is shown
+        if not printable_categories:
             printable_categories = [
-                PrintableCategoryInfo(
-                    id=root_category_in_path['id'],
-                    name=root_category_in_path['name'],
-                    level=1,
-                )
+                PrintableCategoryInfo(id=path[0].id, name=path[0].name, level=1)
             ]
 
         return sort_path, printable_categories
@@ -360,6 +463,8 @@ class CategoryService:
                 parent_id=category.parent_id,
                 show_in_print_overview=category.show_in_print_overview,
                 equipment_count=category.equipment_count,
+                direct_equipment_count=category.direct_equipment_count,
+                equipment_by_status=category.equipment_by_status,
                 created_at=category.created_at,
                 updated_at=category.updated_at,
             )
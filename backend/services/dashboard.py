@@ -0,0 +1,88 @@
+"""Dashboard service module.
+
+This module aggregates the counters shown on the home dashboard. Results are
+cached for a short time so the page cost does not grow with the catalog.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.cache import cache_get, cache_set, make_cache_key
+from backend.core.config import settings
+from backend.core.timezone_utils import MOSCOW_TZ
+from backend.repositories import BookingRepository, EquipmentRepository
+from backend.schemas.dashboard import CategoryCount, DashboardSummary
+
+
+class DashboardService:
+    """Service for home dashboard aggregates."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+        self.equipment_repository = EquipmentRepository(session)
+        self.booking_repository = BookingRepository(session)
+
+    async def get_summary(
+        self, now: Optional[datetime] = None, refresh: bool = False
+    ) -> DashboardSummary:
+        """Get dashboard counters.
+
+        Args:
+            now: Current datetime, defaults to the current Moscow time
+            refresh: Bypass the cache and recompute counters
+
+        Returns:
+            DashboardSummary: Aggregated counters
+        """
+        now = (now or datetime.now(MOSCOW_TZ)).astimezone(MOSCOW_TZ)
+        cache_key = make_cache_key('dashboard', now.date().isoformat())
+
+        if not refresh:
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                return DashboardSummary.model_validate_json(cached)
+
+        summary = await self._build_summary(now)
+        await cache_set(
+            cache_key, summary.model_dump_json(), settings.DASHBOARD_CACHE_TTL
+        )
+        return summary
+
+    async def _build_summary(self, now: datetime) -> DashboardSummary:
+        """Compute dashboard counters with aggregate queries.
+
+        Args:
+            now: Current datetime in Moscow timezone
+
+        Returns:
+            DashboardSummary: Aggregated counters
+        """
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_end = day_start + timedelta(days=1)
+
+        equipment_by_status = await self.equipment_repository.count_by_status()
+        categories = await self.equipment_repository.count_by_category()
+        bookings_by_status = await self.booking_repository.count_by_status()
+        day_counts = await self.booking_repository.get_day_counts(
+            day_start, day_end, now
+        )
+
+        return DashboardSummary(
+            equipment_total=sum(equipment_by_status.values()),
+            equipment_by_status=equipment_by_status,
+            equipment_by_category=[
+                CategoryCount.model_validate(row) for row in categories
+            ],
+            bookings_by_status=bookings_by_status,
+            pickups_today=day_counts['pickups'],
+            returns_today=day_counts['returns'],
+            overdue=day_counts['overdue'],
+            generated_at=now,
+        )
@@ -357,8 +357,8 @@ class EquipmentService:
         if available_to and available_to.tzinfo is None:
             available_to = available_to.replace(tzinfo=timezone.utc)
 
-        # Get equipment list using repository
-        equipment_list = await self.repository.get_list(
+        # Get equipment rows with category names in a single query
+        rows = await self.repository.get_list_rows(
             skip=skip,
             limit=limit,
             status=status,
@@ -370,34 +370,7 @@ class EquipmentService:
             include_deleted=include_deleted,
         )
 
-        # Load equipment with categories
-        loaded_equipment = []
-        for equipment in equipment_list:
-            loaded = await self._load_equipment_with_category(equipment)
-            loaded_equipment.append(loaded)
-
-        # Convert to response objects with category names
-        responses = []
-        for equipment in loaded_equipment:
-            # Create a dictionary with all equipment attributes
-            equipment_dict = {
-                'id': equipment.id,
-                'name': equipment.name,
-                'description': equipment.description,
-                'category_id': equipment.category_id,
-                'barcode': equipment.barcode,
-                'serial_number': equipment.serial_number,
-                'replacement_cost': equipment.replacement_cost,
-                'status': equipment.status,
-                'created_at': equipment.created_at,
-                'updated_at': equipment.updated_at,
-                'category_name': (
-                    equipment.category.name if equipment.category else 'Без категории'
-                ),
-            }
-            responses.append(EquipmentResponse.model_validate(equipment_dict))
-
-        return responses
+        return [EquipmentResponse.model_validate(row) for row in rows]
 
     async def update_equipment(
         self,
@@ -1082,11 +1055,9 @@ class EquipmentService:
         enhanced_items = []
         for equipment_response in equipment_list:
             projects = active_projects.get(equipment_response.id, [])
-            # Convert to dict and add active_projects
-            equipment_dict = equipment_response.model_dump()
-            equipment_dict['active_projects'] = projects
-            enhanced_item = EquipmentResponse.model_validate(equipment_dict)
-            enhanced_items.append(enhanced_item)
+            enhanced_items.append(
+                equipment_response.model_copy(update={'active_projects': projects})
+            )
 
         return enhanced_items
 
@@ -0,0 +1,92 @@
+"""Export service module.
+
+This module reads equipment, bookings and projects for file exports. Rows
+are fetched through a server-side cursor in batches, so an export holds at
+most one batch of ORM objects in memory.
+"""
+
+from typing import Any, AsyncIterator, List, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from backend.core.config import settings
+from backend.core.export import ExportColumn, format_cell
+
+
+def _name_of(obj: Any) -> Any:
+    """Get ``name`` of an optional related object."""
+    return obj.name if obj is not None else None
+
+
+EQUIPMENT_COLUMNS: Sequence[ExportColumn] = (
+    ExportColumn('ID', lambda e: e.id),
+    ExportColumn('Название', lambda e: e.name),
+    ExportColumn('Категория', lambda e: _name_of(e.category)),
+    ExportColumn('Серийный номер', lambda e: e.serial_number),
+    ExportColumn('Штрихкод', lambda e: e.barcode),
+    ExportColumn('Статус', lambda e: e.status),
+    ExportColumn('Стоимость замены', lambda e: e.replacement_cost),
+    ExportColumn('Описание', lambda e: e.description),
+    ExportColumn('Создано', lambda e: e.created_at),
+)
+
+BOOKING_COLUMNS: Sequence[ExportColumn] = (
+    ExportColumn('ID', lambda b: b.id),
+    ExportColumn('Клиент', lambda b: _name_of(b.client)),
+    ExportColumn('Оборудование', lambda b: _name_of(b.equipment)),
+    ExportColumn('Проект', lambda b: _name_of(b.project)),
+    ExportColumn('Начало', lambda b: b.start_date),
+    ExportColumn('Окончание', lambda b: b.end_date),
+    ExportColumn('Количество', lambda b: b.quantity),
+    ExportColumn('Статус', lambda b: b.booking_status),
+    ExportColumn('Оплата', lambda b: b.payment_status),
+    ExportColumn('Сумма', lambda b: b.total_amount),
+    ExportColumn('Оплачено', lambda b: b.paid_amount),
+)
+
+PROJECT_COLUMNS: Sequence[ExportColumn] = (
+    ExportColumn('ID', lambda p: p.id),
+    ExportColumn('Название', lambda p: p.name),
+    ExportColumn('Клиент', lambda p: _name_of(p.client)),
+    ExportColumn('Начало', lambda p: p.start_date),
+    ExportColumn('Окончание', lambda p: p.end_date),
+    ExportColumn('Статус', lambda p: p.status),
+    ExportColumn('Оплата', lambda p: p.payment_status),
+    ExportColumn('Описание', lambda p: p.description),
+    ExportColumn('Создано', lambda p: p.created_at),
+)
+
+
+class ExportService:
+    """Service streaming query results as export rows."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    async def iter_rows(
+        self, stmt: Select, columns: Sequence[ExportColumn]
+    ) -> AsyncIterator[List[Any]]:
+        """Stream ORM query results as rows of cell values.
+
+        The statement may only eagerly load many-to-one relationships with
+        ``joinedload``; the filter builders used for pagination already
+        satisfy this.
+
+        Args:
+            stmt: ORM select statement
+            columns: Exported columns
+
+        Yields:
+            List[Any]: Cell values of one object
+        """
+        result = await self.session.stream(
+            stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        async for obj in result.scalars():
+            yield [format_cell(column.value(obj)) for column in columns]
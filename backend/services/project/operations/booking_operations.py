@@ -3,7 +3,7 @@
 This module contains methods for managing project bookings.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -15,10 +15,17 @@ from backend.constants.log_messages import (
     ProjectLogMessages,
 )
 from backend.core.timezone_utils import ensure_timezone_aware, normalize_project_period
-from backend.exceptions import NotFoundError, ValidationError
-from backend.exceptions.messages import ProjectErrorMessages
+from backend.core.unit_of_work import UnitOfWork
+from backend.exceptions import DateError, NotFoundError, ValidationError
+from backend.exceptions.messages import DateErrorMessages, ProjectErrorMessages
 from backend.models import Project
 from backend.repositories import BookingRepository, ProjectRepository
+from backend.schemas import (
+    ProjectRescheduleResponse,
+    RescheduleConflict,
+    RescheduledBooking,
+)
+from backend.services.availability import invalidate_timelines
 from backend.services.booking import BookingService
 from backend.services.project.operations.crud_operations import CrudOperations
 
@@ -190,9 +197,9 @@ class BookingOperations:
         """Create new project with bookings.
 
         This method creates a project and associated bookings in a single transaction.
-        If the project creation succeeds but some bookings fail, the transaction will
-        still be committed and the method will return the project with the successfully
-        created bookings.
+        Each booking is created in its own savepoint: if some bookings fail, only their
+        changes are rolled back, the transaction is still committed once and the method
+        returns the project with the successfully created bookings.
 
         Args:
             name: Project name
@@ -226,165 +233,316 @@ class BookingOperations:
             start_date = ensure_timezone_aware(start_date)
             end_date = ensure_timezone_aware(end_date)
 
-            # Create the project first
-            project = await self.crud_operations.create_project(
-                name=name,
-                client_id=client_id,
-                start_date=start_date,
-                end_date=end_date,
-                description=description,
-                notes=notes,
-            )
+            # Project and bookings are committed together
+            async with UnitOfWork(self.db_session) as uow:
+                # Create the project first
+                project = await self.crud_operations.create_project(
+                    name=name,
+                    client_id=client_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    description=description,
+                    notes=notes,
+                )
 
-            created_bookings = []
-            failed_bookings = []
-
-            # Create bookings for each piece of equipment
-            for booking_data in bookings:
-                equipment_id = booking_data.get('equipment_id')
-                booking_start = booking_data.get('start_date')
-                booking_end = booking_data.get('end_date')
-
-                if not all([equipment_id, booking_start, booking_end]):
-                    log.warning('Incomplete booking data: {}', booking_data)
-                    failed_bookings.append(
-                        {
-                            'data': booking_data,
-                            'reason': ProjectErrorMessages.INCOMPLETE_BOOKING_DATA,
-                        }
-                    )
-                    continue
+                created_bookings = []
+                failed_bookings = []
 
-                try:
-                    # Validate and convert types
-                    try:
-                        equipment_id_str = str(equipment_id)
-                        equipment_id_int = int(equipment_id_str)
-                    except (ValueError, TypeError):
-                        log.warning('Invalid equipment ID: {}', equipment_id)
-                        failed_bookings.append(
-                            {
-                                'data': booking_data,
-                                'reason': (
-                                    ProjectErrorMessages.INVALID_EQUIPMENT_ID.format(
-                                        equipment_id
-                                    )
-                                ),
-                            }
-                        )
-                        continue
+                # Create bookings for each piece of equipment
+                for booking_data in bookings:
+                    equipment_id = booking_data.get('equipment_id')
+                    booking_start = booking_data.get('start_date')
+                    booking_end = booking_data.get('end_date')
 
-                    if not isinstance(booking_start, datetime):
-                        log.warning('Invalid start date type: {}', booking_start)
+                    if not all([equipment_id, booking_start, booking_end]):
+                        log.warning('Incomplete booking data: {}', booking_data)
                         failed_bookings.append(
                             {
                                 'data': booking_data,
-                                'reason': (
-                                    ProjectErrorMessages.INVALID_DATE_TYPE.format(
-                                        booking_start
-                                    )
-                                ),
+                                'reason': ProjectErrorMessages.INCOMPLETE_BOOKING_DATA,
                             }
                         )
                         continue
 
-                    if not isinstance(booking_end, datetime):
-                        log.warning('Invalid end date type: {}', booking_end)
+                    try:
+                        # Validate and convert types
+                        try:
+                            equipment_id_str = str(equipment_id)
+                            equipment_id_int = int(equipment_id_str)
+                        except (ValueError, TypeError):
+                            log.warning('Invalid equipment ID: {}', equipment_id)
+                            reason = ProjectErrorMessages.INVALID_EQUIPMENT_ID
+                            failed_bookings.append(
+                                {
+                                    'data': booking_data,
+                                    'reason': reason.format(equipment_id),
+                                }
+                            )
+                            continue
+
+                        if not isinstance(booking_start, datetime):
+                            log.warning('Invalid start date type: {}', booking_start)
+                            failed_bookings.append(
+                                {
+                                    'data': booking_data,
+                                    'reason': (
+                                        ProjectErrorMessages.INVALID_DATE_TYPE.format(
+                                            booking_start
+                                        )
+                                    ),
+                                }
+                            )
+                            continue
+
+                        if not isinstance(booking_end, datetime):
+                            log.warning('Invalid end date type: {}', booking_end)
+                            failed_bookings.append(
+                                {
+                                    'data': booking_data,
+                                    'reason': (
+                                        ProjectErrorMessages.INVALID_DATE_TYPE.format(
+                                            booking_end
+                                        )
+                                    ),
+                                }
+                            )
+                            continue
+
+                        # Normalize only if end is 00:00 (date-only);
+                        # otherwise keep explicit times
+                        if (
+                            isinstance(booking_end, datetime)
+                            and booking_end.hour == 0
+                            and booking_end.minute == 0
+                            and booking_end.second == 0
+                            and booking_end.microsecond == 0
+                        ):
+                            booking_start, booking_end = normalize_project_period(
+                                booking_start, booking_end
+                            )
+                        # Ensure tz-aware (assume Moscow for naive)
+                        booking_start = ensure_timezone_aware(booking_start)
+                        booking_end = ensure_timezone_aware(booking_end)
+
+                        # Create booking linked to the project; a failure
+                        # only rolls back its own savepoint
+                        async with uow.savepoint():
+                            booking = await self.booking_service.create_booking(
+                                client_id=client_id,
+                                equipment_id=equipment_id_int,
+                                start_date=booking_start,
+                                end_date=booking_end,
+                                total_amount=0,
+                                deposit_amount=0,
+                                quantity=booking_data.get('quantity', 1),
+                                notes=None,
+                                project_id=project.id,
+                            )
+
+                        created_bookings.append(booking)
+
+                        log.info(
+                            BookingLogMessages.BOOKING_CREATED, equipment_id, project.id
+                        )
+                    except Exception as e:
+                        log.error(
+                            'Failed to create booking for equipment {}: {}',
+                            equipment_id,
+                            str(e),
+                        )
                         failed_bookings.append(
                             {
                                 'data': booking_data,
                                 'reason': (
-                                    ProjectErrorMessages.INVALID_DATE_TYPE.format(
-                                        booking_end
+                                    ProjectErrorMessages.BOOKING_CREATION_FAILED.format(
+                                        equipment_id, str(e)
                                     )
                                 ),
                             }
                         )
-                        continue
 
-                    # Normalize only if end is 00:00 (date-only);
-                    # otherwise keep explicit times
-                    if (
-                        isinstance(booking_end, datetime)
-                        and booking_end.hour == 0
-                        and booking_end.minute == 0
-                        and booking_end.second == 0
-                        and booking_end.microsecond == 0
-                    ):
-                        booking_start, booking_end = normalize_project_period(
-                            booking_start, booking_end
-                        )
-                    # Ensure tz-aware (assume Moscow for naive)
-                    booking_start = ensure_timezone_aware(booking_start)
-                    booking_end = ensure_timezone_aware(booking_end)
-
-                    # Create booking with verified data
-                    booking = await self.booking_service.create_booking(
-                        client_id=client_id,
-                        equipment_id=equipment_id_int,
-                        start_date=booking_start,
-                        end_date=booking_end,
-                        total_amount=0,
-                        deposit_amount=0,
-                        quantity=booking_data.get('quantity', 1),
-                        notes=None,
+                if not created_bookings and bookings:
+                    log.warning(
+                        BookingLogMessages.NO_BOOKINGS_CREATED,
+                        project.id,
+                        len(bookings),
                     )
-
-                    # Link booking to project
-                    booking.project_id = project.id
-                    await self.db_session.flush()
-
-                    created_bookings.append(booking)
-
+                    # Log that all booking attempts failed
                     log.info(
-                        BookingLogMessages.BOOKING_CREATED, equipment_id, project.id
-                    )
-                except Exception as e:
-                    log.error(
-                        'Failed to create booking for equipment {}: {}',
-                        equipment_id,
-                        str(e),
-                    )
-                    failed_bookings.append(
-                        {
-                            'data': booking_data,
-                            'reason': (
-                                ProjectErrorMessages.BOOKING_CREATION_FAILED.format(
-                                    equipment_id, str(e)
-                                )
-                            ),
-                        }
+                        'Project {} has no bookings: all {} booking attempts failed',
+                        project.id,
+                        len(bookings),
                     )
 
-            if not created_bookings and bookings:
-                log.warning(
-                    BookingLogMessages.NO_BOOKINGS_CREATED, project.id, len(bookings)
-                )
-                # Log that all booking attempts failed
+                # Log the results of the operation
                 log.info(
-                    'Project {} has no bookings: all {} booking attempts failed',
+                    BookingLogMessages.BOOKING_RESULT,
                     project.id,
-                    len(bookings),
+                    len(created_bookings),
+                    len(failed_bookings),
                 )
 
-            # Log the results of the operation
-            log.info(
-                BookingLogMessages.BOOKING_RESULT,
-                project.id,
-                len(created_bookings),
-                len(failed_bookings),
+            # Caches were invalidated before the commit, drop entries
+            # a concurrent reader may have filled in the meantime
+            await invalidate_timelines(
+                [booking.equipment_id for booking in created_bookings]
             )
 
-            # Commit the transaction
-            await self.db_session.commit()
-
             # Update project with loaded bookings
             return await self.crud_operations.get_project(
                 project.id, with_bookings=True
             )
 
         except Exception as e:
-            # In case of an error, rollback the transaction
-            await self.db_session.rollback()
+            # The unit of work has already rolled the transaction back
             log.error(ErrorLogMessages.CREATE_PROJECT_ERROR, str(e))
             raise
+
+    async def reschedule_project(
+        self,
+        project_id: int,
+        shift: Optional[timedelta] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        booking_ids: Optional[List[int]] = None,
+        dry_run: bool = True,
+    ) -> ProjectRescheduleResponse:
+        """Move project bookings by an interval or to a new period.
+
+        Conflicts of all planned periods are found with one query. A dry
+        run only reports them; otherwise the bookings are moved with one
+        statement if there are none, together with the project dates when
+        the whole project is moved.
+
+        Args:
+            project_id: Project ID
+            shift: Interval added to the booking dates
+            start_date: New start date of the bookings, instead of a shift
+            end_date: New end date of the bookings, instead of a shift
+            booking_ids: Bookings to move, all open bookings if None
+            dry_run: Only preview the new dates and conflicts
+
+        Returns:
+            ProjectRescheduleResponse: Planned periods, conflicts and
+            whether the bookings were moved
+
+        Raises:
+            NotFoundError: If project not found
+            ValidationError: If the move is not specified or bookings are
+                not open bookings of the project
+            DateError: If the new period is empty
+        """
+        log = logger.bind(project_id=project_id, dry_run=dry_run)
+
+        if shift is not None and (start_date is not None or end_date is not None):
+            raise ValidationError('Specify either a shift or new dates, not both')
+        if shift is None:
+            if start_date is None or end_date is None:
+                raise ValidationError('Specify a shift or both new dates')
+            start_date = ensure_timezone_aware(start_date)
+            end_date = ensure_timezone_aware(end_date)
+            if start_date >= end_date:
+                raise DateError(
+                    DateErrorMessages.INVALID_DATES,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+        elif not shift:
+            raise ValidationError('Shift must not be zero')
+
+        try:
+            project = await self.repository.get_by_id(project_id)
+            if project is None:
+                log.warning(ProjectLogMessages.PROJECT_NOT_FOUND, project_id)
+                raise NotFoundError(
+                    ProjectErrorMessages.PROJECT_NOT_FOUND.format(project_id),
+                    details={'project_id': project_id},
+                )
+
+            bookings = await self.booking_repository.get_project_open_bookings(
+                project_id, booking_ids, for_update=not dry_run
+            )
+            if booking_ids is not None:
+                unknown = sorted(set(booking_ids) - {row.id for row in bookings})
+                if unknown:
+                    raise ValidationError(
+                        'Bookings are not open bookings of the project',
+                        details={'booking_ids': ','.join(map(str, unknown))},
+                    )
+
+            planned = [
+                RescheduledBooking(
+                    booking_id=row.id,
+                    equipment_id=row.equipment_id,
+                    equipment_name=row.equipment_name,
+                    start_date=row.start_date,
+                    end_date=row.end_date,
+                    new_start_date=row.start_date + shift if shift else start_date,
+                    new_end_date=row.end_date + shift if shift else end_date,
+                )
+                for row in bookings
+            ]
+            conflicts = await self.booking_repository.find_move_conflicts(
+                [
+                    (
+                        item.booking_id,
+                        item.equipment_id,
+                        item.new_start_date,
+                        item.new_end_date,
+                    )
+                    for item in planned
+                ]
+            )
+
+            project_start, project_end = project.start_date, project.end_date
+            if booking_ids is None:
+                if shift:
+                    project_start, project_end = (
+                        project_start + shift,
+                        project_end + shift,
+                    )
+                else:
+                    project_start, project_end = start_date, end_date
+
+            applied = not dry_run and not conflicts and bool(planned)
+            if applied:
+                await self.booking_repository.move_bookings(
+                    [item.booking_id for item in planned],
+                    shift=shift,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                project.start_date = project_start
+                project.end_date = project_end
+                await self.db_session.commit()
+                await invalidate_timelines(item.equipment_id for item in planned)
+                log.info('Rescheduled {} bookings of project', len(planned))
+            else:
+                await self.db_session.rollback()
+
+            return ProjectRescheduleResponse(
+                project_id=project_id,
+                applied=applied,
+                project_start_date=project_start,
+                project_end_date=project_end,
+                bookings=planned,
+                conflicts=[
+                    RescheduleConflict(
+                        booking_id=row.booking_id,
+                        equipment_id=row.equipment_id,
+                        conflicting_booking_id=row.conflicting_booking_id,
+                        conflicting_project_id=row.conflicting_project_id,
+                        start_date=row.start_date,
+                        end_date=row.end_date,
+                        booking_status=row.booking_status.value,
+                    )
+                    for row in conflicts
+                ],
+            )
+        except (NotFoundError, ValidationError):
+            await self.db_session.rollback()
+            raise
+        except Exception as e:
+            await self.db_session.rollback()
+            log.error('Error rescheduling project bookings: {}', str(e))
+            raise
@@ -3,8 +3,8 @@
 This module contains all basic CRUD operations for projects.
 """
 
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,10 +16,17 @@ from backend.constants.log_messages import (
 )
 from backend.core.config import settings
 from backend.core.timezone_utils import ensure_timezone_aware, normalize_project_period
+from backend.core.unit_of_work import commit_or_flush, rollback_if_unowned
 from backend.exceptions import CaptchaError, DateError, NotFoundError, ValidationError
 from backend.exceptions.messages import DateErrorMessages, ProjectErrorMessages
-from backend.models import BookingStatus, Project, ProjectPaymentStatus, ProjectStatus
-from backend.repositories import BookingRepository, ClientRepository, ProjectRepository
+from backend.models import Project, ProjectPaymentStatus, ProjectStatus
+from backend.repositories import (
+    BookingRepository,
+    ClientRepository,
+    EquipmentRepository,
+    ProjectRepository,
+)
+from backend.services.availability import invalidate_timelines
 
 
 class CrudOperations:
@@ -35,6 +42,7 @@ class CrudOperations:
         self.repository = ProjectRepository(db_session)
         self.client_repository = ClientRepository(db_session)
         self.booking_repository = BookingRepository(db_session)
+        self.equipment_repository = EquipmentRepository(db_session)
 
     async def create_project(
         self,
@@ -105,8 +113,8 @@ class CrudOperations:
             # Save project
             created_project = await self.repository.create(project)
 
-            # Commit transaction
-            await self.db_session.commit()
+            # Commit transaction unless a unit of work owns it
+            await commit_or_flush(self.db_session)
 
             log.info(
                 ProjectLogMessages.PROJECT_CREATED, created_project.id, client.name
@@ -116,11 +124,11 @@ class CrudOperations:
 
         except (ValidationError, NotFoundError, DateError):
             # Re-raise domain exceptions without wrapping
-            await self.db_session.rollback()
+            await rollback_if_unowned(self.db_session)
             raise
         except Exception as e:
             # Rollback in case of error
-            await self.db_session.rollback()
+            await rollback_if_unowned(self.db_session)
             log.error(ErrorLogMessages.CREATE_PROJECT_ERROR, str(e))
             raise
 
@@ -291,21 +299,16 @@ class CrudOperations:
                     details={'project_id': project_id},
                 )
 
-            # Cascade completion and soft deletion of bookings if project is completed
+            # Cascade completion and soft deletion of bookings if project is closed
+            released_equipment_ids: Set[int] = set()
             if status in [ProjectStatus.COMPLETED, ProjectStatus.CANCELLED]:
-                project_with_bookings = await self.repository.get_by_id_with_bookings(
-                    project_id
+                closed_bookings = await self.booking_repository.close_project_bookings(
+                    project_id, datetime.now(timezone.utc)
                 )
-                if project_with_bookings and project_with_bookings.bookings:
-                    for booking in project_with_bookings.bookings:
-                        if booking.booking_status not in [
-                            BookingStatus.COMPLETED,
-                            BookingStatus.CANCELLED,
-                        ]:
-                            booking.booking_status = BookingStatus.COMPLETED
-                            await self.booking_repository.update(booking)
-                        await self.booking_repository.soft_delete(booking.id)
-                await self.db_session.flush()
+                released_equipment_ids = {
+                    booking.equipment_id for booking in closed_bookings
+                }
+                await self.equipment_repository.release_rented(released_equipment_ids)
 
             # Get client name for response
             client = await self.client_repository.get(updated_project.client_id)
@@ -320,6 +323,7 @@ class CrudOperations:
 
             # Commit the transaction
             await self.db_session.commit()
+            await invalidate_timelines(released_equipment_ids)
 
             log.info(ProjectLogMessages.PROJECT_UPDATED, project_id)
             return updated_project
@@ -376,6 +380,9 @@ class CrudOperations:
             # Soft delete the project
             result = await self.repository.delete(project_id)
             await self.db_session.commit()
+            await invalidate_timelines(
+                booking.equipment_id for booking in project.bookings or []
+            )
 
             if result:
                 log.info(ProjectLogMessages.PROJECT_DELETED, project_id)
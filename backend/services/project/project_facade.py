@@ -3,13 +3,14 @@
 This module provides service functionality for project management.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models import Project, ProjectPaymentStatus, ProjectStatus
 from backend.repositories import BookingRepository, ClientRepository, ProjectRepository
+from backend.schemas import ProjectRescheduleResponse
 from backend.services.booking import BookingService
 from backend.services.project.formatters import FormattersOperations
 from backend.services.project.operations import (
@@ -305,6 +306,42 @@ class ProjectService:
             project_id, booking_id
         )
 
+    async def reschedule_project(
+        self,
+        project_id: int,
+        shift: Optional[timedelta] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        booking_ids: Optional[List[int]] = None,
+        dry_run: bool = True,
+    ) -> ProjectRescheduleResponse:
+        """Move project bookings by an interval or to a new period.
+
+        Args:
+            project_id: Project ID
+            shift: Interval added to the booking dates
+            start_date: New start date of the bookings, instead of a shift
+            end_date: New end date of the bookings, instead of a shift
+            booking_ids: Bookings to move, all open bookings if None
+            dry_run: Only preview the new dates and conflicts
+
+        Returns:
+            Planned periods, conflicts and whether the bookings were moved
+
+        Raises:
+            NotFoundError: If project not found
+            ValidationError: If the move is invalid
+            DateError: If the new period is empty
+        """
+        return await self.booking_operations.reschedule_project(
+            project_id,
+            shift=shift,
+            start_date=start_date,
+            end_date=end_date,
+            booking_ids=booking_ids,
+            dry_run=dry_run,
+        )
+
     async def get_project_bookings(self, project_id: int) -> List[dict]:
         """Get bookings for project.
 
@@ -0,0 +1,227 @@
+"""Report service module.
+
+This module refreshes the report summary table and prepares utilization,
+revenue and idle inventory report queries.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from backend.core.config import settings
+from backend.core.timezone_utils import MOSCOW_TZ
+from backend.exceptions import DateError
+from backend.exceptions.messages import DateErrorMessages
+from backend.repositories import ReportRepository
+from backend.schemas.report import ReportRefreshResult
+
+
+class ReportService:
+    """Service for utilization and revenue reports."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+        self.repository = ReportRepository(session)
+
+    async def refresh(self, full: bool = False) -> ReportRefreshResult:
+        """Refresh the report summary table.
+
+        Only bookings updated since the previous refresh are recomputed,
+        unless ``full`` is set or the table is empty. Waits for a refresh
+        running in another session to finish first.
+
+        Args:
+            full: Rebuild the whole table
+
+        Returns:
+            ReportRefreshResult: Refresh statistics
+        """
+        await self.repository.lock_refresh()
+        return await self._refresh(full)
+
+    async def try_refresh(self, full: bool = False) -> Optional[ReportRefreshResult]:
+        """Refresh the report summary table unless a refresh is running.
+
+        Args:
+            full: Rebuild the whole table
+
+        Returns:
+            Optional[ReportRefreshResult]: Refresh statistics or None if
+                another session is refreshing
+        """
+        if not await self.repository.lock_refresh(wait=False):
+            logger.info('Report stats refresh skipped: another refresh is running')
+            return None
+        return await self._refresh(full)
+
+    async def _refresh(self, full: bool) -> ReportRefreshResult:
+        """Refresh the report summary table while holding the refresh lock.
+
+        Both watermarks are read in the refresh transaction before any
+        booking, so bookings committed during the refresh are picked up by
+        the next one.
+
+        Args:
+            full: Rebuild the whole table
+
+        Returns:
+            ReportRefreshResult: Refresh statistics
+        """
+        since = None if full else await self.repository.get_watermark()
+        refreshed_at = await self.repository.get_change_watermark()
+        bookings, rows = await self.repository.refresh_daily_stats(
+            refreshed_at, since=since
+        )
+        logger.info(
+            'Report stats refreshed: {} bookings, {} rows (full={})',
+            bookings,
+            rows,
+            since is None,
+        )
+        return ReportRefreshResult(
+            full=since is None,
+            bookings=bookings,
+            rows=rows,
+            refreshed_at=refreshed_at,
+        )
+
+    def get_utilization_query(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category_id: Optional[int] = None,
+    ) -> Select:
+        """Get equipment utilization query.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+            category_id: Optional category filter
+
+        Returns:
+            Select statement for pagination
+
+        Raises:
+            DateError: If the period is invalid
+        """
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        return self.repository.get_utilization_query(start_date, end_date, category_id)
+
+    def get_category_revenue_query(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> Select:
+        """Get revenue per category query.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+
+        Returns:
+            Select statement for pagination
+
+        Raises:
+            DateError: If the period is invalid
+        """
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        return self.repository.get_category_revenue_query(start_date, end_date)
+
+    def get_client_revenue_query(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> Select:
+        """Get revenue per client query.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+
+        Returns:
+            Select statement for pagination
+
+        Raises:
+            DateError: If the period is invalid
+        """
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        return self.repository.get_client_revenue_query(start_date, end_date)
+
+    def get_monthly_revenue_query(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> Select:
+        """Get revenue per month query.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+
+        Returns:
+            Select statement for pagination
+
+        Raises:
+            DateError: If the period is invalid
+        """
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        return self.repository.get_monthly_revenue_query(start_date, end_date)
+
+    def get_idle_equipment_query(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category_id: Optional[int] = None,
+    ) -> Select:
+        """Get idle equipment query.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+            category_id: Optional category filter
+
+        Returns:
+            Select statement for pagination
+
+        Raises:
+            DateError: If the period is invalid
+        """
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        return self.repository.get_idle_equipment_query(
+            start_date, end_date, category_id
+        )
+
+    @staticmethod
+    def resolve_period(
+        start_date: Optional[date], end_date: Optional[date]
+    ) -> Tuple[date, date]:
+        """Fill in default report period and validate it.
+
+        The period defaults to the last ``REPORTS_DEFAULT_PERIOD_DAYS`` days
+        ending today in the business timezone.
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period
+
+        Returns:
+            Tuple of (start_date, end_date)
+
+        Raises:
+            DateError: If start_date is after end_date
+        """
+        end_date = end_date or datetime.now(MOSCOW_TZ).date()
+        start_date = start_date or end_date - timedelta(
+            days=settings.REPORTS_DEFAULT_PERIOD_DAYS - 1
+        )
+        if start_date > end_date:
+            raise DateError(
+                DateErrorMessages.INVALID_DATES,
+                details={
+                    'start_date': start_date.isoformat(),
+                    'end_date': end_date.isoformat(),
+                },
+            )
+        return start_date, end_date
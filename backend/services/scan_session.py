@@ -3,10 +3,24 @@
 This module provides service for managing scan sessions.
 """
 
-from typing import List, Optional
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
+from backend.core.cache import cache_get, cache_set, make_cache_key
+from backend.core.config import settings
 from backend.models import ScanSession
 from backend.repositories import ScanSessionRepository
+from backend.schemas.scan_session import (
+    StockTakeItem,
+    StockTakeReport,
+    StockTakeResult,
+    StockTakeSummary,
+)
+
+# Extra lifetime of cached item chunks over the index pointing to them
+STOCK_TAKE_CHUNK_TTL_MARGIN = 60
 
 
 class ScanSessionService:
@@ -119,3 +133,290 @@ class ScanSessionService:
             Number of deleted sessions
         """
         return await self.repository.clean_expired()
+
+    async def get_stock_take(
+        self,
+        session_id: int,
+        category_id: Optional[int] = None,
+        refresh: bool = False,
+    ) -> Optional[StockTakeReport]:
+        """Reconcile a scan session and load the whole report into memory.
+
+        Use ``stream_stock_take`` for large warehouses.
+
+        Args:
+            session_id: Scan session ID
+            category_id: Optional category to limit the audit to its subtree
+            refresh: Recompute the report even if a cached copy exists
+
+        Returns:
+            Stock-take report if the session exists, None otherwise
+        """
+        stock_take = await self.stream_stock_take(session_id, category_id, refresh)
+        if stock_take is None:
+            return None
+        summary, items = stock_take
+        return StockTakeReport(summary=summary, items=[item async for item in items])
+
+    async def get_stock_take_summary(
+        self,
+        session_id: int,
+        category_id: Optional[int] = None,
+        refresh: bool = False,
+    ) -> Optional[StockTakeSummary]:
+        """Reconcile a scan session and return the counters only.
+
+        The counters are computed by an aggregate query without loading the
+        items and cached per session revision. Booking and equipment status
+        changes do not invalidate the cache, so BOOKED, RENTED and MISSING
+        classifications may be up to ``STOCK_TAKE_CACHE_TTL`` old; pass
+        ``refresh`` to reconcile against the current state.
+
+        Args:
+            session_id: Scan session ID
+            category_id: Optional category to limit the audit to its subtree
+            refresh: Recompute the counters even if a cached copy exists
+
+        Returns:
+            Stock-take summary if the session exists, None otherwise
+        """
+        session = await self.repository.get(session_id)
+        if not session:
+            return None
+
+        cache_key = self._stock_take_cache_key(session, category_id)
+        if not refresh:
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                return StockTakeSummary.model_validate_json(cached)
+
+        summary = await self._count_stock_take(session, category_id)
+        await cache_set(
+            cache_key, summary.model_dump_json(), settings.STOCK_TAKE_CACHE_TTL
+        )
+        return summary
+
+    async def stream_stock_take(
+        self,
+        session_id: int,
+        category_id: Optional[int] = None,
+        refresh: bool = False,
+    ) -> Optional[Tuple[StockTakeSummary, AsyncIterator[StockTakeItem]]]:
+        """Reconcile a scan session and stream its items.
+
+        The counters are computed first by an aggregate query, then the items
+        are streamed from a server-side cursor and cached in chunks of
+        ``EXPORT_BATCH_SIZE`` items while they are consumed. A fully consumed
+        report is served from the cached chunks until the session changes,
+        so re-opening a large audit does not recompute it. Memory use does
+        not depend on the size of the warehouse either way. As with the
+        summary, bookings and equipment status changes are only picked up
+        once the cached report expires or ``refresh`` is passed.
+
+        Args:
+            session_id: Scan session ID
+            category_id: Optional category to limit the audit to its subtree
+            refresh: Recompute the report even if a cached copy exists
+
+        Returns:
+            Tuple of (summary, item iterator) if the session exists, None
+            otherwise
+        """
+        session = await self.repository.get(session_id)
+        if not session:
+            return None
+
+        cache_key = self._stock_take_cache_key(session, category_id)
+        if not refresh:
+            cached = await cache_get(f'{cache_key}:items')
+            if cached is not None:
+                index = json.loads(cached)
+                summary = StockTakeSummary.model_validate(index['summary'])
+                return summary, self._cached_stock_take_items(
+                    cache_key, summary, index['chunks']
+                )
+
+        summary = await self._count_stock_take(session, category_id)
+        await cache_set(
+            cache_key, summary.model_dump_json(), settings.STOCK_TAKE_CACHE_TTL
+        )
+        return summary, self._stream_stock_take_items(session, summary, cache_key)
+
+    @staticmethod
+    def _stock_take_cache_key(session: ScanSession, category_id: Optional[int]) -> str:
+        """Get the cache key of a stock-take of a scan session revision.
+
+        The revision is the full-precision ``updated_at``, as scans often
+        change a session several times within a second.
+
+        Args:
+            session: Scan session
+            category_id: Optional category the audit is limited to
+
+        Returns:
+            str: Cache key of the summary, the base of the item keys
+        """
+        return make_cache_key(
+            'stock_take',
+            session.id,
+            session.updated_at.isoformat(),
+            category_id if category_id is not None else 'all',
+        )
+
+    @staticmethod
+    def _chunk_cache_key(cache_key: str, summary: StockTakeSummary, chunk: int) -> str:
+        """Get the cache key of a chunk of stock-take items.
+
+        Chunks of every computation have their own keys, so a recomputed
+        report never mixes with chunks of the previous one.
+
+        Args:
+            cache_key: Cache key of the stock-take
+            summary: Summary of the computation the chunk belongs to
+            chunk: Chunk number
+
+        Returns:
+            str: Cache key
+        """
+        return f'{cache_key}:items:{summary.generated_at.isoformat()}:{chunk}'
+
+    async def _count_stock_take(
+        self, session: ScanSession, category_id: Optional[int]
+    ) -> StockTakeSummary:
+        """Compute the stock-take counters of a scan session.
+
+        Args:
+            session: Scan session
+            category_id: Optional category to limit the audit to its subtree
+
+        Returns:
+            Stock-take summary
+        """
+        scan_counts, _ = self._scanned_equipment(session)
+        now = datetime.now(timezone.utc)
+        counts = await self.repository.count_stock_take_results(
+            list(scan_counts), now, category_id
+        )
+        return StockTakeSummary(
+            session_id=session.id,
+            category_id=category_id,
+            generated_at=now,
+            scanned=len(scan_counts),
+            **{
+                result.value.lower(): counts.get(result.value, 0)
+                for result in StockTakeResult
+            },
+        )
+
+    async def _stream_stock_take_items(
+        self, session: ScanSession, summary: StockTakeSummary, cache_key: str
+    ) -> AsyncIterator[StockTakeItem]:
+        """Stream stock-take items from the database and cache them in chunks.
+
+        The chunk index is stored only once all items were produced, so an
+        interrupted stream leaves no partial report behind. Chunks outlive
+        the index, which therefore never points to expired chunks.
+
+        Args:
+            session: Scan session
+            summary: Summary computed for the same reference time
+            cache_key: Cache key of the stock-take
+
+        Yields:
+            StockTakeItem: Reconciled items
+        """
+        scan_counts, scanned_barcodes = self._scanned_equipment(session)
+        chunk_ttl = settings.STOCK_TAKE_CACHE_TTL + STOCK_TAKE_CHUNK_TTL_MARGIN
+        chunk: List[str] = []
+        chunks = 0
+        async for row in self.repository.stream_stock_take_rows(
+            list(scan_counts),
+            summary.generated_at,
+            summary.category_id,
+            settings.EXPORT_BATCH_SIZE,
+        ):
+            item = StockTakeItem(
+                equipment_id=row.equipment_id,
+                result=StockTakeResult(row.result),
+                barcode=row.barcode or scanned_barcodes.get(row.equipment_id),
+                name=row.name,
+                serial_number=row.serial_number,
+                status=row.status,
+                category_id=row.category_id,
+                category_name=row.category_name,
+                booking_id=row.booking_id,
+                scan_count=scan_counts.get(row.equipment_id, 0),
+            )
+            chunk.append(item.model_dump_json())
+            if len(chunk) == settings.EXPORT_BATCH_SIZE:
+                await cache_set(
+                    self._chunk_cache_key(cache_key, summary, chunks),
+                    '\n'.join(chunk),
+                    chunk_ttl,
+                )
+                chunks += 1
+                chunk = []
+            yield item
+
+        if chunk:
+            await cache_set(
+                self._chunk_cache_key(cache_key, summary, chunks),
+                '\n'.join(chunk),
+                chunk_ttl,
+            )
+            chunks += 1
+        await cache_set(
+            f'{cache_key}:items',
+            json.dumps({'summary': summary.model_dump(mode='json'), 'chunks': chunks}),
+            settings.STOCK_TAKE_CACHE_TTL,
+        )
+
+    async def _cached_stock_take_items(
+        self, cache_key: str, summary: StockTakeSummary, chunks: int
+    ) -> AsyncIterator[StockTakeItem]:
+        """Read cached stock-take items chunk by chunk.
+
+        Args:
+            cache_key: Cache key of the stock-take
+            summary: Cached summary of the report
+            chunks: Number of cached chunks
+
+        Yields:
+            StockTakeItem: Reconciled items
+
+        Raises:
+            RuntimeError: If a chunk was evicted from the cache
+        """
+        for number in range(chunks):
+            chunk = await cache_get(self._chunk_cache_key(cache_key, summary, number))
+            if chunk is None:
+                raise RuntimeError(
+                    f'Stock-take chunk {number} of session {summary.session_id} '
+                    'is no longer cached'
+                )
+            for line in chunk.split('\n'):
+                yield StockTakeItem.model_validate_json(line)
+
+    @staticmethod
+    def _scanned_equipment(
+        session: ScanSession,
+    ) -> Tuple[Counter[int], Dict[int, str]]:
+        """Count scans per equipment item of a scan session.
+
+        Args:
+            session: Scan session
+
+        Returns:
+            Tuple of (scans by equipment ID, first scanned barcode by
+            equipment ID)
+        """
+        scan_counts: Counter[int] = Counter()
+        scanned_barcodes: Dict[int, str] = {}
+        for item in session.items or []:
+            equipment_id = item.get('equipment_id')
+            if equipment_id is None:
+                continue
+            scan_counts[int(equipment_id)] += 1
+            if item.get('barcode'):
+                scanned_barcodes.setdefault(int(equipment_id), item['barcode'])
+        return scan_counts, scanned_barcodes
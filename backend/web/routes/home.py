@@ -10,8 +10,7 @@ from starlette.templating import _TemplateResponse
 
 from backend.core.database import get_db
 from backend.core.templates import templates
-from backend.services import EquipmentService
-from backend.web.routes.utils import prepare_model_list_for_template
+from backend.services import DashboardService
 
 router = APIRouter()
 
@@ -23,6 +22,9 @@ async def index(
 ) -> _TemplateResponse:
     """Render index page.
 
+    Only aggregated counters are rendered server-side; item lists are
+    loaded by the page through the paginated API.
+
     Args:
         request: FastAPI request
         db: Database session
@@ -30,13 +32,12 @@ async def index(
     Returns:
         _TemplateResponse: Rendered template
     """
-    equipment_service = EquipmentService(db)
-    equipment_list = await equipment_service.get_all()
+    summary = await DashboardService(db).get_summary()
 
     return templates.TemplateResponse(
         'index.html',
         {
             'request': request,
-            'equipment_list': prepare_model_list_for_template(equipment_list),
+            'summary': summary.model_dump(mode='json'),
         },
     )
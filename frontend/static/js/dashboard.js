@@ -0,0 +1,132 @@
+/**
+ * Home dashboard module
+ * Counters are rendered by the server; lists are loaded page by page
+ * through the paginated API so the page weight does not grow with the catalog.
+ */
+
+import { api } from './utils/api.js';
+import { formatDate } from './utils/common.js';
+
+const RECENT_BOOKINGS_SIZE = 5;
+const EQUIPMENT_PAGE_SIZE = 20;
+
+const BOOKING_STATUS_COLORS = {
+    PENDING: 'warning',
+    CONFIRMED: 'info',
+    ACTIVE: 'success',
+    COMPLETED: 'secondary',
+    CANCELLED: 'danger',
+    OVERDUE: 'danger'
+};
+
+const EQUIPMENT_STATUS_COLORS = {
+    AVAILABLE: 'success',
+    RENTED: 'warning',
+    MAINTENANCE: 'danger',
+    BROKEN: 'danger',
+    RETIRED: 'secondary'
+};
+
+let equipmentPage = 0;
+let equipmentPages = null;
+let equipmentLoading = false;
+
+/**
+ * Escape text for safe insertion into HTML
+ * @param {string} value - Raw text
+ * @returns {string} - Escaped text
+ */
+function escapeHtml(value) {
+    const div = document.createElement('div');
+    div.textContent = value ?? '';
+    return div.innerHTML;
+}
+
+/**
+ * Load the most recent bookings (first page only)
+ */
+async function loadRecentBookings() {
+    const container = document.getElementById('recentBookings');
+    try {
+        const page = await api.get('/bookings/', { page: 1, size: RECENT_BOOKINGS_SIZE });
+
+        if (page.items.length === 0) {
+            container.innerHTML = '<div class="text-center py-3">Нет бронирований</div>';
+            return;
+        }
+
+        container.innerHTML = page.items.map(booking => `
+            <div class="list-group-item">
+                <div class="d-flex w-100 justify-content-between">
+                    <h6 class="mb-1">${escapeHtml(booking.client_name)}</h6>
+                    <small class="text-muted">${formatDate(booking.start_date)}</small>
+                </div>
+                <p class="mb-1">${escapeHtml(booking.equipment_name)}</p>
+                <small class="text-${BOOKING_STATUS_COLORS[booking.booking_status] || 'secondary'}">${booking.booking_status}</small>
+            </div>
+        `).join('');
+    } catch (error) {
+        console.error('Error loading recent bookings:', error);
+        container.innerHTML = `
+            <div class="alert alert-danger">
+                Ошибка загрузки бронирований
+            </div>
+        `;
+    }
+}
+
+/**
+ * Load the next page of equipment and append it to the list
+ */
+async function loadMoreEquipment() {
+    if (equipmentLoading || (equipmentPages !== null && equipmentPage >= equipmentPages)) {
+        return;
+    }
+
+    const list = document.getElementById('equipmentList');
+    const loader = document.getElementById('equipmentListLoader');
+    const button = document.getElementById('loadMoreEquipment');
+
+    equipmentLoading = true;
+    loader.classList.remove('d-none');
+    button.disabled = true;
+
+    try {
+        const page = await api.get('/equipment/paginated', {
+            page: equipmentPage + 1,
+            size: EQUIPMENT_PAGE_SIZE
+        });
+        equipmentPage = page.page;
+        equipmentPages = page.pages;
+
+        list.insertAdjacentHTML('beforeend', page.items.map(item => `
+            <a href="/equipment/${item.id}" class="list-group-item list-group-item-action d-flex justify-content-between align-items-center">
+                <div>
+                    <div class="fw-bold">${escapeHtml(item.name)}</div>
+                    <small class="text-muted">${escapeHtml(item.category_name)}</small>
+                </div>
+                <span class="badge bg-${EQUIPMENT_STATUS_COLORS[item.status] || 'primary'}">${item.status}</span>
+            </a>
+        `).join(''));
+
+        const hasMore = equipmentPage < equipmentPages;
+        button.textContent = 'Показать ещё';
+        button.classList.toggle('d-none', !hasMore);
+    } catch (error) {
+        console.error('Error loading equipment:', error);
+        list.insertAdjacentHTML('beforeend', `
+            <div class="alert alert-danger">
+                Ошибка загрузки оборудования
+            </div>
+        `);
+    } finally {
+        equipmentLoading = false;
+        loader.classList.add('d-none');
+        button.disabled = false;
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    loadRecentBookings();
+    document.getElementById('loadMoreEquipment').addEventListener('click', loadMoreEquipment);
+});
@@ -0,0 +1,65 @@
+"""Add booking_daily_stats summary table for reports
+
+Revision ID: d62672d3777a
+Revises: fa64e7c900f3
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd62672d3777a'
+down_revision: Union[str, None] = 'fa64e7c900f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'booking_daily_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('equipment_id', sa.Integer(), nullable=False),
+        sa.Column('client_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column(
+            'refreshed_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['equipment_id'], ['equipment.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('booking_id', 'day', name='uq_booking_daily_stats_day'),
+    )
+    op.create_index(op.f('ix_booking_daily_stats_day'), 'booking_daily_stats', ['day'])
+    op.create_index(
+        op.f('ix_booking_daily_stats_equipment_id'),
+        'booking_daily_stats',
+        ['equipment_id'],
+    )
+    op.create_index(
+        op.f('ix_booking_daily_stats_client_id'),
+        'booking_daily_stats',
+        ['client_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_booking_daily_stats_client_id'), table_name='booking_daily_stats'
+    )
+    op.drop_index(
+        op.f('ix_booking_daily_stats_equipment_id'), table_name='booking_daily_stats'
+    )
+    op.drop_index(op.f('ix_booking_daily_stats_day'), table_name='booking_daily_stats')
+    op.drop_table('booking_daily_stats')
@@ -0,0 +1,74 @@
+"""Add composite and partial indexes for hot booking and equipment queries
+
+Revision ID: 4b7e2c91a0d5
+Revises: d62672d3777a
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2c91a0d5'
+down_revision: Union[str, None] = 'd62672d3777a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('deleted_at IS NULL')
+
+# Index name, table, columns and partial index predicate
+INDEXES = (
+    (
+        'ix_bookings_equipment_status_period',
+        'bookings',
+        ['equipment_id', 'booking_status', 'start_date', 'end_date'],
+        LIVE_ROWS,
+    ),
+    (
+        'ix_bookings_client_id_created_at',
+        'bookings',
+        ['client_id', 'created_at'],
+        None,
+    ),
+    (
+        'ix_equipment_category_id_name',
+        'equipment',
+        ['category_id', 'name'],
+        LIVE_ROWS,
+    ),
+    (
+        'ix_scan_sessions_expires_at',
+        'scan_sessions',
+        ['expires_at'],
+        LIVE_ROWS,
+    ),
+)
+
+
+def upgrade() -> None:
+    # Build indexes without blocking writes to the tables
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
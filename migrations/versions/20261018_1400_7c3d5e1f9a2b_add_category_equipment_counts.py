@@ -0,0 +1,220 @@
+"""Add category_equipment_counts rollup maintained by triggers
+
+Revision ID: 7c3d5e1f9a2b
+Revises: 4b7e2c91a0d5
+Create Date: 2026-10-18 14:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3d5e1f9a2b'
+down_revision: Union[str, None] = '4b7e2c91a0d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ADD_FUNCTION = '''
+CREATE OR REPLACE FUNCTION category_equipment_counts_add(
+    category_ids integer[], statuses equipmentstatus[], deltas integer[]
+) RETURNS void LANGUAGE sql AS $$
+    WITH RECURSIVE delta AS (
+        SELECT category_id, status, sum(n) AS n
+        FROM unnest(category_ids, statuses, deltas) AS d (category_id, status, n)
+        GROUP BY category_id, status
+        HAVING sum(n) <> 0
+    ),
+    ancestors (category_id, ancestor_id) AS (
+        SELECT DISTINCT category_id, category_id FROM delta
+        UNION
+        SELECT ancestors.category_id, categories.parent_id
+        FROM ancestors
+        JOIN categories ON categories.id = ancestors.ancestor_id
+        WHERE categories.parent_id IS NOT NULL
+    )
+    INSERT INTO category_equipment_counts AS counts
+        (category_id, status, direct_count, subtree_count)
+    SELECT
+        ancestors.ancestor_id,
+        delta.status,
+        coalesce(sum(delta.n) FILTER (
+            WHERE ancestors.ancestor_id = delta.category_id
+        ), 0),
+        sum(delta.n)
+    FROM delta
+    JOIN ancestors ON ancestors.category_id = delta.category_id
+    GROUP BY ancestors.ancestor_id, delta.status
+    ORDER BY ancestors.ancestor_id, delta.status
+    ON CONFLICT (category_id, status) DO UPDATE SET
+        direct_count = counts.direct_count + excluded.direct_count,
+        subtree_count = counts.subtree_count + excluded.subtree_count
+$$
+'''
+
+EQUIPMENT_TRIGGER_FUNCTION = '''
+CREATE OR REPLACE FUNCTION category_equipment_counts_on_equipment()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM category_equipment_counts;
+    ELSIF TG_OP = 'INSERT' THEN
+        PERFORM category_equipment_counts_add(
+            array_agg(category_id), array_agg(status), array_agg(1)
+        )
+        FROM new_rows
+        WHERE deleted_at IS NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM category_equipment_counts_add(
+            array_agg(category_id), array_agg(status), array_agg(-1)
+        )
+        FROM old_rows
+        WHERE deleted_at IS NULL;
+    ELSE
+        PERFORM category_equipment_counts_add(
+            array_agg(category_id), array_agg(status), array_agg(n)
+        )
+        FROM (
+            SELECT category_id, status, 1 AS n
+            FROM new_rows
+            WHERE deleted_at IS NULL
+            UNION ALL
+            SELECT category_id, status, -1 AS n
+            FROM old_rows
+            WHERE deleted_at IS NULL
+        ) AS changes;
+    END IF;
+    RETURN NULL;
+END
+$$
+'''
+
+CATEGORY_MOVE_TRIGGER_FUNCTION = '''
+CREATE OR REPLACE FUNCTION category_equipment_counts_on_category_move()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    WITH RECURSIVE chain (id, sign) AS (
+        SELECT OLD.parent_id, -1 WHERE OLD.parent_id IS NOT NULL
+        UNION ALL
+        SELECT NEW.parent_id, 1 WHERE NEW.parent_id IS NOT NULL
+        UNION
+        SELECT categories.parent_id, chain.sign
+        FROM chain
+        JOIN categories ON categories.id = chain.id
+        WHERE categories.parent_id IS NOT NULL
+    )
+    INSERT INTO category_equipment_counts AS counts
+        (category_id, status, direct_count, subtree_count)
+    SELECT chain.id, moved.status, 0, sum(chain.sign * moved.subtree_count)
+    FROM chain
+    CROSS JOIN category_equipment_counts AS moved
+    WHERE moved.category_id = NEW.id AND moved.subtree_count <> 0
+    GROUP BY chain.id, moved.status
+    HAVING sum(chain.sign * moved.subtree_count) <> 0
+    ORDER BY chain.id, moved.status
+    ON CONFLICT (category_id, status) DO UPDATE SET
+        subtree_count = counts.subtree_count + excluded.subtree_count;
+    RETURN NULL;
+END
+$$
+'''
+
+TRIGGERS = (
+    'CREATE TRIGGER equipment_counts_insert AFTER INSERT ON equipment '
+    'REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER equipment_counts_update AFTER UPDATE ON equipment '
+    'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER equipment_counts_delete AFTER DELETE ON equipment '
+    'REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER equipment_counts_truncate AFTER TRUNCATE ON equipment '
+    'FOR EACH STATEMENT '
+    'EXECUTE FUNCTION category_equipment_counts_on_equipment()',
+    'CREATE TRIGGER categories_equipment_counts_move '
+    'AFTER UPDATE OF parent_id ON categories FOR EACH ROW '
+    'WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id) '
+    'EXECUTE FUNCTION category_equipment_counts_on_category_move()',
+)
+
+# Counts of live equipment per category and status, with subtree totals
+BACKFILL = '''
+WITH RECURSIVE ancestors (category_id, ancestor_id) AS (
+    SELECT id, id FROM categories
+    UNION
+    SELECT ancestors.category_id, categories.parent_id
+    FROM ancestors
+    JOIN categories ON categories.id = ancestors.ancestor_id
+    WHERE categories.parent_id IS NOT NULL
+),
+direct AS (
+    SELECT category_id, status, count(*) AS n
+    FROM equipment
+    WHERE deleted_at IS NULL
+    GROUP BY category_id, status
+)
+INSERT INTO category_equipment_counts
+    (category_id, status, direct_count, subtree_count)
+SELECT
+    ancestors.ancestor_id,
+    direct.status,
+    coalesce(sum(direct.n) FILTER (
+        WHERE ancestors.ancestor_id = direct.category_id
+    ), 0),
+    sum(direct.n)
+FROM direct
+JOIN ancestors ON ancestors.category_id = direct.category_id
+GROUP BY ancestors.ancestor_id, direct.status
+'''
+
+
+def upgrade() -> None:
+    op.create_table(
+        'category_equipment_counts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM(name='equipmentstatus', create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            'direct_count', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+        sa.Column(
+            'subtree_count', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'category_id', 'status', name='uq_category_equipment_counts_status'
+        ),
+    )
+
+    # Block equipment and category writes until the triggers are in place,
+    # so no change is missed between the backfill and the first trigger run
+    op.execute('LOCK TABLE equipment, categories IN SHARE ROW EXCLUSIVE MODE')
+    op.execute(BACKFILL)
+    op.execute(ADD_FUNCTION)
+    op.execute(EQUIPMENT_TRIGGER_FUNCTION)
+    op.execute(CATEGORY_MOVE_TRIGGER_FUNCTION)
+    for trigger in TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS categories_equipment_counts_move ON categories')
+    for trigger in ('truncate', 'delete', 'update', 'insert'):
+        op.execute(f'DROP TRIGGER IF EXISTS equipment_counts_{trigger} ON equipment')
+    op.execute('DROP FUNCTION IF EXISTS category_equipment_counts_on_category_move()')
+    op.execute('DROP FUNCTION IF EXISTS category_equipment_counts_on_equipment()')
+    op.execute(
+        'DROP FUNCTION IF EXISTS '
+        'category_equipment_counts_add(integer[], equipmentstatus[], integer[])'
+    )
+    op.drop_table('category_equipment_counts')
@@ -32,8 +32,9 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import text
 
-from backend.core.database import get_db
+from backend.core.database import get_db, get_read_db
 from backend.core.logging import configure_logging
+from backend.core.query_counter import install_query_counter
 from backend.main import app as main_app
 from backend.models import (
     Booking,
@@ -69,6 +70,7 @@ from backend.services import (
     EquipmentService,
     ScanSessionService,
 )
+from backend.services.category import invalidate_category_tree
 from backend.services.project import ProjectService
 from tests.factories.project import ProjectFactory
 
@@ -96,6 +98,8 @@ def configure_test_logging():
 configure_test_logging()
 
 
+pytest_plugins = ['tests.plugins.query_counter']
+
 P = ParamSpec('P')
 T = TypeVar('T')
 R = TypeVar('R')
@@ -239,6 +243,7 @@ async def engine(create_test_database) -> AsyncGenerator[AsyncEngine, None]:
         future=True,
         poolclass=NullPool,
     )
+    install_query_counter(engine)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -350,6 +355,7 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
         yield db_session
 
     main_app.dependency_overrides[get_db] = override_get_session
+    main_app.dependency_overrides[get_read_db] = override_get_session
 
     transport = ASGITransport(app=main_app)
     base_url = 'http://test'
@@ -376,6 +382,9 @@ async def cleanup_test_data(engine) -> AsyncGenerator[None, None]:
     """Clean up test data after each test."""
     yield
 
+    # The cached category tree refers to rows removed below
+    invalidate_category_tree()
+
     # Create a new session specifically for cleanup
     session_factory = async_sessionmaker(
         engine, class_=AsyncSession, expire_on_commit=False, autoflush=True
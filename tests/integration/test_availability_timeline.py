@@ -0,0 +1,268 @@
+"""Integration tests for equipment availability timelines."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import (
+    Booking,
+    BookingStatus,
+    Category,
+    Client,
+    Equipment,
+    EquipmentStatus,
+    PaymentStatus,
+)
+from backend.services import availability
+from backend.services.availability import (
+    AvailabilityService,
+    free_intervals,
+    invalidate_timelines,
+)
+
+pytestmark = pytest.mark.asyncio
+
+WINDOW_START = datetime(2030, 3, 1, tzinfo=timezone.utc)
+WINDOW_END = datetime(2030, 3, 31, tzinfo=timezone.utc)
+
+
+def _day(day: int) -> datetime:
+    return WINDOW_START + timedelta(days=day - 1)
+
+
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+async def _add_bookings(
+    db_session: AsyncSession,
+    equipment: Equipment,
+    client: Client,
+    periods: List[Tuple[int, int, BookingStatus]],
+) -> List[Booking]:
+    bookings = [
+        Booking(
+            equipment_id=equipment.id,
+            client_id=client.id,
+            start_date=_day(first),
+            end_date=_day(last),
+            booking_status=booking_status,
+            payment_status=PaymentStatus.PENDING,
+            total_amount=100,
+            deposit_amount=0,
+        )
+        for first, last, booking_status in periods
+    ]
+    db_session.add_all(bookings)
+    await db_session.commit()
+    return bookings
+
+
+class _MemoryCache:
+    """In-memory replacement of the cache functions used for timelines."""
+
+    def __init__(self) -> None:
+        self.values: Dict[str, Any] = {}
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return [self.values.get(key) for key in keys]
+
+    async def incr_many(self, keys: Sequence[str]) -> List[int]:
+        for key in keys:
+            self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return [int(self.values[key]) for key in keys]
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def hget_many(self, keys: Sequence[str], field: str) -> List[Optional[str]]:
+        return [self.values.get(key, {}).get(field) for key in keys]
+
+    async def hset_many(self, values: Dict[str, str], field: str, ttl: int) -> None:
+        for key, value in values.items():
+            self.values.setdefault(key, {})[field] = value
+
+
+@pytest.fixture
+def memory_cache(monkeypatch: pytest.MonkeyPatch) -> _MemoryCache:
+    """Back the timeline cache with a dictionary."""
+    cache = _MemoryCache()
+    monkeypatch.setattr(availability, 'cache_get_many', cache.get_many)
+    monkeypatch.setattr(availability, 'cache_incr_many', cache.incr_many)
+    monkeypatch.setattr(availability, 'cache_delete', cache.delete)
+    monkeypatch.setattr(availability, 'cache_hget_many', cache.hget_many)
+    monkeypatch.setattr(availability, 'cache_hset_many', cache.hset_many)
+    return cache
+
+
+def test_free_intervals_fill_gaps() -> None:
+    """Test free intervals cover the window outside busy ones."""
+    busy = [
+        {'start': _day(1), 'end': _day(3)},
+        {'start': _day(5), 'end': _day(8)},
+    ]
+
+    assert free_intervals(busy, _day(1), _day(10)) == [
+        {'start': _day(3), 'end': _day(5)},
+        {'start': _day(8), 'end': _day(10)},
+    ]
+    assert free_intervals([], _day(1), _day(2)) == [{'start': _day(1), 'end': _day(2)}]
+
+
+async def test_timeline_merges_and_clips_bookings(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    test_equipment: Equipment,
+    test_client: Client,
+) -> None:
+    """Test overlapping and touching bookings form one busy interval."""
+    bookings = await _add_bookings(
+        db_session,
+        test_equipment,
+        test_client,
+        [
+            (0, 3, BookingStatus.CONFIRMED),
+            (2, 5, BookingStatus.ACTIVE),
+            (5, 7, BookingStatus.CONFIRMED),
+            (10, 12, BookingStatus.CANCELLED),
+            (20, 40, BookingStatus.CONFIRMED),
+        ],
+    )
+
+    response = await async_client.get(
+        f'/api/v1/equipment/{test_equipment.id}/availability/timeline',
+        params={
+            'start_date': WINDOW_START.isoformat(),
+            'end_date': WINDOW_END.isoformat(),
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data['equipment_id'] == test_equipment.id
+    busy = [
+        (_parse(interval['start']), _parse(interval['end']), interval['booking_ids'])
+        for interval in data['busy']
+    ]
+    assert busy == [
+        (WINDOW_START, _day(7), [bookings[0].id, bookings[1].id, bookings[2].id]),
+        (_day(20), WINDOW_END, [bookings[4].id]),
+    ]
+    free = [
+        (_parse(interval['start']), _parse(interval['end']))
+        for interval in data['free']
+    ]
+    assert free == [(_day(7), _day(20))]
+
+
+async def test_timelines_of_several_equipment(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    test_category: Category,
+    test_equipment: Equipment,
+    test_client: Client,
+) -> None:
+    """Test one request returns timelines in the requested order."""
+    other = Equipment(
+        name='Other Equipment',
+        category_id=test_category.id,
+        barcode='00000000101',
+        replacement_cost=100,
+        status=EquipmentStatus.AVAILABLE,
+    )
+    db_session.add(other)
+    await db_session.commit()
+    await _add_bookings(
+        db_session, other, test_client, [(3, 4, BookingStatus.CONFIRMED)]
+    )
+
+    response = await async_client.get(
+        '/api/v1/equipment/availability/timeline',
+        params={
+            'equipment_ids': [other.id, test_equipment.id],
+            'start_date': WINDOW_START.isoformat(),
+            'end_date': WINDOW_END.isoformat(),
+        },
+    )
+
+    assert response.status_code == 200
+    timelines = response.json()
+    assert [timeline['equipment_id'] for timeline in timelines] == [
+        other.id,
+        test_equipment.id,
+    ]
+    assert len(timelines[0]['busy']) == 1
+    assert len(timelines[0]['free']) == 2
+    assert timelines[1]['busy'] == []
+    assert len(timelines[1]['free']) == 1
+
+
+async def test_timeline_validation(
+    async_client: AsyncClient, test_equipment: Equipment
+) -> None:
+    """Test empty windows and unknown equipment are rejected."""
+    response = await async_client.get(
+        f'/api/v1/equipment/{test_equipment.id}/availability/timeline',
+        params={
+            'start_date': WINDOW_END.isoformat(),
+            'end_date': WINDOW_START.isoformat(),
+        },
+    )
+    assert response.status_code == 422
+
+    response = await async_client.get(
+        '/api/v1/equipment/availability/timeline',
+        params={
+            'equipment_ids': [test_equipment.id, test_equipment.id + 1000],
+            'start_date': WINDOW_START.isoformat(),
+            'end_date': WINDOW_END.isoformat(),
+        },
+    )
+    assert response.status_code == 404
+
+
+async def test_timeline_cache_drops_timelines_read_before_a_change(
+    monkeypatch: pytest.MonkeyPatch,
+    memory_cache: _MemoryCache,
+    db_session: AsyncSession,
+    test_equipment: Equipment,
+    test_client: Client,
+) -> None:
+    """Test a timeline read before a concurrent booking change is not served."""
+    service = AvailabilityService(db_session)
+    read_busy_intervals = service.booking_repository.get_busy_intervals
+
+    async def read_then_change(*args: Any) -> Any:
+        # A booking is committed and invalidated after the read
+        busy = await read_busy_intervals(*args)
+        await _add_bookings(
+            db_session, test_equipment, test_client, [(3, 4, BookingStatus.CONFIRMED)]
+        )
+        await invalidate_timelines([test_equipment.id])
+        return busy
+
+    repository = service.booking_repository
+    monkeypatch.setattr(repository, 'get_busy_intervals', read_then_change)
+    (stale,) = await service.get_timelines(
+        [test_equipment.id], WINDOW_START, WINDOW_END
+    )
+    assert stale.busy == []
+
+    monkeypatch.setattr(repository, 'get_busy_intervals', read_busy_intervals)
+    (fresh,) = await service.get_timelines(
+        [test_equipment.id], WINDOW_START, WINDOW_END
+    )
+    assert len(fresh.busy) == 1
+
+    async def unexpected_read(*args: Any) -> Any:
+        raise AssertionError('Timeline was not served from the cache')
+
+    monkeypatch.setattr(repository, 'get_busy_intervals', unexpected_read)
+    (cached,) = await service.get_timelines(
+        [test_equipment.id], WINDOW_START, WINDOW_END
+    )
+    assert cached == fresh
@@ -1,8 +1,12 @@
 """Integration tests for barcode API endpoints."""
 
+import io
+
 from httpx import AsyncClient
+from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core import code128
 from tests.conftest import async_test
 
 
@@ -89,3 +93,19 @@ async def test_get_next_sequence_number(
     data = response.json()
     assert 'next_sequence_number' in data
     assert isinstance(data['next_sequence_number'], int)
+
+
+@async_test
+async def test_get_code128_image(
+    async_client: AsyncClient,
+) -> None:
+    """Test Code128 images are rendered without Ghostscript."""
+    response = await async_client.get(
+        '/api/v1/barcodes/00000001234/image', params={'barcode_type': 'code128'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'image/png'
+    image = Image.open(io.BytesIO(response.content))
+    assert image.mode == '1'
+    assert image.size == (2 * (sum(code128.modules('00000001234')) + 20), 80)
@@ -430,3 +430,54 @@ async def test_filter_by_equipment_query(
     pagination_response = response.json()
     bookings = pagination_response['items']
     assert any(b['equipment_id'] == test_equipment.id for b in bookings)
+
+
+@async_test
+async def test_create_bookings_batch_isolates_failures(
+    async_client: AsyncClient, test_client: Any, test_equipment: Any
+) -> None:
+    """Test a failed batch item does not discard the other bookings."""
+    equipment_id = test_equipment.id
+    start_date = datetime.now() + timedelta(days=1)
+    item = {
+        'client_id': test_client.id,
+        'equipment_id': equipment_id,
+        'start_date': start_date.isoformat(),
+        'end_date': (start_date + timedelta(days=3)).isoformat(),
+        'total_amount': 300.00,
+    }
+
+    # The second booking overlaps the first one of the same batch
+    response = await async_client.post('/api/v1/bookings/batch', json=[item, item])
+    assert response.status_code == status.HTTP_201_CREATED
+    result = response.json()
+    assert result['created_count'] == 1
+    assert result['failed_count'] == 1
+    assert result['failed_bookings'][0]['error_type'] == 'AvailabilityError'
+
+    response = await async_client.get(f'/api/v1/bookings/?equipment_id={equipment_id}')
+    assert len(response.json()['items']) == 1
+
+
+@async_test
+async def test_create_bookings_batch_without_successes(
+    async_client: AsyncClient, test_client: Any, test_equipment: Any
+) -> None:
+    """Test a batch without created bookings persists nothing."""
+    equipment_id = test_equipment.id
+    start_date = datetime.now() + timedelta(days=1)
+    data = {
+        'client_id': test_client.id,
+        'equipment_id': equipment_id,
+        'start_date': start_date.isoformat(),
+        'end_date': (start_date + timedelta(days=3)).isoformat(),
+        'total_amount': 300.00,
+    }
+    response = await async_client.post('/api/v1/bookings/', json=data)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.post('/api/v1/bookings/batch', json=[data])
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get(f'/api/v1/bookings/?equipment_id={equipment_id}')
+    assert len(response.json()['items']) == 1
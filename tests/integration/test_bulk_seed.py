@@ -0,0 +1,165 @@
+"""Integration tests for the bulk seed loader."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import Booking, BookingStatus, Category, Equipment, Project
+from backend.scripts.bulk_seed import (
+    bulk_load,
+    generate_synthetic_data,
+    load_order,
+    read_extended_data,
+)
+from backend.services.barcode import BarcodeService
+
+pytestmark = pytest.mark.asyncio
+
+TODAY = date(2024, 6, 1)
+
+
+def test_load_order_follows_foreign_keys() -> None:
+    """Test referenced tables are loaded before referencing ones."""
+    order = load_order(['bookings', 'projects', 'equipment', 'clients', 'categories'])
+
+    assert order.index('categories') < order.index('equipment')
+    assert order.index('clients') < order.index('projects')
+    assert order.index('projects') < order.index('bookings')
+    assert order.index('equipment') < order.index('bookings')
+
+
+async def test_bulk_load_synthetic_data(db_session: AsyncSession) -> None:
+    """Test a synthetic dataset is copied consistently."""
+    data = generate_synthetic_data(500, equipment=20, seed=1, today=TODAY)
+
+    connection = await db_session.connection()
+    counts = await bulk_load(connection, data, truncate=True, batch_size=64)
+    await db_session.commit()
+
+    assert counts['bookings'] == 500
+    assert counts['equipment'] == 20
+    total = await db_session.scalar(select(func.count()).select_from(Booking))
+    assert total == 500
+
+    # Bookings of one equipment item never overlap
+    overlaps = await db_session.scalar(
+        text(
+            'SELECT count(*) FROM bookings a JOIN bookings b '
+            'ON a.equipment_id = b.equipment_id AND a.id < b.id '
+            'AND a.start_date < b.end_date AND b.start_date < a.end_date'
+        )
+    )
+    assert overlaps == 0
+
+    # Synthetic data is reproducible
+    again = list(
+        generate_synthetic_data(500, equipment=20, seed=1, today=TODAY)['bookings']
+    )
+    assert again[0]['booking_status'] == BookingStatus.COMPLETED
+    assert len(again) == 500
+
+
+async def test_bulk_load_resets_sequences(db_session: AsyncSession) -> None:
+    """Test new rows get IDs and barcodes after the loaded ones."""
+    data = generate_synthetic_data(50, equipment=10, seed=2, today=TODAY)
+
+    connection = await db_session.connection()
+    counts = await bulk_load(connection, data, truncate=True)
+    await db_session.commit()
+
+    category = Category(name='After bulk load')
+    db_session.add(category)
+    await db_session.commit()
+    assert category.id == counts['categories'] + 1
+
+    service = BarcodeService(db_session)
+    barcode = await service.generate_barcode()
+    assert await service.parse_barcode(barcode) > counts['equipment']
+
+
+async def test_bulk_load_rejects_non_empty_tables(
+    db_session: AsyncSession, test_category: Category
+) -> None:
+    """Test loading into a non-empty table fails without truncate."""
+    connection = await db_session.connection()
+
+    with pytest.raises(ValueError, match='categories'):
+        await bulk_load(connection, {'categories': [{'id': 1, 'name': 'Dup'}]})
+
+
+async def test_bulk_load_extended_ndjson(
+    db_session: AsyncSession, tmp_path: Path
+) -> None:
+    """Test NDJSON extracts are loaded with their IDs and JSON values."""
+    rows = {
+        'categories': [
+            {'id': 7, 'name': 'Root', 'description': None, 'parent_id': None},
+            {'id': 9, 'name': 'Child', 'description': 'c', 'parent_id': 7},
+        ],
+        'clients': [
+            {'id': 3, 'name': 'Client', 'email': 'c@example.com', 'status': 'ACTIVE'}
+        ],
+        'projects': [
+            {
+                'id': 5,
+                'name': 'Project',
+                'client_id': 3,
+                'start_date': '2024-01-01T10:00:00+03:00',
+                'end_date': '2024-01-05T18:00:00+03:00',
+                'status': 'ACTIVE',
+            }
+        ],
+        'equipment': [
+            {
+                'id': 11,
+                'name': 'Camera',
+                'barcode': '00000004211',
+                'category_id': 9,
+                'status': 'AVAILABLE',
+                'replacement_cost': 1000,
+            }
+        ],
+        'bookings': [
+            {
+                'id': 13,
+                'client_id': 3,
+                'equipment_id': 11,
+                'project_id': 5,
+                'booking_status': 'CONFIRMED',
+                'payment_status': 'PENDING',
+                'start_date': '2024-01-02T10:00:00+03:00',
+                'end_date': '2024-01-03T18:00:00+03:00',
+                'total_amount': 150.5,
+                'deposit_amount': 0.0,
+            }
+        ],
+    }
+    for name, table_rows in rows.items():
+        (tmp_path / f'{name}.ndjson').write_text(
+            ''.join(json.dumps(row) + '\n' for row in table_rows), encoding='utf-8'
+        )
+    (tmp_path / 'manifest.json').write_text(
+        json.dumps({'files': {name: f'{name}.ndjson' for name in rows}}),
+        encoding='utf-8',
+    )
+
+    connection = await db_session.connection()
+    await bulk_load(connection, read_extended_data(tmp_path), truncate=True)
+    await db_session.commit()
+
+    booking = await db_session.get(Booking, 13)
+    assert booking is not None
+    assert booking.quantity == 1
+    assert str(booking.total_amount) == '150.50'
+    assert booking.project_id == 5
+    project = await db_session.get(Project, 5)
+    assert project is not None and project.end_date.day == 5
+    equipment = await db_session.get(Equipment, 11)
+    assert equipment is not None and equipment.category_id == 9
+    service = BarcodeService(db_session)
+    next_barcode = await service.generate_barcode()
+    assert await service.parse_barcode(next_barcode) > 42
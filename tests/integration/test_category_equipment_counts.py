@@ -0,0 +1,151 @@
+"""Integration tests for the category equipment count rollup."""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import (
+    Category,
+    CategoryEquipmentCount,
+    Equipment,
+    EquipmentStatus,
+)
+from backend.repositories import CategoryRepository
+
+pytestmark = pytest.mark.asyncio
+
+Rollup = Dict[Tuple[int, str], Tuple[int, int]]
+
+
+async def _rollup(session: AsyncSession) -> Rollup:
+    """Read non-zero rollup rows as (direct, subtree) by category and status."""
+    result = await session.execute(
+        select(CategoryEquipmentCount).where(CategoryEquipmentCount.subtree_count != 0)
+    )
+    return {
+        (row.category_id, row.status.value): (row.direct_count, row.subtree_count)
+        for row in result.scalars()
+    }
+
+
+async def _tree(session: AsyncSession) -> List[Category]:
+    """Create categories root > child > leaf and a separate root."""
+    root = Category(name='Camera')
+    other = Category(name='Light')
+    session.add_all([root, other])
+    await session.flush()
+    child = Category(name='Cinema cameras', parent_id=root.id)
+    session.add(child)
+    await session.flush()
+    leaf = Category(name='Full frame', parent_id=child.id)
+    session.add(leaf)
+    await session.commit()
+    return [root, child, leaf, other]
+
+
+def _equipment(number: int, category: Category) -> Equipment:
+    return Equipment(
+        name=f'Item {number}',
+        barcode=f'ROLLUP{number:05d}',
+        category_id=category.id,
+        replacement_cost=1000,
+    )
+
+
+async def test_counts_follow_equipment_writes(db_session: AsyncSession) -> None:
+    """Test that creates, status changes, moves and deletes update the rollup."""
+    root, child, leaf, other = await _tree(db_session)
+    items = [_equipment(n, leaf) for n in range(3)] + [_equipment(3, child)]
+    db_session.add_all(items)
+    await db_session.commit()
+
+    available = EquipmentStatus.AVAILABLE.value
+    assert await _rollup(db_session) == {
+        (leaf.id, available): (3, 3),
+        (child.id, available): (1, 4),
+        (root.id, available): (0, 4),
+    }
+
+    items[0].status = EquipmentStatus.BROKEN
+    items[1].category_id = other.id
+    items[2].deleted_at = datetime.now(timezone.utc)
+    items[3].name = 'Renamed'
+    await db_session.commit()
+
+    broken = EquipmentStatus.BROKEN.value
+    assert await _rollup(db_session) == {
+        (leaf.id, broken): (1, 1),
+        (child.id, available): (1, 1),
+        (child.id, broken): (0, 1),
+        (root.id, available): (0, 1),
+        (root.id, broken): (0, 1),
+        (other.id, available): (1, 1),
+    }
+
+    await db_session.delete(items[0])
+    await db_session.commit()
+    assert (leaf.id, broken) not in await _rollup(db_session)
+
+
+async def test_counts_follow_bulk_updates_and_category_moves(
+    db_session: AsyncSession,
+) -> None:
+    """Test that set-based updates and category moves update the rollup."""
+    root, child, leaf, other = await _tree(db_session)
+    db_session.add_all([_equipment(n, leaf) for n in range(4)])
+    await db_session.commit()
+
+    await db_session.execute(
+        update(Equipment)
+        .where(Equipment.category_id == leaf.id)
+        .values(status=EquipmentStatus.RENTED)
+    )
+    leaf.parent_id = other.id
+    await db_session.commit()
+
+    rented = EquipmentStatus.RENTED.value
+    assert await _rollup(db_session) == {
+        (leaf.id, rented): (4, 4),
+        (other.id, rented): (0, 4),
+    }
+
+    # A full rebuild gives the same rollup as the incremental updates
+    incremental = await _rollup(db_session)
+    await CategoryRepository(db_session).rebuild_equipment_counts()
+    await db_session.commit()
+    assert await _rollup(db_session) == incremental
+
+
+async def test_categories_with_equipment_count(
+    async_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Test that the endpoint reports subtree, direct and status counts."""
+    root, child, leaf, other = await _tree(db_session)
+    items = [_equipment(n, leaf) for n in range(2)] + [_equipment(2, child)]
+    items[0].status = EquipmentStatus.MAINTENANCE
+    # Soft-deleted equipment is not counted
+    items.append(_equipment(3, child))
+    items[3].deleted_at = datetime.now(timezone.utc)
+    db_session.add_all(items)
+    await db_session.commit()
+
+    response = await async_client.get('/api/v1/categories/with-equipment-count')
+    assert response.status_code == status.HTTP_200_OK
+    data = {category['id']: category for category in response.json()}
+
+    assert data[root.id]['equipment_count'] == 3
+    assert data[root.id]['direct_equipment_count'] == 0
+    assert data[root.id]['equipment_by_status'] == {
+        'AVAILABLE': 2,
+        'MAINTENANCE': 1,
+    }
+    assert data[child.id]['equipment_count'] == 3
+    assert data[child.id]['direct_equipment_count'] == 1
+    assert data[leaf.id]['equipment_count'] == 2
+    assert data[other.id]['equipment_count'] == 0
+    assert data[other.id]['equipment_by_status'] == {}
@@ -0,0 +1,127 @@
+"""Integration tests for dashboard API."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.timezone_utils import MOSCOW_TZ
+from backend.models import (
+    Booking,
+    BookingStatus,
+    Client,
+    Equipment,
+    EquipmentStatus,
+    PaymentStatus,
+)
+from backend.services import DashboardService
+
+pytestmark = pytest.mark.asyncio
+
+
+def _booking(
+    equipment: Equipment,
+    client: Client,
+    start_date: datetime,
+    end_date: datetime,
+    booking_status: BookingStatus,
+) -> Booking:
+    return Booking(
+        equipment_id=equipment.id,
+        client_id=client.id,
+        start_date=start_date,
+        end_date=end_date,
+        booking_status=booking_status,
+        payment_status=PaymentStatus.PENDING,
+        total_amount=100.00,
+        deposit_amount=0.00,
+    )
+
+
+async def test_dashboard_summary_counts(
+    db_session: AsyncSession,
+    test_equipment: Equipment,
+    test_client: Client,
+) -> None:
+    """Test that pickups, returns and overdue bookings are counted for today."""
+    now = datetime.now(MOSCOW_TZ).replace(hour=12, minute=0, second=0, microsecond=0)
+    test_equipment.status = EquipmentStatus.RENTED
+    db_session.add_all(
+        [
+            _booking(
+                test_equipment,
+                test_client,
+                now + timedelta(hours=2),
+                now + timedelta(days=2),
+                BookingStatus.CONFIRMED,
+            ),
+            _booking(
+                test_equipment,
+                test_client,
+                now - timedelta(days=2),
+                now + timedelta(hours=3),
+                BookingStatus.ACTIVE,
+            ),
+            _booking(
+                test_equipment,
+                test_client,
+                now - timedelta(days=5),
+                now - timedelta(days=1),
+                BookingStatus.ACTIVE,
+            ),
+            _booking(
+                test_equipment,
+                test_client,
+                now - timedelta(days=5),
+                now + timedelta(hours=1),
+                BookingStatus.CANCELLED,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    summary = await DashboardService(db_session).get_summary(now=now, refresh=True)
+
+    assert summary.equipment_total == 1
+    assert summary.equipment_by_status == {'RENTED': 1}
+    assert len(summary.equipment_by_category) == 1
+    assert summary.equipment_by_category[0].category_id == test_equipment.category_id
+    assert summary.equipment_by_category[0].count == 1
+    assert summary.bookings_by_status == {
+        'ACTIVE': 2,
+        'CANCELLED': 1,
+        'CONFIRMED': 1,
+    }
+    assert summary.pickups_today == 1
+    assert summary.returns_today == 1
+    assert summary.overdue == 1
+
+
+async def test_get_dashboard_summary(
+    async_client: AsyncClient,
+    test_equipment: Equipment,
+    assert_max_queries,
+) -> None:
+    """Test that the dashboard endpoint uses a fixed number of queries."""
+    with assert_max_queries(4):
+        response = await async_client.get('/api/v1/dashboard', params={'refresh': True})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data['equipment_total'] == 1
+    assert data['equipment_by_status'] == {'AVAILABLE': 1}
+    assert data['pickups_today'] == 0
+
+
+async def test_index_page_renders_summary(
+    async_client: AsyncClient,
+    test_equipment: Equipment,
+) -> None:
+    """Test that the home page renders counters without the equipment list."""
+    response = await async_client.get('/')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'id="categoryCounts"' in response.text
+    assert test_equipment.name not in response.text
@@ -0,0 +1,182 @@
+"""Integration tests for the diagnostics endpoints."""
+
+import asyncio
+from typing import Iterator
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.core import slow_query_log as slow_query_module
+from backend.core.config import settings
+from backend.core.profiler import (
+    DIAGNOSTICS_TOKEN_HEADER,
+    PROFILE_HEADER,
+    PROFILE_ID_HEADER,
+)
+from backend.core.slow_query_log import install_slow_query_log, slow_query_log
+from backend.repositories import ClientRepository
+
+pytestmark = pytest.mark.asyncio
+
+TOKEN = 'diagnostics-secret'
+AUTH = {DIAGNOSTICS_TOKEN_HEADER: TOKEN}
+
+
+@pytest.fixture
+def diagnostics_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable diagnostics with a known token."""
+    monkeypatch.setattr(settings, 'DIAGNOSTICS_TOKEN', TOKEN)
+
+
+@pytest.fixture
+def slow_queries(
+    engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """Log every statement of the test engine as slow."""
+    monkeypatch.setattr(slow_query_log, 'threshold', 0.0)
+    slow_query_log.reset()
+    install_slow_query_log(engine)
+    try:
+        yield
+    finally:
+        for name, listener in (
+            ('before_cursor_execute', slow_query_module._before_cursor_execute),
+            ('after_cursor_execute', slow_query_module._after_cursor_execute),
+        ):
+            event.remove(engine.sync_engine, name, listener)
+        slow_query_log.reset()
+
+
+async def test_diagnostics_hidden_without_token(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test diagnostics are not exposed when no token is configured."""
+    monkeypatch.setattr(settings, 'DIAGNOSTICS_TOKEN', '')
+
+    response = await async_client.get('/api/v1/diagnostics/profiles', headers=AUTH)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client.get(
+        '/api/v1/health', headers={**AUTH, PROFILE_HEADER: '1'}
+    )
+    assert PROFILE_ID_HEADER not in response.headers
+
+
+@pytest.mark.usefixtures('diagnostics_enabled')
+async def test_diagnostics_require_valid_token(async_client: AsyncClient) -> None:
+    """Test a wrong token is rejected and does not trigger profiling."""
+    headers = {DIAGNOSTICS_TOKEN_HEADER: 'wrong'}
+
+    response = await async_client.get('/api/v1/diagnostics/profiles', headers=headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = await async_client.get(
+        '/api/v1/health', headers={**headers, PROFILE_HEADER: '1'}
+    )
+    assert PROFILE_ID_HEADER not in response.headers
+
+
+@pytest.mark.usefixtures('diagnostics_enabled')
+async def test_sample_event_loop(async_client: AsyncClient) -> None:
+    """Test the event loop is sampled into collapsed stacks."""
+    response = await async_client.get(
+        '/api/v1/diagnostics/profile',
+        params={'duration': 0.05, 'interval_ms': 5},
+        headers=AUTH,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith('text/plain')
+    lines = response.text.splitlines()
+    assert lines
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+
+@pytest.mark.usefixtures('diagnostics_enabled')
+async def test_sample_duration_is_limited(async_client: AsyncClient) -> None:
+    """Test sampling time is capped by the configured maximum."""
+    response = await async_client.get(
+        '/api/v1/diagnostics/profile',
+        params={'duration': settings.PROFILE_MAX_SECONDS + 1},
+        headers=AUTH,
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.usefixtures('diagnostics_enabled')
+async def test_request_profile(async_client: AsyncClient) -> None:
+    """Test a request sent with the profile header is profiled and stored."""
+    response = await async_client.get(
+        '/api/v1/health/live', headers={**AUTH, PROFILE_HEADER: '1'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    profile_id = response.headers[PROFILE_ID_HEADER]
+
+    response = await async_client.get('/api/v1/diagnostics/profiles', headers=AUTH)
+    assert response.status_code == status.HTTP_200_OK
+    summary = response.json()[0]
+    assert summary['id'] == profile_id
+    assert summary['method'] == 'GET'
+    assert summary['path'] == '/api/v1/health/live'
+    assert summary['status_code'] == status.HTTP_200_OK
+
+    response = await async_client.get(
+        f'/api/v1/diagnostics/profiles/{profile_id}', headers=AUTH
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert 'cumulative' in response.text
+    assert 'function calls' in response.text
+
+    response = await async_client.get(
+        '/api/v1/diagnostics/profiles/unknown', headers=AUTH
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.usefixtures('diagnostics_enabled', 'slow_queries')
+async def test_slow_query_log(
+    async_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Test slow statements are listed with their source and plan."""
+    await ClientRepository(db_session).get_by_email('nobody@example.com')
+    await asyncio.gather(*slow_query_module._plan_tasks)
+
+    response = await async_client.get(
+        '/api/v1/diagnostics/queries', params={'limit': 50}, headers=AUTH
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    entry = next(
+        item
+        for item in response.json()
+        if item['fingerprint'].startswith('SELECT clients.')
+        and 'WHERE clients.email = ?' in item['fingerprint']
+    )
+    assert entry['count'] == 1
+    assert entry['slow_count'] == 1
+    assert entry['source'] == 'backend.repositories.client:get_by_email'
+    assert 'actual time=' in entry['plan']
+
+    response = await async_client.delete('/api/v1/diagnostics/queries', headers=AUTH)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert slow_query_log.top() == []
+
+
+async def test_plan_capture_times_out(
+    engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a plan capture is cancelled by the statement timeout."""
+    monkeypatch.setattr(settings, 'SLOW_QUERY_EXPLAIN_TIMEOUT_MS', 50)
+    statement = 'SELECT pg_sleep(5)'
+    stats = slow_query_log.record(statement, 5.0)
+    try:
+        await asyncio.wait_for(
+            slow_query_module.capture_plan(engine, stats, statement, ()), timeout=2
+        )
+        assert stats.plan is None
+    finally:
+        slow_query_log.reset()
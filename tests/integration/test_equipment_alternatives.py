@@ -0,0 +1,139 @@
+"""Integration tests for suggested equipment alternatives."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import (
+    Booking,
+    BookingStatus,
+    Category,
+    Client,
+    Equipment,
+    EquipmentStatus,
+    PaymentStatus,
+)
+
+pytestmark = pytest.mark.asyncio
+
+START = datetime(2030, 5, 10, 10, tzinfo=timezone.utc)
+END = START + timedelta(days=3)
+
+
+@pytest.fixture
+async def catalog(
+    db_session: AsyncSession, test_category: Category, test_client: Client
+) -> Dict[str, Equipment]:
+    """Create equipment around a camera that is already booked."""
+    child = Category(name='Cinema cameras', parent_id=test_category.id)
+    other = Category(name='Unrelated')
+    db_session.add_all([child, other])
+    await db_session.commit()
+
+    def item(
+        key: str,
+        name: str,
+        category: Category,
+        serial: Optional[str] = None,
+        status: EquipmentStatus = EquipmentStatus.AVAILABLE,
+    ) -> Equipment:
+        return Equipment(
+            name=name,
+            category_id=category.id,
+            barcode=f'ALT-{key}',
+            serial_number=serial,
+            replacement_cost=1000,
+            status=status,
+        )
+
+    items = {
+        'source': item('source', 'Arri Alexa Mini', test_category, 'S0'),
+        'twin': item('twin', 'Arri Alexa Mini', child, 'S1'),
+        'busy_twin': item('busy_twin', 'Arri Alexa Mini', test_category, 'S2'),
+        'brand': item('brand', 'ARRI SkyPanel', test_category, 'S3'),
+        'other_brand': item('other_brand', 'Sony FX6', test_category, 'S4'),
+        'cable': item('cable', 'Cable', child),
+        'broken': item(
+            'broken', 'Arri Alexa Mini', test_category, 'S5', EquipmentStatus.BROKEN
+        ),
+        'elsewhere': item('elsewhere', 'Arri Alexa Mini', other, 'S6'),
+    }
+    db_session.add_all(items.values())
+    await db_session.commit()
+
+    db_session.add_all(
+        [
+            Booking(
+                equipment_id=items[key].id,
+                client_id=test_client.id,
+                start_date=START + timedelta(days=1),
+                end_date=END + timedelta(days=1),
+                booking_status=booking_status,
+                payment_status=PaymentStatus.PENDING,
+                total_amount=100,
+                deposit_amount=0,
+            )
+            for key, booking_status in [
+                ('source', BookingStatus.CONFIRMED),
+                ('busy_twin', BookingStatus.CONFIRMED),
+                ('brand', BookingStatus.CANCELLED),
+                ('cable', BookingStatus.ACTIVE),
+            ]
+        ]
+    )
+    await db_session.commit()
+    return items
+
+
+async def test_alternatives_are_ranked(
+    async_client: AsyncClient, catalog: Dict[str, Equipment]
+) -> None:
+    """Test free items of the category subtree are ranked by similarity."""
+    response = await async_client.get(
+        f'/api/v1/equipment/{catalog["source"].id}/alternatives',
+        params={'start_date': START.isoformat(), 'end_date': END.isoformat()},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item['id'] for item in data] == [
+        catalog['twin'].id,
+        catalog['brand'].id,
+        catalog['other_brand'].id,
+        catalog['cable'].id,
+    ]
+    assert data[0]['same_name'] is True
+    assert data[0]['category_depth'] == 1
+    assert data[0]['category_name'] == 'Cinema cameras'
+    assert data[1]['same_name'] is False
+    assert data[1]['category_depth'] == 0
+
+
+async def test_alternatives_with_same_name(
+    async_client: AsyncClient, catalog: Dict[str, Equipment]
+) -> None:
+    """Test suggestions can be limited to items with the same name."""
+    response = await async_client.get(
+        f'/api/v1/equipment/{catalog["source"].id}/alternatives',
+        params={
+            'start_date': START.isoformat(),
+            'end_date': END.isoformat(),
+            'same_name': True,
+        },
+    )
+
+    assert response.status_code == 200
+    assert [item['id'] for item in response.json()] == [catalog['twin'].id]
+
+
+async def test_alternatives_of_unknown_equipment(async_client: AsyncClient) -> None:
+    """Test unknown equipment is reported as not found."""
+    response = await async_client.get(
+        '/api/v1/equipment/999999/alternatives',
+        params={'start_date': START.isoformat(), 'end_date': END.isoformat()},
+    )
+
+    assert response.status_code == 404
@@ -1,12 +1,13 @@
 """Equipment API integration tests."""
 
 from datetime import datetime, timedelta, timezone
-from typing import TypedDict, cast
+from typing import Callable, ContextManager, TypedDict, cast
 
 from fastapi import status as http_status
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.query_counter import QueryStats
 from backend.models import Category, Client, Equipment
 from backend.models.equipment import EquipmentStatus
 from backend.services.booking import BookingService
@@ -104,6 +105,38 @@ async def test_get_equipment_list(
     assert any(item['id'] == test_equipment.id for item in result)
 
 
+@async_test
+async def test_get_equipment_list_single_query(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    test_category: Category,
+    assert_max_queries: Callable[[int], ContextManager[QueryStats]],
+) -> None:
+    """Test that the equipment list is loaded with one query."""
+    db_session.add_all(
+        [
+            Equipment(
+                name=f'Bulk Equipment {i}',
+                category_id=test_category.id,
+                barcode=f'BULK{i:07d}',
+                serial_number=f'BULK-SN-{i}',
+                replacement_cost=1000,
+                status=EquipmentStatus.AVAILABLE,
+            )
+            for i in range(20)
+        ]
+    )
+    await db_session.commit()
+
+    with assert_max_queries(1):
+        response = await async_client.get('/api/v1/equipment/?limit=1000')
+
+    assert response.status_code == 200
+    result = response.json()
+    assert len(result) == 20
+    assert all(item['category_name'] == test_category.name for item in result)
+
+
 @async_test
 async def test_get_equipment_by_category(
     async_client: AsyncClient,
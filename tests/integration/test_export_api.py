@@ -0,0 +1,82 @@
+"""Integration tests for export endpoints."""
+
+import csv
+import io
+import zipfile
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from backend.models import Booking, Equipment
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_export_equipment_csv(
+    async_client: AsyncClient, test_equipment: Equipment
+) -> None:
+    """Test equipment CSV export with filters."""
+    equipment_id = test_equipment.id
+
+    response = await async_client.get(
+        '/api/v1/equipment/export', params={'query': 'Test'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith('text/csv')
+    assert 'equipment.csv' in response.headers['content-disposition']
+    rows = list(csv.reader(io.StringIO(response.content.decode('utf-8-sig'))))
+    assert rows[0][:3] == ['ID', 'Название', 'Категория']
+    assert rows[1][:3] == [str(equipment_id), 'Test Equipment', 'Test Category']
+    assert len(rows) == 2
+
+
+async def test_export_equipment_filters_out_rows(
+    async_client: AsyncClient, test_equipment: Equipment
+) -> None:
+    """Test that export applies the same filters as the paginated list."""
+    response = await async_client.get(
+        '/api/v1/equipment/export', params={'query': 'missing'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    rows = list(csv.reader(io.StringIO(response.content.decode('utf-8-sig'))))
+    assert len(rows) == 1
+
+
+async def test_export_bookings_xlsx(
+    async_client: AsyncClient, test_booking: Booking
+) -> None:
+    """Test bookings XLSX export."""
+    response = await async_client.get(
+        '/api/v1/bookings/export', params={'format': 'xlsx'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'bookings.xlsx' in response.headers['content-disposition']
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        sheet = archive.read('xl/worksheets/sheet1.xml').decode('utf-8')
+    assert 'Test Client' in sheet
+    assert 'Test Equipment' in sheet
+
+
+async def test_export_projects_csv(async_client: AsyncClient) -> None:
+    """Test projects export with no matching rows returns only headers."""
+    response = await async_client.get('/api/v1/projects/export')
+
+    assert response.status_code == status.HTTP_200_OK
+    rows = list(csv.reader(io.StringIO(response.content.decode('utf-8-sig'))))
+    assert rows == [
+        [
+            'ID',
+            'Название',
+            'Клиент',
+            'Начало',
+            'Окончание',
+            'Статус',
+            'Оплата',
+            'Описание',
+            'Создано',
+        ]
+    ]
@@ -0,0 +1,98 @@
+"""Integration tests for health API."""
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from backend.api.v1.endpoints import health as health_endpoints
+from backend.core import cache, health
+from backend.core.health import check_readiness
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_liveness(async_client: AsyncClient) -> None:
+    """Test liveness probe."""
+    response = await async_client.get('/api/v1/health/live')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'status': 'alive'}
+
+
+class _HealthyRedis:
+    """Redis client answering every ping."""
+
+    async def ping(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def readiness_dependencies(
+    engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Point the readiness probe at the test database and a healthy Redis."""
+    monkeypatch.setattr(health_endpoints, 'engine', engine)
+    monkeypatch.setattr(cache, 'redis', _HealthyRedis())
+    monkeypatch.setattr(health, '_cached', None)
+
+
+@pytest.mark.usefixtures('readiness_dependencies')
+async def test_readiness_endpoint(async_client: AsyncClient) -> None:
+    """Test readiness probe reports ready and reuses the result."""
+    response = await async_client.get('/api/v1/health/ready')
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data['status'] == 'ready'
+    assert data['cached'] is False
+    assert data['checks']['database']['healthy'] is True
+    assert data['checks']['redis']['healthy'] is True
+    assert data['scheduler'] == 'disabled'
+
+    response = await async_client.get('/api/v1/health/ready')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['cached'] is True
+    assert response.json()['checked_at'] == data['checked_at']
+
+
+@pytest.mark.usefixtures('readiness_dependencies')
+async def test_readiness_endpoint_without_database(
+    async_client: AsyncClient, engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test readiness probe reports unavailable when the database check fails."""
+    unreachable = create_async_engine(
+        engine.url.set(database='act_rental_missing'), poolclass=engine.pool.__class__
+    )
+    monkeypatch.setattr(health_endpoints, 'engine', unreachable)
+    try:
+        response = await async_client.get('/api/v1/health/ready')
+    finally:
+        await unreachable.dispose()
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    data = response.json()
+    assert data['status'] == 'unavailable'
+    assert data['checks']['database']['healthy'] is False
+    assert data['checks']['redis']['healthy'] is True
+
+
+async def test_check_readiness(engine: AsyncEngine) -> None:
+    """Test readiness checks against the test database without Redis."""
+    result = await check_readiness(engine, None, use_cache=False)
+
+    assert result.checks['database'].healthy is True
+    assert result.checks['database'].latency_ms is not None
+    assert result.checks['redis'].healthy is False
+    assert result.status == 'unavailable'
+    assert result.cached is False
+
+
+async def test_check_readiness_is_cached(engine: AsyncEngine) -> None:
+    """Test that a recent readiness result is reused."""
+    first = await check_readiness(engine, None, use_cache=False)
+    second = await check_readiness(engine, None)
+
+    assert second.cached is True
+    assert second.checked_at == first.checked_at
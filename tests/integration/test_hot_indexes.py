@@ -0,0 +1,98 @@
+"""Integration tests matching hot queries to their indexes."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.repositories import (
+    BookingRepository,
+    EquipmentRepository,
+    ScanSessionRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+START = datetime(2030, 6, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=3)
+
+Capture = List[Tuple[str, Any]]
+
+
+@pytest.fixture
+def captured(engine: AsyncEngine) -> Iterator[Capture]:
+    """Capture SELECT statements sent to the test database."""
+    statements: Capture = []
+
+    def listener(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if statement.startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', listener)
+    yield statements
+    event.remove(engine.sync_engine, 'before_cursor_execute', listener)
+
+
+async def _indexes_used(engine: AsyncEngine, statement: str, parameters: Any) -> str:
+    """Get the plan of a statement when sequential scans are avoided."""
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql('SET LOCAL enable_seqscan = off')
+        result = await conn.exec_driver_sql(
+            f'EXPLAIN (FORMAT JSON) {statement}', parameters
+        )
+        plan = result.scalar_one()
+        await conn.rollback()
+    return plan if isinstance(plan, str) else json.dumps(plan)
+
+
+@pytest.mark.parametrize(
+    ('query', 'index'),
+    [
+        (
+            lambda session: BookingRepository(session).check_availability(
+                1, START, END
+            ),
+            'ix_bookings_equipment_status_period',
+        ),
+        (
+            lambda session: BookingRepository(session).get_by_client(1),
+            'ix_bookings_client_id_created_at',
+        ),
+        (
+            lambda session: session.execute(
+                EquipmentRepository(session)
+                .get_paginatable_query(category_id=1)
+                .limit(20)
+            ),
+            'ix_equipment_category_id_name',
+        ),
+        (
+            lambda session: ScanSessionRepository(session).get_expired(START),
+            'ix_scan_sessions_expires_at',
+        ),
+    ],
+    ids=['availability', 'client_bookings', 'category_equipment', 'expired_sessions'],
+)
+async def test_hot_query_matches_index(
+    db_session: AsyncSession,
+    engine: AsyncEngine,
+    captured: Capture,
+    query: Callable[[AsyncSession], Awaitable[Any]],
+    index: str,
+) -> None:
+    """Test the predicates of a hot query match its partial index."""
+    await query(db_session)
+
+    assert captured
+    statement, parameters = captured[-1]
+    assert index in await _indexes_used(engine, statement, parameters)
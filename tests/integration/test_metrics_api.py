@@ -0,0 +1,57 @@
+"""Integration tests for metrics API."""
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from backend.core.metrics import Histogram, Metric
+from backend.models import Equipment
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_metrics(
+    async_client: AsyncClient,
+    test_equipment: Equipment,
+) -> None:
+    """Test that metrics are exposed in the Prometheus text format."""
+    await async_client.get('/api/v1/health')
+
+    response = await async_client.get('/api/v1/metrics')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith('text/plain')
+    body = response.text
+    assert '# TYPE http_request_duration_seconds histogram' in body
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/health"}'
+        in body
+    )
+    assert 'db_pool_checked_out' in body
+    assert 'equipment_items{status="AVAILABLE"} 1' in body
+
+
+async def test_histogram_render() -> None:
+    """Test cumulative bucket rendering of histograms."""
+    histogram = Histogram('job_seconds', 'Job duration', ('job',), buckets=(1, 5))
+    histogram.observe(0.5, job='a')
+    histogram.observe(3, job='a')
+    histogram.observe(10, job='a')
+
+    lines = histogram.render()
+
+    assert 'job_seconds_bucket{job="a",le="1"} 1' in lines
+    assert 'job_seconds_bucket{job="a",le="5"} 2' in lines
+    assert 'job_seconds_bucket{job="a",le="+Inf"} 3' in lines
+    assert 'job_seconds_sum{job="a"} 13.5' in lines
+    assert 'job_seconds_count{job="a"} 3' in lines
+
+
+async def test_metric_requires_samples() -> None:
+    """Test a metric type without samples cannot be instantiated."""
+
+    class Incomplete(Metric):
+        type_name = 'gauge'
+
+    with pytest.raises(TypeError):
+        Incomplete('incomplete', 'Incomplete metric')  # type: ignore[abstract]
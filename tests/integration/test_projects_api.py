@@ -1,13 +1,16 @@
 """Integration tests for Projects API endpoints."""
 
 from datetime import datetime, timedelta, timezone
+from typing import Dict
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.models.booking import Booking, BookingStatus, PaymentStatus
 from backend.models.client import Client
-from backend.models.equipment import Equipment
+from backend.models.equipment import Equipment, EquipmentStatus
 from backend.models.project import Project
 
 
@@ -375,6 +378,87 @@ class TestProjectsAPIPatch:
         data = response.json()
         assert 'detail' in data
 
+    @pytest.mark.asyncio
+    async def test_complete_project_closes_bookings(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project: Project,
+        test_equipment: Equipment,
+        test_client: Client,
+    ) -> None:
+        """Test completing a project completes and soft deletes its bookings."""
+        # Arrange
+        other = Equipment(
+            name='Busy elsewhere',
+            category_id=test_equipment.category_id,
+            barcode='00000000202',
+            replacement_cost=100,
+            status=EquipmentStatus.RENTED,
+        )
+        test_equipment.status = EquipmentStatus.RENTED
+        db_session.add(other)
+        await db_session.commit()
+
+        start = datetime.now(timezone.utc)
+
+        def booking(
+            equipment: Equipment, status: BookingStatus, in_project: bool = True
+        ) -> Booking:
+            return Booking(
+                equipment_id=equipment.id,
+                client_id=test_client.id,
+                project_id=test_project.id if in_project else None,
+                start_date=start,
+                end_date=start + timedelta(days=2),
+                booking_status=status,
+                payment_status=PaymentStatus.PENDING,
+                total_amount=100,
+                deposit_amount=0,
+            )
+
+        bookings = [
+            booking(test_equipment, BookingStatus.ACTIVE),
+            booking(other, BookingStatus.CANCELLED),
+            booking(other, BookingStatus.CONFIRMED),
+            booking(other, BookingStatus.ACTIVE, in_project=False),
+        ]
+        db_session.add_all(bookings)
+        await db_session.commit()
+        booking_ids = [item.id for item in bookings]
+
+        # Act
+        response = await async_client.patch(
+            f'/api/v1/projects/{test_project.id}', json={'status': 'COMPLETED'}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        db_session.expire_all()
+        rows = (
+            await db_session.execute(
+                select(Booking.booking_status, Booking.deleted_at)
+                .where(Booking.id.in_(booking_ids))
+                .order_by(Booking.id)
+            )
+        ).all()
+        assert [row.booking_status for row in rows] == [
+            BookingStatus.COMPLETED,
+            BookingStatus.CANCELLED,
+            BookingStatus.COMPLETED,
+            BookingStatus.ACTIVE,
+        ]
+        assert [row.deleted_at is not None for row in rows] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        await db_session.refresh(test_equipment)
+        await db_session.refresh(other)
+        assert test_equipment.status == EquipmentStatus.AVAILABLE
+        assert other.status == EquipmentStatus.RENTED
+
 
 class TestProjectsAPIDelete:
     """Test cases for DELETE /api/v1/projects/{id} endpoints."""
@@ -643,3 +727,192 @@ class TestProjectPaymentStatusAPI:
             # Check that payment_status is included in response
             for project in data['items']:
                 assert 'payment_status' in project
+
+
+class TestProjectsAPIReschedule:
+    """Test cases for POST /api/v1/projects/{id}/reschedule endpoint."""
+
+    @pytest.fixture
+    async def project_bookings(
+        self,
+        db_session: AsyncSession,
+        test_project: Project,
+        test_equipment: Equipment,
+        test_client: Client,
+    ) -> Dict[str, Booking]:
+        """Create two project bookings and a booking of another project."""
+        start = test_project.start_date
+        other_project = Project(
+            name='Other Project',
+            client_id=test_client.id,
+            start_date=start + timedelta(days=9),
+            end_date=start + timedelta(days=12),
+        )
+        db_session.add(other_project)
+        await db_session.commit()
+
+        def booking(days: int, length: int, project: Project) -> Booking:
+            return Booking(
+                equipment_id=test_equipment.id,
+                client_id=test_client.id,
+                project_id=project.id,
+                start_date=start + timedelta(days=days),
+                end_date=start + timedelta(days=days + length),
+                booking_status=BookingStatus.CONFIRMED,
+                payment_status=PaymentStatus.PENDING,
+                total_amount=100,
+                deposit_amount=0,
+            )
+
+        bookings = {
+            'first': booking(0, 2, test_project),
+            'second': booking(4, 2, test_project),
+            'other': booking(9, 3, other_project),
+        }
+        db_session.add_all(bookings.values())
+        await db_session.commit()
+        return bookings
+
+    @pytest.mark.asyncio
+    async def test_reschedule_preview_reports_conflicts(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project: Project,
+        project_bookings: Dict[str, Booking],
+    ) -> None:
+        """Test a dry run lists conflicts without moving bookings."""
+        second_id = project_bookings['second'].id
+        other_id = project_bookings['other'].id
+        second_start = project_bookings['second'].start_date
+
+        # Act
+        response = await async_client.post(
+            f'/api/v1/projects/{test_project.id}/reschedule',
+            json={'shift_days': 4},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data['applied'] is False
+        assert len(data['bookings']) == 2
+        assert [
+            (item['booking_id'], item['conflicting_booking_id'])
+            for item in data['conflicts']
+        ] == [(second_id, other_id)]
+        await db_session.refresh(project_bookings['second'])
+        assert project_bookings['second'].start_date == second_start
+
+    @pytest.mark.asyncio
+    async def test_reschedule_with_conflicts_is_not_applied(
+        self,
+        async_client: AsyncClient,
+        test_project: Project,
+        project_bookings: Dict[str, Booking],
+    ) -> None:
+        """Test conflicting moves are rejected as a whole."""
+        # Act
+        response = await async_client.post(
+            f'/api/v1/projects/{test_project.id}/reschedule',
+            json={'shift_days': 4, 'dry_run': False},
+        )
+
+        # Assert
+        assert response.status_code == 409
+        assert response.json()['applied'] is False
+
+    @pytest.mark.asyncio
+    async def test_reschedule_shifts_project(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project: Project,
+        project_bookings: Dict[str, Booking],
+    ) -> None:
+        """Test all bookings and the project dates move together."""
+        project_start = test_project.start_date
+        first_end = project_bookings['first'].end_date
+        second_start = project_bookings['second'].start_date
+
+        # Act
+        response = await async_client.post(
+            f'/api/v1/projects/{test_project.id}/reschedule',
+            json={'shift_days': 1, 'shift_hours': 12, 'dry_run': False},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()['applied'] is True
+        shift = timedelta(days=1, hours=12)
+        for booking in (*project_bookings.values(), test_project):
+            await db_session.refresh(booking)
+        assert project_bookings['first'].end_date == first_end + shift
+        assert project_bookings['second'].start_date == second_start + shift
+        assert test_project.start_date == project_start + shift
+
+    @pytest.mark.asyncio
+    async def test_reschedule_selected_booking_to_new_dates(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project: Project,
+        project_bookings: Dict[str, Booking],
+    ) -> None:
+        """Test selected bookings move to new dates, detecting overlaps."""
+        first = project_bookings['first']
+        first_id = first.id
+        first_start = first.start_date
+        second_id = project_bookings['second'].id
+        project_id = test_project.id
+        project_end = test_project.end_date
+
+        # Act
+        response = await async_client.post(
+            f'/api/v1/projects/{project_id}/reschedule',
+            json={
+                'booking_ids': [first_id],
+                'start_date': (first_start + timedelta(days=5)).isoformat(),
+                'end_date': (first_start + timedelta(days=7)).isoformat(),
+                'dry_run': False,
+            },
+        )
+        assert response.status_code == 409
+        assert [
+            item['conflicting_booking_id'] for item in response.json()['conflicts']
+        ] == [second_id]
+
+        new_start = first_start + timedelta(days=2)
+        response = await async_client.post(
+            f'/api/v1/projects/{project_id}/reschedule',
+            json={
+                'booking_ids': [first_id],
+                'start_date': new_start.isoformat(),
+                'end_date': (new_start + timedelta(days=1)).isoformat(),
+                'dry_run': False,
+            },
+        )
+
+        # Assert
+        assert response.status_code == 200
+        await db_session.refresh(first)
+        await db_session.refresh(test_project)
+        assert first.start_date == new_start
+        assert test_project.end_date == project_end
+
+    @pytest.mark.asyncio
+    async def test_reschedule_rejects_unknown_bookings(
+        self,
+        async_client: AsyncClient,
+        test_project: Project,
+        project_bookings: Dict[str, Booking],
+    ) -> None:
+        """Test bookings of other projects cannot be moved."""
+        # Act
+        response = await async_client.post(
+            f'/api/v1/projects/{test_project.id}/reschedule',
+            json={'booking_ids': [project_bookings['other'].id], 'shift_days': 1},
+        )
+
+        # Assert
+        assert response.status_code == 400
@@ -0,0 +1,80 @@
+"""Integration tests for per-request SQL query counting."""
+
+from typing import Callable, ContextManager
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from backend.core.query_counter import QueryStats
+from backend.models import Equipment
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_server_timing_header(async_client: AsyncClient) -> None:
+    """Test that responses carry database timing."""
+    response = await async_client.get('/api/v1/health')
+
+    assert response.status_code == status.HTTP_200_OK
+    server_timing = response.headers['server-timing']
+    assert 'db;dur=' in server_timing
+    assert 'desc="0 queries"' in server_timing
+    assert 'app;dur=' in server_timing
+
+
+async def test_assert_max_queries_counts_requests(
+    async_client: AsyncClient,
+    test_equipment: Equipment,
+    assert_max_queries: Callable[[int], ContextManager[QueryStats]],
+) -> None:
+    """Test that statements executed by a request are counted."""
+    with assert_max_queries(5) as stats:
+        response = await async_client.get(f'/api/v1/equipment/{test_equipment.id}')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert stats.count > 0
+
+
+@pytest.mark.max_queries(5)
+async def test_get_equipment_query_budget(
+    async_client: AsyncClient,
+    test_equipment: Equipment,
+) -> None:
+    """Test that fetching one equipment item stays within its query budget."""
+    response = await async_client.get(f'/api/v1/equipment/{test_equipment.id}')
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_client_writes_use_returning(
+    async_client: AsyncClient,
+    assert_max_queries: Callable[[int], ContextManager[QueryStats]],
+) -> None:
+    """Test that writes fetch server defaults without a separate SELECT."""
+    with assert_max_queries(1):
+        response = await async_client.post(
+            '/api/v1/clients/', json={'name': 'Returning Client'}
+        )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()['created_at'] is not None
+    client_id = response.json()['id']
+
+    # Loading the client and updating it
+    with assert_max_queries(2):
+        response = await async_client.put(
+            f'/api/v1/clients/{client_id}/', json={'notes': 'Updated'}
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['updated_at'] is not None
+
+
+async def test_query_stats_duplicates() -> None:
+    """Test detection of repeated statements."""
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record('SELECT * FROM equipment WHERE id = $1', 0.001)
+    stats.record('SELECT * FROM categories', 0.002)
+
+    assert stats.count == 4
+    assert stats.duplicates() == [('SELECT * FROM equipment WHERE id = $1', 3)]
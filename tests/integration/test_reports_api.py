@@ -0,0 +1,280 @@
+"""Integration tests for reports API."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.core.timezone_utils import MOSCOW_TZ
+from backend.models import (
+    Booking,
+    BookingDailyStat,
+    BookingStatus,
+    Client,
+    Equipment,
+    PaymentStatus,
+)
+from backend.repositories.report import REFRESH_LOCK_KEY
+from backend.services import ReportService
+
+pytestmark = pytest.mark.asyncio
+
+PERIOD = {'start_date': '2026-03-01', 'end_date': '2026-03-10'}
+
+
+@pytest.fixture
+async def idle_equipment(db_session: AsyncSession, test_equipment: Equipment):
+    """Create equipment that is never booked."""
+    equipment = Equipment(
+        name='Idle Equipment',
+        category_id=test_equipment.category_id,
+        serial_number='IDLE001',
+        barcode='IDLE001',
+        replacement_cost=1000,
+    )
+    db_session.add(equipment)
+    await db_session.commit()
+    return equipment
+
+
+@pytest.fixture
+async def report_bookings(
+    db_session: AsyncSession, test_equipment: Equipment, test_client: Client
+) -> list[Booking]:
+    """Create bookings inside and outside the report period."""
+
+    def booking(start: datetime, end: datetime, booking_status: BookingStatus):
+        return Booking(
+            equipment_id=test_equipment.id,
+            client_id=test_client.id,
+            start_date=start,
+            end_date=end,
+            booking_status=booking_status,
+            payment_status=PaymentStatus.PENDING,
+            total_amount=100.00,
+            deposit_amount=0.00,
+        )
+
+    bookings = [
+        booking(
+            datetime(2026, 3, 1, 10, tzinfo=MOSCOW_TZ),
+            datetime(2026, 3, 3, 18, tzinfo=MOSCOW_TZ),
+            BookingStatus.COMPLETED,
+        ),
+        booking(
+            datetime(2026, 3, 5, 10, tzinfo=MOSCOW_TZ),
+            datetime(2026, 3, 5, 18, tzinfo=MOSCOW_TZ),
+            BookingStatus.CONFIRMED,
+        ),
+        booking(
+            datetime(2026, 3, 7, 10, tzinfo=MOSCOW_TZ),
+            datetime(2026, 3, 8, 18, tzinfo=MOSCOW_TZ),
+            BookingStatus.CANCELLED,
+        ),
+        booking(
+            datetime(2026, 2, 27, 10, tzinfo=MOSCOW_TZ),
+            datetime(2026, 2, 28, 18, tzinfo=MOSCOW_TZ),
+            BookingStatus.COMPLETED,
+        ),
+    ]
+    db_session.add_all(bookings)
+    await db_session.commit()
+    return bookings
+
+
+async def test_refresh_splits_revenue_by_day(
+    db_session: AsyncSession, report_bookings: list[Booking]
+) -> None:
+    """Test that bookings are expanded into days with exact revenue split."""
+    result = await ReportService(db_session).refresh()
+
+    assert result.full is True
+    assert result.rows == 6
+
+    rows = (
+        await db_session.execute(
+            select(BookingDailyStat.day, BookingDailyStat.revenue)
+            .where(BookingDailyStat.booking_id == report_bookings[0].id)
+            .order_by(BookingDailyStat.day)
+        )
+    ).all()
+    assert [row.day.isoformat() for row in rows] == [
+        '2026-03-01',
+        '2026-03-02',
+        '2026-03-03',
+    ]
+    assert [row.revenue for row in rows] == [
+        Decimal('33.33'),
+        Decimal('33.33'),
+        Decimal('33.34'),
+    ]
+
+
+async def test_incremental_refresh(
+    db_session: AsyncSession, report_bookings: list[Booking]
+) -> None:
+    """Test that only changed bookings are recomputed."""
+    service = ReportService(db_session)
+    await service.refresh()
+
+    report_bookings[1].booking_status = BookingStatus.CANCELLED
+    await db_session.commit()
+
+    result = await service.refresh()
+
+    assert result.full is False
+    assert result.bookings == 1
+    assert result.rows == 0
+    remaining = (
+        await db_session.execute(
+            select(BookingDailyStat.booking_id).where(
+                BookingDailyStat.booking_id == report_bookings[1].id
+            )
+        )
+    ).all()
+    assert remaining == []
+
+
+async def test_incremental_refresh_picks_up_late_commits(
+    engine: AsyncEngine, db_session: AsyncSession, report_bookings: list[Booking]
+) -> None:
+    """Test that a change committed after a refresh started is not missed."""
+    async with AsyncSession(engine) as writer:
+        # updated_at is the start of this transaction, before the refresh
+        await writer.execute(
+            update(Booking)
+            .where(Booking.id == report_bookings[1].id)
+            .values(booking_status=BookingStatus.CANCELLED)
+        )
+        service = ReportService(db_session)
+        first = await service.refresh()
+        await writer.commit()
+
+    assert first.rows == 6
+    result = await service.refresh()
+
+    assert result.bookings == 1
+    assert result.refreshed_at >= first.refreshed_at
+    remaining = (
+        await db_session.execute(
+            select(BookingDailyStat.booking_id).where(
+                BookingDailyStat.booking_id == report_bookings[1].id
+            )
+        )
+    ).all()
+    assert remaining == []
+
+
+async def test_try_refresh_skips_while_refreshing(
+    engine: AsyncEngine, db_session: AsyncSession, report_bookings: list[Booking]
+) -> None:
+    """Test that a scheduled refresh is skipped while another one runs."""
+    service = ReportService(db_session)
+    async with AsyncSession(engine) as other:
+        await other.execute(select(func.pg_advisory_xact_lock(REFRESH_LOCK_KEY)))
+        assert await service.try_refresh() is None
+        await db_session.rollback()
+
+    result = await service.try_refresh()
+
+    assert result is not None
+    assert result.rows == 6
+
+
+async def test_utilization_report(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    report_bookings: list[Booking],
+    idle_equipment: Equipment,
+) -> None:
+    """Test equipment utilization over the period."""
+    await ReportService(db_session).refresh()
+
+    response = await async_client.get('/api/v1/reports/utilization', params=PERIOD)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data['total'] == 2
+    busy, idle = data['items']
+    assert busy['equipment_id'] == report_bookings[0].equipment_id
+    assert busy['booked_days'] == 4
+    assert Decimal(busy['utilization']) == Decimal('40.00')
+    assert Decimal(busy['revenue']) == Decimal('200.00')
+    assert busy['category_rank'] == 1
+    assert idle['equipment_id'] == idle_equipment.id
+    assert idle['booked_days'] == 0
+    assert idle['category_rank'] == 2
+
+
+async def test_revenue_reports(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    test_client: Client,
+    report_bookings: list[Booking],
+) -> None:
+    """Test revenue per category, client and month."""
+    await ReportService(db_session).refresh()
+
+    categories = await async_client.get(
+        '/api/v1/reports/revenue/categories', params=PERIOD
+    )
+    assert categories.status_code == status.HTTP_200_OK
+    category = categories.json()['items'][0]
+    assert category['bookings'] == 2
+    assert Decimal(category['revenue']) == Decimal('200.00')
+    assert Decimal(category['share']) == Decimal('100.00')
+
+    clients = await async_client.get('/api/v1/reports/revenue/clients', params=PERIOD)
+    assert clients.status_code == status.HTTP_200_OK
+    assert clients.json()['items'][0]['client_id'] == test_client.id
+
+    months = await async_client.get(
+        '/api/v1/reports/revenue/months',
+        params={'start_date': '2026-02-01', 'end_date': '2026-03-31'},
+    )
+    assert months.status_code == status.HTTP_200_OK
+    february, march = months.json()['items']
+    assert february['month'] == '2026-02-01'
+    assert february['change'] is None
+    assert Decimal(march['revenue']) == Decimal('200.00')
+    assert Decimal(march['running_total']) == Decimal('300.00')
+    assert Decimal(march['change']) == Decimal('100.00')
+
+
+async def test_idle_equipment_report(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    report_bookings: list[Booking],
+    idle_equipment: Equipment,
+) -> None:
+    """Test that only equipment without bookings in the period is listed."""
+    await ReportService(db_session).refresh()
+
+    response = await async_client.get(
+        '/api/v1/reports/idle',
+        params={'start_date': '2026-03-06', 'end_date': '2026-03-10'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    items = response.json()['items']
+    assert [item['equipment_id'] for item in items] == [
+        idle_equipment.id,
+        report_bookings[0].equipment_id,
+    ]
+    assert items[0]['last_booked_day'] is None
+    assert items[1]['last_booked_day'] == '2026-03-05'
+    assert items[1]['idle_days'] == 5
+
+
+async def test_report_invalid_period(async_client: AsyncClient) -> None:
+    """Test that a period ending before it starts is rejected."""
+    response = await async_client.get(
+        '/api/v1/reports/utilization',
+        params={'start_date': '2026-03-10', 'end_date': '2026-03-01'},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
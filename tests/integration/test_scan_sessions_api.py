@@ -1,12 +1,13 @@
 """Integration tests for scan sessions API."""
 
+import json
 from typing import Any
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
-from backend.models import ScanSession
+from backend.models import Equipment, ScanSession
 from backend.schemas.scan_session import ScanSessionResponse
 
 pytestmark = pytest.mark.asyncio
@@ -209,3 +210,42 @@ async def test_update_scan_session_partial(
     assert data['name'] == update_data['name']
     # Items should be unchanged
     assert len(data['items']) == len(test_scan_session.items)
+
+
+async def test_stream_stock_take_report(
+    async_client: AsyncClient,
+    test_equipment: Equipment,
+) -> None:
+    """Test the stock-take report streams the summary and filtered items."""
+    response = await async_client.post(
+        '/api/v1/scan-sessions/',
+        json={
+            'name': 'Stock-take',
+            'items': [
+                {'equipment_id': 999999, 'barcode': 'UNKNOWN', 'name': 'Unknown'}
+            ],
+        },
+    )
+    session_id = response.json()['id']
+
+    response = await async_client.get(
+        f'/api/v1/scan-sessions/{session_id}/stock-take/report',
+        params={'result': 'MISSING'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    summary, *items = [json.loads(line) for line in response.text.splitlines()]
+    assert summary['scanned'] == 1
+    assert summary['missing'] == 1
+    assert summary['unexpected'] == 1
+    assert [(item['equipment_id'], item['result']) for item in items] == [
+        (test_equipment.id, 'MISSING')
+    ]
+
+    response = await async_client.get(f'/api/v1/scan-sessions/{session_id}/stock-take')
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['missing'] == 1
+
+    response = await async_client.get('/api/v1/scan-sessions/999999/stock-take/report')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1 @@
+"""Pytest plugins for the test suite."""
@@ -0,0 +1,66 @@
+"""Pytest plugin asserting SQL query counts.
+
+Usage:
+    Mark a test to limit the number of statements executed by its body::
+
+        @pytest.mark.max_queries(3)
+        async def test_get_equipment(async_client):
+            ...
+
+    Or limit a single block with the ``assert_max_queries`` fixture::
+
+        async def test_list(async_client, assert_max_queries):
+            with assert_max_queries(2):
+                await async_client.get('/api/v1/equipment/')
+"""
+
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Generator, Iterator
+
+import pytest
+
+from backend.core.query_counter import QueryStats, track_queries
+
+
+def _format_failure(stats: QueryStats, limit: int) -> str:
+    """Build assertion message listing the most repeated statements."""
+    lines = [f'Expected at most {limit} queries, executed {stats.count}']
+    for statement, count in stats.statements.most_common(5):
+        lines.append(f'  {count}x {" ".join(statement.split())[:200]}')
+    return '\n'.join(lines)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the ``max_queries`` marker."""
+    config.addinivalue_line(
+        'markers',
+        'max_queries(limit): fail if the test body executes more SQL statements',
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:
+    """Track statements executed by tests marked with ``max_queries``."""
+    marker = item.get_closest_marker('max_queries')
+    if marker is None:
+        yield
+        return
+
+    limit = int(marker.args[0])
+    with track_queries() as stats:
+        outcome = yield
+    if outcome.excinfo is None and stats.count > limit:
+        pytest.fail(_format_failure(stats, limit), pytrace=False)
+
+
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], ContextManager[QueryStats]]:
+    """Get a context manager failing when a block exceeds a query count."""
+
+    @contextmanager
+    def _assert_max_queries(limit: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= limit, _format_failure(stats, limit)
+
+    return _assert_max_queries
@@ -0,0 +1,60 @@
+"""Unit tests for benchmark result helpers."""
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from backend.core.config import settings
+from backend.scripts.benchmark import (
+    check_destructive_target,
+    compare_results,
+    percentile,
+)
+
+
+def test_percentile_interpolates() -> None:
+    """Test percentiles interpolate between closest ranks."""
+    values = [40.0, 10.0, 30.0, 20.0]
+
+    assert percentile(values, 50) == pytest.approx(25.0)
+    assert percentile(values, 95) == pytest.approx(38.5)
+    assert percentile(values, 100) == 40.0
+    assert percentile([], 50) == 0.0
+
+
+def test_compare_results_reports_regressions() -> None:
+    """Test latency growth above tolerance and extra queries are reported."""
+    baseline = {
+        'list': {'p50_ms': 10.0, 'p95_ms': 20.0, 'queries_max': 2},
+        'search': {'p50_ms': 10.0, 'p95_ms': 20.0, 'queries_max': 2},
+    }
+    results = {
+        'list': {'p50_ms': 11.0, 'p95_ms': 30.0, 'queries_max': 3},
+        'search': {'p50_ms': 11.9, 'p95_ms': 23.9, 'queries_max': 2},
+        'new': {'p50_ms': 100.0, 'p95_ms': 100.0, 'queries_max': 50},
+    }
+
+    regressions = compare_results(results, baseline, tolerance=0.2)
+
+    assert regressions == [
+        'list: p95_ms 20.0 -> 30.0',
+        'list: queries_max 2 -> 3',
+    ]
+
+
+def test_check_destructive_target(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test destroying data needs a separate database or a confirmation."""
+    app_url = make_url(settings.DATABASE_URL)
+    benchmark_url = app_url.set(database='benchmark').render_as_string()
+    monkeypatch.setattr(settings, 'ENVIRONMENT', 'development')
+
+    check_destructive_target(benchmark_url, confirmed=False)
+    check_destructive_target(None, confirmed=True)
+    with pytest.raises(ValueError, match='--database-url'):
+        check_destructive_target(None, confirmed=False)
+    with pytest.raises(ValueError, match='is the application database'):
+        check_destructive_target(app_url.render_as_string(), confirmed=False)
+    check_destructive_target(app_url.render_as_string(), confirmed=True)
+
+    monkeypatch.setattr(settings, 'ENVIRONMENT', 'production')
+    with pytest.raises(ValueError, match='production'):
+        check_destructive_target(benchmark_url, confirmed=True)
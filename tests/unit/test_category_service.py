@@ -1,8 +1,12 @@
 """Unit tests for category service."""
 
+from typing import List
+
 import pytest
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.query_counter import track_queries
 from backend.models.category import Category
 from backend.services.category import CategoryService
 from tests.conftest import async_fixture, async_test
@@ -149,3 +153,127 @@ class TestCategoryService:
         assert isinstance(categories[0], Category)
         assert hasattr(categories[0], 'equipment_count')
         assert getattr(categories[0], 'equipment_count') == 0
+
+    @async_test
+    async def test_print_hierarchy_from_cached_tree(
+        self,
+        category_service: CategoryService,
+    ) -> None:
+        """Test print hierarchy lookups without queries once the tree is cached."""
+        root = await category_service.create_category(
+            name='Root', description='Root', show_in_print_overview=False
+        )
+        child = await category_service.create_category(
+            name='Child', description='Child', parent_id=root.id
+        )
+        leaf = await category_service.create_category(
+            name='Leaf', description='Leaf', parent_id=child.id
+        )
+
+        with track_queries() as stats:
+            sort_path, printable = (
+                await category_service.get_print_hierarchy_and_sort_path(leaf.id)
+            )
+        assert stats.count == 1
+        assert sort_path == [root.id, child.id, leaf.id]
+        assert [(c.id, c.name, c.level) for c in printable] == [
+            (child.id, 'Child', 1),
+            (leaf.id, 'Leaf', 2),
+        ]
+
+        with track_queries() as stats:
+            for category_id in (root.id, child.id, leaf.id, None):
+                await category_service.get_print_hierarchy_and_sort_path(category_id)
+        assert stats.count == 0
+
+        # Category writes drop the cached tree
+        await category_service.update_category(child.id, name='Renamed')
+        _, printable = await category_service.get_print_hierarchy_and_sort_path(leaf.id)
+        assert printable[0].name == 'Renamed'
+
+    @async_test
+    async def test_category_tree_load_overlapping_write(
+        self,
+        category_service: CategoryService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a tree loaded before a category write is not cached."""
+        root = await category_service.create_category(name='Root', description='Root')
+        get_tree_nodes = category_service.repository.get_tree_nodes
+        created = []
+
+        async def get_tree_nodes_then_create() -> List[RowMapping]:
+            rows = await get_tree_nodes()
+            if not created:
+                created.append(
+                    await category_service.create_category(
+                        name='Child', description='Child', parent_id=root.id
+                    )
+                )
+            return rows
+
+        monkeypatch.setattr(
+            category_service.repository, 'get_tree_nodes', get_tree_nodes_then_create
+        )
+        tree = await category_service.get_category_tree()
+        assert root.id in tree
+        assert created[0].id not in tree
+
+        tree = await category_service.get_category_tree()
+        assert created[0].id in tree
+
+    @async_test
+    async def test_print_hierarchy_of_deleted_category(
+        self,
+        category_service: CategoryService,
+    ) -> None:
+        """Test that equipment of a deleted category prints without hierarchy."""
+        root = await category_service.create_category(name='Root', description='Root')
+        leaf = await category_service.create_category(
+            name='Leaf', description='Leaf', parent_id=root.id
+        )
+        await category_service.delete_category(leaf.id)
+
+        with track_queries() as stats:
+            result = await category_service.get_print_hierarchy_and_sort_path(leaf.id)
+        assert result == ([], [])
+        assert stats.count == 1
+
+        # Deleted and unknown categories are remembered, not reloaded
+        with track_queries() as stats:
+            for _ in range(3):
+                for category_id in (leaf.id, root.id):
+                    await category_service.get_print_hierarchy_and_sort_path(
+                        category_id
+                    )
+        assert stats.count == 0
+
+        await category_service.get_print_hierarchy_and_sort_path(leaf.id + 1000)
+        with track_queries() as stats:
+            result = await category_service.get_print_hierarchy_and_sort_path(
+                leaf.id + 1000
+            )
+        assert result == ([], [])
+        assert stats.count == 0
+
+    @async_test
+    async def test_print_hierarchy_without_printable_categories(
+        self,
+        category_service: CategoryService,
+    ) -> None:
+        """Test that the root category is printed when no category is marked."""
+        root = await category_service.create_category(
+            name='Root', description='Root', show_in_print_overview=False
+        )
+        child = await category_service.create_category(
+            name='Child',
+            description='Child',
+            parent_id=root.id,
+            show_in_print_overview=False,
+        )
+
+        sort_path, printable = await category_service.get_print_hierarchy_and_sort_path(
+            child.id
+        )
+        assert sort_path == [root.id, child.id]
+        assert [(c.id, c.level) for c in printable] == [(root.id, 1)]
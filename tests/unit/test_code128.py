@@ -0,0 +1,94 @@
+"""Unit tests for the Code 128 rasterizer and the render pool."""
+
+import asyncio
+import io
+import threading
+
+import pytest
+from PIL import Image
+
+from backend.core import code128
+from backend.core.render_pool import RenderPool, RenderQueueFullError
+
+
+def test_patterns_are_eleven_modules_wide() -> None:
+    """Test every symbol is 11 modules wide and the stop code 13."""
+    assert len(code128.PATTERNS) == 107
+    for value, pattern in enumerate(code128.PATTERNS[: code128.STOP]):
+        assert sum(map(int, pattern)) == 11, value
+    assert sum(map(int, code128.PATTERNS[code128.STOP])) == 13
+
+
+def test_encode_digits_with_code_set_c() -> None:
+    """Test an odd run of digits is packed in pairs after one code B digit."""
+    values = code128.encode('00000001234')
+
+    assert values == [
+        code128.START_B,
+        16,
+        code128.CODE_C,
+        0,
+        0,
+        0,
+        12,
+        34,
+        10,
+        code128.STOP,
+    ]
+    assert code128.encode('1234')[:3] == [code128.START_C, 12, 34]
+
+
+def test_encode_mixed_text() -> None:
+    """Test short digit runs stay in code set B and long ones switch to C."""
+    assert code128.encode('PJJ123C') == [104, 48, 42, 42, 17, 18, 19, 35, 55, 106]
+
+    values = code128.encode('AB123456CD')
+    assert values[:8] == [104, 33, 34, 99, 12, 34, 56, 100]
+
+
+def test_encode_rejects_unsupported_text() -> None:
+    """Test empty and non-ASCII values are rejected."""
+    assert not code128.is_encodable('')
+    assert not code128.is_encodable('Камера')
+    with pytest.raises(ValueError):
+        code128.encode('tab\there')
+
+
+def test_render_png() -> None:
+    """Test the image starts and ends with quiet zones around the bars."""
+    image = Image.open(io.BytesIO(code128.render_png('A1', module_width=1)))
+    row = [image.getpixel((x, 0)) for x in range(image.width)]
+
+    assert image.width == sum(code128.modules('A1')) + 20
+    assert row[:10] == [255] * 10 and row[-10:] == [255] * 10
+    assert row[10] == 0 and row[11] == 0 and row[12] == 255
+
+
+@pytest.mark.asyncio
+async def test_render_pool_limits_concurrency() -> None:
+    """Test the pool runs at most its workers and rejects past its queue."""
+    pool = RenderPool('test', workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block() -> str:
+        started.set()
+        release.wait(5)
+        return 'done'
+
+    try:
+        first = asyncio.ensure_future(pool.run(block))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        second = asyncio.ensure_future(pool.run(block))
+        await asyncio.sleep(0)
+        assert pool.stats() == {'running': 1, 'queued': 1}
+
+        with pytest.raises(RenderQueueFullError):
+            await pool.run(block)
+
+        release.set()
+        assert await asyncio.gather(first, second) == ['done', 'done']
+        assert pool.stats() == {'running': 0, 'queued': 0}
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,71 @@
+"""Unit tests for read replica session routing."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.core import database
+from backend.core.database import RoutingSession, read_only, use_replica
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_routing_without_replica(engine: AsyncEngine) -> None:
+    """Test that reads use the session bind when no replica is configured."""
+    session = AsyncSession(bind=engine, sync_session_class=RoutingSession)
+    try:
+        with use_replica():
+            assert session.sync_session.get_bind() is engine.sync_engine
+    finally:
+        await session.close()
+
+
+async def test_routing_with_replica(
+    engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that read-only scopes are routed to the replica engine."""
+    replica = database.create_engine_from_settings(database.DATABASE_URL)
+    monkeypatch.setattr(database, 'replica_engine', replica)
+    session = AsyncSession(bind=engine, sync_session_class=RoutingSession)
+
+    @read_only
+    async def read_bind() -> object:
+        return session.sync_session.get_bind()
+
+    try:
+        assert session.sync_session.get_bind() is engine.sync_engine
+        assert await read_bind() is replica.sync_engine
+        assert session.sync_session.get_bind() is engine.sync_engine
+    finally:
+        await session.close()
+        await replica.dispose()
+
+
+async def test_routing_stays_on_primary_within_write_transaction(
+    engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that read-only scopes use the primary once a transaction used it."""
+    replica = database.create_engine_from_settings(
+        engine.url.render_as_string(hide_password=False)
+    )
+    monkeypatch.setattr(database, 'replica_engine', replica)
+    session = AsyncSession(bind=engine, sync_session_class=RoutingSession)
+
+    @read_only
+    async def read_bind() -> object:
+        return session.sync_session.get_bind()
+
+    try:
+        # Replica reads do not pin the transaction to the replica
+        with use_replica():
+            await session.execute(text('SELECT 1'))
+        assert await read_bind() is replica.sync_engine
+
+        await session.execute(text('SELECT 1'))
+        assert await read_bind() is engine.sync_engine
+
+        await session.commit()
+        assert await read_bind() is replica.sync_engine
+    finally:
+        await session.close()
+        await replica.dispose()
@@ -0,0 +1,72 @@
+"""Unit tests for streaming export encoders."""
+
+import io
+import zipfile
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, AsyncIterator, List, Sequence
+from xml.etree import ElementTree
+
+import pytest
+
+from backend.core.export import format_cell, iter_csv, iter_xlsx
+from backend.models import EquipmentStatus
+
+pytestmark = pytest.mark.asyncio
+
+SHEET_NS = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+
+async def _rows(rows: Sequence[Sequence[Any]]) -> AsyncIterator[Sequence[Any]]:
+    for row in rows:
+        yield row
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> bytes:
+    return b''.join([chunk async for chunk in chunks])
+
+
+def _read_sheet(data: bytes) -> List[List[str]]:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        root = ElementTree.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+    rows = []
+    for row in root.iterfind('.//s:row', SHEET_NS):
+        rows.append([''.join(cell.itertext()) for cell in row])
+    return rows
+
+
+def test_format_cell() -> None:
+    """Test conversion of values to cell values."""
+    assert format_cell(None) == ''
+    assert format_cell(EquipmentStatus.RENTED) == 'RENTED'
+    assert format_cell(Decimal('10.50')) == Decimal('10.50')
+    assert format_cell(True) == 'да'
+    assert (
+        format_cell(datetime(2026, 3, 1, 7, 30, tzinfo=timezone.utc))
+        == '01.03.2026 10:30'
+    )
+
+
+async def test_iter_csv() -> None:
+    """Test CSV encoding with byte order mark and quoting."""
+    data = await _collect(
+        iter_csv(['ID', 'Название'], _rows([[1, 'Камера, 4K'], [2, 'Свет']]))
+    )
+
+    text = data.decode('utf-8')
+    assert text.startswith('\ufeff')
+    assert text[1:].splitlines() == ['ID,Название', '1,"Камера, 4K"', '2,Свет']
+
+
+async def test_iter_xlsx() -> None:
+    """Test that the streamed workbook is a valid zip with all rows."""
+    rows = [[index, f'Item <{index * 7919}> & co'] for index in range(1, 20001)]
+
+    chunks = [chunk async for chunk in iter_xlsx(['ID', 'Name'], _rows(rows))]
+
+    assert len(chunks) > 2
+    sheet = _read_sheet(b''.join(chunks))
+    assert sheet[0] == ['ID', 'Name']
+    assert sheet[1] == ['1', 'Item <7919> & co']
+    assert len(sheet) == 20001
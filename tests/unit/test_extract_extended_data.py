@@ -0,0 +1,102 @@
+"""Unit tests for streaming extended data extraction helpers."""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.models import BookingStatus, Equipment
+from backend.scripts.extract_extended_data import (
+    OutputFormat,
+    assemble_json,
+    extract_tables,
+    id_file_name,
+    table_file_name,
+    write_ndjson,
+)
+
+ROWS = [
+    {
+        'id': 1,
+        'name': 'Камера',
+        'status': BookingStatus.ACTIVE,
+        'amount': Decimal('10.50'),
+        'created_at': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    },
+    {'id': 2, 'name': None, 'status': None, 'amount': None, 'created_at': None},
+]
+
+
+def test_write_ndjson_one_document_per_line(tmp_path: Path) -> None:
+    """Test rows are written as single-line JSON documents."""
+    path = tmp_path / table_file_name('bookings', OutputFormat.NDJSON)
+
+    assert write_ndjson(iter(ROWS), path) == 2
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {
+            'id': 1,
+            'name': 'Камера',
+            'status': 'ACTIVE',
+            'amount': 10.5,
+            'created_at': '2024-01-02T03:04:05+00:00',
+        },
+        {'id': 2, 'name': None, 'status': None, 'amount': None, 'created_at': None},
+    ]
+
+
+def test_write_ndjson_compressed(tmp_path: Path) -> None:
+    """Test .gz table files are gzip compressed."""
+    path = tmp_path / table_file_name('bookings', OutputFormat.NDJSON_GZ)
+
+    write_ndjson(iter(ROWS), path)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        assert [json.loads(line)['id'] for line in file] == [1, 2]
+
+
+def test_assemble_json_matches_seed_format(tmp_path: Path) -> None:
+    """Test table files are combined into the document read by seed_data."""
+    bookings = tmp_path / 'bookings.ndjson'
+    clients = tmp_path / 'clients.ndjson'
+    write_ndjson(iter(ROWS), bookings)
+    write_ndjson(iter([]), clients)
+    output = tmp_path / 'extended_data.json'
+
+    assemble_json(
+        [('bookings', bookings), ('clients', clients)],
+        output,
+        {'summary': {'bookings_count': 2, 'clients_count': 0}},
+    )
+
+    data = json.loads(output.read_text(encoding='utf-8'))
+    assert [row['id'] for row in data['bookings']] == [1, 2]
+    assert data['clients'] == []
+    assert data['summary'] == {'bookings_count': 2, 'clients_count': 0}
+
+
+@pytest.mark.asyncio
+async def test_incremental_extraction_lists_all_ids(
+    tmp_path: Path, engine: AsyncEngine, test_equipment: Equipment
+) -> None:
+    """Test incremental extractions carry ID lists for deletion reconciling."""
+    sync_engine = create_engine(engine.url.set(drivername='postgresql+psycopg2'))
+    since = datetime.now(timezone.utc) + timedelta(hours=1)
+    try:
+        counts, _ = extract_tables(
+            sync_engine, tmp_path, OutputFormat.NDJSON, since=since, workers=1
+        )
+    finally:
+        sync_engine.dispose()
+
+    assert counts['equipment'] == 0
+    ids_path = tmp_path / id_file_name('equipment', OutputFormat.NDJSON)
+    assert ids_path.name == 'equipment.ids.ndjson'
+    lines = ids_path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [{'id': test_equipment.id}]
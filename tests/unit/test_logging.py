@@ -0,0 +1,88 @@
+"""Unit tests for the logging pipeline."""
+
+import logging
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from loguru import logger
+
+from backend.core import logging as app_logging
+from backend.core.logging import (
+    InterceptHandler,
+    LogSampler,
+    build_log_filter,
+    parse_sampling_rates,
+)
+
+
+def _record(name: str, level: int = logging.DEBUG) -> Dict[str, Any]:
+    """Build the part of a loguru record used by the sampler."""
+    return {'name': name, 'level': SimpleNamespace(no=level), 'message': 'row'}
+
+
+def test_parse_sampling_rates() -> None:
+    """Test sampling rates are parsed from the setting."""
+    assert parse_sampling_rates('') == {}
+    assert parse_sampling_rates('backend.api=0.5, backend.repositories=0') == {
+        'backend.api': 0.5,
+        'backend.repositories': 0.0,
+    }
+    for value in ('backend.api', 'backend.api=2', '=0.5', 'backend.api=many'):
+        with pytest.raises(ValueError):
+            parse_sampling_rates(value)
+
+
+def test_sampler_keeps_share_of_debug_records() -> None:
+    """Test every n-th debug record of the longest matching prefix is kept."""
+    sampler = LogSampler({'backend': 0.5, 'backend.api': 0.25, 'backend.web': 0})
+
+    def kept(name: str, level: int = logging.DEBUG) -> int:
+        return sum(sampler.keep(_record(name, level)) for _ in range(8))
+
+    assert kept('backend.api.v1.endpoints.bookings') == 2
+    assert kept('backend.services.booking') == 4
+    assert kept('backend.web.router') == 0
+    assert kept('backend.apis') == 4
+    assert kept('uvicorn') == 8
+    assert kept('backend.api', logging.INFO) == 8
+
+
+def test_log_filter_combines_sampling_and_filtering() -> None:
+    """Test the sink filter samples before the content filters."""
+    assert build_log_filter('') is app_logging.should_log
+
+    log_filter = build_log_filter('backend.api=0')
+    assert not log_filter(_record('backend.api.v1'))
+    assert log_filter(_record('backend.api.v1', logging.WARNING))
+
+
+def test_intercept_handler_drops_records_before_formatting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test records below the sink level are never formatted."""
+    formatted: List[str] = []
+    messages: List[str] = []
+
+    class Message:
+        def __str__(self) -> str:
+            formatted.append('called')
+            return 'formatted'
+
+    monkeypatch.setattr(app_logging, '_min_level_no', logging.INFO)
+    handler_id = logger.add(messages.append, format='{message}', level='DEBUG')
+    try:
+        handler = InterceptHandler()
+        handler.emit(logging.makeLogRecord({'msg': Message(), 'levelno': 10}))
+        assert formatted == []
+
+        handler.emit(
+            logging.makeLogRecord(
+                {'msg': Message(), 'levelno': 20, 'levelname': 'INFO', 'row': 3}
+            )
+        )
+    finally:
+        logger.remove(handler_id)
+
+    assert formatted == ['called']
+    assert [message.strip() for message in messages] == ['formatted']
@@ -0,0 +1,111 @@
+"""Unit tests for the built-in profilers."""
+
+import sys
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.core import profiler
+from backend.core.config import settings
+from backend.core.profiler import (
+    ProfilerBusyError,
+    ProfileStore,
+    RequestProfile,
+    collapse_stack,
+    format_collapsed,
+    has_diagnostics_access,
+    profile_event_loop,
+    sample_thread,
+)
+
+
+def _profile(profile_id: str) -> RequestProfile:
+    """Build a stored request profile."""
+    return RequestProfile(
+        id=profile_id,
+        method='GET',
+        path='/',
+        status_code=200,
+        duration_ms=1.0,
+        created_at=datetime.now(timezone.utc),
+        stats='',
+    )
+
+
+def test_diagnostics_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the token is required and an empty setting disables access."""
+    monkeypatch.setattr(settings, 'DIAGNOSTICS_TOKEN', '')
+    assert not has_diagnostics_access('')
+    assert not has_diagnostics_access('secret')
+
+    monkeypatch.setattr(settings, 'DIAGNOSTICS_TOKEN', 'secret')
+    assert has_diagnostics_access('secret')
+    assert not has_diagnostics_access('other')
+    assert not has_diagnostics_access(None)
+
+
+def test_collapse_stack_lists_outermost_frame_first() -> None:
+    """Test stacks are folded from the outermost to the innermost frame."""
+
+    def inner() -> str:
+        return collapse_stack(sys._getframe())
+
+    def outer() -> str:
+        return inner()
+
+    stack = outer().split(';')
+    assert stack[-2:] == [f'{__name__}:outer', f'{__name__}:inner']
+
+
+def test_sample_thread_records_busy_function() -> None:
+    """Test the sampler sees the function a thread is running."""
+    stop = threading.Event()
+
+    def busy_worker() -> None:
+        while not stop.is_set():
+            stop.wait(0.001)
+
+    thread = threading.Thread(target=busy_worker)
+    thread.start()
+    try:
+        stacks = sample_thread(thread.ident or 0, duration=0.05, interval=0.005)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert sum(stacks.values()) > 0
+    assert all('busy_worker' in stack for stack in stacks)
+
+
+def test_format_collapsed() -> None:
+    """Test stacks are printed most frequent first."""
+    stacks = Counter({'a;b': 1, 'a;c': 3})
+
+    assert format_collapsed(stacks) == 'a;c 3\na;b 1\n'
+
+
+def test_profile_store_keeps_latest() -> None:
+    """Test the store drops the oldest profiles."""
+    store = ProfileStore(2)
+    for profile_id in ('first', 'second', 'third'):
+        store.add(_profile(profile_id))
+
+    assert [profile.id for profile in store.latest()] == ['third', 'second']
+    assert store.get('first') is None
+    assert store.get('second') is not None
+
+
+@pytest.mark.asyncio
+async def test_one_sampling_run_at_a_time() -> None:
+    """Test a second sampling run is rejected while one is active."""
+    assert profiler._sampling_lock.acquire(blocking=False)
+    try:
+        with pytest.raises(ProfilerBusyError):
+            await profile_event_loop(0.01, 0.001)
+    finally:
+        profiler._sampling_lock.release()
+
+    stacks = await profile_event_loop(0.02, 0.002)
+    assert any('test_one_sampling_run_at_a_time' in stack for stack in stacks)
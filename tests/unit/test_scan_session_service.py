@@ -1,12 +1,15 @@
 """Unit tests for scan session service."""
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Dict, Optional
 
 import pytest
 
-from backend.models import ScanSession
+from backend.core.config import settings
+from backend.models import Equipment, ScanSession
+from backend.schemas import StockTakeResult
 from backend.services import ScanSessionService
+from backend.services import scan_session as scan_session_module
 
 pytestmark = pytest.mark.asyncio
 
@@ -187,3 +190,130 @@ async def test_clean_expired_sessions(
     await db_session.delete(expired_session)
     await db_session.delete(valid_session)
     await db_session.commit()
+
+
+async def test_get_stock_take(
+    scan_session_service: ScanSessionService,
+    test_equipment: Equipment,
+) -> None:
+    """Test reconciling a scan session against the warehouse state."""
+    session = await scan_session_service.create_session(
+        name='Stock-take',
+        items=[
+            {
+                'equipment_id': test_equipment.id,
+                'barcode': test_equipment.barcode,
+                'name': test_equipment.name,
+            },
+            {'equipment_id': 999999, 'barcode': 'UNKNOWN', 'name': 'Unknown'},
+        ],
+    )
+
+    report = await scan_session_service.get_stock_take(session.id)
+
+    assert report is not None
+    assert report.summary.scanned == 2
+    assert report.summary.present == 1
+    assert report.summary.unexpected == 1
+    assert report.summary.missing == 0
+    results = {item.equipment_id: item.result for item in report.items}
+    assert results[test_equipment.id] == StockTakeResult.PRESENT
+    assert results[999999] == StockTakeResult.UNEXPECTED
+
+
+async def test_get_stock_take_missing_items(
+    scan_session_service: ScanSessionService,
+    test_equipment: Equipment,
+) -> None:
+    """Test that unscanned on-site equipment is reported as missing."""
+    session = await scan_session_service.create_session(name='Empty stock-take')
+
+    report = await scan_session_service.get_stock_take(session.id)
+
+    assert report is not None
+    assert report.summary.missing == 1
+    assert report.items[0].equipment_id == test_equipment.id
+    assert report.items[0].result == StockTakeResult.MISSING
+
+
+@pytest.fixture
+def memory_cache(monkeypatch: pytest.MonkeyPatch) -> Dict[str, str]:
+    """Back the stock-take cache with a dictionary."""
+    cache: Dict[str, str] = {}
+
+    async def cache_get(key: str) -> Optional[str]:
+        return cache.get(key)
+
+    async def cache_set(key: str, value: str, ttl: int) -> None:
+        cache[key] = value
+
+    monkeypatch.setattr(scan_session_module, 'cache_get', cache_get)
+    monkeypatch.setattr(scan_session_module, 'cache_set', cache_set)
+    return cache
+
+
+async def test_stock_take_cache_follows_session_revisions(
+    memory_cache: Dict[str, str],
+    scan_session_service: ScanSessionService,
+    test_equipment: Equipment,
+) -> None:
+    """Test edits within the same second do not serve the previous report."""
+    session = await scan_session_service.create_session(name='Stock-take')
+    summary = await scan_session_service.get_stock_take_summary(session.id)
+    assert summary is not None
+    assert summary.missing == 1
+
+    await scan_session_service.update_session(
+        session.id,
+        items=[{'equipment_id': test_equipment.id, 'barcode': test_equipment.barcode}],
+    )
+    summary = await scan_session_service.get_stock_take_summary(session.id)
+
+    assert summary is not None
+    assert summary.present == 1
+    assert summary.missing == 0
+    assert len(memory_cache) == 2
+
+
+async def test_stream_stock_take_from_cached_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+    memory_cache: Dict[str, str],
+    scan_session_service: ScanSessionService,
+    test_equipment: Equipment,
+) -> None:
+    """Test a streamed report is cached in chunks and read back from them."""
+    monkeypatch.setattr(settings, 'EXPORT_BATCH_SIZE', 1)
+    session = await scan_session_service.create_session(
+        name='Stock-take',
+        items=[{'equipment_id': 999999, 'barcode': 'UNKNOWN', 'name': 'Unknown'}],
+    )
+
+    stock_take = await scan_session_service.stream_stock_take(session.id)
+    assert stock_take is not None
+    summary, items = stock_take
+    streamed = [item async for item in items]
+    assert len(streamed) == 2
+    assert summary.missing == summary.unexpected == 1
+    assert len([key for key in memory_cache if ':items:' in key]) == 2
+
+    async def unexpected_stream(*args: Any) -> Any:
+        raise AssertionError('Report was not served from the cache')
+        yield
+
+    monkeypatch.setattr(
+        scan_session_service.repository, 'stream_stock_take_rows', unexpected_stream
+    )
+    stock_take = await scan_session_service.stream_stock_take(session.id)
+    assert stock_take is not None
+    cached_summary, items = stock_take
+    assert cached_summary == summary
+    assert [item async for item in items] == streamed
+
+
+async def test_get_stock_take_nonexistent_session(
+    scan_session_service: ScanSessionService,
+) -> None:
+    """Test stock-take for a non-existent scan session."""
+    report = await scan_session_service.get_stock_take(999)
+
+    assert report is None
@@ -0,0 +1,71 @@
+"""Unit tests for the slow query log."""
+
+import pytest
+
+from backend.core.slow_query_log import SlowQueryLog, can_explain, fingerprint
+
+
+def test_fingerprint_normalizes_literals() -> None:
+    """Test executions of one query share a fingerprint."""
+    assert (
+        fingerprint(
+            'SELECT e.id, e.name::VARCHAR FROM equipment AS e -- list\n'
+            "WHERE e.id IN ($1, $2, $3) AND e.name = 'it''s'   LIMIT 10"
+        )
+        == 'SELECT e.id, e.name::VARCHAR FROM equipment AS e '
+        'WHERE e.id IN (...) AND e.name = ? LIMIT ?'
+    )
+    assert fingerprint('SELECT * FROM t WHERE id = 1 AND t2.x = 2.5') == (
+        'SELECT * FROM t WHERE id = ? AND t2.x = ?'
+    )
+    assert fingerprint(
+        'INSERT INTO bookings (a, b) VALUES ($1, $2), ($3, $4) RETURNING id'
+    ) == fingerprint('INSERT INTO bookings (a, b) VALUES ($1, $2) RETURNING id')
+
+
+def test_can_explain_only_plain_selects() -> None:
+    """Test plans are not captured for writes and locking reads."""
+    assert can_explain('  SELECT * FROM t WHERE note = $1')
+    assert can_explain("SELECT * FROM t WHERE note = 'for update'")
+    assert not can_explain('UPDATE t SET a = 1')
+    assert not can_explain('SELECT * FROM t WHERE id = $1 FOR UPDATE')
+    assert not can_explain('SELECT * FROM t FOR NO KEY UPDATE SKIP LOCKED')
+    assert not can_explain('SELECT * FROM t\nFOR  SHARE OF t NOWAIT')
+    assert not can_explain('SELECT * FROM t FOR KEY SHARE')
+    assert not can_explain('SELECT pg_advisory_xact_lock($1)')
+
+
+def test_record_aggregates_per_fingerprint() -> None:
+    """Test count, total, max and slow executions are tracked."""
+    log = SlowQueryLog(threshold_ms=100, max_fingerprints=10)
+
+    log.record('SELECT * FROM t WHERE id = 1', 0.05)
+    log.record('SELECT * FROM t WHERE id = 2', 0.25)
+    stats = log.record('SELECT * FROM t WHERE id = 3', 0.15)
+
+    assert stats.count == 3
+    assert stats.total_time == pytest.approx(0.45)
+    assert stats.max_time == 0.25
+    assert stats.mean_time == pytest.approx(0.15)
+    assert stats.slow_count == 2
+    assert stats.statement == 'SELECT * FROM t WHERE id = 2'
+
+
+def test_top_sorts_and_evicts_cheapest() -> None:
+    """Test the most expensive fingerprints are kept and listed first."""
+    log = SlowQueryLog(threshold_ms=100, max_fingerprints=2)
+    for _ in range(3):
+        log.record('SELECT a FROM t', 0.01)
+    log.record('SELECT b FROM t', 0.2)
+    log.record('SELECT c FROM t', 0.05)
+
+    assert [stats.fingerprint for stats in log.top()] == [
+        'SELECT b FROM t',
+        'SELECT c FROM t',
+    ]
+    assert [stats.fingerprint for stats in log.top(1, 'count')] == ['SELECT b FROM t']
+    with pytest.raises(ValueError):
+        log.top(sort='name')
+
+    log.reset()
+    assert log.top() == []
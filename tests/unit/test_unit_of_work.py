@@ -0,0 +1,104 @@
+"""Unit tests for the unit of work."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.core.unit_of_work import UnitOfWork, in_unit_of_work
+from backend.models import Client, Project
+from backend.repositories import ClientRepository
+from backend.services.project.operations.crud_operations import CrudOperations
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _committed_names(engine: AsyncEngine) -> List[str]:
+    """Get client names visible to another connection."""
+    async with AsyncSession(engine) as session:
+        result = await session.execute(select(Client.name).order_by(Client.name))
+        return list(result.scalars().all())
+
+
+async def test_commit_is_deferred(
+    db_session: AsyncSession, engine: AsyncEngine
+) -> None:
+    """Test repository writes are committed once the unit completes."""
+    repository = ClientRepository(db_session)
+
+    async with UnitOfWork(db_session):
+        assert in_unit_of_work(db_session)
+        client = await repository.create(Client(name='First'))
+        assert client.id is not None
+        await repository.create(Client(name='Second'))
+        assert await _committed_names(engine) == []
+
+    assert not in_unit_of_work(db_session)
+    assert await _committed_names(engine) == ['First', 'Second']
+
+
+async def test_error_rolls_back_everything(
+    db_session: AsyncSession, engine: AsyncEngine
+) -> None:
+    """Test an error leaves no partial state behind."""
+    repository = ClientRepository(db_session)
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(db_session):
+            await repository.create(Client(name='First'))
+            raise RuntimeError('boom')
+
+    assert not in_unit_of_work(db_session)
+    assert await _committed_names(engine) == []
+
+
+async def test_savepoint_isolates_failures(
+    db_session: AsyncSession, engine: AsyncEngine
+) -> None:
+    """Test a failed savepoint only discards its own changes."""
+    repository = ClientRepository(db_session)
+
+    async with UnitOfWork(db_session) as uow:
+        await repository.create(Client(name='Kept'))
+        with pytest.raises(RuntimeError):
+            async with uow.savepoint():
+                await repository.create(Client(name='Discarded'))
+                raise RuntimeError('boom')
+        async with uow.savepoint():
+            await repository.create(Client(name='Also kept'))
+
+    assert await _committed_names(engine) == ['Also kept', 'Kept']
+
+
+async def test_nested_units_commit_once(
+    db_session: AsyncSession, engine: AsyncEngine
+) -> None:
+    """Test only the outermost unit commits."""
+    repository = ClientRepository(db_session)
+
+    async with UnitOfWork(db_session):
+        async with UnitOfWork(db_session):
+            await repository.create(Client(name='Inner'))
+        assert in_unit_of_work(db_session)
+        assert await _committed_names(engine) == []
+
+    assert await _committed_names(engine) == ['Inner']
+
+
+async def test_service_commits_outside_unit_of_work(
+    db_session: AsyncSession, engine: AsyncEngine, test_client: Client
+) -> None:
+    """Test services still commit their own writes without a unit of work."""
+    start_date = datetime.now(timezone.utc) + timedelta(days=1)
+
+    project = await CrudOperations(db_session).create_project(
+        name='Standalone',
+        client_id=test_client.id,
+        start_date=start_date,
+        end_date=start_date + timedelta(days=2),
+    )
+
+    async with AsyncSession(engine) as session:
+        assert await session.get(Project, project.id) is not None